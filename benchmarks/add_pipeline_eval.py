@@ -0,0 +1,170 @@
+"""
+Compare the multi-call and fused `Memory.add` pipelines on quality and latency.
+
+Each dataset case replays a sequence of conversations for one user, then compares the stored memories with the
+memories expected at the end. A stored memory matches an expected one when their embeddings have a cosine
+similarity of at least `--threshold`. Cases are JSON lines such as:
+
+    {"user_id": "u1", "conversations": [["I love tea"], ["Actually I switched to coffee"]], "expected": ["Likes coffee"]}
+
+where every conversation is a list of user messages (or a list of {"role", "content"} dicts).
+
+    python benchmarks/add_pipeline_eval.py --config my_config.json [--dataset cases.jsonl]
+
+The config is a `Memory.from_config` dict. Each pipeline writes to its own collection and history database.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from mem0 import Memory
+
+SAMPLE_CASES = [
+    {
+        "user_id": "alice",
+        "conversations": [
+            ["Hi, I'm Alice. I work as a nurse in Lyon."],
+            ["I really like green tea, but coffee makes me jittery."],
+            ["I just moved from Lyon to Paris for a new job at a hospital."],
+        ],
+        "expected": ["Name is Alice", "Is a nurse", "Likes green tea", "Dislikes coffee", "Lives in Paris"],
+    },
+    {
+        "user_id": "bob",
+        "conversations": [
+            ["My favourite movie is Inception and I play tennis on Sundays."],
+            ["I stopped playing tennis, I do rock climbing now."],
+        ],
+        "expected": ["Favourite movie is Inception", "Does rock climbing"],
+    },
+    {
+        "user_id": "carol",
+        "conversations": [
+            [
+                {"role": "user", "content": "Can you recommend a restaurant?"},
+                {"role": "assistant", "content": "Sure, do you have any dietary restrictions?"},
+                {"role": "user", "content": "I'm vegetarian and allergic to peanuts."},
+            ],
+        ],
+        "expected": ["Is vegetarian", "Allergic to peanuts"],
+    },
+]
+
+
+def load_cases(path):
+    if not path:
+        return SAMPLE_CASES
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def to_messages(conversation):
+    return [m if isinstance(m, dict) else {"role": "user", "content": m} for m in conversation]
+
+
+def make_memory(base_config, pipeline, workdir):
+    config = json.loads(json.dumps(base_config))
+    config["add_pipeline"] = pipeline
+    config["history_db_path"] = os.path.join(workdir, f"history_{pipeline}.db")
+    vector_store = config.setdefault("vector_store", {})
+    vector_store_config = vector_store.setdefault("config", {})
+    vector_store_config["collection_name"] = f"pipeline_eval_{pipeline}_{uuid.uuid4().hex[:8]}"
+    memory = Memory.from_config(config)
+
+    calls = [0]
+    generate_response = memory.llm.generate_response
+
+    def counted(*args, **kwargs):
+        calls[0] += 1
+        return generate_response(*args, **kwargs)
+
+    memory.llm.generate_response = counted
+    return memory, calls
+
+
+def match(memory, stored, expected, threshold):
+    if not stored or not expected:
+        return 0, 0
+    stored_vectors = np.asarray(memory.embedding_model.embed_batch(stored, "search"), dtype=np.float64)
+    expected_vectors = np.asarray(memory.embedding_model.embed_batch(expected, "search"), dtype=np.float64)
+    stored_vectors /= np.linalg.norm(stored_vectors, axis=1, keepdims=True)
+    expected_vectors /= np.linalg.norm(expected_vectors, axis=1, keepdims=True)
+    similarity = expected_vectors @ stored_vectors.T >= threshold
+    return int(similarity.any(axis=1).sum()), int(similarity.any(axis=0).sum())
+
+
+def evaluate(base_config, pipeline, cases, threshold, workdir):
+    memory, calls = make_memory(base_config, pipeline, workdir)
+    latencies = []
+    matched_expected = matched_stored = total_expected = total_stored = 0
+    try:
+        for case in cases:
+            user_id = f"{case['user_id']}-{uuid.uuid4().hex[:8]}"
+            for conversation in case["conversations"]:
+                started = time.perf_counter()
+                memory.add(to_messages(conversation), user_id=user_id)
+                latencies.append(time.perf_counter() - started)
+
+            stored = [m["memory"] for m in memory.get_all(user_id=user_id)["results"]]
+            hits_expected, hits_stored = match(memory, stored, case["expected"], threshold)
+            matched_expected += hits_expected
+            matched_stored += hits_stored
+            total_expected += len(case["expected"])
+            total_stored += len(stored)
+    finally:
+        memory.vector_store.delete_col()
+
+    recall = matched_expected / total_expected if total_expected else 0.0
+    precision = matched_stored / total_stored if total_stored else 0.0
+    latencies.sort()
+    return {
+        "pipeline": pipeline,
+        "adds": len(latencies),
+        "llm_calls_per_add": calls[0] / len(latencies) if latencies else 0.0,
+        "latency_p50_s": statistics.median(latencies) if latencies else 0.0,
+        "latency_p95_s": latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0.0,
+        "recall": recall,
+        "precision": precision,
+        "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", help="JSON file with the Memory.from_config dict. Defaults to the default config")
+    parser.add_argument("--dataset", help="JSON lines file with evaluation cases. Defaults to a small built-in sample")
+    parser.add_argument("--pipelines", nargs="+", default=["multi_call", "fused"], choices=["multi_call", "fused"])
+    parser.add_argument("--threshold", type=float, default=0.8, help="Cosine similarity counted as a match")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    base_config = {}
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            base_config = json.load(f)
+    cases = load_cases(args.dataset)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [evaluate(base_config, pipeline, cases, args.threshold, workdir) for pipeline in args.pipelines]
+
+    header = f"{'pipeline':<12}{'adds':>6}{'llm/add':>9}{'p50 s':>9}{'p95 s':>9}{'recall':>9}{'precision':>11}{'f1':>7}"
+    print(header)
+    for r in results:
+        print(
+            f"{r['pipeline']:<12}{r['adds']:>6}{r['llm_calls_per_add']:>9.2f}{r['latency_p50_s']:>9.2f}"
+            f"{r['latency_p95_s']:>9.2f}{r['recall']:>9.2f}{r['precision']:>11.2f}{r['f1']:>7.2f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Cold-start cost of mem0: `import mem0`, `from mem0 import Memory` and building a `Memory`.
+
+Every stage runs in a fresh interpreter, as a serverless worker would, and reports the median wall time over
+`--runs` runs together with the mem0 modules' share from `python -X importtime`. Construction uses the local
+vector store, an OpenAI embedder and LLM (no request is made) and a throwaway MOREMEM_DIR, so nothing leaves
+the machine. The script exits non-zero when building a `Memory` (after `mem0` is imported, but including the
+provider SDKs it loads) takes longer than `--budget` seconds.
+
+    python benchmarks/cold_start.py --runs 5 --budget 1.0
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CONSTRUCT = """
+import time
+from mem0 import Memory
+started = time.perf_counter()
+Memory.from_config({{
+    "vector_store": {{"provider": "local", "config": {{"path": {path!r}, "embedding_model_dims": 1536}}}},
+    "embedder": {{"provider": "openai", "config": {{"api_key": "sk-benchmark"}}}},
+    "llm": {{"provider": "openai", "config": {{"api_key": "sk-benchmark"}}}},
+    "history_db_path": {history!r},
+}})
+print(time.perf_counter() - started)
+"""
+
+
+def run(code, env):
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - started, result
+
+
+def import_breakdown(code, env):
+    """Microseconds spent importing each top-level package (its own modules only), from `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    totals = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + int(own)
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def report(label, timings):
+    print(f"{label:<28} median {statistics.median(timings) * 1000:>8.1f} ms   max {max(timings) * 1000:>8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1.0, help="Seconds allowed to build a Memory")
+    parser.add_argument("--top", type=int, default=8, help="Number of top-level imports to list")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="mem0-cold-start-") as directory:
+        env = {**os.environ, "MOREMEM_DIR": directory, "MEM0_TELEMETRY": "false"}
+        run("pass", env)
+        report("python startup", [run("pass", env)[0] for _ in range(args.runs)])
+        report("import mem0", [run("import mem0", env)[0] for _ in range(args.runs)])
+        report("from mem0 import Memory", [run("from mem0 import Memory", env)[0] for _ in range(args.runs)])
+
+        construction = []
+        for i in range(args.runs):
+            code = CONSTRUCT.format(path=f"{directory}/store-{i}", history=f"{directory}/history-{i}.db")
+            construction.append(float(run(code, env)[1].stdout.strip()))
+        report("Memory()", construction)
+
+        code = CONSTRUCT.format(path=f"{directory}/store-breakdown", history=f"{directory}/history-breakdown.db")
+        print("\nimport time by top-level package, `from mem0 import Memory` and `Memory()`:")
+        for package, microseconds in import_breakdown(code, env)[: args.top]:
+            print(f"  {package:<26} {microseconds / 1000:>8.1f} ms")
+
+    median = statistics.median(construction)
+    if median > args.budget:
+        print(f"\nMemory() took {median:.3f}s, over the {args.budget:.3f}s budget")
+        sys.exit(1)
+    print(f"\nMemory() took {median:.3f}s, within the {args.budget:.3f}s budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark of the local NumPy vector store against Qdrant's local mode.
+
+Both stores get the same vectors and payloads; the benchmark reports insert throughput, then unfiltered and
+per-user filtered search latency, and how many of the local store's top results agree with Qdrant's.
+
+    python benchmarks/local_vector_store.py --rows 20000 --dims 384 --dtypes float32 int8
+"""
+
+import argparse
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from mem0.vector_stores.local import LocalVectorStore
+from mem0.vector_stores.qdrant import Qdrant
+
+
+def make_data(args):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(args.rows, args.dims)).astype(np.float32)
+    payloads = [{"data": f"memory {i}", "user_id": f"user-{i % args.users}"} for i in range(args.rows)]
+    ids = [str(uuid.uuid4()) for _ in range(args.rows)]
+    queries = rng.normal(size=(args.searches, args.dims)).astype(np.float32)
+    return vectors, payloads, ids, queries
+
+
+def timed_insert(store, vectors, payloads, ids, batch_size):
+    started = time.perf_counter()
+    for start in range(0, len(ids), batch_size):
+        end = start + batch_size
+        store.insert(vectors=vectors[start:end].tolist(), payloads=payloads[start:end], ids=ids[start:end])
+    return len(ids) / (time.perf_counter() - started)
+
+
+def timed_searches(store, queries, args, filtered):
+    latencies, results = [], []
+    for query in queries:
+        filters = {"user_id": f"user-{random.randrange(args.users)}"} if filtered else None
+        started = time.perf_counter()
+        hits = store.search(query=query.tolist(), limit=args.limit, filters=filters)
+        latencies.append(time.perf_counter() - started)
+        results.append([str(hit.id) for hit in hits])
+    return latencies, results
+
+
+def report(label, insert_rate, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<32} insert {insert_rate:>9.0f} vec/s"
+        f"   p50 {statistics.median(latencies) * 1000:>7.2f} ms   p95 {p95 * 1000:>7.2f} ms"
+    )
+
+
+def overlap(results, reference):
+    shared = sum(len(set(found) & set(expected)) for found, expected in zip(results, reference))
+    return shared / max(1, sum(len(expected) for expected in reference))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dtypes", nargs="+", default=["float32", "float16", "int8"])
+    args = parser.parse_args()
+
+    vectors, payloads, ids, queries = make_data(args)
+    directory = tempfile.mkdtemp(prefix="mem0-local-benchmark-")
+    try:
+        random.seed(0)
+        qdrant = Qdrant(
+            collection_name="benchmark", embedding_model_dims=args.dims, path=f"{directory}/qdrant", on_disk=True
+        )
+        rate = timed_insert(qdrant, vectors, payloads, ids, args.batch_size)
+        latencies, reference = timed_searches(qdrant, queries, args, filtered=False)
+        report("qdrant local", rate, latencies)
+        random.seed(0)
+        filtered_latencies, filtered_reference = timed_searches(qdrant, queries, args, filtered=True)
+        report("qdrant local (filtered)", rate, filtered_latencies)
+
+        for dtype in args.dtypes:
+            store = LocalVectorStore(
+                collection_name=f"benchmark_{dtype}", embedding_model_dims=args.dims, path=directory, dtype=dtype
+            )
+            rate = timed_insert(store, vectors, payloads, ids, args.batch_size)
+            random.seed(0)
+            latencies, results = timed_searches(store, queries, args, filtered=False)
+            report(f"local {dtype}", rate, latencies)
+            random.seed(0)
+            filtered_latencies, filtered_results = timed_searches(store, queries, args, filtered=True)
+            report(f"local {dtype} (filtered)", rate, filtered_latencies)
+            print(
+                f"{'':<32} top-{args.limit} agreement with qdrant: {overlap(results, reference):.1%} unfiltered, "
+                f"{overlap(filtered_results, filtered_reference):.1%} filtered"
+            )
+            store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
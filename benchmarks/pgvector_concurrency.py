@@ -0,0 +1,122 @@
+"""
+Concurrency benchmark for the pgvector store.
+
+Runs the same search workload from a thread pool and from asyncio tasks against stores configured with
+different pool sizes, which shows how far the pooled connections scale compared with a single one.
+
+    python benchmarks/pgvector_concurrency.py --host localhost --port 5432 --user postgres --password postgres
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from mem0.vector_stores.pgvector import PGVector
+
+
+def make_store(args, maxconn, prepared_statements=True):
+    return PGVector(
+        dbname=args.dbname,
+        collection_name=args.collection,
+        embedding_model_dims=args.dims,
+        user=args.user,
+        password=args.password,
+        host=args.host,
+        port=args.port,
+        diskann=False,
+        hnsw=True,
+        maxconn=maxconn,
+        prepared_statements=prepared_statements,
+    )
+
+
+def random_vector(dims):
+    return [random.random() for _ in range(dims)]
+
+
+def seed(store, args):
+    vectors = [random_vector(args.dims) for _ in range(args.rows)]
+    payloads = [{"data": f"memory {i}", "user_id": f"user-{i % args.users}"} for i in range(args.rows)]
+    ids = [str(uuid.uuid4()) for _ in range(args.rows)]
+    store.insert_many(vectors=vectors, payloads=payloads, ids=ids)
+
+
+def timed_search(store, args):
+    started = time.perf_counter()
+    store.search(random_vector(args.dims), limit=5, filters={"user_id": f"user-{random.randrange(args.users)}"})
+    return time.perf_counter() - started
+
+
+def run_threads(store, args):
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        started = time.perf_counter()
+        latencies = list(executor.map(lambda _: timed_search(store, args), range(args.requests)))
+    return time.perf_counter() - started, latencies
+
+
+async def run_async(store, args):
+    async def one():
+        started = time.perf_counter()
+        await store.asearch(
+            random_vector(args.dims), limit=5, filters={"user_id": f"user-{random.randrange(args.users)}"}
+        )
+        return time.perf_counter() - started
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded():
+        async with semaphore:
+            return await one()
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(bounded() for _ in range(args.requests)))
+    return time.perf_counter() - started, latencies
+
+
+def report(label, elapsed, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<32} {len(latencies) / elapsed:>9.1f} req/s"
+        f"   p50 {statistics.median(latencies) * 1000:>7.2f} ms   p95 {p95 * 1000:>7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dbname", default="postgres")
+    parser.add_argument("--user", default="postgres")
+    parser.add_argument("--password", default="postgres")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5432)
+    parser.add_argument("--collection", default="mem0_pool_benchmark")
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    store = make_store(args, maxconn=max(args.pool_sizes))
+    store.delete_col()
+    store.create_col(args.dims)
+    seed(store, args)
+
+    try:
+        for maxconn in args.pool_sizes:
+            for prepared in (False, True):
+                store = make_store(args, maxconn=maxconn, prepared_statements=prepared)
+                suffix = "prepared" if prepared else "plain"
+                report(f"threads maxconn={maxconn} {suffix}", *run_threads(store, args))
+                report(f"asyncio maxconn={maxconn} {suffix}", *asyncio.run(run_async(store, args)))
+    finally:
+        store.delete_col()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Load test of the REST server (`server/main.py`) against local stand-in providers.
+
+The script serves an OpenAI-compatible stand-in for the embedder and the LLM (deterministic hashed bag-of-words
+embeddings and canned JSON completions, with an optional simulated latency), starts the server under uvicorn with
+`--workers` processes, and drives it with `--users` concurrent httpx clients issuing a mix of adds, searches and
+listings for a pool of users. It reports throughput and latency percentiles per operation, then the server's
+/metrics for the pool.
+
+The default vector store is the in-process `local` store, which only one process may write to, so it is used
+with a single worker. To load several workers, pass `--vector-store` with the JSON config of a shared store:
+
+    python benchmarks/server_load.py --users 32 --duration 20
+    python benchmarks/server_load.py --workers 4 --vector-store \
+        '{"provider": "qdrant", "config": {"host": "localhost", "port": 6333, "embedding_model_dims": 256}}'
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server")
+
+WORDS = "tea coffee paris london dog cat pizza sushi running chess guitar piano python rust hiking jazz".split()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def embed(text, dims):
+    """Hashed bag-of-words vector: texts sharing words are close, like a real embedding."""
+    vector = [0.0] * dims
+    for word in text.lower().split():
+        digest = hashlib.md5(word.encode()).digest()
+        vector[int.from_bytes(digest[:4], "little") % dims] += 1.0 if digest[4] % 2 else -1.0
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def stand_in_provider(latency):
+    """OpenAI-compatible embeddings and chat completions answered locally."""
+    app = FastAPI()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        await asyncio.sleep(latency)
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        dims = body.get("dimensions") or 256
+        data = [{"object": "embedding", "index": i, "embedding": embed(text, dims)} for i, text in enumerate(texts)]
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "stand-in"),
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat(request: Request):
+        body = await request.json()
+        await asyncio.sleep(latency)
+        last = body["messages"][-1]["content"]
+        # Valid for every JSON prompt of the add pipeline: one fact is extracted, no memory action is taken
+        content = json.dumps({"facts": [last[-200:]], "memory": []})
+        return {
+            "id": "stand-in",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stand-in"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    return app
+
+
+def start_stand_in(port, latency):
+    config = uvicorn.Config(stand_in_provider(latency), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    return server
+
+
+def server_config(args, directory, provider_url):
+    vector_store = (
+        json.loads(args.vector_store)
+        if args.vector_store
+        else {"provider": "local", "config": {"path": f"{directory}/store", "embedding_model_dims": args.dims}}
+    )
+    return {
+        "version": "v1.1",
+        "vector_store": vector_store,
+        "embedder": {
+            "provider": "openai",
+            "config": {"api_key": "stand-in", "openai_base_url": provider_url, "embedding_dims": args.dims},
+        },
+        "llm": {"provider": "openai", "config": {"api_key": "stand-in", "openai_base_url": provider_url}},
+        "history_db_path": f"{directory}/history.db",
+    }
+
+
+async def wait_until_ready(client, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/metrics")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("The server did not start")
+
+
+async def virtual_user(client, args, deadline, latencies, errors):
+    while time.monotonic() < deadline:
+        user_id = f"user-{random.randrange(args.tenants)}"
+        operation = random.choices(["add", "search", "get_all"], weights=args.mix)[0]
+        started = time.perf_counter()
+        if operation == "add":
+            text = f"I like {' and '.join(random.sample(WORDS, 3))}"
+            response = await client.post(
+                "/api/memories",
+                json={"messages": [{"role": "user", "content": text}], "user_id": user_id, "infer": args.infer},
+            )
+        elif operation == "search":
+            response = await client.post(
+                "/api/search", json={"query": f"does the user like {random.choice(WORDS)}", "user_id": user_id}
+            )
+        else:
+            response = await client.get("/api/memories", params={"user_id": user_id, "page_size": 20})
+        latencies[operation].append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors[operation] += 1
+
+
+def report(label, latencies, elapsed, errors):
+    latencies = sorted(latencies)
+    if not latencies:
+        return
+    pick = lambda q: latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000  # noqa: E731
+    print(
+        f"{label:<10} {len(latencies) / elapsed:>8.1f} req/s   p50 {statistics.median(latencies) * 1000:>7.1f} ms"
+        f"   p95 {pick(0.95):>7.1f} ms   p99 {pick(0.99):>7.1f} ms   errors {errors}"
+    )
+
+
+async def run_load(args, base_url):
+    limits = httpx.Limits(max_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        await wait_until_ready(client)
+        latencies, errors = defaultdict(list), defaultdict(int)
+        # One request per worker first, so that building the pooled Memory is not counted
+        await asyncio.gather(*(client.get("/api/memories", params={"user_id": "warmup"}) for _ in range(args.workers)))
+        started = time.monotonic()
+        await asyncio.gather(
+            *(virtual_user(client, args, started + args.duration, latencies, errors) for _ in range(args.users))
+        )
+        elapsed = time.monotonic() - started
+
+        total = sum(len(values) for values in latencies.values())
+        print(f"{total} requests in {elapsed:.1f}s from {args.users} users against {args.workers} worker(s)")
+        for operation in ("add", "search", "get_all"):
+            report(operation, latencies[operation], elapsed, errors[operation])
+        metrics = (await client.get("/metrics")).text
+        print("\n".join(line for line in metrics.splitlines() if line.startswith("mem0_memory_pool")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--users", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load")
+    parser.add_argument("--tenants", type=int, default=100, help="Distinct user_ids")
+    parser.add_argument("--mix", type=int, nargs=3, default=[2, 7, 1], metavar=("ADD", "SEARCH", "GET_ALL"))
+    parser.add_argument("--infer", action="store_true", help="Run adds through the stand-in LLM")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated provider latency in seconds")
+    parser.add_argument("--dims", type=int, default=256)
+    parser.add_argument("--vector-store", help="JSON vector store config shared by the workers")
+    args = parser.parse_args()
+    if args.workers > 1 and not args.vector_store:
+        parser.error("the local vector store is single-process; pass --vector-store to load several workers")
+
+    provider_port, server_port = free_port(), free_port()
+    stand_in = start_stand_in(provider_port, args.latency)
+    with tempfile.TemporaryDirectory(prefix="mem0-server-load-") as directory:
+        config_path = os.path.join(directory, "config.json")
+        with open(config_path, "w") as config_file:
+            json.dump(server_config(args, directory, f"http://127.0.0.1:{provider_port}/v1"), config_file)
+        env = {
+            **os.environ,
+            "MEM0_SERVER_CONFIG": config_path,
+            "MEM0_SERVER_STATE_DIR": os.path.join(directory, "state"),
+            "MOREMEM_DIR": directory,
+            "MEM0_TELEMETRY": "false",
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", SERVER_DIR, "--port", str(server_port)]
+            + ["--workers", str(args.workers), "--log-level", "warning"],
+            env=env,
+        )
+        try:
+            asyncio.run(run_load(args, f"http://127.0.0.1:{server_port}"))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+            stand_in.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
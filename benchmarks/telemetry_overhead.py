@@ -0,0 +1,94 @@
+"""
+Per-call overhead of `capture_event`.
+
+Compares telemetry turned off, turned on (events queued for the background thread, PostHog replaced by a stub so
+nothing leaves the machine), and the previous implementation, which rebuilt the host properties and called
+`posthog.capture` on the caller's thread (with a client that never sends).
+
+    python benchmarks/telemetry_overhead.py --calls 100000
+"""
+
+import argparse
+import platform
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from posthog import Posthog
+
+import mem0
+from mem0.memory import telemetry as telemetry_module
+
+
+def fake_memory():
+    component = SimpleNamespace(config=SimpleNamespace(embedding_dims=1536))
+    return SimpleNamespace(
+        collection_name="mem0",
+        embedding_model=component,
+        vector_store=object(),
+        llm=object(),
+        graph=None,
+        config=SimpleNamespace(graph_store=SimpleNamespace(config=None)),
+        api_version="v1.1",
+    )
+
+
+def legacy_capture_event(posthog, event_name, memory_instance):
+    """`capture_event` as it was: every call built the host properties and went through `posthog.capture`."""
+    properties = {
+        "client_source": "python",
+        "client_version": mem0.__version__,
+        "python_version": sys.version,
+        "os": sys.platform,
+        "os_version": platform.version(),
+        "os_release": platform.release(),
+        "processor": platform.processor(),
+        "machine": platform.machine(),
+        **telemetry_module.memory_event_data(memory_instance),
+    }
+    posthog.capture(distinct_id="user", event=event_name, properties=properties)
+
+
+def per_call(label, function, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {elapsed / calls * 1e6:>8.2f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+
+    memory = fake_memory()
+    # A real client that builds and queues messages but never sends them
+    legacy_posthog = Posthog(project_api_key="key", host="https://posthog.invalid", send=False)
+    with patch("posthog.Posthog"):
+        disabled = telemetry_module.AnonymousTelemetry("key", "https://posthog.invalid", enabled=False)
+        enabled = telemetry_module.AnonymousTelemetry(
+            "key", "https://posthog.invalid", enabled=True, max_queue_size=args.calls, flush_interval=3600
+        )
+
+        for label, instance in (("off", disabled), ("on", enabled)):
+            with patch.object(telemetry_module, "telemetry", instance):
+                per_call(
+                    f"capture_event ({label})", lambda: telemetry_module.capture_event("mem0.add", memory), args.calls
+                )
+                per_call(
+                    f"capture_event ({label}, sampled internal)",
+                    lambda: telemetry_module.capture_event("mem0._create_memory", memory),
+                    args.calls,
+                )
+        per_call("legacy capture_event", lambda: legacy_capture_event(legacy_posthog, "mem0.add", memory), args.calls)
+
+        started = time.perf_counter()
+        queued = len(enabled._queue)
+        enabled.close()
+        print(f"background flush of {queued} queued events: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
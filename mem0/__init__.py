@@ -1,6 +1,27 @@
+import importlib
 import importlib.metadata
 
 __version__ = importlib.metadata.version("moremem0")
 
-from mem0.client.main import MemoryClient, AsyncMemoryClient  # noqa
-from mem0.memory.main import Memory  # noqa
+# Imported on first access, so that `import mem0` does not pay for the HTTP client, the config models and the
+# vector store libraries they reference
+_LAZY_ATTRIBUTES = {
+    "MemoryClient": "mem0.client.main",
+    "AsyncMemoryClient": "mem0.client.main",
+    "Memory": "mem0.memory.main",
+    "AsyncMemory": "mem0.memory.main",
+}
+
+__all__ = ["MemoryClient", "AsyncMemoryClient", "Memory", "AsyncMemory"]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -13,9 +13,6 @@ logger = logging.getLogger(__name__)
 
 warnings.filterwarnings("default", category=DeprecationWarning)
 
-# Setup user config
-setup_config()
-
 
 class APIError(Exception):
     """Exception raised for errors in the API."""
@@ -78,6 +75,8 @@ class MemoryClient:
         self.host = host or "https://api.mem0.ai"
         self.org_id = org_id
         self.project_id = project_id
+        # Setup user config
+        setup_config()
         self.user_id = get_user_id()
 
         if not self.api_key:
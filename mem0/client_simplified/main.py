@@ -99,6 +99,32 @@ class MemoryClient:
         response.raise_for_status()
         return response.json()
 
+    @api_error_handler
+    def batch_add(self, memories: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """在一次请求中添加多组对话的记忆
+
+        不同 user_id/agent_id/run_id 的对话在服务器端并发处理，相同标识的对话按顺序处理。
+
+        Args:
+            memories: 字典列表，每项包含 messages（字符串或消息字典列表）以及 add 接受的参数，如 user_id, metadata
+
+        Returns:
+            包含 results 的字典，按顺序对应每组对话；失败的项为 {"error": ...}
+
+        Raises:
+            APIError: 如果API请求失败
+        """
+        payload = []
+        for memory in memories:
+            item = {k: v for k, v in memory.items() if v is not None}
+            if isinstance(item.get("messages"), str):
+                item["messages"] = [{"role": "user", "content": item["messages"]}]
+            payload.append(item)
+
+        response = self.client.post("/memories/batch", json={"memories": payload})
+        response.raise_for_status()
+        return response.json()
+
     @api_error_handler
     def get(self, memory_id: str) -> Dict[str, Any]:
         """获取特定记忆
@@ -121,7 +147,8 @@ class MemoryClient:
         """获取所有记忆，可选过滤
 
         Args:
-            **kwargs: 用于过滤的可选参数 (user_id, agent_id, run_id)
+            **kwargs: 用于过滤的可选参数 (user_id, agent_id, run_id)；传入 page_size 和/或 cursor 时按页返回，
+                结果中的 next_cursor 用于获取下一页
 
         Returns:
             包含记忆的字典列表
@@ -155,6 +182,24 @@ class MemoryClient:
         response.raise_for_status()
         return response.json()
 
+    @api_error_handler
+    def batch_search(self, searches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """在一次请求中执行多个搜索，服务器端批量计算所有查询的嵌入并发搜索
+
+        Args:
+            searches: 字典列表，每项包含 query 以及 search 接受的参数，如 user_id, filters, limit
+
+        Returns:
+            包含 results 的字典，按顺序对应每个搜索；失败的项为 {"error": ...}
+
+        Raises:
+            APIError: 如果API请求失败
+        """
+        payload = [{k: v for k, v in search.items() if v is not None} for search in searches]
+        response = self.client.post("/search/batch", json={"searches": payload})
+        response.raise_for_status()
+        return response.json()
+
     @api_error_handler
     def update(self, memory_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """更新记忆
@@ -207,6 +252,23 @@ class MemoryClient:
         response.raise_for_status()
         return response.json()
 
+    @api_error_handler
+    def batch_delete(self, memory_ids: List[str]) -> Dict[str, List[str]]:
+        """批量删除记忆
+
+        Args:
+            memory_ids: 记忆ID列表
+
+        Returns:
+            包含 deleted（已删除的ID）和 not_found（不存在的ID）的字典
+
+        Raises:
+            APIError: 如果API请求失败
+        """
+        response = self.client.request("DELETE", "/memories/batch", json={"memory_ids": memory_ids})
+        response.raise_for_status()
+        return response.json()
+
     @api_error_handler
     def delete_all(self, **kwargs) -> Dict[str, str]:
         """删除所有记忆，可选过滤
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -7,6 +7,7 @@ from mem0.embeddings.configs import EmbedderConfig
 from mem0.graphs.configs import GraphStoreConfig
 from mem0.llms.configs import LlmConfig
 from mem0.memory.setup import moremem_dir
+from mem0.rerankers.configs import RerankerConfig
 from mem0.vector_stores.configs import VectorStoreConfig
 
 
@@ -24,6 +25,61 @@ class MemoryItem(BaseModel):
     categories: Optional[List[str]] = Field([], description="The relative categories of the memory") # TODO:ERORR 这个地方有问题，Qdrant调用的search接口改了之后出现了奇怪的返回
 
 
+class DeferredAddConfig(BaseModel):
+    path: Optional[str] = Field(
+        description="Path of the durable queue of deferred adds, defaults to `add_queue.db` under `moremem_dir`",
+        default=None,
+    )
+    concurrency: int = Field(description="Number of deferred adds processed at once", default=4)
+    max_pending: int = Field(description="Queued adds above which `add(mode='deferred')` blocks", default=1000)
+    enqueue_timeout: Optional[float] = Field(
+        description="Seconds to wait for room in a full queue before raising TimeoutError, None to wait indefinitely",
+        default=None,
+    )
+    retention: float = Field(description="Seconds finished jobs are kept for `get_add_job`", default=7 * 24 * 3600)
+    lease_timeout: float = Field(
+        description="Seconds a running job stays reserved to its process without a heartbeat before it is requeued",
+        default=60.0,
+    )
+
+
+class HybridSearchConfig(BaseModel):
+    enabled: bool = Field(description="Fuse keyword and vector search results in `search`", default=False)
+    lexical_index: Literal["auto", "native", "local"] = Field(
+        description=(
+            "Where keyword search runs: 'native' uses the vector store's own full-text search, 'local' a SQLite "
+            "FTS5 index maintained by Memory, 'auto' the native search when the store has one that also matches "
+            "Chinese terms (pgvector's does not)"
+        ),
+        default="auto",
+    )
+    path: Optional[str] = Field(
+        description=(
+            "Path of the local keyword index, defaults to `lexical_index.db` under `moremem_dir`. Its tables are "
+            "named after the collection and the vector store's identity, so several stores can share the file"
+        ),
+        default=None,
+    )
+    vector_weight: float = Field(description="Weight of the vector ranking in the fusion", default=1.0)
+    lexical_weight: float = Field(description="Weight of the keyword ranking in the fusion", default=1.0)
+    rrf_k: int = Field(description="Reciprocal-rank fusion constant", default=60)
+    candidate_multiplier: int = Field(
+        description="Each ranking retrieves `limit * candidate_multiplier` candidates before fusion", default=2
+    )
+
+
+class SearchCacheConfig(BaseModel):
+    enabled: bool = Field(description="Cache `search` results until a memory in their scope is written", default=False)
+    max_entries: int = Field(description="Cached searches kept before the least recently used is evicted", default=1024)
+    ttl: Optional[float] = Field(
+        description=(
+            "Seconds a cached search stays valid, None for no limit. Set it when other processes write to the same "
+            "store, since only this instance's writes invalidate the cache"
+        ),
+        default=None,
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -45,6 +101,29 @@ class MemoryConfig(BaseModel):
         description="Configuration for the graph",
         default_factory=GraphStoreConfig,
     )
+    reranker: RerankerConfig = Field(
+        description="Configuration for the reranking stage of search",
+        default_factory=RerankerConfig,
+    )
+    hybrid_search: HybridSearchConfig = Field(
+        description="Configuration for hybrid keyword + vector search",
+        default_factory=HybridSearchConfig,
+    )
+    search_cache: SearchCacheConfig = Field(
+        description="Configuration for the cache of search results",
+        default_factory=SearchCacheConfig,
+    )
+    add_pipeline: Literal["multi_call", "fused"] = Field(
+        description=(
+            "How `add` infers memories: 'multi_call' makes separate LLM calls for fact extraction, the update "
+            "decision and categorisation, 'fused' does all three in a single call"
+        ),
+        default="multi_call",
+    )
+    deferred_add: DeferredAddConfig = Field(
+        description="Configuration for the background queue behind `add(mode='deferred')`",
+        default_factory=DeferredAddConfig,
+    )
     version: str = Field(
         description="The version of the API",
         default="v1.1",
@@ -1,8 +1,6 @@
 from abc import ABC
 from typing import Dict, Optional, Union
 
-import httpx
-
 from mem0.configs.base import AzureConfig
 
 
@@ -34,6 +32,13 @@ class BaseEmbedderConfig(ABC):
         memory_add_embedding_type: Optional[str] = None,
         memory_update_embedding_type: Optional[str] = None,
         memory_search_embedding_type: Optional[str] = None,
+        # Shared HTTP connection pool
+        http_timeout: float = 60.0,
+        http_connect_timeout: float = 10.0,
+        http_max_connections: int = 100,
+        http_max_keepalive_connections: int = 20,
+        http_max_retries: int = 3,
+        http2: bool = True,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -66,6 +71,18 @@ class BaseEmbedderConfig(ABC):
         :type memory_update_embedding_type: Optional[str], optional
         :param memory_search_embedding_type: The type of embedding to use for the search memory action, defaults to None
         :type memory_search_embedding_type: Optional[str], optional
+        :param http_timeout: Read, write and pool timeout in seconds for provider HTTP requests, defaults to 60.0
+        :type http_timeout: float, optional
+        :param http_connect_timeout: Connect timeout in seconds for provider HTTP requests, defaults to 10.0
+        :type http_connect_timeout: float, optional
+        :param http_max_connections: Maximum number of connections in the shared HTTP pool, defaults to 100
+        :type http_max_connections: int, optional
+        :param http_max_keepalive_connections: Maximum number of idle keep-alive connections kept in the pool, defaults to 20
+        :type http_max_keepalive_connections: int, optional
+        :param http_max_retries: Retries with jittered backoff for 429/5xx responses, defaults to 3
+        :type http_max_retries: int, optional
+        :param http2: Use HTTP/2 when the optional h2 package is installed, defaults to True
+        :type http2: bool, optional
         """
 
         self.model = model
@@ -74,7 +91,13 @@ class BaseEmbedderConfig(ABC):
         self.embedding_dims = embedding_dims
 
         # AzureOpenAI specific
-        self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_client_proxies = http_client_proxies
+        if http_client_proxies:
+            import httpx
+
+            self.http_client = httpx.Client(proxies=http_client_proxies)
+        else:
+            self.http_client = None
 
         # Ollama specific
         self.ollama_base_url = ollama_base_url
@@ -96,3 +119,11 @@ class BaseEmbedderConfig(ABC):
         self.memory_add_embedding_type = memory_add_embedding_type
         self.memory_update_embedding_type = memory_update_embedding_type
         self.memory_search_embedding_type = memory_search_embedding_type
+
+        # Shared HTTP connection pool
+        self.http_timeout = http_timeout
+        self.http_connect_timeout = http_connect_timeout
+        self.http_max_connections = http_max_connections
+        self.http_max_keepalive_connections = http_max_keepalive_connections
+        self.http_max_retries = http_max_retries
+        self.http2 = http2
@@ -0,0 +1,43 @@
+from abc import ABC
+from typing import Optional
+
+
+class BaseRerankerConfig(ABC):
+    """
+    Config for Rerankers.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        # BM25 specific
+        tokenizer_cache_size: int = 10000,
+        # Cross-encoder specific
+        device: Optional[str] = None,
+        batch_size: int = 32,
+        model_kwargs: Optional[dict] = None,
+    ):
+        """
+        Initializes a configuration class instance for the Rerankers.
+
+        :param model: Model to use (cross-encoder only), defaults to None
+        :type model: Optional[str], optional
+        :param tokenizer_cache_size: Number of tokenized texts kept by the BM25 reranker, defaults to 10000
+        :type tokenizer_cache_size: int, optional
+        :param device: Device to run the cross-encoder on, defaults to None
+        :type device: Optional[str], optional
+        :param batch_size: Number of (query, document) pairs scored per cross-encoder batch, defaults to 32
+        :type batch_size: int, optional
+        :param model_kwargs: key-value arguments for the cross-encoder model, defaults a dict inside init
+        :type model_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
+        """
+
+        self.model = model
+
+        # BM25 specific
+        self.tokenizer_cache_size = tokenizer_cache_size
+
+        # Cross-encoder specific
+        self.device = device
+        self.batch_size = batch_size
+        self.model_kwargs = model_kwargs or {}
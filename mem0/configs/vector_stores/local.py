@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class LocalVectorStoreConfig(BaseModel):
+    collection_name: str = Field("mem0", description="Name of the collection")
+    embedding_model_dims: int = Field(1536, description="Dimensions of the embedding model")
+    path: Optional[str] = Field(None, description="Directory holding the vector files and payload database")
+    dtype: Literal["float32", "float16", "int8"] = Field(
+        "float32", description="Storage type of the vectors; float16 halves and int8 quarters the memory used"
+    )
+    distance: Literal["cosine", "dot"] = Field("cosine", description="Similarity used to rank search results")
+    indexed_fields: Optional[List[str]] = Field(
+        None, description="Metadata fields to index for filtering, in addition to user_id, agent_id and run_id"
+    )
+    initial_capacity: int = Field(1024, ge=1, description="Rows allocated in the vector file before it grows")
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        allowed_fields = set(cls.model_fields.keys())
+        input_fields = set(values.keys())
+        extra_fields = input_fields - allowed_fields
+        if extra_fields:
+            raise ValueError(
+                f"Extra fields not allowed: {', '.join(extra_fields)}. Please input only the following fields: {', '.join(allowed_fields)}"
+            )
+        return values
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -25,6 +25,12 @@ class MilvusDBConfig(BaseModel):
     collection_name: str = Field("mem0", description="Name of the collection")
     embedding_model_dims: int = Field(1536, description="Dimensions of the embedding model")
     metric_type: str = Field("L2", description="Metric type for similarity search")
+    indexed_fields: Optional[List[str]] = Field(
+        None, description="Metadata fields to index for filtering, in addition to user_id, agent_id and run_id"
+    )
+    tenant_key: Optional[str] = Field(
+        None, description="Payload field that partitions the collection by tenant, e.g. user_id"
+    )
 
     @model_validator(mode="before")
     @classmethod
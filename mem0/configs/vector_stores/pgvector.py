@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -13,6 +13,15 @@ class PGVectorConfig(BaseModel):
     port: Optional[int] = Field(None, description="Database port. Default is 1536")
     diskann: Optional[bool] = Field(True, description="Use diskann for approximate nearest neighbors search")
     hnsw: Optional[bool] = Field(False, description="Use hnsw for faster search")
+    minconn: int = Field(1, description="Minimum number of pooled connections kept open")
+    maxconn: int = Field(10, description="Maximum number of pooled connections; further callers wait for a free one")
+    prepared_statements: bool = Field(
+        True, description="Prepare search statements once per connection. Disable behind a transaction-mode pgbouncer"
+    )
+    list_batch_size: int = Field(1000, description="Rows fetched per round-trip by the server-side cursor used in list")
+    indexed_fields: Optional[List[str]] = Field(
+        None, description="Metadata fields to index for filtering, in addition to user_id, agent_id and run_id"
+    )
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -16,6 +16,12 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    indexed_fields: Optional[List[str]] = Field(
+        None, description="Metadata fields to index for filtering, in addition to user_id, agent_id and run_id"
+    )
+    tenant_key: Optional[str] = Field(
+        None, description="Payload field that partitions the collection by tenant, e.g. user_id"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -8,6 +8,9 @@ class RedisDBConfig(BaseModel):
     redis_url: str = Field(..., description="Redis URL")
     collection_name: str = Field("mem0", description="Collection name")
     embedding_model_dims: int = Field(1536, description="Embedding model dimensions")
+    indexed_fields: Optional[List[str]] = Field(
+        None, description="Metadata fields to index for filtering, in addition to user_id, agent_id and run_id"
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -1,13 +1,17 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.http import LoopLocal, openai_client_kwargs
 
 
 class AliyunEmbedding(EmbeddingBase):
+    # DashScope text-embedding-v3 accepts at most 10 inputs per request
+    batch_size = 10
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -16,7 +20,17 @@ class AliyunEmbedding(EmbeddingBase):
 
         api_key = self.config.api_key or os.getenv("ALIYUN_API_KEY")
         base_url = self.config.aliyun_base_url or os.getenv("ALIYUN_API_BASE") or "https://dashscope.aliyuncs.com/compatible-mode/v1"
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(api_key=api_key, base_url=base_url, **openai_client_kwargs(self.config))
+        # Async clients are only created on first use of `aembed`, one per event loop
+        self._client_kwargs = {"api_key": api_key, "base_url": base_url}
+        self._async_clients = LoopLocal(
+            lambda: AsyncOpenAI(**self._client_kwargs, **openai_client_kwargs(self.config, asynchronous=True))
+        )
+
+    @property
+    def async_client(self):
+        """The `AsyncOpenAI` client of the running event loop."""
+        return self._async_clients.get()
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -30,3 +44,51 @@ class AliyunEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model, dimensions = self.config.embedding_dims).data[0].embedding
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text using the native async client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(input=[text], model=self.config.model, dimensions=self.config.embedding_dims)
+        return response.data[0].embedding
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Aliyun, sending up to `batch_size` inputs per request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), self.batch_size):
+            response = self.client.embeddings.create(input=texts[start : start + self.batch_size], model=self.config.model, dimensions=self.config.embedding_dims)
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embeddings for a list of texts using the native async client.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), self.batch_size):
+            response = await self.async_client.embeddings.create(input=texts[start : start + self.batch_size], model=self.config.model, dimensions=self.config.embedding_dims)
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
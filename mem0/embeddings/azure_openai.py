@@ -1,5 +1,5 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from openai import AzureOpenAI
 
@@ -8,6 +8,9 @@ from mem0.embeddings.base import EmbeddingBase
 
 
 class AzureOpenAIEmbedding(EmbeddingBase):
+    # Maximum number of inputs accepted by one embeddings request
+    batch_size = 2048
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -38,3 +41,20 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Azure OpenAI, sending up to `batch_size` inputs per request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), self.batch_size):
+            response = self.client.embeddings.create(input=texts[start : start + self.batch_size], model=self.config.model)
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 
@@ -30,3 +31,48 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embedding for the given text.
+
+        Providers with a native async client override this; the default runs `embed` in a worker thread
+        so that the event loop is never blocked.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+
+        Returns:
+            list: The embedding vector.
+        """
+        return await asyncio.to_thread(self.embed, text, memory_action)
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        Providers whose API accepts several inputs per request override this to embed the whole
+        list in one round-trip; the default falls back to one `embed` call per text.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return [self.embed(text, memory_action) for text in texts]
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Asynchronously get the embeddings for a list of texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        return await asyncio.to_thread(self.embed_batch, texts, memory_action)
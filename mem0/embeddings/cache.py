@@ -0,0 +1,206 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+
+# Providers whose vectors depend on the memory action (task type), so the action is part of the cache key
+ACTION_SENSITIVE_PROVIDERS = {"vertexai"}
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so that trivially different strings share a cache entry."""
+    return " ".join(text.split())
+
+
+class EmbeddingCache:
+    """
+    Thread-safe embedding cache with an in-memory LRU tier and an optional SQLite tier.
+
+    Entries expire after `ttl` seconds (never, if `ttl` is None). The in-memory tier holds at most
+    `max_size` vectors; the SQLite tier, when a `path` is given, survives process restarts and is
+    consulted on an in-memory miss.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None, path: Optional[str] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.connection = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            with self.connection:
+                self.connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS embeddings (
+                        key TEXT PRIMARY KEY,
+                        vector BLOB,
+                        created_at REAL
+                    )
+                """
+                )
+
+    @classmethod
+    def from_config(cls, config):
+        from mem0.memory.setup import moremem_dir
+
+        path = None
+        if config.persistent:
+            path = config.path or os.path.join(moremem_dir, "embedding_cache.db")
+        return cls(max_size=config.max_size, ttl=config.ttl, path=path)
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def get_many(self, keys: List[str]) -> Dict[str, list]:
+        """Return the cached vectors for the given keys, counting a hit or a miss for each key."""
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and not self._expired(entry[1]):
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    missing.append(key)
+
+            if missing and self.connection is not None:
+                placeholders = ",".join("?" * len(missing))
+                rows = self.connection.execute(
+                    f"SELECT key, vector, created_at FROM embeddings WHERE key IN ({placeholders})", missing
+                ).fetchall()
+                for key, blob, created_at in rows:
+                    if self._expired(created_at):
+                        continue
+                    vector = array("f", blob).tolist()
+                    found[key] = vector
+                    self._remember(key, vector, created_at)
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, list]):
+        """Store the given key -> vector pairs in every tier."""
+        now = time.time()
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector, now)
+            if self.connection is not None and items:
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                        [(key, array("f", vector).tobytes(), now) for key, vector in items.items()],
+                    )
+
+    def _remember(self, key, vector, created_at):
+        self._entries[key] = (vector, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self.connection is not None:
+                with self.connection:
+                    self.connection.execute("DELETE FROM embeddings")
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+
+class CachedEmbedding(EmbeddingBase):
+    """
+    Wraps any `EmbeddingBase` so that repeated texts are served from an `EmbeddingCache`.
+
+    Cache keys combine the provider, model, embedding dimensions and the normalized text, so a
+    persistent cache can safely be shared between differently configured embedders.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, provider: str, cache: EmbeddingCache):
+        self.embedder = embedder
+        self.provider = provider
+        self.cache = cache
+
+    @property
+    def config(self):
+        return self.embedder.config
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper itself
+        return getattr(self.__dict__["embedder"], name)
+
+    def _key(self, text, memory_action):
+        action = memory_action if self.provider in ACTION_SENSITIVE_PROVIDERS else None
+        raw = "\x00".join(
+            [self.provider, str(self.config.model), str(self.config.embedding_dims), str(action), normalize_text(text)]
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _split(self, texts, memory_action):
+        keys = [self._key(text, memory_action) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in cached))
+        return keys, cached, missing
+
+    def _merge(self, keys, cached, missing, memory_action, embeddings):
+        fresh = {self._key(text, memory_action): embedding for text, embedding in zip(missing, embeddings)}
+        self.cache.set_many(fresh)
+        cached.update(fresh)
+        return [cached[key] for key in keys]
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        keys, cached, missing = self._split(texts, memory_action)
+        embeddings = []
+        if missing:
+            embeddings = (
+                [self.embedder.embed(missing[0], memory_action)]
+                if len(missing) == 1
+                else self.embedder.embed_batch(missing, memory_action)
+            )
+        return self._merge(keys, cached, missing, memory_action, embeddings)
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        return (await self.aembed_batch([text], memory_action))[0]
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        keys, cached, missing = self._split(texts, memory_action)
+        embeddings = []
+        if missing:
+            embeddings = (
+                [await self.embedder.aembed(missing[0], memory_action)]
+                if len(missing) == 1
+                else await self.embedder.aembed_batch(missing, memory_action)
+            )
+        return self._merge(keys, cached, missing, memory_action, embeddings)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Return hit/miss counters of the underlying cache."""
+        return self.cache.stats()
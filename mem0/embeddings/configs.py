@@ -3,12 +3,27 @@ from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, field_validator
 
 
+class EmbeddingCacheConfig(BaseModel):
+    enabled: bool = Field(description="Whether to cache embeddings", default=False)
+    max_size: int = Field(description="Maximum number of embeddings kept in the in-memory LRU", default=10000)
+    ttl: Optional[float] = Field(description="Seconds after which a cached embedding expires, None to never expire", default=None)
+    persistent: bool = Field(description="Also persist embeddings to a SQLite database", default=False)
+    path: Optional[str] = Field(
+        description="Path of the persistent cache database, defaults to `embedding_cache.db` under `moremem_dir`",
+        default=None,
+    )
+
+
 class EmbedderConfig(BaseModel):
     provider: str = Field(
         description="Provider of the embedding model (e.g., 'ollama', 'openai')",
         default="siliconflow",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache: EmbeddingCacheConfig = Field(
+        description="Configuration for the embedding cache",
+        default_factory=EmbeddingCacheConfig,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
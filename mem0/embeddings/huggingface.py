@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from sentence_transformers import SentenceTransformer
 
@@ -27,3 +27,17 @@ class HuggingFaceEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         return self.model.encode(text, convert_to_numpy=True).tolist()
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Hugging Face, encoding them as one batch.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        return self.model.encode(texts, convert_to_numpy=True).tolist()
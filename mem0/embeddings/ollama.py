@@ -1,6 +1,6 @@
 import subprocess
 import sys
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
@@ -29,12 +29,14 @@ class OllamaEmbedding(EmbeddingBase):
         self.config.embedding_dims = self.config.embedding_dims or 512
 
         self.client = Client(host=self.config.ollama_base_url)
-        self._ensure_model_exists()
+        # Checked on the first request rather than here, so construction makes no calls to the Ollama server
+        self._model_checked = False
 
     def _ensure_model_exists(self):
         """
         Ensure the specified model exists locally. If not, pull it from Ollama.
         """
+        self._model_checked = True
         local_models = self.client.list()["models"]
         if not any(model.get("name") == self.config.model for model in local_models):
             self.client.pull(self.config.model)
@@ -49,5 +51,24 @@ class OllamaEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        if not self._model_checked:
+            self._ensure_model_exists()
         response = self.client.embeddings(model=self.config.model, prompt=text)
         return response["embedding"]
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Ollama's `/api/embed` endpoint in a single request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        if not self._model_checked:
+            self._ensure_model_exists()
+        response = self.client.embed(model=self.config.model, input=texts)
+        return [list(embedding) for embedding in response["embeddings"]]
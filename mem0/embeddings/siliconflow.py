@@ -1,12 +1,15 @@
 import os
-import requests
-from typing import Optional, Literal
+from typing import List, Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.http import get_http_client
 
 
 class SiliconFlowEmbedding(EmbeddingBase):
+    # Maximum number of inputs accepted by one embeddings request
+    batch_size = 32
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -15,6 +18,17 @@ class SiliconFlowEmbedding(EmbeddingBase):
 
         self.api_key = self.config.api_key or os.getenv("SILICONFLOW_API_KEY")
         self.base_url = self.config.siliconflow_base_url or os.getenv("SILICONFLOW_API_BASE") or "https://api.siliconflow.cn/v1/embeddings"
+        # Pooled keep-alive client shared with other providers, retrying 429/5xx with jittered backoff
+        self.client = get_http_client(self.config)
+
+    def _post(self, payload):
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        response = self.client.post(self.base_url, json=payload, headers=headers)
+        response.raise_for_status()
+        return response.json()["data"]
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -32,8 +46,26 @@ class SiliconFlowEmbedding(EmbeddingBase):
             "input": text,
             "encoding_format": "float"
         }
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        return requests.request("POST", self.base_url, json=payload, headers=headers).json()['data'][0]['embedding']
+        return self._post(payload)[0]["embedding"]
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using SiliconFlow, sending up to `batch_size` inputs per request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for start in range(0, len(texts), self.batch_size):
+            payload = {
+                "model": self.config.model,
+                "input": texts[start : start + self.batch_size],
+                "encoding_format": "float"
+            }
+            data = self._post(payload)
+            embeddings.extend(item["embedding"] for item in sorted(data, key=lambda item: item["index"]))
+        return embeddings
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -9,6 +9,21 @@ class Neo4jConfig(BaseModel):
     url: Optional[str] = Field(None, description="Host address for the graph database")
     username: Optional[str] = Field(None, description="Username for the graph database")
     password: Optional[str] = Field(None, description="Password for the graph database")
+    similarity_search: Literal["auto", "vector_index", "local"] = Field(
+        "auto",
+        description=(
+            "How similar nodes are found: 'vector_index' uses a Neo4j vector index (Neo4j 5.11+), 'local' scores the "
+            "user's node embeddings with NumPy, 'auto' uses the vector index when it can be created"
+        ),
+    )
+    vector_index_name: str = Field("memory_entity_embedding", description="Name of the Neo4j vector index on entity embeddings")
+    vector_index_candidates: int = Field(
+        100,
+        description=(
+            "Nearest neighbours first fetched from the vector index per query before filtering by user; doubled while "
+            "other users' nodes crowd out the user's matches"
+        ),
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -6,6 +6,7 @@ from openai import OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.http import openai_client_kwargs
 
 
 class AliyunLLM(LLMBase):
@@ -17,7 +18,7 @@ class AliyunLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("ALIYUN_API_KEY")
         base_url = self.config.deepseek_base_url or os.getenv("ALIYUN_API_BASE") or "https://dashscope.aliyuncs.com/compatible-mode/v1"
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(api_key=api_key, base_url=base_url, **openai_client_kwargs(self.config))
 
     def _parse_response(self, response, tools):
         """
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -28,3 +29,19 @@ class LLMBase(ABC):
             str: The generated response.
         """
         pass
+
+    async def agenerate_response(self, messages, **kwargs):
+        """
+        Asynchronously generate a response based on the given messages.
+
+        Providers with a native async client override this; the default runs `generate_response`
+        in a worker thread so that the event loop is never blocked.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            **kwargs: Provider specific arguments such as response_format or tools.
+
+        Returns:
+            str: The generated response.
+        """
+        return await asyncio.to_thread(self.generate_response, messages, **kwargs)
@@ -16,12 +16,14 @@ class OllamaLLM(LLMBase):
         if not self.config.model:
             self.config.model = "llama3.1:70b"
         self.client = Client(host=self.config.ollama_base_url)
-        self._ensure_model_exists()
+        # Checked on the first request rather than here, so construction makes no calls to the Ollama server
+        self._model_checked = False
 
     def _ensure_model_exists(self):
         """
         Ensure the specified model exists locally. If not, pull it from Ollama.
         """
+        self._model_checked = True
         local_models = self.client.list()["models"]
         if not any(model.get("name") == self.config.model for model in local_models):
             self.client.pull(self.config.model)
@@ -90,5 +92,7 @@ class OllamaLLM(LLMBase):
         if tools:
             params["tools"] = tools
 
+        if not self._model_checked:
+            self._ensure_model_exists()
         response = self.client.chat(**params)
         return self._parse_response(response, tools)
@@ -6,6 +6,7 @@ from openai import OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.http import openai_client_kwargs
 
 
 class OpenAIStructuredLLM(LLMBase):
@@ -17,7 +18,7 @@ class OpenAIStructuredLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
         base_url = self.config.openai_base_url or os.getenv("OPENAI_API_BASE") or "https://api.openai.com/v1"
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(api_key=api_key, base_url=base_url, **openai_client_kwargs(self.config))
 
     def generate_response(
         self,
@@ -0,0 +1,209 @@
+import hashlib
+import logging
+import uuid
+from datetime import datetime
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+# Telemetry event fired once per applied group, named after the single-item methods it replaces
+EVENT_TELEMETRY_NAMES = {
+    "ADD": "mem0._create_memory",
+    "UPDATE": "mem0._update_memory",
+    "DELETE": "mem0._delete_memory",
+}
+
+
+def build_create_payload(data, categories, metadata=None):
+    """Payload of a newly created memory."""
+    payload = dict(metadata or {})
+    payload["data"] = data
+    payload["hash"] = hashlib.md5(data.encode()).hexdigest()
+    payload["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    payload["categories"] = categories
+    return payload
+
+
+def build_update_payload(existing_payload, data, metadata=None):
+    """Payload of an updated memory, keeping its creation time and session identifiers."""
+    payload = dict(metadata or {})
+    payload["data"] = data
+    payload["hash"] = hashlib.md5(data.encode()).hexdigest()
+    payload["created_at"] = existing_payload.get("created_at")
+    payload["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    for key in ["user_id", "agent_id", "run_id"]:
+        if key in existing_payload:
+            payload[key] = existing_payload[key]
+    return payload
+
+
+def index_existing_memories(search_results):
+    """
+    Prepare the memories retrieved for an update decision to be shown to the LLM.
+
+    Duplicates are removed and memory ids are replaced by small integer ids, which the LLM is less likely to
+    mangle or hallucinate.
+
+    Args:
+        search_results (list): Lists of vector store hits, e.g. one list per extracted fact.
+
+    Returns:
+        tuple: The `{"id", "text"}` entries for the prompt, the mapping from integer ids back to memory ids,
+            and the payloads of the retrieved memories keyed by memory id.
+    """
+    retrieved_old_memory = {}
+    existing_payloads = {}
+    for existing_memories in search_results:
+        for mem in existing_memories:
+            retrieved_old_memory[mem.id] = mem.payload["data"]
+            existing_payloads[mem.id] = mem.payload
+
+    logger.info(f"Total existing memories: {len(retrieved_old_memory)}\n")
+
+    temp_uuid_mapping = {}
+    prompt_memories = []
+    for idx, (memory_id, text) in enumerate(retrieved_old_memory.items()):
+        temp_uuid_mapping[str(idx)] = memory_id
+        prompt_memories.append({"id": str(idx), "text": text})
+    return prompt_memories, temp_uuid_mapping, existing_payloads
+
+
+class MemoryActionBatch:
+    """
+    The ADD/UPDATE/DELETE actions decided by the LLM, grouped by event so that each group can be
+    written with one bulk vector-store call and one history insert.
+    """
+
+    def __init__(self):
+        self.groups = {"ADD": [], "UPDATE": [], "DELETE": []}
+        self._entries = []
+
+    @classmethod
+    def from_actions(cls, actions, temp_uuid_mapping, existing_payloads, metadata=None):
+        """
+        Build a batch from the LLM response.
+
+        Args:
+            actions (list): The `memory` list returned by the update-memory prompt.
+            temp_uuid_mapping (dict): Maps the integer ids shown to the LLM back to memory ids.
+            existing_payloads (dict): Payloads of the retrieved memories, keyed by memory id.
+            metadata (dict, optional): Metadata of the memories being added. Defaults to None.
+        """
+        batch = cls()
+        for resp in actions:
+            logger.info(f"the element in {resp}\n")
+            try:
+                event = resp.get("event")
+                if not resp.get("text"):
+                    logging.info("Skipping memory entry because of empty `text` field.")
+                    continue
+                elif event == "ADD":
+                    entry = {
+                        "id": str(uuid.uuid4()),
+                        "text": resp.get("text"),
+                        "categories": resp.get("categories"),
+                        "payload": build_create_payload(resp.get("text"), resp.get("categories"), metadata),
+                        "result": {
+                            "memory": resp.get("text"),
+                            "event": event,
+                            "categories": resp.get("categories"),
+                        },
+                    }
+                elif event == "UPDATE":
+                    memory_id = temp_uuid_mapping[resp.get("id")]
+                    existing_payload = existing_payloads[memory_id]
+                    entry = {
+                        "id": memory_id,
+                        "text": resp.get("text"),
+                        "previous": existing_payload.get("data"),
+                        "payload": build_update_payload(existing_payload, resp.get("text"), metadata),
+                        "result": {
+                            "memory": resp.get("text"),
+                            "event": event,
+                            "previous_memory": resp.get("old_memory"),
+                        },
+                    }
+                elif event == "DELETE":
+                    memory_id = temp_uuid_mapping[resp.get("id")]
+                    entry = {
+                        "id": memory_id,
+                        "text": resp.get("text"),
+                        "previous": existing_payloads[memory_id].get("data"),
+                        "payload": existing_payloads[memory_id],
+                        "result": {"memory": resp.get("text"), "event": event},
+                    }
+                else:
+                    continue
+            except Exception as e:
+                logging.error(f"Error in new_memories_with_actions: {e}")
+                continue
+            entry["event"] = event
+            batch.groups[event].append(entry)
+            batch._entries.append(entry)
+        return batch
+
+    def texts_to_embed(self, existing_embeddings):
+        """Texts of the ADD and UPDATE groups that have no embedding yet, keyed by memory action."""
+        missing = {"add": [], "update": []}
+        for event, action in [("ADD", "add"), ("UPDATE", "update")]:
+            for entry in self.groups[event]:
+                text = entry["text"]
+                if text not in existing_embeddings and text not in missing[action]:
+                    missing[action].append(text)
+        return missing
+
+    def ids(self, event):
+        return [entry["id"] for entry in self.groups[event]]
+
+    def payloads(self, event):
+        return [entry["payload"] for entry in self.groups[event]]
+
+    def vectors(self, event, embeddings):
+        return [embeddings[entry["text"]] for entry in self.groups[event]]
+
+    def history_records(self, applied):
+        """History rows for the groups in `applied`, ready for `SQLiteManager.add_history_many`."""
+        records = []
+        for entry in self._entries:
+            if entry["event"] not in applied:
+                continue
+            if entry["event"] == "ADD":
+                records.append(
+                    {
+                        "memory_id": entry["id"],
+                        "old_memory": None,
+                        "new_memory": entry["text"],
+                        "categories": entry["categories"],
+                        "event": "ADD",
+                        "created_at": entry["payload"]["created_at"],
+                    }
+                )
+            elif entry["event"] == "UPDATE":
+                records.append(
+                    {
+                        "memory_id": entry["id"],
+                        "old_memory": entry["previous"],
+                        "new_memory": entry["text"],
+                        "categories": None,
+                        "event": "UPDATE",
+                        "created_at": entry["payload"]["created_at"],
+                        "updated_at": entry["payload"]["updated_at"],
+                    }
+                )
+            else:
+                records.append(
+                    {
+                        "memory_id": entry["id"],
+                        "old_memory": entry["previous"],
+                        "new_memory": None,
+                        "categories": None,
+                        "event": "DELETE",
+                        "is_deleted": 1,
+                    }
+                )
+        return records
+
+    def results(self, applied):
+        """The per-memory results of the groups in `applied`, in the order the LLM returned them."""
+        return [{"id": entry["id"], **entry["result"]} for entry in self._entries if entry["event"] in applied]
@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+from concurrent.futures import Future
+
+
+def when_all(futures, callback):
+    """Call `callback()` once every future in `futures` is done (immediately if there are none)."""
+    futures = [future for future in futures if future is not None]
+    if not futures:
+        callback()
+        return
+
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        callback()
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+def run_after(executor, dependencies, fn, *args):
+    """
+    Submit `fn(*args)` to `executor` once all `dependencies` are done and return a future for its result.
+
+    Unlike waiting on the dependencies inside the task, no worker thread is held while they run, so chains of
+    dependent tasks cannot exhaust the pool.
+    """
+    result = Future()
+
+    def submit():
+        inner = executor.submit(fn, *args)
+        inner.add_done_callback(lambda done: _copy_outcome(done, result))
+
+    when_all(dependencies, submit)
+    return result
+
+
+def _copy_outcome(source, target):
+    exception = source.exception()
+    if exception is not None:
+        target.set_exception(exception)
+    else:
+        target.set_result(source.result())
+
+
+class AddManyCheckpoint:
+    """
+    Append-only record of the conversations `Memory.add_many` has finished.
+
+    Each line holds the JSON-encoded id of one completed conversation, so an interrupted backfill can be
+    resumed by running it again with the same checkpoint file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._done = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self._done.add(json.loads(line))
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key):
+        return key in self._done
+
+    def __len__(self):
+        return len(self._done)
+
+    def mark_done(self, key):
+        with self._lock:
+            self._file.write(json.dumps(key) + "\n")
+            self._file.flush()
+            self._done.add(key)
+
+    def close(self):
+        self._file.close()
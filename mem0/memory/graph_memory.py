@@ -1,22 +1,13 @@
 import logging
+import threading
 
 from mem0.memory.utils import format_entities
 
-try:
-    import MicroTokenizer
-except ImportError:
-    raise ImportError("MicroTokenizer is not installed. Please install it using pip install MicroTokenizer")
-
 try:
     from langchain_neo4j import Neo4jGraph
 except ImportError:
     raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -26,12 +17,18 @@ from mem0.graphs.tools import (
     RELATIONS_TOOL,
 )
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages, get_extract_entities_prompt, get_extract_relations_prompt
-from mem0.utils.factory import EmbedderFactory, LlmFactory
+from mem0.utils.factory import EmbedderFactory, LlmFactory, RerankerFactory
 
 logger = logging.getLogger(__name__)
 
+# Label shared by every entity node so that a single vector index covers all entity types
+ENTITY_LABEL = "__Entity__"
+
 
 class MemoryGraph:
+    # Candidates fetched from the vector index per embedding before falling back to scoring the user's nodes locally
+    MAX_VECTOR_INDEX_CANDIDATES = 10_000
+
     def __init__(self, config):
         self.config = config
         self.graph = Neo4jGraph(
@@ -39,7 +36,9 @@ class MemoryGraph:
             self.config.graph_store.config.username,
             self.config.graph_store.config.password,
         )
-        self.embedding_model = EmbedderFactory.create(self.config.embedder.provider, self.config.embedder.config)
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.embedder.cache
+        )
 
         self.llm_provider = "openai_structured"
         self.llm_config = self.config.llm.config
@@ -50,10 +49,25 @@ class MemoryGraph:
             self.llm_config = self.config.graph_store.llm.config
 
         self.llm = LlmFactory.create(self.llm_provider, self.llm_config)
+        self._reranker = None
         self.user_id = None
         self.threshold = 0.7
+        self.similarity_search = self.config.graph_store.config.similarity_search
+        self.vector_index_name = self.config.graph_store.config.vector_index_name
+        self.vector_index_candidates = self.config.graph_store.config.vector_index_candidates
+        self._vector_index_ready = False
+        self._vector_index_lock = threading.Lock()
         self.structured_output_provider = ["azure_openai_structured", "openai_structured", "aliyun"]
 
+    @property
+    def reranker(self):
+        # Created on first search: the default BM25 reranker imports a slow-loading tokenizer
+        if self._reranker is None:
+            self._reranker = RerankerFactory.create(
+                self.config.reranker.provider, self.config.reranker.config, self.embedding_model
+            )
+        return self._reranker
+
     def add(self, data, filters, custom_node_types=None, custom_relations=None, graph_prompt=None, includes=None, excludes=None):
         """
         Adds data to the graph.
@@ -67,7 +81,6 @@ class MemoryGraph:
         search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
         to_be_deleted = self._get_delete_triples_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_relations = self._delete_relations(to_be_deleted, filters["user_id"])
         added_triples = self._add_triples(to_be_added, filters["user_id"], entity_type_map)
@@ -94,29 +107,14 @@ class MemoryGraph:
         if not search_output:
             return []
 
-        search_outputs_sequence = [
-            [item["source"], item["relatationship"], item["destination"]] for item in search_output
-        ]
-        # TODO 使用外部模型来进行重排序
-        # print(search_outputs_sequence)
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = MicroTokenizer.cut(query) # 多语言切片
-
-        # 计算每个文档的 BM25 评分
-        scores = []
-        for i in range(len(search_outputs_sequence)):
-            score = bm25.get_scores(tokenized_query)
-            scores.append(score)
-            # print(f"BM25 Score for document {i}: {score}")
-
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
-        # BM25基于词频进行查询，在片段较少的情况下会排序失败
-        # 多语言的情况下也会失败
+        documents = [" ".join([item["source"], item["relatationship"], item["destination"]]) for item in search_output]
+        # The triples' text has no stored embedding (only their nodes do), so an embedding reranker embeds it
+        reranked_results = self.reranker.rerank(query, documents, top_n=self.config.reranker.top_n)
 
         search_results = []
-        for item in reranked_results:
-            search_results.append({"source": item[0], "relationship": item[1], "destination": item[2]})
+        for idx, _ in reranked_results:
+            item = search_output[idx]
+            search_results.append({"source": item["source"], "relationship": item["relatationship"], "destination": item["destination"]})
 
         logger.info(f"Returned {len(search_results)} search results\n")
 
@@ -228,44 +226,161 @@ class MemoryGraph:
 
     def _search_graph_db(self, node_list, filters, limit=100):
         """Search similar nodes among and their respective incoming and outgoing relations."""
+        if not node_list:
+            return []
+        node_embeddings = self.embedding_model.embed_batch(node_list)
+        similar_nodes = self._find_similar_nodes(node_embeddings, filters["user_id"], self.threshold)
+
+        rows = [
+            {"idx": idx, "id": node_id, "similarity": similarity}
+            for idx, matches in enumerate(similar_nodes)
+            for node_id, similarity in matches
+        ]
+        if not rows:
+            return []
+
+        cypher_query = """
+        UNWIND $rows AS row
+        MATCH (n)
+        WHERE elementId(n) = row.id
+        MATCH (n)-[r]-(m)
+        WITH row, r, startNode(r) AS s, endNode(r) AS d
+        RETURN DISTINCT row.idx AS idx, s.name AS source, elementId(s) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, d.name AS destination, elementId(d) AS destination_id, row.similarity AS similarity
+        """
+        relations = self.graph.query(cypher_query, params={"rows": rows})
+
+        # Keep the `limit` most similar relations per entity, as each entity used to be searched on its own
         result_triples = []
+        for idx in range(len(node_list)):
+            triples = sorted((r for r in relations if r["idx"] == idx), key=lambda r: r["similarity"], reverse=True)
+            for triple in triples[:limit]:
+                triple = dict(triple)
+                del triple["idx"]
+                result_triples.append(triple)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            cypher_query = """
-            MATCH (n)
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
-            WITH n,
-                round(reduce(dot = 0.0, i IN range(0, size(n.embedding)-1) | dot + n.embedding[i] * $n_embedding[i]) /
-                (sqrt(reduce(l2 = 0.0, i IN range(0, size(n.embedding)-1) | l2 + n.embedding[i] * n.embedding[i])) *
-                sqrt(reduce(l2 = 0.0, i IN range(0, size($n_embedding)-1) | l2 + $n_embedding[i] * $n_embedding[i]))), 4) AS similarity
-            WHERE similarity >= $threshold
-            MATCH (n)-[r]->(m)
-            RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id, similarity
-            UNION
-            MATCH (n)
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
-            WITH n,
-                round(reduce(dot = 0.0, i IN range(0, size(n.embedding)-1) | dot + n.embedding[i] * $n_embedding[i]) /
-                (sqrt(reduce(l2 = 0.0, i IN range(0, size(n.embedding)-1) | l2 + n.embedding[i] * n.embedding[i])) *
-                sqrt(reduce(l2 = 0.0, i IN range(0, size($n_embedding)-1) | l2 + $n_embedding[i] * $n_embedding[i]))), 4) AS similarity
-            WHERE similarity >= $threshold
-            MATCH (m)-[r]->(n)
-            RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id, similarity
-            ORDER BY similarity DESC
-            LIMIT $limit
-            """
+        return result_triples
+
+    def _find_similar_nodes(self, embeddings, user_id, threshold, limit=None):
+        """
+        Find the user's nodes whose embedding has a cosine similarity of at least `threshold` with each embedding.
+
+        Returns:
+            list: For each embedding, a list of (element_id, similarity) pairs sorted by decreasing similarity,
+                truncated to `limit` pairs if given.
+        """
+        if not embeddings:
+            return []
+        if self._use_vector_index(len(embeddings[0])):
+            matches = self._find_similar_nodes_with_index(embeddings, user_id, threshold, limit)
+        else:
+            matches = self._find_similar_nodes_locally(embeddings, user_id, threshold)
+        return [pairs[:limit] if limit else pairs for pairs in matches]
+
+    def _use_vector_index(self, dimensions):
+        """Whether similarity search should go through the Neo4j vector index, creating the index on first use."""
+        if self.similarity_search == "local":
+            return False
+        if self._vector_index_ready:
+            return True
+
+        with self._vector_index_lock:
+            if self._vector_index_ready:
+                return True
+            try:
+                self.graph.query(
+                    f"""
+                    CREATE VECTOR INDEX {self.vector_index_name} IF NOT EXISTS
+                    FOR (n:{ENTITY_LABEL}) ON (n.embedding)
+                    OPTIONS {{indexConfig: {{`vector.dimensions`: {int(dimensions)}, `vector.similarity_function`: 'cosine'}}}}
+                    """
+                )
+                # Nodes created before the index existed do not carry the shared label yet
+                self.graph.query(
+                    f"MATCH (n) WHERE n.embedding IS NOT NULL AND NOT n:{ENTITY_LABEL} SET n:{ENTITY_LABEL}"
+                )
+            except Exception as e:
+                if self.similarity_search == "vector_index":
+                    raise
+                logger.warning(f"Neo4j vector index unavailable, scoring node embeddings locally instead: {e}")
+                self.similarity_search = "local"
+                return False
+            self._vector_index_ready = True
+            return True
+
+    def _find_similar_nodes_with_index(self, embeddings, user_id, threshold, limit=None):
+        """
+        The index returns the global nearest neighbours, which are filtered by user afterwards, so other users' nodes
+        can crowd the user's matches out of the candidates. An embedding is settled once its candidates run out, fall
+        below `threshold` or hold `limit` matches; the others are queried again with twice the candidates, and scored
+        locally once `MAX_VECTOR_INDEX_CANDIDATES` would be exceeded.
+        """
+        # Neo4j reports cosine scores normalised to [0, 1] as (1 + cosine) / 2
+        cypher = """
+        UNWIND range(0, size($embeddings) - 1) AS idx
+        CALL db.index.vector.queryNodes($index_name, $candidates, $embeddings[idx]) YIELD node, score
+        WITH idx, node, round(2 * score - 1, 4) AS similarity
+        ORDER BY idx, similarity DESC
+        RETURN idx, count(node) AS returned, min(similarity) AS lowest,
+               collect(CASE WHEN node.user_id = $user_id AND similarity >= $threshold
+                            THEN {id: elementId(node), similarity: similarity} END) AS matches
+        """
+        matches = [[] for _ in embeddings]
+        pending = list(range(len(embeddings)))
+        candidates = self.vector_index_candidates
+        while pending:
             params = {
-                "n_embedding": n_embedding,
-                "threshold": self.threshold,
-                "user_id": filters["user_id"],
-                "limit": limit,
+                "embeddings": [embeddings[i] for i in pending],
+                "index_name": self.vector_index_name,
+                "candidates": candidates,
+                "user_id": user_id,
+                "threshold": threshold,
             }
-            ans = self.graph.query(cypher_query, params=params)
-            result_triples.extend(ans)
+            unsettled = []
+            for row in self.graph.query(cypher, params=params):
+                idx = pending[row["idx"]]
+                matches[idx] = [(match["id"], match["similarity"]) for match in row["matches"]]
+                cut_off = row["returned"] >= candidates and row["lowest"] >= threshold
+                if cut_off and not (limit and len(matches[idx]) >= limit):
+                    unsettled.append(idx)
+            pending = unsettled
+            candidates *= 2
+            if pending and candidates > self.MAX_VECTOR_INDEX_CANDIDATES:
+                local = self._find_similar_nodes_locally([embeddings[i] for i in pending], user_id, threshold)
+                for idx, pairs in zip(pending, local):
+                    matches[idx] = pairs
+                break
+        return matches
+
+    def _find_similar_nodes_locally(self, embeddings, user_id, threshold):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is not installed. Please install it using pip install numpy")
 
-        return result_triples
+        cypher = """
+        MATCH (n)
+        WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
+        RETURN elementId(n) AS id, n.embedding AS embedding
+        """
+        candidates = self.graph.query(cypher, params={"user_id": user_id})
+        if not candidates:
+            return [[] for _ in embeddings]
+
+        candidate_ids = [candidate["id"] for candidate in candidates]
+        candidate_matrix = np.asarray([candidate["embedding"] for candidate in candidates], dtype=np.float32)
+        query_matrix = np.asarray(embeddings, dtype=np.float32)
+        candidate_norms = np.linalg.norm(candidate_matrix, axis=1)
+        query_norms = np.linalg.norm(query_matrix, axis=1)
+        denominator = np.outer(query_norms, candidate_norms)
+        denominator[denominator == 0] = np.inf
+        similarities = (query_matrix @ candidate_matrix.T / denominator).astype(np.float64).round(4)
+
+        matches = []
+        for row in similarities:
+            selected = np.flatnonzero(row >= threshold)
+            selected = selected[np.argsort(-row[selected], kind="stable")]
+            matches.append([(candidate_ids[i], round(float(row[i]), 4)) for i in selected])
+        return matches
 
     def _get_delete_triples_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
@@ -295,37 +410,52 @@ class MemoryGraph:
         return to_be_deleted
 
     def _delete_relations(self, to_be_deleted, user_id):
-        """Delete the outdated relations from the graph."""
-        results = []
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relatationship = item["relationship"]
+        """Delete the outdated relations from the graph, with one UNWIND query per relationship type."""
+        groups = {}
+        for idx, item in enumerate(to_be_deleted):
+            groups.setdefault(item["relationship"], []).append(
+                {"idx": idx, "source": item["source"], "destination": item["destination"]}
+            )
 
-            # Delete the specific relationship between nodes
+        rows_by_item = [[] for _ in to_be_deleted]
+        for relatationship, rows in groups.items():
             cypher = f"""
-            MATCH (n {{name: $source_name, user_id: $user_id}})
+            UNWIND $rows AS row
+            MATCH (n {{name: row.source, user_id: $user_id}})
             -[r:{relatationship}]->
-            (m {{name: $dest_name, user_id: $user_id}})
+            (m {{name: row.destination, user_id: $user_id}})
             DELETE r
             RETURN 
+                row.idx AS idx,
                 n.name AS source,
                 m.name AS target,
                 type(r) AS relationship
             """
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+            for result in self.graph.query(cypher, params={"rows": rows, "user_id": user_id}):
+                result = dict(result)
+                rows_by_item[result.pop("idx")].append(result)
+        return rows_by_item
 
     def _add_triples(self, to_be_added, user_id, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
-        results = []
-        for item in to_be_added:
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
+
+        Every distinct entity name is embedded and matched against existing nodes once, then the triples are
+        written with one UNWIND query per combination of relationship type, node labels and resolution outcome.
+        """
+        if not to_be_added:
+            return []
+
+        entity_names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
+        # search for the nodes with the closest embeddings
+        similar_nodes = self._find_similar_nodes(
+            [entity_embeddings[name] for name in entity_names], user_id, threshold=0.9, limit=1
+        )
+        entity_node_ids = {name: matches[0][0] if matches else None for name, matches in zip(entity_names, similar_nodes)}
+
+        groups = {}
+        for idx, item in enumerate(to_be_added):
             # entities
             source = item["source"]
             destination = item["destination"]
@@ -336,187 +466,107 @@ class MemoryGraph:
             if isinstance(source_types, str):
                 source_types = [source_types]
             destination_types = entity_type_map.get(destination, "unknown")
- 
             if isinstance(destination_types, str):
                 destination_types = [destination_types]
 
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, user_id, threshold=0.9)
-            destination_node_search_result = self._search_destination_node(dest_embedding, user_id, threshold=0.9)
-
-            # 如果目标节点不存在，但源节点存在
-            if not destination_node_search_result and source_node_search_result:
-                destination_labels = ':'.join(destination_types)
-                cypher = f"""
-                    MATCH (source)
-                    WHERE elementId(source) = $source_id
-                    MERGE (destination:{destination_labels} {{name: $destination_name, user_id: $user_id}})
-                    ON CREATE SET
-                        destination.created = timestamp(),
-                        destination.embedding = $destination_embedding
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
-                    """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "relationship": relationship,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
-
-            # 如果目标节点存在，但源节点不存在
-            elif destination_node_search_result and not source_node_search_result:
-                source_labels = ':'.join(source_types)
-                cypher = f"""
-                    MATCH (destination)
-                    WHERE elementId(destination) = $destination_id
-                    MERGE (source:{source_labels} {{name: $source_name, user_id: $user_id}})
-                    ON CREATE SET
-                        source.created = timestamp(),
-                        source.embedding = $source_embedding
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
-                    """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
+            source_id = entity_node_ids[source]
+            destination_id = entity_node_ids[destination]
+            # Labels only matter for nodes that are merged by name
+            key = (
+                relationship,
+                None if source_id else ":".join(source_types),
+                None if destination_id else ":".join(destination_types),
+            )
+            groups.setdefault(key, []).append(
+                {
+                    "idx": idx,
+                    "source_id": source_id,
+                    "destination_id": destination_id,
                     "source_name": source,
-                    "relationship": relationship,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
-
-            # 如果源节点和目标节点都存在
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                    MATCH (source)
-                    WHERE elementId(source) = $source_id
-                    MATCH (destination)
-                    WHERE elementId(destination) = $destination_id
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created_at = timestamp(),
-                        r.updated_at = timestamp()
-                    RETURN source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
-                    """
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                    "relationship": relationship,
+                    "destination_name": destination,
+                    "source_embedding": entity_embeddings[source],
+                    "destination_embedding": entity_embeddings[destination],
                 }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
-
-            # 如果源节点和目标节点都不存在
-            elif not source_node_search_result and not destination_node_search_result:
-                source_labels = ':'.join(source_types)
-                destination_labels = ':'.join(destination_types)
-                cypher = f"""
-                    MERGE (n:{source_labels} {{name: $source_name, user_id: $user_id}})
-                    ON CREATE SET n.created = timestamp(), n.embedding = $source_embedding
-                    ON MATCH SET n.embedding = $source_embedding
-                    MERGE (m:{destination_labels} {{name: $dest_name, user_id: $user_id}})
-                    ON CREATE SET m.created = timestamp(), m.embedding = $dest_embedding
-                    ON MATCH SET m.embedding = $dest_embedding
-                    MERGE (n)-[rel:{relationship}]->(m)
-                    ON CREATE SET rel.created = timestamp()
-                    RETURN n.name AS source, labels(n) AS source_labels, type(rel) AS relationship, m.name AS target, labels(m) AS target_labels
-                    """
+            )
 
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
+        results = [[] for _ in to_be_added]
+        for (relationship, source_labels, destination_labels), rows in groups.items():
+            cypher = self._add_triples_query(relationship, source_labels, destination_labels)
+            for result in self.graph.query(cypher, params={"rows": rows, "user_id": user_id}):
+                result = dict(result)
+                results[result.pop("idx")].append(result)
         return results
 
+    def _add_triples_query(self, relationship, source_labels, destination_labels):
+        """UNWIND query writing a group of triples; a label string of None means the node was resolved by id."""
+        # 如果目标节点不存在，但源节点存在
+        if source_labels is None and destination_labels is not None:
+            return f"""
+                UNWIND $rows AS row
+                MATCH (source)
+                WHERE elementId(source) = row.source_id
+                MERGE (destination:{destination_labels} {{name: row.destination_name, user_id: $user_id}})
+                ON CREATE SET
+                    destination.created = timestamp(),
+                    destination.embedding = row.destination_embedding
+                SET destination:{ENTITY_LABEL}
+                MERGE (source)-[r:{relationship}]->(destination)
+                ON CREATE SET 
+                    r.created = timestamp()
+                RETURN row.idx AS idx, source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
+                """
+
+        # 如果目标节点存在，但源节点不存在
+        if source_labels is not None and destination_labels is None:
+            return f"""
+                UNWIND $rows AS row
+                MATCH (destination)
+                WHERE elementId(destination) = row.destination_id
+                MERGE (source:{source_labels} {{name: row.source_name, user_id: $user_id}})
+                ON CREATE SET
+                    source.created = timestamp(),
+                    source.embedding = row.source_embedding
+                SET source:{ENTITY_LABEL}
+                MERGE (source)-[r:{relationship}]->(destination)
+                ON CREATE SET 
+                    r.created = timestamp()
+                RETURN row.idx AS idx, source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
+                """
+
+        # 如果源节点和目标节点都存在
+        if source_labels is None and destination_labels is None:
+            return f"""
+                UNWIND $rows AS row
+                MATCH (source)
+                WHERE elementId(source) = row.source_id
+                MATCH (destination)
+                WHERE elementId(destination) = row.destination_id
+                MERGE (source)-[r:{relationship}]->(destination)
+                ON CREATE SET 
+                    r.created_at = timestamp(),
+                    r.updated_at = timestamp()
+                RETURN row.idx AS idx, source.name AS source, labels(source) AS source_labels, type(r) AS relationship, destination.name AS target, labels(destination) AS target_labels
+                """
+
+        # 如果源节点和目标节点都不存在
+        return f"""
+            UNWIND $rows AS row
+            MERGE (n:{source_labels} {{name: row.source_name, user_id: $user_id}})
+            ON CREATE SET n.created = timestamp(), n.embedding = row.source_embedding
+            ON MATCH SET n.embedding = row.source_embedding
+            SET n:{ENTITY_LABEL}
+            MERGE (m:{destination_labels} {{name: row.destination_name, user_id: $user_id}})
+            ON CREATE SET m.created = timestamp(), m.embedding = row.destination_embedding
+            ON MATCH SET m.embedding = row.destination_embedding
+            SET m:{ENTITY_LABEL}
+            MERGE (n)-[rel:{relationship}]->(m)
+            ON CREATE SET rel.created = timestamp()
+            RETURN row.idx AS idx, n.name AS source, labels(n) AS source_labels, type(rel) AS relationship, m.name AS target, labels(m) AS target_labels
+            """
+
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
             item["source"] = item["source"].lower().replace(" ", "_")
             item["relationship"] = item["relationship"].lower().replace(" ", "_")
             item["destination"] = item["destination"].lower().replace(" ", "_")
         return entity_list
-
-    def _search_source_node(self, source_embedding, user_id, threshold=0.9):
-        cypher = """
-            MATCH (source_candidate)
-            WHERE source_candidate.embedding IS NOT NULL 
-            AND source_candidate.user_id = $user_id
-
-            WITH source_candidate,
-                round(
-                    reduce(dot = 0.0, i IN range(0, size(source_candidate.embedding)-1) |
-                        dot + source_candidate.embedding[i] * $source_embedding[i]) /
-                    (sqrt(reduce(l2 = 0.0, i IN range(0, size(source_candidate.embedding)-1) |
-                        l2 + source_candidate.embedding[i] * source_candidate.embedding[i])) *
-                    sqrt(reduce(l2 = 0.0, i IN range(0, size($source_embedding)-1) |
-                        l2 + $source_embedding[i] * $source_embedding[i])))
-                , 4) AS source_similarity
-            WHERE source_similarity >= $threshold
-
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(source_candidate)
-            """
-
-        params = {
-            "source_embedding": source_embedding,
-            "user_id": user_id,
-            "threshold": threshold,
-        }
-
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    def _search_destination_node(self, destination_embedding, user_id, threshold=0.9):
-        cypher = """
-            MATCH (destination_candidate)
-            WHERE destination_candidate.embedding IS NOT NULL 
-            AND destination_candidate.user_id = $user_id
-
-            WITH destination_candidate,
-                round(
-                    reduce(dot = 0.0, i IN range(0, size(destination_candidate.embedding)-1) |
-                        dot + destination_candidate.embedding[i] * $destination_embedding[i]) /
-                    (sqrt(reduce(l2 = 0.0, i IN range(0, size(destination_candidate.embedding)-1) |
-                        l2 + destination_candidate.embedding[i] * destination_candidate.embedding[i])) *
-                    sqrt(reduce(l2 = 0.0, i IN range(0, size($destination_embedding)-1) |
-                        l2 + $destination_embedding[i] * $destination_embedding[i])))
-                , 4) AS destination_similarity
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(destination_candidate)
-            """
-        params = {
-            "destination_embedding": destination_embedding,
-            "user_id": user_id,
-            "threshold": threshold,
-        }
-
-        result = self.graph.query(cypher, params=params)
-        return result
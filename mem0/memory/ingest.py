@@ -0,0 +1,370 @@
+import concurrent.futures
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Statuses a job can no longer leave
+FINISHED_STATUSES = ("done", "failed")
+
+
+class AddJobQueue:
+    """
+    Durable FIFO of deferred `Memory.add` calls, stored in SQLite.
+
+    Jobs of the same user_id/agent_id/run_id are handed out one at a time and in enqueue order, so later
+    conversations are always reconciled against the memories written by earlier ones. Jobs are tagged with
+    the owner (the identity of the vector store they write to) that enqueued them, so several stores can share a
+    file.
+
+    A claimed job is leased to the claiming queue for `lease_timeout` seconds and the lease is renewed with
+    `heartbeat` while the job runs. Jobs whose lease expired, e.g. because their process died, are queued again;
+    jobs still running in another process are left alone.
+    """
+
+    def __init__(self, path, owner, lease_timeout=60.0):
+        self.path = path
+        self.owner = owner
+        self.lease_timeout = lease_timeout
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.Lock()
+        self._create_table()
+
+    def _create_table(self):
+        with self._lock:
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS add_jobs (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT UNIQUE NOT NULL,
+                    owner TEXT NOT NULL,
+                    user_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    worker TEXT,
+                    lease_expires REAL
+                );
+                CREATE INDEX IF NOT EXISTS add_jobs_pending ON add_jobs (owner, status, user_key, seq);
+                """
+            )
+            # Queues created before leases existed
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(add_jobs)")}
+            for column, column_type in (("worker", "TEXT"), ("lease_expires", "REAL")):
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE add_jobs ADD COLUMN {column} {column_type}")
+
+    def enqueue(self, user_key, messages, kwargs):
+        job_id = str(uuid.uuid4())
+        payload = json.dumps({"messages": messages, "kwargs": kwargs})
+        with self._lock:
+            self.connection.execute(
+                "INSERT INTO add_jobs (id, owner, user_key, payload, status, created_at) VALUES (?, ?, ?, ?, 'queued', ?)",
+                (job_id, self.owner, user_key, payload, time.time()),
+            )
+        return job_id
+
+    def claim(self, limit):
+        """
+        Lease up to `limit` runnable jobs to this queue and return them as `(id, messages, kwargs)`.
+
+        A job is runnable when it is the oldest queued job of its user key and no job of that key is running.
+        Jobs whose lease expired are queued again first.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._requeue_expired()
+                rows = self.connection.execute(
+                    """
+                    SELECT j.id, j.payload FROM add_jobs j
+                    WHERE j.owner = ? AND j.status = 'queued'
+                      AND j.seq = (
+                          SELECT MIN(q.seq) FROM add_jobs q
+                          WHERE q.owner = j.owner AND q.user_key = j.user_key AND q.status = 'queued'
+                      )
+                      AND NOT EXISTS (
+                          SELECT 1 FROM add_jobs r
+                          WHERE r.owner = j.owner AND r.user_key = j.user_key AND r.status = 'running'
+                      )
+                    ORDER BY j.seq
+                    LIMIT ?
+                    """,
+                    (self.owner, limit),
+                ).fetchall()
+                now = time.time()
+                self.connection.executemany(
+                    """
+                    UPDATE add_jobs SET status = 'running', started_at = ?, worker = ?, lease_expires = ?
+                    WHERE id = ?
+                    """,
+                    [(now, self.worker_id, now + self.lease_timeout, job_id) for job_id, _ in rows],
+                )
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+        jobs = []
+        for job_id, payload in rows:
+            payload = json.loads(payload)
+            jobs.append((job_id, payload["messages"], payload["kwargs"]))
+        return jobs
+
+    def finish(self, job_id, result=None, error=None):
+        with self._lock:
+            self.connection.execute(
+                """
+                UPDATE add_jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_expires = NULL
+                WHERE id = ?
+                """,
+                (
+                    "failed" if error is not None else "done",
+                    json.dumps(result, default=str) if error is None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def heartbeat(self, job_ids):
+        """Extend the leases this queue holds on running jobs."""
+        if not job_ids:
+            return
+        with self._lock:
+            self.connection.executemany(
+                "UPDATE add_jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                [(time.time() + self.lease_timeout, job_id, self.worker_id) for job_id in job_ids],
+            )
+
+    def _requeue_expired(self):
+        # Jobs claimed before leases existed have none, and were left by a previous process
+        cursor = self.connection.execute(
+            """
+            UPDATE add_jobs SET status = 'queued', started_at = NULL, worker = NULL, lease_expires = NULL
+            WHERE owner = ? AND status = 'running' AND (lease_expires IS NULL OR lease_expires < ?)
+            """,
+            (self.owner, time.time()),
+        )
+        return cursor.rowcount
+
+    def requeue_expired(self):
+        """Put running jobs whose lease expired back in the queue. Returns how many were requeued."""
+        with self._lock:
+            return self._requeue_expired()
+
+    def prune(self, older_than):
+        """Delete finished jobs that finished before the `older_than` timestamp."""
+        with self._lock:
+            self.connection.execute(
+                "DELETE FROM add_jobs WHERE owner = ? AND status IN ('done', 'failed') AND finished_at < ?",
+                (self.owner, older_than),
+            )
+
+    def get(self, job_id):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT id, status, result, error, created_at, started_at, finished_at FROM add_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "status": row[1],
+            "result": json.loads(row[2]) if row[2] is not None else None,
+            "error": row[3],
+            "created_at": row[4],
+            "started_at": row[5],
+            "finished_at": row[6],
+        }
+
+    def counts(self):
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*), MIN(created_at) FROM add_jobs WHERE owner = ? GROUP BY status",
+                (self.owner,),
+            ).fetchall()
+        counts = {status: 0 for status in ("queued", "running", *FINISHED_STATUSES)}
+        oldest_queued = None
+        for status, count, oldest in rows:
+            counts[status] = count
+            if status == "queued":
+                oldest_queued = oldest
+        return counts, oldest_queued
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+class DeferredAddWorker:
+    """
+    Bounded worker pool draining an `AddJobQueue` through a callable that performs the actual add.
+
+    A dispatcher thread claims runnable jobs whenever a worker slot is free. Enqueueing blocks while
+    `max_pending` jobs are waiting, which pushes back on producers that outpace the LLM. The dispatcher also
+    renews the leases of the running jobs, a third of the way into `queue.lease_timeout`.
+    """
+
+    def __init__(self, queue, run_job, concurrency=4, max_pending=1000, retention=7 * 24 * 3600, poll_interval=1.0):
+        self.queue = queue
+        self.run_job = run_job
+        self.concurrency = max(1, concurrency)
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._running = 0
+        self._pending = 0
+        # Bumped whenever a job is submitted or finishes, so the dispatcher never misses a wake-up
+        self._version = 0
+        self._active = set()
+        self._stats = {"completed": 0, "failed": 0, "throttled": 0, "run_seconds": 0.0, "queue_seconds": 0.0}
+        self._closed = False
+
+        recovered = self.queue.requeue_expired()
+        if recovered:
+            logger.warning(f"Requeued {recovered} deferred add jobs whose worker stopped renewing their lease")
+        self.queue.prune(time.time() - retention)
+        self._pending = self.queue.counts()[0]["queued"]
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="mem0-deferred-add"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch, name="mem0-deferred-add-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, user_key, messages, kwargs, timeout=None):
+        """
+        Enqueue one add and return its job id, waiting while the queue holds `max_pending` jobs.
+
+        Raises:
+            TimeoutError: If the queue stays full for longer than `timeout` seconds.
+        """
+        with self._condition:
+            if self._pending >= self.max_pending:
+                self._stats["throttled"] += 1
+                if not self._condition.wait_for(lambda: self._pending < self.max_pending or self._closed, timeout):
+                    raise TimeoutError(f"Deferred add queue is full ({self.max_pending} pending jobs)")
+            job_id = self.queue.enqueue(user_key, messages, kwargs)
+            self._pending += 1
+            self._version += 1
+            self._condition.notify_all()
+        return job_id
+
+    def _renew_leases(self):
+        with self._condition:
+            job_ids = list(self._active)
+        try:
+            self.queue.heartbeat(job_ids)
+        except Exception as e:
+            logger.error(f"Error renewing the leases of deferred add jobs: {e}")
+
+    def _dispatch(self):
+        next_heartbeat = time.monotonic() + self.queue.lease_timeout / 3
+        while True:
+            if time.monotonic() >= next_heartbeat:
+                self._renew_leases()
+                next_heartbeat = time.monotonic() + self.queue.lease_timeout / 3
+            with self._condition:
+                if self._closed:
+                    return
+                free = self.concurrency - self._running
+                if free <= 0:
+                    self._condition.wait(self.poll_interval)
+                    continue
+                version = self._version
+            try:
+                jobs = self.queue.claim(free)
+            except Exception as e:
+                logger.error(f"Error claiming deferred add jobs: {e}")
+                jobs = []
+            with self._condition:
+                if not jobs:
+                    # Nothing runnable, e.g. the remaining jobs wait for a running job of the same user. Sleep until
+                    # a job is submitted or finishes; the timeout also picks up jobs enqueued by other processes.
+                    self._condition.wait_for(lambda: self._version != version or self._closed, self.poll_interval)
+                    continue
+                self._running += len(jobs)
+                self._active.update(job[0] for job in jobs)
+                self._pending = max(0, self._pending - len(jobs))
+                self._condition.notify_all()
+            for job in jobs:
+                self._executor.submit(self._run, *job)
+
+    def _run(self, job_id, messages, kwargs):
+        started = time.time()
+        result = error = None
+        try:
+            result = self.run_job(messages, kwargs)
+        except Exception as e:
+            logger.error(f"Deferred add job {job_id} failed: {e}")
+            error = str(e)
+        try:
+            self.queue.finish(job_id, result=result, error=error)
+        finally:
+            job = self.queue.get(job_id)
+            with self._condition:
+                self._running -= 1
+                self._active.discard(job_id)
+                self._version += 1
+                self._stats["failed" if error is not None else "completed"] += 1
+                self._stats["run_seconds"] += time.time() - started
+                if job and job["started_at"]:
+                    self._stats["queue_seconds"] += job["started_at"] - job["created_at"]
+                self._condition.notify_all()
+
+    def wait(self, job_id, timeout=None):
+        """
+        Block until the job has finished and return it.
+
+        Raises:
+            KeyError: If there is no job with this id.
+            TimeoutError: If the job has not finished after `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.queue.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown deferred add job: {job_id}")
+            if job["status"] in FINISHED_STATUSES:
+                return job
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"Deferred add job {job_id} is still {job['status']}")
+            with self._condition:
+                self._condition.wait(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+
+    def stats(self):
+        counts, oldest_queued = self.queue.counts()
+        with self._condition:
+            finished = self._stats["completed"] + self._stats["failed"]
+            return {
+                **counts,
+                "oldest_queued_seconds": time.time() - oldest_queued if oldest_queued is not None else 0.0,
+                "concurrency": self.concurrency,
+                "max_pending": self.max_pending,
+                "throttled": self._stats["throttled"],
+                "avg_run_seconds": self._stats["run_seconds"] / finished if finished else 0.0,
+                "avg_queue_seconds": self._stats["queue_seconds"] / finished if finished else 0.0,
+            }
+
+    def close(self, wait=True):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=wait)
+        self.queue.close()
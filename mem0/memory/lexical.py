@@ -0,0 +1,278 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from mem0.memory.setup import moremem_dir
+
+logger = logging.getLogger(__name__)
+
+# Vector store records read per call when filling the index
+BACKFILL_PAGE_SIZE = 1000
+
+# Han, kana and hangul: scripts written without spaces between words
+_CJK = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"[{_CJK}]+|[^\W{_CJK}]+")
+_CJK_RE = re.compile(rf"[{_CJK}]")
+
+
+class OutputData(BaseModel):
+    id: str
+    score: float
+    payload: Dict
+
+
+def tokenize(text, unigrams=False):
+    """
+    Split text into the terms stored in the lexical index.
+
+    Words are lowercased; runs of CJK characters become overlapping character bigrams, which matches Chinese
+    terms without a word segmenter. A single-character run is kept as a unigram.
+
+    Args:
+        text (str): Text to split.
+        unigrams (bool, optional): Also emit every CJK character on its own, so that documents can be found by
+            one-character queries. Defaults to False.
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if _CJK_RE.match(run) and len(run) > 1:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+            if unigrams:
+                tokens.extend(run)
+        else:
+            tokens.append(run)
+    return tokens
+
+
+class LexicalIndex:
+    """
+    SQLite FTS5 inverted index over the `data` of the memories of one collection, ranked with BM25.
+
+    Used by hybrid search for vector stores without a native keyword search. Payloads are stored alongside the
+    terms so lexical-only hits can be returned without a round-trip to the vector store. The tables are named
+    after the collection and the identity of its vector store, so one file can serve collections of the same
+    name in different stores.
+    """
+
+    def __init__(self, path, collection_name, store_identity=None):
+        self.path = path
+        self.collection_name = collection_name
+        suffix = re.sub(r"\W", "_", f"{collection_name}_{store_identity[:12]}" if store_identity else collection_name)
+        self.docs_table = f"lexical_docs_{suffix}"
+        self.terms_table = f"lexical_terms_{suffix}"
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.Lock()
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._lock:
+            self.connection.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.docs_table} (
+                    rowid INTEGER PRIMARY KEY,
+                    memory_id TEXT UNIQUE NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS {self.terms_table} USING fts5(terms);
+                """
+            )
+
+    def upsert(self, memory_ids, payloads):
+        """Index (or re-index) memories from their vector store payloads."""
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._delete(memory_ids)
+                for memory_id, payload in zip(memory_ids, payloads):
+                    cursor = self.connection.execute(
+                        f"INSERT INTO {self.docs_table} (memory_id, payload) VALUES (?, ?)",
+                        (str(memory_id), json.dumps(payload, default=str)),
+                    )
+                    self.connection.execute(
+                        f"INSERT INTO {self.terms_table} (rowid, terms) VALUES (?, ?)",
+                        (cursor.lastrowid, " ".join(tokenize(payload.get("data") or "", unigrams=True))),
+                    )
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def delete(self, memory_ids):
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._delete(memory_ids)
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def _delete(self, memory_ids):
+        for memory_id in memory_ids:
+            row = self.connection.execute(
+                f"SELECT rowid FROM {self.docs_table} WHERE memory_id = ?", (str(memory_id),)
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(f"DELETE FROM {self.terms_table} WHERE rowid = ?", row)
+                self.connection.execute(f"DELETE FROM {self.docs_table} WHERE rowid = ?", row)
+
+    def search(self, query, limit=5, filters: Optional[Dict] = None):
+        """
+        Return the memories sharing terms with the query, best BM25 match first.
+
+        Returns:
+            list: OutputData hits whose score is the BM25 relevance (higher is better).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        conditions = [f"{self.terms_table} MATCH ?"]
+        params = [" OR ".join(f'"{term}"' for term in terms)]
+        for key, value in (filters or {}).items():
+            conditions.append("json_extract(d.payload, ?) = ?")
+            params.extend([f'$."{key}"', value])
+        with self._lock:
+            rows = self.connection.execute(
+                f"""
+                SELECT d.memory_id, bm25({self.terms_table}) AS rank, d.payload
+                FROM {self.terms_table} JOIN {self.docs_table} d ON d.rowid = {self.terms_table}.rowid
+                WHERE {" AND ".join(conditions)}
+                ORDER BY rank
+                LIMIT ?
+                """,
+                (*params, limit),
+            ).fetchall()
+        # FTS5's bm25() is negated so that ascending order ranks the best match first
+        return [OutputData(id=memory_id, score=-rank, payload=json.loads(payload)) for memory_id, rank, payload in rows]
+
+    def is_empty(self):
+        with self._lock:
+            return self.connection.execute(f"SELECT 1 FROM {self.docs_table} LIMIT 1").fetchone() is None
+
+    def backfill(self, vector_store, page_size=BACKFILL_PAGE_SIZE):
+        """
+        Index every memory of the vector store, one page at a time.
+
+        Returns:
+            int: The number of memories indexed.
+        """
+        indexed, cursor = 0, None
+        while True:
+            memories, cursor = vector_store.list_page(filters=None, limit=page_size, cursor=cursor)
+            if memories:
+                self.upsert([memory.id for memory in memories], [memory.payload for memory in memories])
+                indexed += len(memories)
+            if cursor is None:
+                return indexed
+
+    def rebuild(self, vector_store, page_size=BACKFILL_PAGE_SIZE):
+        """Drop the index and fill it again from the vector store, e.g. after other processes wrote to it."""
+        self.reset()
+        return self.backfill(vector_store, page_size)
+
+    def reset(self):
+        with self._lock:
+            self.connection.executescript(
+                f"DROP TABLE IF EXISTS {self.terms_table}; DROP TABLE IF EXISTS {self.docs_table};"
+            )
+        self._create_tables()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+def create_lexical_index(config, vector_store, collection_name, store_identity=None):
+    """
+    Open the local keyword index that hybrid search needs for this vector store.
+
+    A new or empty index is filled from the memories already in the vector store.
+
+    Args:
+        config (HybridSearchConfig): Hybrid search settings.
+        vector_store (VectorStoreBase): Store whose memories are indexed.
+        collection_name (str): Name of the collection.
+        store_identity (str, optional): `VectorStoreConfig.identity()` of the store. Defaults to None.
+
+    Returns:
+        LexicalIndex: The index, or None when hybrid search is disabled or the store's native keyword search is
+            used: with lexical_index='native', or with 'auto' when it also finds CJK terms.
+
+    Raises:
+        ValueError: If a native keyword search is required but the vector store has none.
+    """
+    if not config.enabled:
+        return None
+    if config.lexical_index == "native" and not vector_store.supports_keyword_search:
+        raise ValueError(f"{type(vector_store).__name__} has no native keyword search, use lexical_index='local'")
+    native = vector_store.supports_keyword_search and (
+        config.lexical_index == "native" or vector_store.keyword_search_segments_cjk
+    )
+    if config.lexical_index == "local" or not native:
+        path = config.path or os.path.join(moremem_dir, "lexical_index.db")
+        index = LexicalIndex(path, collection_name, store_identity)
+        if index.is_empty():
+            try:
+                indexed = index.backfill(vector_store)
+            except Exception as e:
+                # Until the next start, keyword search only finds the memories written from now on
+                logger.error(f"Error filling the keyword index from the vector store: {e}")
+            else:
+                if indexed:
+                    logger.info(f"Indexed {indexed} existing memories for keyword search")
+        return index
+    return None
+
+
+def reciprocal_rank_fusion(rankings, weights=None, k=60):
+    """
+    Fuse ranked lists of ids with weighted reciprocal-rank fusion.
+
+    Each list contributes `weight / (k + rank)` (rank starting at 1) to the score of every id it contains, so
+    results that rank well in several lists rise to the top without comparing their raw scores.
+
+    Args:
+        rankings (list): Lists of ids, best first.
+        weights (list, optional): One weight per list. Defaults to 1.0 for every list.
+        k (int, optional): Damping constant; larger values flatten the contribution of top ranks. Defaults to 60.
+
+    Returns:
+        list: `(id, score)` pairs, highest fused score first.
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def fuse_hits(vector_hits, lexical_hits, config, limit):
+    """
+    Merge vector and lexical search hits with `reciprocal_rank_fusion`.
+
+    Args:
+        vector_hits (list): Vector store search results, best first.
+        lexical_hits (list): Keyword search results, best first.
+        config (HybridSearchConfig): Fusion weights and constant.
+        limit (int): Number of fused hits to return.
+
+    Returns:
+        list: OutputData hits scored with their fused RRF score, highest first.
+    """
+    payloads = {}
+    for hit in [*lexical_hits, *vector_hits]:
+        payloads[str(hit.id)] = hit.payload
+    fused = reciprocal_rank_fusion(
+        [[str(hit.id) for hit in vector_hits], [str(hit.id) for hit in lexical_hits]],
+        weights=[config.vector_weight, config.lexical_weight],
+        k=config.rrf_k,
+    )
+    return [OutputData(id=memory_id, score=score, payload=payloads[memory_id]) for memory_id, score in fused[:limit]]
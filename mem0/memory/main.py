@@ -1,65 +1,473 @@
+import asyncio
 import concurrent
-import hashlib
+import functools
 import json
 import logging
+import os
+import queue
+import threading
 import uuid
 import warnings
-from datetime import datetime
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Literal, Optional, List, Union
 
-import pytz
 from pydantic import ValidationError
 
 from mem0.configs.base import MemoryConfig, MemoryItem
 from mem0.configs.prompts import get_update_memory_messages, get_create_categories_prompt
+from mem0.memory.actions import (
+    EVENT_TELEMETRY_NAMES,
+    MemoryActionBatch,
+    build_create_payload,
+    build_update_payload,
+    index_existing_memories,
+)
 from mem0.memory.base import MemoryBase
-from mem0.memory.setup import setup_config
+from mem0.memory.bulk import AddManyCheckpoint, run_after, when_all
+from mem0.memory.ingest import AddJobQueue, DeferredAddWorker
+from mem0.memory.lexical import create_lexical_index, fuse_hits
+from mem0.memory.search_cache import SCOPE_KEYS, SearchCache
+from mem0.memory.setup import moremem_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
+from mem0.memory.transfer import (
+    EXPORT_PAGE_SIZE,
+    aiter_batches,
+    dump_line,
+    export_header,
+    export_record,
+    history_records,
+    iter_batches,
+    same_embedder,
+    vectors_to_reuse,
+)
 from mem0.memory.utils import (
     get_fact_retrieval_messages,
+    get_fused_memory_messages,
     parse_messages,
     parse_vision_messages,
     remove_code_blocks,
 )
-from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
+from mem0.utils.factory import EmbedderFactory, LlmFactory, RerankerFactory, VectorStoreFactory
 
-# Setup user config
-setup_config()
+# Existing memories retrieved for the single LLM call of the fused add pipeline
+FUSED_CANDIDATE_LIMIT = 10
+
+# Records fetched per vector store call when walking every memory of a user
+LIST_PAGE_SIZE = 1000
 
 # 创建 logger 对象
 logger = logging.getLogger('mem0')
 
-# 设置 `mem0` logger 的日志级别
-logger.setLevel(logging.WARNING)
+_logging_configured = False
+
+
+def _setup_logging():
+    """Attach the console handler on first use rather than at import, so importing mem0 leaves logging alone."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    # 设置 `mem0` logger 的日志级别
+    logger.setLevel(logging.WARNING)
+
+    # 创建控制台 Handler，并设置级别
+    console_handler = logging.StreamHandler()
+
+    # 设置日志输出格式
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    console_handler.setFormatter(formatter)
+
+    # 将 Handler 添加到 logger
+    logger.addHandler(console_handler)
+
+    # 关闭其他库的日志输出
+    logging.getLogger().setLevel(logging.WARNING)  # 关闭默认日志级别为DEBUG的日志，避免无关日志输出
+
+
+def _format_listed_memory(mem):
+    """Format a vector store record the way `get_all` returns it."""
+    excluded_keys = {
+        "user_id",
+        "agent_id",
+        "run_id",
+        "hash",
+        "data",
+        "created_at",
+        "updated_at",
+        "id",
+    }
+    return {
+        **MemoryItem(
+            id=mem.id,
+            memory=mem.payload["data"],
+            hash=mem.payload.get("hash"),
+            created_at=mem.payload.get("created_at"),
+            updated_at=mem.payload.get("updated_at"),
+        ).model_dump(exclude={"score"}),
+        **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
+        **(
+            {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
+            if any(k for k in mem.payload if k not in excluded_keys)
+            else {}
+        ),
+    }
+
+
+def _build_filters_and_metadata(kwargs):
+    """
+    Copies of the `metadata` and `filters` of an `add` call, both carrying its user_id, agent_id and run_id.
+
+    The caller's dicts are left untouched.
+    """
+    metadata = dict(kwargs.get("metadata") or {})
+    filters = dict(kwargs.get("filters") or {})
+    for key in ("user_id", "agent_id", "run_id"):
+        if kwargs.get(key):
+            filters[key] = metadata[key] = kwargs[key]
+    return filters, metadata
+
+
+def _format_definitions(definitions):
+    """Render custom categories, node types or relations, lists of {name: description} dicts, as prompt lines."""
+    if not definitions:
+        return definitions
+    return "\n".join([f"- {key}: {value}" for definition in definitions for key, value in definition.items()])
+
+
+def _resolve_add_params(messages, kwargs, config):
+    """
+    Validate the arguments of `add` and resolve them into the inputs of the vector store and graph stages.
+
+    Images in the messages are left to the caller, which may need the LLM to describe them.
+    """
+    kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    filters, metadata = _build_filters_and_metadata(kwargs)
+    if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
+        raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+
+    includes_dic, excludes_dic = dict(kwargs.get("includes") or {}), dict(kwargs.get("excludes") or {})
+    for dic in [includes_dic, excludes_dic]:
+        dic["vector"] = dic.get("vector")
+        dic["graph"] = dic.get("graph")
+
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    return {
+        "messages": messages,
+        "metadata": metadata,
+        "filters": filters,
+        "infer": kwargs.get("infer", True),
+        "custom_categories": _format_definitions(
+            kwargs.get("custom_categories") or config.vector_store.custom_categories
+        ),
+        "custom_node_types": _format_definitions(
+            kwargs.get("custom_node_types") or config.graph_store.custom_node_types
+        ),
+        "custom_relations": _format_definitions(kwargs.get("custom_relations") or config.graph_store.custom_relations),
+        "prompt": kwargs.get("prompt"),
+        "graph_prompt": kwargs.get("graph_prompt"),
+        "includes": includes_dic,
+        "excludes": excludes_dic,
+    }
+
+
+def _parse_memory_list(response):
+    """Decode an LLM response holding a `memory` list; a response that isn't one yields an empty list."""
+    try:
+        parsed = json.loads(remove_code_blocks(response))
+    except Exception as e:
+        logging.error(f"Invalid JSON response: {e}")
+        parsed = None
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("memory"), list):
+        return {"memory": []}
+    parsed["memory"] = [mem for mem in parsed["memory"] if isinstance(mem, dict)]
+    return parsed
+
+
+def _merge_categories(new_memories_with_actions, add_memories, memories_with_categories):
+    """Copy the categories generated for the ADD memories onto them, and list the ADD memories first."""
+    add_memories_dict = {mem.get("text"): mem for mem in add_memories}
+    for mem in memories_with_categories["memory"]:
+        if mem.get("text") in add_memories_dict:
+            add_memories_dict[mem["text"]]["categories"] = mem.get("categories", "")
+    non_add_memories = [mem for mem in new_memories_with_actions["memory"] if mem.get("event") != "ADD"]
+    new_memories_with_actions["memory"] = add_memories + non_add_memories
+
+
+def _close_stores(memory):
+    """Release the connections and files held by the stores of a Memory or AsyncMemory."""
+    for resource in (memory.lexical_index, memory.vector_store, memory.db):
+        if resource is None:
+            continue
+        try:
+            resource.close()
+        except Exception as e:
+            logger.error(f"Error closing {type(resource).__name__}: {e}")
+
+
+def _embedder_identity(memory):
+    """`(provider, model)` of the embedder, as named in the header of an export."""
+    return memory.config.embedder.provider, getattr(memory.embedding_model.config, "model", None)
+
+
+def _deletion_record(memory):
+    """History row of a memory removed by `delete_all`."""
+    return {
+        "memory_id": memory.id,
+        "old_memory": memory.payload.get("data"),
+        "new_memory": None,
+        "categories": None,
+        "event": "DELETE",
+        "is_deleted": 1,
+    }
+
+
+class _DeletionSnapshot:
+    """
+    What `delete_all` needs to know about the memories it removes, collected while listing them: their history rows,
+    ids and user/agent/run scopes. Only these are kept, not the listed records.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.scopes = {}
+
+    def add(self, memory):
+        self.records.append(_deletion_record(memory))
+        scope = {name: memory.payload[name] for name in SCOPE_KEYS if memory.payload.get(name) is not None}
+        self.scopes[tuple(sorted(scope.items()))] = scope
+
+    @property
+    def ids(self):
+        return [record["memory_id"] for record in self.records]
+
+
+def _scope_filters(params):
+    """The user_id, agent_id and run_id set in `params`."""
+    return {key: params[key] for key in ("user_id", "agent_id", "run_id") if params.get(key)}
+
+
+def _message_contents(messages):
+    """Contents of the non-system messages, stored as they are when `add` doesn't infer memories."""
+    return [message["content"] for message in messages if message["role"] != "system"]
+
+
+def _graph_input(messages, filters):
+    """Text of the conversation for the graph store; graph memories need a user_id and default to "user"."""
+    if filters.get("user_id") is None:
+        filters["user_id"] = "user"
+    return "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
+
+
+def _fact_extraction_messages(messages, custom_prompt, includes=None, excludes=None):
+    """LLM messages asking for the facts worth remembering in `messages`."""
+    system_prompt, user_prompt = get_fact_retrieval_messages(
+        parse_messages(messages), includes, excludes, custom_prompt
+    )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _parse_facts(response):
+    """The `facts` of a fact extraction response; a response that isn't one yields no facts."""
+    try:
+        return json.loads(remove_code_blocks(response))["facts"]
+    except Exception as e:
+        logging.error(f"Error in new_retrieved_facts: {e}")
+        return []
+
+
+def _reconcile_messages(retrieved_old_memory, new_retrieved_facts):
+    """LLM messages asking for the ADD/UPDATE/DELETE decisions merging the facts into the existing memories."""
+    return [{"role": "user", "content": get_update_memory_messages(retrieved_old_memory, new_retrieved_facts)}]
+
+
+def _split_add_memories(response):
+    """Decode the LLM's decisions and pick out the ADD memories, the only ones that get categories."""
+    new_memories_with_actions = _parse_memory_list(response)
+    return new_memories_with_actions, [
+        mem for mem in new_memories_with_actions["memory"] if mem.get("event") == "ADD"
+    ]
+
+
+def _categories_messages(add_memories, custom_categories):
+    """LLM messages asking for the categories of new memories."""
+    return [{"role": "user", "content": get_create_categories_prompt({"memory": add_memories}, custom_categories)}]
+
+
+def _plan_actions(new_memories_with_actions, temp_uuid_mapping, existing_payloads, metadata):
+    """The `MemoryActionBatch` of the LLM's decisions; decisions that can't be applied yield an empty batch."""
+    logger.debug(f"the final new_memories_with_actions: {new_memories_with_actions}\n")
+    try:
+        return MemoryActionBatch.from_actions(
+            new_memories_with_actions.get("memory", []), temp_uuid_mapping, existing_payloads, metadata
+        )
+    except Exception as e:
+        logging.error(f"Error in new_memories_with_actions: {e}")
+        return MemoryActionBatch()
+
+
+def _fused_messages(parsed_messages, retrieved_old_memory, includes, excludes, custom_categories):
+    """LLM messages of the fused pipeline, asking for facts, decisions and categories at once."""
+    system_prompt, user_prompt = get_fused_memory_messages(
+        parsed_messages, retrieved_old_memory, includes, excludes, custom_categories
+    )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _parse_fused_actions(response, temp_uuid_mapping, existing_payloads, metadata):
+    """The `MemoryActionBatch` of a fused pipeline response. Raises if the response can't be applied."""
+    actions = json.loads(remove_code_blocks(response)).get("memory", [])
+    return MemoryActionBatch.from_actions(actions, temp_uuid_mapping, existing_payloads, metadata)
+
+
+def _format_memory(memory):
+    """Format a vector store record the way `get` returns it."""
+    filters = _scope_filters(memory.payload)
+
+    # Prepare base memory item
+    memory_item = MemoryItem(
+        id=memory.id,
+        memory=memory.payload["data"],
+        hash=memory.payload.get("hash"),
+        created_at=memory.payload.get("created_at"),
+        updated_at=memory.payload.get("updated_at"),
+    ).model_dump(exclude={"score"})
+
+    # Add metadata if there are additional keys
+    excluded_keys = {
+        "user_id",
+        "agent_id",
+        "run_id",
+        "hash",
+        "data",
+        "created_at",
+        "updated_at",
+        "id",
+    }
+    additional_metadata = {k: v for k, v in memory.payload.items() if k not in excluded_keys}
+    if additional_metadata:
+        memory_item["metadata"] = additional_metadata
+
+    return {**memory_item, **filters}
+
+
+def _format_search_results(memories, rerank_scores=None):
+    """Format vector store hits the way `search` returns them, with their rerank scores when reranked."""
+    excluded_keys = {
+        "user_id",
+        "agent_id",
+        "run_id",
+        "hash",
+        "data",
+        "created_at",
+        "updated_at",
+        "categories",
+        "id",
+    }
+
+    original_memories = [
+        {
+            **MemoryItem(
+                id=mem.id,
+                memory=mem.payload["data"],
+                hash=mem.payload.get("hash"),
+                created_at=mem.payload.get("created_at"),
+                updated_at=mem.payload.get("updated_at"),
+                score=mem.score,
+                categories=mem.payload.get("categories"),
+            ).model_dump(),
+            **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
+            **(
+                {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
+                if any(k for k in mem.payload if k not in excluded_keys)
+                else {}
+            ),
+        }
+        for mem in memories
+    ]
+
+    if rerank_scores is not None:
+        for memory, rerank_score in zip(original_memories, rerank_scores):
+            memory["rerank_score"] = rerank_score
+
+    return original_memories
+
+
+def _delete_all_filters(user_id=None, agent_id=None, run_id=None):
+    """Filters of a `delete_all` call, which must name at least one user, agent or run."""
+    filters = _scope_filters({"user_id": user_id, "agent_id": agent_id, "run_id": run_id})
+    if not filters:
+        raise ValueError(
+            "At least one filter is required to delete all memories. If you want to delete all memories, use the `reset()` method."
+        )
+    return filters
+
 
-# 创建控制台 Handler，并设置级别
-console_handler = logging.StreamHandler()
+def _delete_many_result(memory_ids, found):
+    """Split the ids passed to `delete_many` into those of the `found` memories, now deleted, and the others."""
+    deleted = {str(memory.id) for memory in found}
+    return {
+        "deleted": [memory_id for memory_id in memory_ids if memory_id in deleted],
+        "not_found": [memory_id for memory_id in memory_ids if memory_id not in deleted],
+    }
 
-# 设置日志输出格式
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-console_handler.setFormatter(formatter)
 
-# 将 Handler 添加到 logger
-logger.addHandler(console_handler)
+def _export_page(memory_ids, memories, vectors, history):
+    """Export lines of one page of memories, given their vectors and history rows."""
+    return [
+        dump_line(export_record(memory, vectors.get(memory_id), history.get(memory_id, [])))
+        for memory_id, memory in zip(memory_ids, memories)
+    ]
 
-# 关闭其他库的日志输出
-logging.getLogger().setLevel(logging.WARNING)  # 关闭默认日志级别为DEBUG的日志，避免无关日志输出
 
+def _fill_vectors(vectors, missing, embeddings):
+    """Put the embeddings computed for the `missing` positions of an imported batch into `vectors`."""
+    for idx, embedding in zip(missing, embeddings):
+        vectors[idx] = embedding
 
-class Memory(MemoryBase):
-    def __init__(self, config: MemoryConfig = MemoryConfig()):
-        self.config = config
+
+class _MemoryCore(MemoryBase):
+    """
+    State and I/O-free steps shared by `Memory` and `AsyncMemory`: configuration, argument resolution and result
+    formatting. The subclasses only make the calls to the LLM and the stores, blocking or awaited.
+    """
+
+    def __init__(self, config: Optional[MemoryConfig] = None):
+        _setup_logging()
+        # Setup user config
+        setup_config()
+        self.config = config if config is not None else MemoryConfig()
 
         self.custom_prompt = self.config.vector_store.custom_prompt
-        self.embedding_model = EmbedderFactory.create(self.config.embedder.provider, self.config.embedder.config)
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.embedder.cache
+        )
         self.vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+            self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.tenancy
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        # The LLM client is built on first use: search and get never need it
+        self._llm = None
+        self._llm_factory = functools.partial(LlmFactory.create, self.config.llm.provider, self.config.llm.config)
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self._reranker = None
+        self.lexical_index = create_lexical_index(
+            self.config.hybrid_search, self.vector_store, self.collection_name, self.config.vector_store.identity()
+        )
+        self.search_cache = (
+            SearchCache(self.config.search_cache.max_entries, self.config.search_cache.ttl)
+            if self.config.search_cache.enabled
+            else None
+        )
 
         self.enable_graph = False
 
@@ -69,18 +477,45 @@ class Memory(MemoryBase):
             self.graph = MemoryGraph(self.config)
             self.enable_graph = True
 
-        capture_event("mem0.init", self)
+    @property
+    def llm(self):
+        if self._llm is None:
+            self._llm = self._llm_factory()
+        return self._llm
+
+    @llm.setter
+    def llm(self, llm):
+        self._llm = llm
+
+    @property
+    def reranker(self):
+        # Created on first use: the default BM25 reranker imports a slow-loading tokenizer
+        if self._reranker is None:
+            self._reranker = RerankerFactory.create(
+                self.config.reranker.provider, self.config.reranker.config, self.embedding_model
+            )
+        return self._reranker
+
+    def search_cache_stats(self):
+        """
+        Effectiveness of the search cache.
+
+        Returns:
+            dict: Hits, misses, hit rate, evictions, invalidations and the number of cached searches. None if the
+                cache is disabled.
+        """
+        return self.search_cache.stats() if self.search_cache is not None else None
 
     @classmethod
     def from_config(cls, config_dict: Dict[str, Any]):
         try:
-            config = cls._process_config(config_dict)
+            config_dict = cls._process_config(config_dict)
             config = MemoryConfig(**config_dict)
         except ValidationError as e:
             logger.error(f"Configuration validation error: {e}\n")
             raise
         return cls(config)
-    
+
     @staticmethod
     def _process_config(config_dict: Dict[str, Any]) -> Dict[str, Any]:
         if "graph_store" in config_dict:
@@ -94,12 +529,210 @@ class Memory(MemoryBase):
             logger.error(f"Configuration validation error: {e}")
             raise
 
-    def add(self, messages: Union[str, List[Dict[str, str]]], **kwargs) -> Dict[str, Any]:
+    def _prepare_params(self, kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Prepare query parameters.
+
+        Args:
+            kwargs: Keyword arguments to include in the parameters.
+
+        Returns:
+            A dictionary containing the prepared parameters.
+        """
+
+        if kwargs is None:
+            kwargs = {}
+
+        return {k: v for k, v in kwargs.items() if v is not None}
+
+    def _uses_fused_pipeline(self, prompt=None):
+        # A custom fact extraction prompt only fits the multi-call pipeline
+        return self.config.add_pipeline == "fused" and not (prompt or self.custom_prompt)
+
+    def _format_add_result(self, vector_store_result, graph_result):
+        if self.api_version == "v1.0":
+            warnings.warn(
+                "The current add API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=3,
+            )
+            return vector_store_result
+
+        if self.enable_graph:
+            return {
+                "results": vector_store_result,
+                "relations": graph_result,
+            }
+
+        return {"results": vector_store_result}
+
+    def _format_results(self, api, memories, graph_entities, paginate=False):
+        """
+        Output of `get_all` or `search` in the format of the configured API version. A page of `get_all` is given
+        as `(memories, next_cursor)`.
+        """
+        if paginate:
+            memories, next_cursor = memories
+            page = {"results": memories, "next_cursor": next_cursor}
+            return {**page, "relations": graph_entities} if self.enable_graph else page
+
+        if self.enable_graph:
+            return {"results": memories, "relations": graph_entities}
+
+        if self.api_version == "v1.0":
+            warnings.warn(
+                f"The current {api} API output format is deprecated. "
+                "To use the latest format, set `api_version='v1.1'`. "
+                "The current format will be removed in mem0ai 1.1.0 and later versions.",
+                category=DeprecationWarning,
+                stacklevel=3,
+            )
+            return memories
+        return {"results": memories}
+
+    def _get_all_options(self, kwargs):
+        """Resolve the filters, limit and paging of a `get_all` call."""
+        params = self._prepare_params(kwargs)
+        limit = params.get("limit") or 100
+        return params, _scope_filters(params), limit, "page_size" in params or "cursor" in params
+
+    def _search_options(self, kwargs):
+        """Resolve the filters, limit and rerank/hybrid switches of a `search` call, validating them."""
+        params = self._prepare_params(kwargs)
+        filters = kwargs.get("filters") or {}
+        filters.update(_scope_filters(params))
+        limit = params.get("limit") or 100
+
+        if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
+            raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+
+        rerank = kwargs.get("rerank")
+        if rerank is None:
+            rerank = self.config.reranker.rerank_memories
+        hybrid = kwargs.get("hybrid")
+        if hybrid is None:
+            hybrid = self.config.hybrid_search.enabled
+        if hybrid and self.lexical_index is None and not self.vector_store.supports_keyword_search:
+            raise ValueError("Hybrid search with this vector store requires `hybrid_search.enabled` in the config")
+        return filters, limit, rerank, hybrid
+
+    def _rerank_memories(self, query, memories, query_embedding):
+        """Reorder vector store hits with the reranker, returning them with their rerank scores."""
+        options = {"query_embedding": query_embedding}
+        if self.reranker.uses_document_embeddings:
+            # The stored vectors are the memories' embeddings, so the reranker need not embed them again
+            vectors = self.vector_store.get_vectors([str(mem.id) for mem in memories])
+            options["document_embeddings"] = [vectors.get(str(mem.id)) for mem in memories]
+        ranked = self.reranker.rerank(query, [mem.payload["data"] for mem in memories], **options)
+        return [memories[idx] for idx, _ in ranked], [score for _, score in ranked]
+
+    def _invalidate_searches(self, scopes):
+        """Drop cached searches over the user/agent/run ids of written memories. Call it after the write lands."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(scopes)
+
+    def _embedding_dims(self):
+        """Dimensions of the vectors the vector store holds, if the configuration states them."""
+        return getattr(self.config.vector_store.config, "embedding_model_dims", None) or getattr(
+            self.config.embedder.config, "embedding_dims", None
+        )
+
+    def _export_header(self, filters):
+        return dump_line(export_header(*_embedder_identity(self), self._embedding_dims(), filters))
+
+    def _reusable_vectors(self, header, batch, reembed):
+        """
+        The exported vectors of an imported batch that can be kept, None for the memories to embed again, and the
+        positions of the latter.
+        """
+        # Vectors of another embedder are in another space, even when their dimensions match
+        reembed = reembed or not same_embedder(header, *_embedder_identity(self))
+        vectors = vectors_to_reuse(batch, self._embedding_dims(), reembed)
+        return vectors, [idx for idx, vector in enumerate(vectors) if vector is None]
+
+
+class Memory(_MemoryCore):
+    def __init__(self, config: Optional[MemoryConfig] = None):
+        super().__init__(config)
+        self._deferred_adds = None
+        self._deferred_adds_lock = threading.Lock()
+
+        capture_event("mem0.init", self)
+
+    @property
+    def deferred_adds(self):
+        # Started on first use; jobs left queued by a previous process resume from then on
+        if self._deferred_adds is None:
+            with self._deferred_adds_lock:
+                if self._deferred_adds is None:
+                    deferred_config = self.config.deferred_add
+                    path = deferred_config.path or os.path.join(moremem_dir, "add_queue.db")
+                    # Keyed on the store the jobs write to; hashing the whole config would mix in the API keys
+                    owner = self.config.vector_store.identity()
+                    self._deferred_adds = DeferredAddWorker(
+                        AddJobQueue(path, owner, lease_timeout=deferred_config.lease_timeout),
+                        lambda messages, kwargs: self.add(messages, **kwargs),
+                        concurrency=deferred_config.concurrency,
+                        max_pending=deferred_config.max_pending,
+                        retention=deferred_config.retention,
+                    )
+        return self._deferred_adds
+
+    def get_add_job(self, job_id):
+        """
+        Get the state of a deferred add.
+
+        Args:
+            job_id (str): ID returned by `add(..., mode="deferred")`.
+
+        Returns:
+            dict: The job's `status` ("queued", "running", "done" or "failed"), its `result` or `error`, and its
+                created_at/started_at/finished_at timestamps. None if the job is unknown.
+        """
+        return self.deferred_adds.queue.get(job_id)
+
+    def wait_for_add_job(self, job_id, timeout=None):
+        """
+        Block until a deferred add has finished.
+
+        Args:
+            job_id (str): ID returned by `add(..., mode="deferred")`.
+            timeout (float, optional): Seconds to wait before raising TimeoutError. Defaults to None (no limit).
+
+        Returns:
+            dict: The finished job, as returned by `get_add_job`.
+        """
+        return self.deferred_adds.wait(job_id, timeout=timeout)
+
+    def deferred_add_stats(self):
+        """
+        Backpressure metrics of the deferred add queue.
+
+        Returns:
+            dict: Job counts per status, the age of the oldest queued job, how often producers were throttled by a
+                full queue, and the average queueing and processing time of the jobs finished by this process.
+        """
+        return self.deferred_adds.stats()
+
+    def add(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        mode: Literal["sync", "deferred"] = "sync",
+        enqueue_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
         """
         Adds, updates, or deletes memories as appropriate, based on the provided message(s).
 
         Args:
             messages (str or List[Dict[str, str]]): Messages to store in the memory.
+            mode (str, optional): "sync" to add before returning, or "deferred" to only validate the call, enqueue it
+                in a durable queue processed by background workers and return its job id. Deferred adds of the
+                same user_id/agent_id/run_id are applied in order. Images are described by the worker, not before
+                enqueueing. Defaults to "sync".
+            enqueue_timeout (float, optional): In deferred mode, seconds to wait for room in a full queue before
+                raising TimeoutError. Defaults to `deferred_add.enqueue_timeout`.
             **kwargs: Additional parameters such as user_id, agent_id, app_id, metadata, filters.
                 user_id (str, optional): ID of the user creating the memory. Defaults to None.
                 agent_id (str, optional): ID of the agent creating the memory. Defaults to None.
@@ -122,156 +755,265 @@ class Memory(MemoryBase):
                 'add': added memory
                 'update': updated memory
                 'delete': deleted memory
+            In deferred mode, a dict with the `job_id` to pass to `get_add_job` or `wait_for_add_job`.
         """
+        if mode not in ("sync", "deferred"):
+            raise ValueError(f"Unsupported add mode: {mode}")
 
-        kwargs = self._prepare_params(kwargs)
-        if kwargs.get("metadate") is None:
-            metadata = {}
-
-        filters = kwargs.get("filters") or {}
-        if kwargs.get("user_id"):
-            filters["user_id"] = metadata["user_id"] = kwargs.get("user_id")
-        if kwargs.get("agent_id"):
-            filters["agent_id"] = metadata["agent_id"] = kwargs.get("agent_id")
-        if kwargs.get("run_id"):
-            filters["run_id"] = metadata["run_id"] = kwargs.get("run_id")
-
-        infer = kwargs.get("infer") if kwargs.get("infer") else True
-        
-        includes_dic = kwargs.get("includes") or {}
-        excludes_dic = kwargs.get("excludes") or {}
-        for dic in [includes_dic, excludes_dic]:
-            dic["vector"] = dic.get("vector")
-            dic["graph"] = dic.get("graph")
-
-        # 解析custom_categories
-        custom_categories = kwargs.get("custom_categories") or self.config.vector_store.custom_categories
-        if custom_categories:
-            custom_categories = "\n".join([f"- {key}: {value}" for category in custom_categories for key, value in category.items()])
-
-        # 解析custom_node_types
-        custom_node_types = kwargs.get("custom_node_types") or self.config.graph_store.custom_node_types
-        if custom_node_types:
-            custom_node_types = "\n".join([f"- {key}: {value}" for node_type in custom_node_types for key, value in node_type.items()])
-
-        # 解析custom_relations
-        custom_relations = kwargs.get("custom_relations") or self.config.graph_store.custom_relations
-        if custom_relations:
-            custom_relations = "\n".join([f"- {key}: {value}" for relation in custom_relations for key, value in relation.items()])
-
-        if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
-            raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+        if mode == "deferred":
+            if enqueue_timeout is None:
+                enqueue_timeout = self.config.deferred_add.enqueue_timeout
+            # Only validated here: describing images takes an LLM call, which the worker makes when it runs the job
+            filters = _resolve_add_params(messages, kwargs, self.config)["filters"]
+            user_key = json.dumps([filters.get("user_id"), filters.get("agent_id"), filters.get("run_id")])
+            job_id = self.deferred_adds.submit(user_key, messages, self._prepare_params(kwargs), timeout=enqueue_timeout)
+            return {"job_id": job_id, "status": "queued"}
 
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-        
-        if self.config.llm.config.get("enable_vision"):
-            messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
-        else:
-            messages = parse_vision_messages(messages)
+        params = self._prepare_add_params(messages, kwargs)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, metadata, filters, infer, custom_categories, prompt=kwargs.get("prompt"), includes=includes_dic["vector"], excludes=excludes_dic["vector"])
-            
-            future2 = executor.submit(self._add_to_graph, messages, filters, custom_node_types=custom_node_types, custom_relations=custom_relations, graph_prompt=kwargs.get("graph_prompt"), includes=includes_dic["graph"], excludes=excludes_dic["graph"])
+            future1 = executor.submit(self._add_to_vector_store_from_params, params)
+
+            future2 = executor.submit(self._add_to_graph_from_params, params)
 
             concurrent.futures.wait([future1, future2])
 
             vector_store_result = future1.result()
             graph_result = future2.result()
 
-        if self.api_version == "v1.0":
-            warnings.warn(
-                "The current add API output format is deprecated. "
-                "To use the latest format, set `api_version='v1.1'`. "
-                "The current format will be removed in mem0ai 1.1.0 and later versions.",
-                category=DeprecationWarning,
-                stacklevel=2,
-            )
-            return vector_store_result
-        
-        if self.enable_graph:
+        return self._format_add_result(vector_store_result, graph_result)
+
+    def add_many(
+        self,
+        conversations: Iterable[Dict[str, Any]],
+        concurrency: int = 4,
+        checkpoint_path: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Add memories from many conversations, e.g. to backfill a chat archive.
+
+        The stages of `add` are pipelined across conversations: fact extraction runs for several conversations
+        at once, while the update decision and the writes of conversations sharing the same user_id/agent_id/run_id
+        are applied one after another in input order, so each conversation is reconciled against the memories of
+        the ones before it. At most `concurrency` stages (and therefore LLM calls) run at any time, and only a
+        bounded window of conversations is read ahead from `conversations`.
+
+        Args:
+            conversations (Iterable[dict]): Each item has `messages` plus any keyword argument accepted by `add`
+                (user_id, agent_id, run_id, metadata, infer, prompt, ...), and optionally an `id` identifying the
+                conversation in checkpoints. The id defaults to the position of the conversation.
+            concurrency (int, optional): Maximum number of stages running at once. Defaults to 4.
+            checkpoint_path (str, optional): File recording the ids of completed conversations. Conversations
+                already recorded there are skipped, so an interrupted backfill resumes where it stopped.
+            **kwargs: Defaults for every conversation, overridden by the conversation's own keys.
+
+        Yields:
+            dict: One entry per conversation as soon as it is finished, with its `id`, the `result` of `add`
+                (or `error` if it failed, in which case it is not checkpointed), whether it was `skipped` and
+                the `progress` so far.
+        """
+        checkpoint = AddManyCheckpoint(checkpoint_path) if checkpoint_path else None
+        total = len(conversations) if hasattr(conversations, "__len__") else None
+        finished = queue.Queue()
+        window = max(1, concurrency) * 4
+        vector_tails, graph_tails = {}, {}
+        counts = {"completed": 0, "failed": 0, "skipped": 0}
+
+        def entry(key, result=None, error=None, skipped=False):
+            counts["skipped" if skipped else "failed" if error else "completed"] += 1
             return {
-                "results": vector_store_result,
-                "relations": graph_result,
+                "id": key,
+                "result": result,
+                "error": error,
+                "skipped": skipped,
+                "progress": {**counts, "total": total},
             }
-        
-        return {"results": vector_store_result}
-        
-    def _prepare_params(self, kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Prepare query parameters.
 
-        Args:
-            kwargs: Keyword arguments to include in the parameters.
+        def collect():
+            key, user_key, vector_future, graph_future = finished.get()
+            if vector_tails.get(user_key) is vector_future:
+                del vector_tails[user_key]
+            if graph_tails.get(user_key) is graph_future:
+                del graph_tails[user_key]
+            try:
+                result = self._format_add_result(vector_future.result(), graph_future.result())
+            except Exception as e:
+                logger.error(f"Error adding conversation {key}: {e}")
+                return entry(key, error=str(e))
+            if checkpoint is not None:
+                checkpoint.mark_done(key)
+            return entry(key, result=result)
+
+        capture_event("mem0.add_many", self, {"concurrency": concurrency, "checkpoint": checkpoint is not None})
+        in_flight = 0
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                for index, conversation in enumerate(conversations):
+                    key = conversation.get("id", index)
+                    if checkpoint is not None and key in checkpoint:
+                        yield entry(key, skipped=True)
+                        continue
 
-        Returns:
-            A dictionary containing the prepared parameters.
-        """
+                    options = {**kwargs, **{k: v for k, v in conversation.items() if k not in ("id", "messages")}}
+                    try:
+                        params = self._prepare_add_params(conversation["messages"], options)
+                    except Exception as e:
+                        yield entry(key, error=str(e))
+                        continue
 
-        if kwargs is None:
-            kwargs = {}
+                    filters = params["filters"]
+                    user_key = (filters.get("user_id"), filters.get("agent_id"), filters.get("run_id"))
+                    facts_future = (
+                        executor.submit(
+                            self._extract_facts,
+                            params["messages"],
+                            params["prompt"],
+                            params["includes"]["vector"],
+                            params["excludes"]["vector"],
+                        )
+                        if params["infer"] and not self._uses_fused_pipeline(params["prompt"])
+                        else None
+                    )
+                    vector_future = run_after(
+                        executor,
+                        [facts_future, vector_tails.get(user_key)],
+                        self._add_many_vector_stage,
+                        params,
+                        facts_future,
+                    )
+                    graph_future = run_after(
+                        executor, [graph_tails.get(user_key)], self._add_to_graph_from_params, params
+                    )
+                    vector_tails[user_key] = vector_future
+                    graph_tails[user_key] = graph_future
+                    when_all(
+                        [vector_future, graph_future],
+                        functools.partial(finished.put, (key, user_key, vector_future, graph_future)),
+                    )
+
+                    in_flight += 1
+                    while in_flight >= window:
+                        yield collect()
+                        in_flight -= 1
+
+                while in_flight:
+                    yield collect()
+                    in_flight -= 1
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _add_many_vector_stage(self, params, facts_future):
+        if facts_future is None:
+            return self._add_to_vector_store_from_params(params)
+        return self._reconcile_facts(
+            facts_future.result(), params["metadata"], params["filters"], params["custom_categories"]
+        )
 
-        return {k: v for k, v in kwargs.items() if v is not None}
+    def _prepare_add_params(self, messages, kwargs):
+        """Validate the arguments of `add` and resolve them into the inputs of the vector store and graph stages."""
+        params = _resolve_add_params(messages, kwargs, self.config)
+        if self.config.llm.config.get("enable_vision"):
+            params["messages"] = parse_vision_messages(
+                params["messages"], self.llm, self.config.llm.config.get("vision_details")
+            )
+        else:
+            params["messages"] = parse_vision_messages(params["messages"])
+        return params
+
+    def _add_to_vector_store_from_params(self, params):
+        return self._add_to_vector_store(
+            params["messages"],
+            params["metadata"],
+            params["filters"],
+            params["infer"],
+            params["custom_categories"],
+            prompt=params["prompt"],
+            includes=params["includes"]["vector"],
+            excludes=params["excludes"]["vector"],
+        )
+
+    def _add_to_graph_from_params(self, params):
+        return self._add_to_graph(
+            params["messages"],
+            params["filters"],
+            custom_node_types=params["custom_node_types"],
+            custom_relations=params["custom_relations"],
+            graph_prompt=params["graph_prompt"],
+            includes=params["includes"]["graph"],
+            excludes=params["excludes"]["graph"],
+        )
 
     def _add_to_vector_store(self, messages, metadata, filters, infer, custom_categories=None, prompt=None, includes=None, excludes=None):
         if not infer:
             returned_memories = []
-            for message in messages:
-                if message["role"] != "system":
-                    message_embeddings = self.embedding_model.embed(message["content"], "add")
-                    memory_id = self._create_memory(message["content"], message_embeddings, metadata, categories=[])
-                    returned_memories.append({"id": memory_id, "memory": message["content"], "event": "ADD"})
+            contents = _message_contents(messages)
+            message_embeddings = dict(zip(contents, self.embedding_model.embed_batch(contents, "add")))
+            for content in contents:
+                memory_id = self._create_memory(content, message_embeddings, categories=[], metadata=metadata)
+                returned_memories.append({"id": memory_id, "memory": content, "event": "ADD"})
             return returned_memories
 
-        parsed_messages = parse_messages(messages)
+        if self._uses_fused_pipeline(prompt):
+            return self._add_fused(messages, metadata, filters, custom_categories, includes=includes, excludes=excludes)
 
-        custom_prompt = prompt if prompt else self.custom_prompt
-        system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages, includes, excludes, custom_prompt)
+        new_retrieved_facts = self._extract_facts(messages, prompt=prompt, includes=includes, excludes=excludes)
+        return self._reconcile_facts(new_retrieved_facts, metadata, filters, custom_categories)
 
-        response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
+    def _add_fused(self, messages, metadata, filters, custom_categories=None, includes=None, excludes=None):
+        """
+        Extract facts, decide the ADD/UPDATE/DELETE actions and categorise new memories in a single LLM call.
+
+        The facts are only known once the call returns, so candidate memories are retrieved with one embedding of
+        the whole conversation instead of one per fact.
+        """
+        parsed_messages = parse_messages(messages)
+        conversation_embedding = self.embedding_model.embed(parsed_messages, "search")
+        search_results = self.vector_store.search(
+            query=conversation_embedding, limit=FUSED_CANDIDATE_LIMIT, filters=filters
         )
+        retrieved_old_memory, temp_uuid_mapping, existing_payloads = index_existing_memories([search_results])
 
         try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logging.error(f"Error in new_retrieved_facts: {e}")
-            new_retrieved_facts = []
-
-        retrieved_old_memory = []
-        new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=messages_embeddings,
-                limit=5,
-                filters=filters,
+            response = self.llm.generate_response(
+                messages=_fused_messages(parsed_messages, retrieved_old_memory, includes, excludes, custom_categories),
+                response_format={"type": "json_object"},
             )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
-
-        # remove same records
-        retrieved_old_memory = list({item["id"]: item for item in retrieved_old_memory}.values())
+            batch = _parse_fused_actions(response, temp_uuid_mapping, existing_payloads, metadata)
+        except Exception as e:
+            logging.error(f"Error in fused memory actions: {e}")
+            batch = MemoryActionBatch()
+        returned_memories = self._apply_memory_actions(batch, {})
 
-        logger.info(f"Total existing memories: {len(retrieved_old_memory)}\n")
+        capture_event(
+            "mem0.add", self, {"version": self.api_version, "keys": list(filters.keys()), "pipeline": "fused"}
+        )
 
-        # mapping UUIDs with integers for handling UUID hallucinations
-        temp_uuid_mapping = {}
-        for idx, item in enumerate(retrieved_old_memory):
-            temp_uuid_mapping[str(idx)] = item["id"]
-            retrieved_old_memory[idx]["id"] = str(idx)
+        return returned_memories
 
-        function_calling_prompt = get_update_memory_messages(retrieved_old_memory, new_retrieved_facts)
+    def _extract_facts(self, messages, prompt=None, includes=None, excludes=None):
+        """Ask the LLM for the facts worth remembering in `messages`."""
+        response = self.llm.generate_response(
+            messages=_fact_extraction_messages(messages, prompt or self.custom_prompt, includes, excludes),
+            response_format={"type": "json_object"},
+        )
+        return _parse_facts(response)
+
+    def _reconcile_facts(self, new_retrieved_facts, metadata, filters, custom_categories=None):
+        """Compare extracted facts with the closest existing memories and apply the LLM's ADD/UPDATE/DELETE decisions."""
+        new_message_embeddings = dict(zip(new_retrieved_facts, self.embedding_model.embed_batch(new_retrieved_facts, "add")))
+        # Look up the neighbours of every fact in one batched request instead of one search per fact
+        search_results = self.vector_store.search_batch(
+            queries=[new_message_embeddings[fact] for fact in new_retrieved_facts],
+            limit=5,
+            filters=filters,
+        )
+        retrieved_old_memory, temp_uuid_mapping, existing_payloads = index_existing_memories(search_results)
 
         try:
             new_memories_with_actions = self.llm.generate_response(
-                messages=[{"role": "user", "content": function_calling_prompt}],
+                messages=_reconcile_messages(retrieved_old_memory, new_retrieved_facts),
                 response_format={"type": "json_object"},
             )
         except Exception as e:
@@ -280,55 +1022,8 @@ class Memory(MemoryBase):
 
         new_memories_with_actions = self._create_categories(new_memories_with_actions, custom_categories)
 
-        returned_memories = []
-        logger.debug(f"the final new_memories_with_actions: {new_memories_with_actions}\n")
-        try:
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(f"the element in {resp}\n")
-                try:
-                    if not resp.get("text"):
-                        logging.info("Skipping memory entry because of empty `text` field.")
-                        continue
-                    elif resp.get("event") == "ADD":
-                        memory_id = self._create_memory(
-                            data=resp.get("text"), existing_embeddings=new_message_embeddings, metadata=metadata, categories=resp.get("categories")
-                        )
-                        returned_memories.append(
-                            {
-                                "id": memory_id,
-                                "memory": resp.get("text"),
-                                "event": resp.get("event"),
-                                "categories": resp.get("categories"),
-                            }
-                        )
-                    elif resp.get("event") == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=resp.get("text"),
-                            existing_embeddings=new_message_embeddings,
-                            metadata=metadata,
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": resp.get("text"),
-                                "event": resp.get("event"),
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif resp.get("event") == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": resp.get("text"),
-                                "event": resp.get("event"),
-                            }
-                        )
-                except Exception as e:
-                    logging.error(f"Error in new_memories_with_actions: {e}")
-        except Exception as e:
-            logging.error(f"Error in new_memories_with_actions: {e}")
+        batch = _plan_actions(new_memories_with_actions, temp_uuid_mapping, existing_payloads, metadata)
+        returned_memories = self._apply_memory_actions(batch, new_message_embeddings)
 
         capture_event("mem0.add", self, {"version": self.api_version, "keys": list(filters.keys())})
 
@@ -337,10 +1032,7 @@ class Memory(MemoryBase):
     def _add_to_graph(self, messages, filters, custom_node_types=None, custom_relations=None, graph_prompt=None, includes=None, excludes=None):
         added_entities = []
         if self.enable_graph:
-            if filters.get("user_id") is None:
-                filters["user_id"] = "user"
-
-            data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
+            data = _graph_input(messages, filters)
             added_entities = self.graph.add(data, filters, custom_node_types, custom_relations, graph_prompt, includes, excludes)
 
         return added_entities
@@ -359,36 +1051,7 @@ class Memory(MemoryBase):
         memory = self.vector_store.get(vector_id=memory_id)
         if not memory:
             return None
-
-        filters = {key: memory.payload[key] for key in ["user_id", "agent_id", "run_id"] if memory.payload.get(key)}
-
-        # Prepare base memory item
-        memory_item = MemoryItem(
-            id=memory.id,
-            memory=memory.payload["data"],
-            hash=memory.payload.get("hash"),
-            created_at=memory.payload.get("created_at"),
-            updated_at=memory.payload.get("updated_at"),
-        ).model_dump(exclude={"score"})
-
-        # Add metadata if there are additional keys
-        excluded_keys = {
-            "user_id",
-            "agent_id",
-            "run_id",
-            "hash",
-            "data",
-            "created_at",
-            "updated_at",
-            "id",
-        }
-        additional_metadata = {k: v for k, v in memory.payload.items() if k not in excluded_keys}
-        if additional_metadata:
-            memory_item["metadata"] = additional_metadata
-
-        result = {**memory_item, **filters}
-
-        return result
+        return _format_memory(memory)
 
     def get_all(self, **kwargs):
         """
@@ -400,27 +1063,25 @@ class Memory(MemoryBase):
             agent_id (str, optional)
             run_id (str, optional)
             limit (int, optional)
+            page_size (int, optional): Return one page of this many memories, with the `next_cursor` to pass back
+                for the following page (None after the last one).
+            cursor (str, optional): `next_cursor` of the previous page. Implies paging, with `limit` as the page
+                size when `page_size` is not given.
 
         Returns:
             list: List of all memories.
         """
-        params = self._prepare_params(kwargs)
-        filters = {}
-        if params.get("user_id"):
-            filters["user_id"] = params.get("user_id")
-        if params.get("agent_id"):
-            filters["agent_id"] = params.get("agent_id")
-        if params.get("run_id"):
-            filters["run_id"] = params.get("run_id")
-        if params.get("limit"):
-            limit = params.get("limit")
-        else:
-            limit = 100
+        params, filters, limit, paginate = self._get_all_options(kwargs)
 
-        capture_event("mem0.get_all", self, {"limit": limit, "keys": list(filters.keys())})
+        capture_event("mem0.get_all", self, {"limit": limit, "keys": list(filters.keys()), "paginate": paginate})
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, filters, limit)
+            if paginate:
+                future_memories = executor.submit(
+                    self._get_page_from_vector_store, filters, params.get("page_size") or limit, params.get("cursor")
+                )
+            else:
+                future_memories = executor.submit(self._get_all_from_vector_store, filters, limit)
             future_graph_entities = executor.submit(self.graph.get_all, filters, limit) if self.enable_graph else None
 
             concurrent.futures.wait(
@@ -430,53 +1091,41 @@ class Memory(MemoryBase):
             all_memories = future_memories.result()
             graph_entities = future_graph_entities.result() if future_graph_entities else None
 
-        if self.enable_graph:
-            return {"results": all_memories, "relations": graph_entities}
+        return self._format_results("get_all", all_memories, graph_entities, paginate)
 
-        if self.api_version == "v1.0":
-            warnings.warn(
-                "The current get_all API output format is deprecated. "
-                "To use the latest format, set `api_version='v1.1'`. "
-                "The current format will be removed in mem0ai 1.1.0 and later versions.",
-                category=DeprecationWarning,
-                stacklevel=2,
-            )
-            return all_memories
-        else:
-            return {"results": all_memories}
+    def iter_all(self, page_size=100, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all memories, fetching them from the vector store one page at a time.
+
+        Args:
+            page_size (int, optional): Memories fetched per vector store call. Defaults to 100.
+            **kwargs: user_id, agent_id and run_id to filter on.
+
+        Yields:
+            dict: Each memory, in the format of `get_all`.
+        """
+        filters = _scope_filters(self._prepare_params(kwargs))
+        capture_event("mem0.iter_all", self, {"page_size": page_size, "keys": list(filters.keys())})
+
+        for memory in self._iter_vector_store(filters, page_size):
+            yield _format_listed_memory(memory)
+
+    def _iter_vector_store(self, filters, page_size=LIST_PAGE_SIZE):
+        """Yield the vector store records matching `filters`, fetching them one page at a time."""
+        cursor = None
+        while True:
+            memories, cursor = self.vector_store.list_page(filters=filters, limit=page_size, cursor=cursor)
+            yield from memories
+            if cursor is None:
+                return
 
     def _get_all_from_vector_store(self, filters, limit):
         memories = self.vector_store.list(filters=filters, limit=limit)
+        return [_format_listed_memory(mem) for mem in memories[0]]
 
-        excluded_keys = {
-            "user_id",
-            "agent_id",
-            "run_id",
-            "hash",
-            "data",
-            "created_at",
-            "updated_at",
-            "id",
-        }
-        all_memories = [
-            {
-                **MemoryItem(
-                    id=mem.id,
-                    memory=mem.payload["data"],
-                    hash=mem.payload.get("hash"),
-                    created_at=mem.payload.get("created_at"),
-                    updated_at=mem.payload.get("updated_at"),
-                ).model_dump(exclude={"score"}),
-                **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
-                **(
-                    {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
-                    if any(k for k in mem.payload if k not in excluded_keys)
-                    else {}
-                ),
-            }
-            for mem in memories[0]
-        ]
-        return all_memories
+    def _get_page_from_vector_store(self, filters, page_size, cursor=None):
+        memories, next_cursor = self.vector_store.list_page(filters=filters, limit=page_size, cursor=cursor)
+        return [_format_listed_memory(mem) for mem in memories], next_cursor
 
     def search(self, query: str, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -490,35 +1139,69 @@ class Memory(MemoryBase):
                 run_id (str, optional): ID of the run to search for. Defaults to None.
                 limit (int, optional): Limit the number of results. Defaults to 100.
                 filters (dict, optional): Filters to apply to the search. Defaults to None.
+                rerank (bool, optional): Reorder the memories with the configured reranker, adding a
+                    `rerank_score` to each. Defaults to `config.reranker.rerank_memories`.
+                hybrid (bool, optional): Fuse keyword and vector search with reciprocal-rank fusion; the
+                    `score` of each memory is then its fused score. Defaults to `config.hybrid_search.enabled`.
 
         Returns:
             list: List of search results.
         """
-        params = self._prepare_params(kwargs)
-        filters = kwargs.get("filters") or {}
-        if params.get("user_id"):
-            filters["user_id"] = params.get("user_id")
-        if params.get("agent_id"):
-            filters["agent_id"] = params.get("agent_id")
-        if params.get("run_id"):
-            filters["run_id"] = params.get("run_id")
-        if params.get("limit"):
-            limit = params.get("limit")
-        else:
-            limit = 100
+        return self._search(query, kwargs)
 
-        if not any(key in filters for key in ("user_id", "agent_id", "run_id")):
-            raise ValueError("One of the filters: user_id, agent_id or run_id is required!")
+    def search_many(self, searches: List[Dict[str, Any]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run several searches, e.g. for several users or queries in one agent turn.
 
-        capture_event(
-            "mem0.search",
-            self,
-            {"limit": limit, "version": self.api_version, "keys": list(filters.keys())},
-        )
+        The queries are embedded together in one `embed_batch` call, then the searches run concurrently.
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, filters, limit)
-            future_graph_entities = (
+        Args:
+            searches (list): Each item has a `query` plus any keyword argument accepted by `search`.
+            concurrency (int, optional): Maximum number of searches running at once. Defaults to 8.
+
+        Returns:
+            list: The result of `search` for each item, in order, or `{"error": ...}` for an item that failed.
+        """
+        embeddings = self._embed_queries(searches)
+
+        def run(search):
+            try:
+                kwargs = {key: value for key, value in search.items() if key != "query"}
+                return self._search(search["query"], kwargs, embeddings.get(search["query"]))
+            except Exception as e:
+                logger.error(f"Error in search_many: {e}")
+                return {"error": str(e)}
+
+        if not searches:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(searches)))) as executor:
+            return list(executor.map(run, searches))
+
+    def _embed_queries(self, searches):
+        """Embed the distinct queries of `search_many` in one call; on failure each search embeds its own."""
+        queries = list(dict.fromkeys(search.get("query") for search in searches if search.get("query")))
+        if not queries:
+            return {}
+        try:
+            return dict(zip(queries, self.embedding_model.embed_batch(queries, "search")))
+        except Exception as e:
+            logger.error(f"Error embedding the queries of search_many: {e}")
+            return {}
+
+    def _search(self, query, kwargs, embeddings=None):
+        filters, limit, rerank, hybrid = self._search_options(kwargs)
+
+        capture_event(
+            "mem0.search",
+            self,
+            {"limit": limit, "version": self.api_version, "keys": list(filters.keys())},
+        )
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            future_memories = executor.submit(
+                self._search_memories, query, filters, limit, rerank, hybrid, embeddings
+            )
+            future_graph_entities = (
                 executor.submit(self.graph.search, query, filters, limit) if self.enable_graph else None
             )
 
@@ -529,59 +1212,63 @@ class Memory(MemoryBase):
             original_memories = future_memories.result()
             graph_entities = future_graph_entities.result() if future_graph_entities else None
 
-        if self.enable_graph:
-            return {"results": original_memories, "relations": graph_entities}
-
-        if self.api_version == "v1.0":
-            warnings.warn(
-                "The current get_all API output format is deprecated. "
-                "To use the latest format, set `api_version='v1.1'`. "
-                "The current format will be removed in mem0ai 1.1.0 and later versions.",
-                category=DeprecationWarning,
-                stacklevel=2,
-            )
-            return original_memories
+        return self._format_results("search", original_memories, graph_entities)
+
+    def _search_memories(self, query, filters, limit, rerank=False, hybrid=False, embeddings=None):
+        """`_search_vector_store` behind the search cache, when it is enabled."""
+        if self.search_cache is None:
+            return self._search_vector_store(query, filters, limit, rerank, hybrid, embeddings)
+        key = self.search_cache.key(query, filters, limit, rerank=rerank, hybrid=hybrid)
+        memories = self.search_cache.get(key)
+        if memories is None:
+            memories = self._search_vector_store(query, filters, limit, rerank, hybrid, embeddings)
+            self.search_cache.put(key, memories)
+        return memories
+
+    def _search_vector_store(self, query, filters, limit, rerank=False, hybrid=False, embeddings=None):
+        if hybrid:
+            memories, embeddings = self._hybrid_search(query, filters, limit, embeddings)
         else:
-            return {"results": original_memories}
-
-    def _search_vector_store(self, query, filters, limit):
-        embeddings = self.embedding_model.embed(query, "search")
-        memories = self.vector_store.search(query=embeddings, limit=limit, filters=filters) # TODO 参数filter需要由AI产生
-
-        excluded_keys = {
-            "user_id",
-            "agent_id",
-            "run_id",
-            "hash",
-            "data",
-            "created_at",
-            "updated_at",
-            "categories",
-            "id",
-        }
-
-        original_memories = [
-            {
-                **MemoryItem(
-                    id=mem.id,
-                    memory=mem.payload["data"],
-                    hash=mem.payload.get("hash"),
-                    created_at=mem.payload.get("created_at"),
-                    updated_at=mem.payload.get("updated_at"),
-                    score=mem.score, 
-                    categories=mem.payload.get("categories"),
-                ).model_dump(),
-                **{key: mem.payload[key] for key in ["user_id", "agent_id", "run_id"] if key in mem.payload},
-                **(
-                    {"metadata": {k: v for k, v in mem.payload.items() if k not in excluded_keys}}
-                    if any(k for k in mem.payload if k not in excluded_keys)
-                    else {}
-                ),
-            }
-            for mem in memories
-        ]
+            if embeddings is None:
+                embeddings = self.embedding_model.embed(query, "search")
+            memories = self.vector_store.search(query=embeddings, limit=limit, filters=filters) # TODO 参数filter需要由AI产生
+        rerank_scores = None
+        if rerank and memories:
+            memories, rerank_scores = self._rerank_memories(query, memories, embeddings)
+        return _format_search_results(memories, rerank_scores)
+
+    def _hybrid_search(self, query, filters, limit, embeddings=None):
+        """Run the keyword and vector searches side by side and fuse them, returning the hits and query embedding."""
+        candidates = limit * self.config.hybrid_search.candidate_multiplier
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future_lexical = executor.submit(self._keyword_search, query, candidates, filters)
+            if embeddings is None:
+                embeddings = self.embedding_model.embed(query, "search")
+            vector_hits = self.vector_store.search(query=embeddings, limit=candidates, filters=filters)
+            lexical_hits = future_lexical.result()
+        return fuse_hits(vector_hits, lexical_hits, self.config.hybrid_search, limit), embeddings
+
+    def _keyword_search(self, query, limit, filters):
+        if self.lexical_index is not None:
+            return self.lexical_index.search(query, limit=limit, filters=filters)
+        return self.vector_store.keyword_search(query=query, limit=limit, filters=filters)
+
+    def _index_memories(self, memory_ids, payloads):
+        """Keep the local keyword index in step with the vector store; a failure only degrades hybrid search."""
+        if self.lexical_index is None:
+            return
+        try:
+            self.lexical_index.upsert(memory_ids, payloads)
+        except Exception as e:
+            logger.error(f"Error indexing memories for keyword search: {e}")
 
-        return original_memories
+    def _unindex_memories(self, memory_ids):
+        if self.lexical_index is None:
+            return
+        try:
+            self.lexical_index.delete(memory_ids)
+        except Exception as e:
+            logger.error(f"Error removing memories from the keyword index: {e}")
 
     def update(self, memory_id, data):
         """
@@ -612,6 +1299,28 @@ class Memory(MemoryBase):
         self._delete_memory(memory_id)
         return {"message": "Memory deleted successfully!"}
 
+    def delete_many(self, memory_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Delete several memories by ID with one vector store call.
+
+        Args:
+            memory_ids (list): IDs of the memories to delete.
+
+        Returns:
+            dict: The `deleted` IDs and the IDs that were `not_found`.
+        """
+        capture_event("mem0.delete_many", self, {"count": len(memory_ids)})
+        memory_ids = list(dict.fromkeys(memory_ids))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(memory_ids), 8))) as executor:
+            existing = list(executor.map(lambda memory_id: self.vector_store.get(vector_id=memory_id), memory_ids))
+        found = [memory for memory in existing if memory is not None]
+        if found:
+            self.vector_store.delete_many(vector_ids=[memory.id for memory in found])
+            self._unindex_memories([memory.id for memory in found])
+            self._invalidate_searches([memory.payload for memory in found])
+            self.db.add_history_many([_deletion_record(memory) for memory in found])
+        return _delete_many_result(memory_ids, found)
+
     def delete_all(self, user_id=None, agent_id=None, run_id=None):
         """
         Delete all memories.
@@ -621,25 +1330,21 @@ class Memory(MemoryBase):
             agent_id (str, optional): ID of the agent to delete memories for. Defaults to None.
             run_id (str, optional): ID of the run to delete memories for. Defaults to None.
         """
-        filters = {}
-        if user_id:
-            filters["user_id"] = user_id
-        if agent_id:
-            filters["agent_id"] = agent_id
-        if run_id:
-            filters["run_id"] = run_id
-
-        if not filters:
-            raise ValueError(
-                "At least one filter is required to delete all memories. If you want to delete all memories, use the `reset()` method."
-            )
+        filters = _delete_all_filters(user_id, agent_id, run_id)
 
         capture_event("mem0.delete_all", self, {"keys": list(filters.keys())})
-        memories = self.vector_store.list(filters=filters)[0]
-        for memory in memories:
-            self._delete_memory(memory.id)
-
-        logger.info(f"Deleted {len(memories)} memories\n")
+        # Nothing is deleted while listing, so any cursor walks the whole listing. Memories added between the
+        # snapshot and the delete are deleted without a history row.
+        snapshot = _DeletionSnapshot()
+        for memory in self._iter_vector_store(filters):
+            snapshot.add(memory)
+        self.vector_store.delete_by_filter(filters)
+        # History only records deletes that happened
+        self.db.add_history_many(snapshot.records)
+        self._unindex_memories(snapshot.ids)
+        # The deleted memories may also be cached under other scopes, e.g. their agent_id
+        self._invalidate_searches([filters, *snapshot.scopes.values()])
+        logger.info(f"Deleted {len(snapshot.records)} memories\n")
 
         if self.enable_graph:
             self.graph.delete_all(filters)
@@ -659,6 +1364,100 @@ class Memory(MemoryBase):
         capture_event("mem0.history", self, {"memory_id": memory_id})
         return self.db.get_history(memory_id)
 
+    def rebuild_lexical_index(self):
+        """
+        Index every memory of the vector store again in the local keyword index used by hybrid search.
+
+        The index follows the writes of this instance and is filled when it is created; rebuild it after other
+        processes wrote to the vector store.
+
+        Returns:
+            dict: The number of memories `indexed`.
+        """
+        if self.lexical_index is None:
+            raise ValueError("No local keyword index: enable hybrid_search on a store without native keyword search")
+        capture_event("mem0.rebuild_lexical_index", self)
+        return {"indexed": self.lexical_index.rebuild(self.vector_store)}
+
+    def export(self, filters=None, stream=None, page_size=EXPORT_PAGE_SIZE):
+        """
+        Export memories with their vectors and history as NDJSON, for backups and migrations.
+
+        Memories are read one page at a time, so the export runs in constant memory. See `mem0.memory.transfer`
+        for the format.
+
+        Args:
+            filters (dict, optional): Payload values the exported memories must match, e.g. {"user_id": "alice"}.
+                Defaults to None (every memory).
+            stream (file, optional): Text file to write the lines to. Defaults to None.
+            page_size (int, optional): Memories read per vector store call. Defaults to 500.
+
+        Returns:
+            dict: The number of `memories` written, when `stream` is given. Otherwise an iterator of the lines.
+        """
+        capture_event("mem0.export", self, {"keys": list((filters or {}).keys()), "streamed": stream is not None})
+        lines = self._export_lines(filters or {}, page_size)
+        if stream is None:
+            return lines
+        written = 0
+        for line in lines:
+            stream.write(line)
+            written += 1
+        # The first line is the header
+        return {"memories": written - 1}
+
+    def _export_lines(self, filters, page_size):
+        yield self._export_header(filters)
+        cursor = None
+        while True:
+            memories, cursor = self.vector_store.list_page(filters=filters, limit=page_size, cursor=cursor)
+            if memories:
+                memory_ids = [str(memory.id) for memory in memories]
+                vectors = self.vector_store.get_vectors(memory_ids)
+                history = self.db.get_history_many(memory_ids)
+                yield from _export_page(memory_ids, memories, vectors, history)
+            if cursor is None:
+                return
+
+    def import_(self, stream, batch_size=EXPORT_PAGE_SIZE, reembed=False):
+        """
+        Import memories exported by `export`, e.g. into a store of another provider.
+
+        Memories are written with one bulk upsert per batch, so importing the same export twice leaves a single
+        copy, and their history rows are restored. Exported vectors are reused when the export's header names the
+        configured embedder provider and model and they have the dimensions the vector store expects; the other
+        memories are embedded again from their text, one batch at a time.
+
+        Args:
+            stream (iterable): Lines of the export, such as an open file.
+            batch_size (int, optional): Memories written per vector store call. Defaults to 500.
+            reembed (bool, optional): Embed every memory again, even when the export was made with the configured
+                embedder. Defaults to False.
+
+        Returns:
+            dict: The number of memories `imported` and of those that were `reembedded`.
+        """
+        capture_event("mem0.import", self, {"batch_size": batch_size, "reembed": reembed})
+        result = {"imported": 0, "reembedded": 0}
+        for header, batch in iter_batches(stream, batch_size):
+            vectors, missing = self._reusable_vectors(header, batch, reembed)
+            if missing:
+                embeddings = self.embedding_model.embed_batch([batch[idx]["payload"]["data"] for idx in missing], "add")
+                _fill_vectors(vectors, missing, embeddings)
+            self._write_imported(batch, vectors)
+            result["imported"] += len(batch)
+            result["reembedded"] += len(missing)
+        logger.info(f"Imported {result['imported']} memories, {result['reembedded']} embedded again")
+        return result
+
+    def _write_imported(self, batch, vectors):
+        memory_ids = [document["id"] for document in batch]
+        payloads = [document["payload"] for document in batch]
+        self.vector_store.insert_many(vectors=vectors, payloads=payloads, ids=memory_ids)
+        self.db.add_history_many(history_records(batch))
+        self._index_memories(memory_ids, payloads)
+        self._invalidate_searches(payloads)
+
     def _create_categories(self, new_memories_with_actions, custom_categories):
         """
         为记忆创建categories标签。
@@ -670,43 +1469,67 @@ class Memory(MemoryBase):
         Returns:
             处理后的new_memories_with_actions字典
         """
-        # 从原始响应中解析出记忆
-        try:
-            new_memories_with_actions = remove_code_blocks(new_memories_with_actions)
-            new_memories_with_actions = json.loads(new_memories_with_actions)
-        except Exception as e:
-            logging.error(f"Invalid JSON response: {e}")
-            new_memories_with_actions = []
-        
-        # 过滤出ADD类型的记忆
-        add_memories = [mem for mem in new_memories_with_actions["memory"] if mem["event"] == "ADD"]
-        
+        # 从原始响应中解析出记忆，并过滤出ADD类型的记忆
+        new_memories_with_actions, add_memories = _split_add_memories(new_memories_with_actions)
+
         if add_memories:
             # 只对ADD类型记忆生成categories标签
-            categories_generating_prompt = get_create_categories_prompt({"memory": add_memories}, custom_categories)
             memories_with_categories = self.llm.generate_response(
-                messages=[{"role": "user", "content": categories_generating_prompt}],
+                messages=_categories_messages(add_memories, custom_categories),
                 response_format={"type": "json_object"},
             )
+            # 将categories合并回原始记忆中，并将非ADD类型记忆添加回结果中
+            _merge_categories(new_memories_with_actions, add_memories, _parse_memory_list(memories_with_categories))
+
+        return new_memories_with_actions
+
+
+    def _apply_memory_actions(self, batch, existing_embeddings):
+        """
+        Apply a `MemoryActionBatch` with one bulk vector-store call and one history insert per event type.
+
+        Returns:
+            list: The per-memory results of the groups that were written successfully.
+        """
+        embeddings = dict(existing_embeddings)
+        for memory_action, texts in batch.texts_to_embed(embeddings).items():
+            if texts:
+                embeddings.update(zip(texts, self.embedding_model.embed_batch(texts, memory_action)))
+
+        applied = []
+        if batch.groups["ADD"]:
             try:
-                memories_with_categories = remove_code_blocks(memories_with_categories)
-                memories_with_categories = json.loads(memories_with_categories)
+                self.vector_store.insert_many(
+                    vectors=batch.vectors("ADD", embeddings), ids=batch.ids("ADD"), payloads=batch.payloads("ADD")
+                )
+                applied.append("ADD")
+                self._index_memories(batch.ids("ADD"), batch.payloads("ADD"))
             except Exception as e:
-                logging.error(f"Invalid JSON response: {e}")
-                memories_with_categories = []
-            
-            # 将categories合并回原始记忆中
-            add_memories_dict = {mem["text"]: mem for mem in add_memories}
-            for mem in memories_with_categories["memory"]:
-                if mem["text"] in add_memories_dict:
-                    add_memories_dict[mem["text"]]["categories"] = mem.get("categories", "")
-            
-            # 将非ADD类型记忆添加回结果中
-            non_add_memories = [mem for mem in new_memories_with_actions["memory"] if mem["event"] != "ADD"]
-            new_memories_with_actions["memory"] = add_memories + non_add_memories
-            
-        return new_memories_with_actions
+                logging.error(f"Error adding memories: {e}")
+        if batch.groups["UPDATE"]:
+            try:
+                self.vector_store.update_many(
+                    vector_ids=batch.ids("UPDATE"),
+                    vectors=batch.vectors("UPDATE", embeddings),
+                    payloads=batch.payloads("UPDATE"),
+                )
+                applied.append("UPDATE")
+                self._index_memories(batch.ids("UPDATE"), batch.payloads("UPDATE"))
+            except Exception as e:
+                logging.error(f"Error updating memories: {e}")
+        if batch.groups["DELETE"]:
+            try:
+                self.vector_store.delete_many(vector_ids=batch.ids("DELETE"))
+                applied.append("DELETE")
+                self._unindex_memories(batch.ids("DELETE"))
+            except Exception as e:
+                logging.error(f"Error deleting memories: {e}")
 
+        self.db.add_history_many(batch.history_records(applied))
+        self._invalidate_searches([entry["payload"] for event in applied for entry in batch.groups[event]])
+        for event in applied:
+            capture_event(EVENT_TELEMETRY_NAMES[event], self, {"memory_ids": batch.ids(event)})
+        return batch.results(applied)
 
     def _create_memory(self, data, existing_embeddings, categories, metadata=None):
         logger.info(f"Creating memory with {data=}\n")
@@ -715,17 +1538,15 @@ class Memory(MemoryBase):
         else:
             embeddings = self.embedding_model.embed(data, "add")
         memory_id = str(uuid.uuid4())
-        metadata = metadata or {}
-        metadata["data"] = data
-        metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-        metadata["categories"] = categories
+        metadata = build_create_payload(data, categories, metadata)
 
         self.vector_store.insert(
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
         )
+        self._index_memories([memory_id], [metadata])
+        self._invalidate_searches([metadata])
         self.db.add_history(memory_id, None, data, categories, "ADD", created_at=metadata["created_at"])
         capture_event("mem0._create_memory", self, {"memory_id": memory_id})
         return memory_id
@@ -739,18 +1560,7 @@ class Memory(MemoryBase):
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
         prev_value = existing_memory.payload.get("data")
 
-        new_metadata = metadata or {}
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
+        new_metadata = build_update_payload(existing_memory.payload, data, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
@@ -761,6 +1571,8 @@ class Memory(MemoryBase):
             vector=embeddings,
             payload=new_metadata,
         )
+        self._index_memories([memory_id], [new_metadata])
+        self._invalidate_searches([existing_memory.payload, new_metadata])
         logger.info(f"Updating memory with ID {memory_id=} with {data=}\n")
         self.db.add_history(
             memory_id,
@@ -779,6 +1591,8 @@ class Memory(MemoryBase):
         existing_memory = self.vector_store.get(vector_id=memory_id)
         prev_value = existing_memory.payload["data"]
         self.vector_store.delete(vector_id=memory_id)
+        self._unindex_memories([memory_id])
+        self._invalidate_searches([existing_memory.payload])
         self.db.add_history(memory_id, prev_value, None, None, "DELETE", is_deleted=1)
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id})
         return memory_id
@@ -790,10 +1604,699 @@ class Memory(MemoryBase):
         logger.warning("Resetting all memories\n")
         self.vector_store.delete_col()
         self.vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+            self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.tenancy
         )
+        if self.lexical_index is not None:
+            self.lexical_index.reset()
+        if self.search_cache is not None:
+            self.search_cache.clear()
         self.db.reset()
         capture_event("mem0.reset", self)
 
+    def close(self):
+        """
+        Stop the deferred-add workers once their running jobs finish, then release the vector store, keyword index
+        and history database. The instance can't be used afterwards.
+        """
+        if self._deferred_adds is not None:
+            self._deferred_adds.close()
+        _close_stores(self)
+
     def chat(self, query):
         raise NotImplementedError("Chat function not implemented yet.")
+
+
+class AsyncMemory(_MemoryCore):
+    """
+    Asyncio counterpart of `Memory`.
+
+    Every public method is a coroutine. The embedder, LLM and vector store are driven through their
+    `aembed`/`agenerate_response`/`asearch`... interfaces, which use native async clients where the
+    provider offers one and fall back to a worker thread otherwise, so a single event loop can keep
+    many memory operations in flight without a thread pool per call.
+    """
+
+    def __init__(self, config: Optional[MemoryConfig] = None):
+        super().__init__(config)
+
+        capture_event("mem0.init", self, {"sync_type": "async"})
+
+    async def add(self, messages: Union[str, List[Dict[str, str]]], **kwargs) -> Dict[str, Any]:
+        """
+        Adds, updates, or deletes memories as appropriate, based on the provided message(s).
+
+        Accepts the same arguments and returns the same structure as `Memory.add`.
+        """
+        params = _resolve_add_params(messages, kwargs, self.config)
+        if self.config.llm.config.get("enable_vision"):
+            params["messages"] = await asyncio.to_thread(
+                parse_vision_messages, params["messages"], self.llm, self.config.llm.config.get("vision_details")
+            )
+        else:
+            params["messages"] = parse_vision_messages(params["messages"])
+
+        vector_store_result, graph_result = await asyncio.gather(
+            self._add_to_vector_store(
+                params["messages"],
+                params["metadata"],
+                params["filters"],
+                params["infer"],
+                params["custom_categories"],
+                prompt=params["prompt"],
+                includes=params["includes"]["vector"],
+                excludes=params["excludes"]["vector"],
+            ),
+            self._add_to_graph(
+                params["messages"],
+                params["filters"],
+                custom_node_types=params["custom_node_types"],
+                custom_relations=params["custom_relations"],
+                graph_prompt=params["graph_prompt"],
+                includes=params["includes"]["graph"],
+                excludes=params["excludes"]["graph"],
+            ),
+        )
+        return self._format_add_result(vector_store_result, graph_result)
+
+    async def _add_to_vector_store(self, messages, metadata, filters, infer, custom_categories=None, prompt=None, includes=None, excludes=None):
+        if not infer:
+            returned_memories = []
+            contents = _message_contents(messages)
+            message_embeddings = dict(zip(contents, await self.embedding_model.aembed_batch(contents, "add")))
+            for content in contents:
+                memory_id = await self._create_memory(content, message_embeddings, categories=[], metadata=metadata)
+                returned_memories.append({"id": memory_id, "memory": content, "event": "ADD"})
+            return returned_memories
+
+        if self._uses_fused_pipeline(prompt):
+            return await self._add_fused(messages, metadata, filters, custom_categories, includes=includes, excludes=excludes)
+
+        new_retrieved_facts = await self._extract_facts(messages, prompt=prompt, includes=includes, excludes=excludes)
+        return await self._reconcile_facts(new_retrieved_facts, metadata, filters, custom_categories)
+
+    async def _add_fused(self, messages, metadata, filters, custom_categories=None, includes=None, excludes=None):
+        """
+        Async version of `Memory._add_fused`.
+        """
+        parsed_messages = parse_messages(messages)
+        conversation_embedding = await self.embedding_model.aembed(parsed_messages, "search")
+        search_results = await self.vector_store.asearch(
+            query=conversation_embedding, limit=FUSED_CANDIDATE_LIMIT, filters=filters
+        )
+        retrieved_old_memory, temp_uuid_mapping, existing_payloads = index_existing_memories([search_results])
+
+        try:
+            response = await self.llm.agenerate_response(
+                messages=_fused_messages(parsed_messages, retrieved_old_memory, includes, excludes, custom_categories),
+                response_format={"type": "json_object"},
+            )
+            batch = _parse_fused_actions(response, temp_uuid_mapping, existing_payloads, metadata)
+        except Exception as e:
+            logging.error(f"Error in fused memory actions: {e}")
+            batch = MemoryActionBatch()
+        returned_memories = await self._apply_memory_actions(batch, {})
+
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": list(filters.keys()), "sync_type": "async", "pipeline": "fused"},
+        )
+
+        return returned_memories
+
+    async def _extract_facts(self, messages, prompt=None, includes=None, excludes=None):
+        """
+        Async version of `Memory._extract_facts`.
+        """
+        response = await self.llm.agenerate_response(
+            messages=_fact_extraction_messages(messages, prompt or self.custom_prompt, includes, excludes),
+            response_format={"type": "json_object"},
+        )
+        return _parse_facts(response)
+
+    async def _reconcile_facts(self, new_retrieved_facts, metadata, filters, custom_categories=None):
+        """
+        Async version of `Memory._reconcile_facts`.
+        """
+        new_message_embeddings = dict(zip(new_retrieved_facts, await self.embedding_model.aembed_batch(new_retrieved_facts, "add")))
+        search_results = await self.vector_store.asearch_batch(
+            queries=[new_message_embeddings[fact] for fact in new_retrieved_facts],
+            limit=5,
+            filters=filters,
+        )
+        retrieved_old_memory, temp_uuid_mapping, existing_payloads = index_existing_memories(search_results)
+
+        try:
+            new_memories_with_actions = await self.llm.agenerate_response(
+                messages=_reconcile_messages(retrieved_old_memory, new_retrieved_facts),
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logging.error(f"Error in new_memories_with_actions: {e}")
+            new_memories_with_actions = []
+
+        new_memories_with_actions = await self._create_categories(new_memories_with_actions, custom_categories)
+
+        batch = _plan_actions(new_memories_with_actions, temp_uuid_mapping, existing_payloads, metadata)
+        returned_memories = await self._apply_memory_actions(batch, new_message_embeddings)
+
+        capture_event("mem0.add", self, {"version": self.api_version, "keys": list(filters.keys()), "sync_type": "async"})
+
+        return returned_memories
+
+    async def _add_to_graph(self, messages, filters, custom_node_types=None, custom_relations=None, graph_prompt=None, includes=None, excludes=None):
+        added_entities = []
+        if self.enable_graph:
+            data = _graph_input(messages, filters)
+            added_entities = await asyncio.to_thread(
+                self.graph.add, data, filters, custom_node_types, custom_relations, graph_prompt, includes, excludes
+            )
+
+        return added_entities
+
+    async def _create_categories(self, new_memories_with_actions, custom_categories):
+        """
+        Async version of `Memory._create_categories`.
+        """
+        new_memories_with_actions, add_memories = _split_add_memories(new_memories_with_actions)
+
+        if add_memories:
+            memories_with_categories = await self.llm.agenerate_response(
+                messages=_categories_messages(add_memories, custom_categories),
+                response_format={"type": "json_object"},
+            )
+            _merge_categories(new_memories_with_actions, add_memories, _parse_memory_list(memories_with_categories))
+
+        return new_memories_with_actions
+
+    async def get(self, memory_id):
+        """
+        Retrieve a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to retrieve.
+
+        Returns:
+            dict: Retrieved memory.
+        """
+        capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
+        memory = await self.vector_store.aget(vector_id=memory_id)
+        if not memory:
+            return None
+        return _format_memory(memory)
+
+    async def get_all(self, **kwargs):
+        """
+        List all memories.
+
+        Parameters:
+        **kwargs:
+            user_id (str, optional)
+            agent_id (str, optional)
+            run_id (str, optional)
+            limit (int, optional)
+            page_size (int, optional): Return one page of this many memories, with the `next_cursor` to pass back
+                for the following page (None after the last one).
+            cursor (str, optional): `next_cursor` of the previous page. Implies paging, with `limit` as the page
+                size when `page_size` is not given.
+
+        Returns:
+            list: List of all memories.
+        """
+        params, filters, limit, paginate = self._get_all_options(kwargs)
+
+        capture_event(
+            "mem0.get_all",
+            self,
+            {"limit": limit, "keys": list(filters.keys()), "paginate": paginate, "sync_type": "async"},
+        )
+
+        if paginate:
+            fetch_memories = self._get_page_from_vector_store(
+                filters, params.get("page_size") or limit, params.get("cursor")
+            )
+        else:
+            fetch_memories = self._get_all_from_vector_store(filters, limit)
+
+        if self.enable_graph:
+            all_memories, graph_entities = await asyncio.gather(
+                fetch_memories,
+                asyncio.to_thread(self.graph.get_all, filters, limit),
+            )
+        else:
+            all_memories = await fetch_memories
+            graph_entities = None
+        return self._format_results("get_all", all_memories, graph_entities, paginate)
+
+    async def iter_all(self, page_size=100, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all memories, fetching them from the vector store one page at a time.
+
+        Accepts the same arguments as `Memory.iter_all`.
+        """
+        filters = _scope_filters(self._prepare_params(kwargs))
+        capture_event(
+            "mem0.iter_all", self, {"page_size": page_size, "keys": list(filters.keys()), "sync_type": "async"}
+        )
+
+        async for memory in self._iter_vector_store(filters, page_size):
+            yield _format_listed_memory(memory)
+
+    async def _iter_vector_store(self, filters, page_size=LIST_PAGE_SIZE):
+        """Yield the vector store records matching `filters`, fetching them one page at a time."""
+        cursor = None
+        while True:
+            memories, cursor = await self.vector_store.alist_page(filters=filters, limit=page_size, cursor=cursor)
+            for memory in memories:
+                yield memory
+            if cursor is None:
+                return
+
+    async def _get_all_from_vector_store(self, filters, limit):
+        memories = await self.vector_store.alist(filters=filters, limit=limit)
+        return [_format_listed_memory(mem) for mem in memories[0]]
+
+    async def _get_page_from_vector_store(self, filters, page_size, cursor=None):
+        memories, next_cursor = await self.vector_store.alist_page(filters=filters, limit=page_size, cursor=cursor)
+        return [_format_listed_memory(mem) for mem in memories], next_cursor
+
+    async def search(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Search for memories.
+
+        Accepts the same arguments and returns the same structure as `Memory.search`.
+        """
+        return await self._search(query, kwargs)
+
+    async def search_many(self, searches: List[Dict[str, Any]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run several searches, embedding their queries in one `aembed_batch` call.
+
+        Accepts the same arguments and returns the same structure as `Memory.search_many`.
+        """
+        embeddings = await self._embed_queries(searches)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(search):
+            async with semaphore:
+                try:
+                    kwargs = {key: value for key, value in search.items() if key != "query"}
+                    return await self._search(search["query"], kwargs, embeddings.get(search["query"]))
+                except Exception as e:
+                    logger.error(f"Error in search_many: {e}")
+                    return {"error": str(e)}
+
+        return list(await asyncio.gather(*(run(search) for search in searches)))
+
+    async def _embed_queries(self, searches):
+        queries = list(dict.fromkeys(search.get("query") for search in searches if search.get("query")))
+        if not queries:
+            return {}
+        try:
+            return dict(zip(queries, await self.embedding_model.aembed_batch(queries, "search")))
+        except Exception as e:
+            logger.error(f"Error embedding the queries of search_many: {e}")
+            return {}
+
+    async def _search(self, query, kwargs, embeddings=None):
+        filters, limit, rerank, hybrid = self._search_options(kwargs)
+
+        capture_event(
+            "mem0.search",
+            self,
+            {"limit": limit, "version": self.api_version, "keys": list(filters.keys()), "sync_type": "async"},
+        )
+
+        if self.enable_graph:
+            original_memories, graph_entities = await asyncio.gather(
+                self._search_memories(query, filters, limit, rerank, hybrid, embeddings),
+                asyncio.to_thread(self.graph.search, query, filters, limit),
+            )
+        else:
+            original_memories = await self._search_memories(query, filters, limit, rerank, hybrid, embeddings)
+            graph_entities = None
+        return self._format_results("search", original_memories, graph_entities)
+
+    async def _search_memories(self, query, filters, limit, rerank=False, hybrid=False, embeddings=None):
+        """`_search_vector_store` behind the search cache, when it is enabled."""
+        if self.search_cache is None:
+            return await self._search_vector_store(query, filters, limit, rerank, hybrid, embeddings)
+        key = self.search_cache.key(query, filters, limit, rerank=rerank, hybrid=hybrid)
+        memories = self.search_cache.get(key)
+        if memories is None:
+            memories = await self._search_vector_store(query, filters, limit, rerank, hybrid, embeddings)
+            self.search_cache.put(key, memories)
+        return memories
+
+    async def _search_vector_store(self, query, filters, limit, rerank=False, hybrid=False, embeddings=None):
+        if hybrid:
+            memories, embeddings = await self._hybrid_search(query, filters, limit, embeddings)
+        else:
+            if embeddings is None:
+                embeddings = await self.embedding_model.aembed(query, "search")
+            memories = await self.vector_store.asearch(query=embeddings, limit=limit, filters=filters)
+        rerank_scores = None
+        if rerank and memories:
+            memories, rerank_scores = await asyncio.to_thread(self._rerank_memories, query, memories, embeddings)
+        return _format_search_results(memories, rerank_scores)
+
+    async def _hybrid_search(self, query, filters, limit, embeddings=None):
+        """Run the keyword and vector searches concurrently and fuse them, returning the hits and query embedding."""
+        candidates = limit * self.config.hybrid_search.candidate_multiplier
+
+        async def vector_search():
+            vector = embeddings if embeddings is not None else await self.embedding_model.aembed(query, "search")
+            return await self.vector_store.asearch(query=vector, limit=candidates, filters=filters), vector
+
+        (vector_hits, embeddings), lexical_hits = await asyncio.gather(
+            vector_search(), self._keyword_search(query, candidates, filters)
+        )
+        return fuse_hits(vector_hits, lexical_hits, self.config.hybrid_search, limit), embeddings
+
+    async def _keyword_search(self, query, limit, filters):
+        if self.lexical_index is not None:
+            return await asyncio.to_thread(self.lexical_index.search, query, limit=limit, filters=filters)
+        return await self.vector_store.akeyword_search(query=query, limit=limit, filters=filters)
+
+    async def _index_memories(self, memory_ids, payloads):
+        """Keep the local keyword index in step with the vector store; a failure only degrades hybrid search."""
+        if self.lexical_index is None:
+            return
+        try:
+            await asyncio.to_thread(self.lexical_index.upsert, memory_ids, payloads)
+        except Exception as e:
+            logger.error(f"Error indexing memories for keyword search: {e}")
+
+    async def _unindex_memories(self, memory_ids):
+        if self.lexical_index is None:
+            return
+        try:
+            await asyncio.to_thread(self.lexical_index.delete, memory_ids)
+        except Exception as e:
+            logger.error(f"Error removing memories from the keyword index: {e}")
+
+    async def update(self, memory_id, data):
+        """
+        Update a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to update.
+            data (dict): Data to update the memory with.
+
+        Returns:
+            dict: Updated memory.
+        """
+        capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
+
+        existing_embeddings = {data: await self.embedding_model.aembed(data, "update")}
+
+        await self._update_memory(memory_id, data, existing_embeddings)
+        return {"message": "Memory updated successfully!"}
+
+    async def delete(self, memory_id):
+        """
+        Delete a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to delete.
+        """
+        capture_event("mem0.delete", self, {"memory_id": memory_id, "sync_type": "async"})
+        await self._delete_memory(memory_id)
+        return {"message": "Memory deleted successfully!"}
+
+    async def delete_many(self, memory_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Delete several memories by ID with one vector store call.
+
+        Accepts the same arguments and returns the same structure as `Memory.delete_many`.
+        """
+        capture_event("mem0.delete_many", self, {"count": len(memory_ids), "sync_type": "async"})
+        memory_ids = list(dict.fromkeys(memory_ids))
+        existing = await asyncio.gather(*(self.vector_store.aget(vector_id=memory_id) for memory_id in memory_ids))
+        found = [memory for memory in existing if memory is not None]
+        if found:
+            await self.vector_store.adelete_many(vector_ids=[memory.id for memory in found])
+            await self._unindex_memories([memory.id for memory in found])
+            self._invalidate_searches([memory.payload for memory in found])
+            await asyncio.to_thread(self.db.add_history_many, [_deletion_record(memory) for memory in found])
+        return _delete_many_result(memory_ids, found)
+
+    async def delete_all(self, user_id=None, agent_id=None, run_id=None):
+        """
+        Delete all memories.
+
+        Args:
+            user_id (str, optional): ID of the user to delete memories for. Defaults to None.
+            agent_id (str, optional): ID of the agent to delete memories for. Defaults to None.
+            run_id (str, optional): ID of the run to delete memories for. Defaults to None.
+        """
+        filters = _delete_all_filters(user_id, agent_id, run_id)
+
+        capture_event("mem0.delete_all", self, {"keys": list(filters.keys()), "sync_type": "async"})
+        # Snapshot, delete by filter, then write the history, see `Memory.delete_all`
+        snapshot = _DeletionSnapshot()
+        async for memory in self._iter_vector_store(filters):
+            snapshot.add(memory)
+        await self.vector_store.adelete_by_filter(filters)
+        await asyncio.to_thread(self.db.add_history_many, snapshot.records)
+        await self._unindex_memories(snapshot.ids)
+        self._invalidate_searches([filters, *snapshot.scopes.values()])
+        logger.info(f"Deleted {len(snapshot.records)} memories\n")
+
+        if self.enable_graph:
+            await asyncio.to_thread(self.graph.delete_all, filters)
+
+        return {"message": "Memories deleted successfully!"}
+
+    async def history(self, memory_id):
+        """
+        Get the history of changes for a memory by ID.
+
+        Args:
+            memory_id (str): ID of the memory to get history for.
+
+        Returns:
+            list: List of changes for the memory.
+        """
+        capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "async"})
+        return await asyncio.to_thread(self.db.get_history, memory_id)
+
+    async def rebuild_lexical_index(self):
+        """
+        Index every memory of the vector store again in the local keyword index used by hybrid search.
+
+        Accepts the same arguments and returns the same structure as `Memory.rebuild_lexical_index`.
+        """
+        if self.lexical_index is None:
+            raise ValueError("No local keyword index: enable hybrid_search on a store without native keyword search")
+        capture_event("mem0.rebuild_lexical_index", self, {"sync_type": "async"})
+        return {"indexed": await asyncio.to_thread(self.lexical_index.rebuild, self.vector_store)}
+
+    async def export(self, filters=None, stream=None, page_size=EXPORT_PAGE_SIZE):
+        """
+        Export memories with their vectors and history as NDJSON.
+
+        Accepts the same arguments and returns the same structure as `Memory.export`, with an async iterator of
+        the lines when `stream` is not given.
+        """
+        capture_event(
+            "mem0.export",
+            self,
+            {"keys": list((filters or {}).keys()), "streamed": stream is not None, "sync_type": "async"},
+        )
+        lines = self._export_lines(filters or {}, page_size)
+        if stream is None:
+            return lines
+        written = 0
+        async for line in lines:
+            stream.write(line)
+            written += 1
+        return {"memories": written - 1}
+
+    async def _export_lines(self, filters, page_size):
+        yield self._export_header(filters)
+        cursor = None
+        while True:
+            memories, cursor = await self.vector_store.alist_page(filters=filters, limit=page_size, cursor=cursor)
+            if memories:
+                memory_ids = [str(memory.id) for memory in memories]
+                vectors, history = await asyncio.gather(
+                    self.vector_store.aget_vectors(memory_ids),
+                    asyncio.to_thread(self.db.get_history_many, memory_ids),
+                )
+                for line in _export_page(memory_ids, memories, vectors, history):
+                    yield line
+            if cursor is None:
+                return
+
+    async def import_(self, stream, batch_size=EXPORT_PAGE_SIZE, reembed=False):
+        """
+        Import memories exported by `export`.
+
+        Accepts the same arguments and returns the same structure as `Memory.import_`; `stream` may also be an
+        async iterable of lines, such as `mem0.memory.transfer.aiter_lines` over a request body.
+        """
+        capture_event("mem0.import", self, {"batch_size": batch_size, "reembed": reembed, "sync_type": "async"})
+        result = {"imported": 0, "reembedded": 0}
+        async for header, batch in aiter_batches(stream, batch_size):
+            vectors, missing = self._reusable_vectors(header, batch, reembed)
+            if missing:
+                embeddings = await self.embedding_model.aembed_batch(
+                    [batch[idx]["payload"]["data"] for idx in missing], "add"
+                )
+                _fill_vectors(vectors, missing, embeddings)
+            await self._write_imported(batch, vectors)
+            result["imported"] += len(batch)
+            result["reembedded"] += len(missing)
+        logger.info(f"Imported {result['imported']} memories, {result['reembedded']} embedded again")
+        return result
+
+    async def _write_imported(self, batch, vectors):
+        memory_ids = [document["id"] for document in batch]
+        payloads = [document["payload"] for document in batch]
+        await self.vector_store.ainsert_many(vectors=vectors, payloads=payloads, ids=memory_ids)
+        await asyncio.to_thread(self.db.add_history_many, history_records(batch))
+        await self._index_memories(memory_ids, payloads)
+        self._invalidate_searches(payloads)
+
+    async def _apply_memory_actions(self, batch, existing_embeddings):
+        """
+        Apply a `MemoryActionBatch` with one bulk vector-store call and one history insert per event type.
+
+        Returns:
+            list: The per-memory results of the groups that were written successfully.
+        """
+        embeddings = dict(existing_embeddings)
+        for memory_action, texts in batch.texts_to_embed(embeddings).items():
+            if texts:
+                embeddings.update(zip(texts, await self.embedding_model.aembed_batch(texts, memory_action)))
+
+        applied = []
+        if batch.groups["ADD"]:
+            try:
+                await self.vector_store.ainsert_many(
+                    vectors=batch.vectors("ADD", embeddings), ids=batch.ids("ADD"), payloads=batch.payloads("ADD")
+                )
+                applied.append("ADD")
+                await self._index_memories(batch.ids("ADD"), batch.payloads("ADD"))
+            except Exception as e:
+                logging.error(f"Error adding memories: {e}")
+        if batch.groups["UPDATE"]:
+            try:
+                await self.vector_store.aupdate_many(
+                    vector_ids=batch.ids("UPDATE"),
+                    vectors=batch.vectors("UPDATE", embeddings),
+                    payloads=batch.payloads("UPDATE"),
+                )
+                applied.append("UPDATE")
+                await self._index_memories(batch.ids("UPDATE"), batch.payloads("UPDATE"))
+            except Exception as e:
+                logging.error(f"Error updating memories: {e}")
+        if batch.groups["DELETE"]:
+            try:
+                await self.vector_store.adelete_many(vector_ids=batch.ids("DELETE"))
+                applied.append("DELETE")
+                await self._unindex_memories(batch.ids("DELETE"))
+            except Exception as e:
+                logging.error(f"Error deleting memories: {e}")
+
+        await asyncio.to_thread(self.db.add_history_many, batch.history_records(applied))
+        self._invalidate_searches([entry["payload"] for event in applied for entry in batch.groups[event]])
+        for event in applied:
+            capture_event(EVENT_TELEMETRY_NAMES[event], self, {"memory_ids": batch.ids(event), "sync_type": "async"})
+        return batch.results(applied)
+
+    async def _create_memory(self, data, existing_embeddings, categories, metadata=None):
+        logger.info(f"Creating memory with {data=}\n")
+        if data in existing_embeddings:
+            embeddings = existing_embeddings[data]
+        else:
+            embeddings = await self.embedding_model.aembed(data, "add")
+        memory_id = str(uuid.uuid4())
+        metadata = build_create_payload(data, categories, metadata)
+
+        await self.vector_store.ainsert(
+            vectors=[embeddings],
+            ids=[memory_id],
+            payloads=[metadata],
+        )
+        await self._index_memories([memory_id], [metadata])
+        self._invalidate_searches([metadata])
+        await asyncio.to_thread(
+            self.db.add_history, memory_id, None, data, categories, "ADD", created_at=metadata["created_at"]
+        )
+        capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
+        return memory_id
+
+    async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+        logger.info(f"Updating memory with {data=}\n")
+
+        try:
+            existing_memory = await self.vector_store.aget(vector_id=memory_id)
+        except Exception:
+            raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
+        prev_value = existing_memory.payload.get("data")
+
+        new_metadata = build_update_payload(existing_memory.payload, data, metadata)
+
+        if data in existing_embeddings:
+            embeddings = existing_embeddings[data]
+        else:
+            embeddings = await self.embedding_model.aembed(data, "update")
+        await self.vector_store.aupdate(
+            vector_id=memory_id,
+            vector=embeddings,
+            payload=new_metadata,
+        )
+        await self._index_memories([memory_id], [new_metadata])
+        self._invalidate_searches([existing_memory.payload, new_metadata])
+        logger.info(f"Updating memory with ID {memory_id=} with {data=}\n")
+        await asyncio.to_thread(
+            self.db.add_history,
+            memory_id,
+            prev_value,
+            data,
+            None,
+            "UPDATE",
+            created_at=new_metadata["created_at"],
+            updated_at=new_metadata["updated_at"],
+        )
+        capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
+        return memory_id
+
+    async def _delete_memory(self, memory_id):
+        logger.info(f"Deleting memory with {memory_id=}\n")
+        existing_memory = await self.vector_store.aget(vector_id=memory_id)
+        prev_value = existing_memory.payload["data"]
+        await self.vector_store.adelete(vector_id=memory_id)
+        await self._unindex_memories([memory_id])
+        self._invalidate_searches([existing_memory.payload])
+        await asyncio.to_thread(self.db.add_history, memory_id, prev_value, None, None, "DELETE", is_deleted=1)
+        capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "async"})
+        return memory_id
+
+    async def reset(self):
+        """
+        Reset the memory store.
+        """
+        logger.warning("Resetting all memories\n")
+        await asyncio.to_thread(self.vector_store.delete_col)
+        self.vector_store = await asyncio.to_thread(
+            VectorStoreFactory.create,
+            self.config.vector_store.provider,
+            self.config.vector_store.config,
+            self.config.vector_store.tenancy,
+        )
+        if self.lexical_index is not None:
+            await asyncio.to_thread(self.lexical_index.reset)
+        if self.search_cache is not None:
+            self.search_cache.clear()
+        await asyncio.to_thread(self.db.reset)
+        capture_event("mem0.reset", self, {"sync_type": "async"})
+
+    async def close(self):
+        """Release the vector store, keyword index and history database. The instance can't be used afterwards."""
+        await asyncio.to_thread(_close_stores, self)
+
+    async def chat(self, query):
+        raise NotImplementedError("Chat function not implemented yet.")
@@ -0,0 +1,181 @@
+import asyncio
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def config_id(config):
+    """Stable identifier of a configuration dict: a hash of its canonical JSON."""
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+class MemoryPool:
+    """
+    LRU pool of memory instances keyed by the hash of their configuration.
+
+    An instance is built the first time its configuration is requested and reused afterwards, so switching between
+    configurations does not reconnect to the vector store or rebuild the LLM and embedder clients. Concurrent
+    requests for a configuration that is still being built wait for that build instead of starting their own. When
+    more than `max_size` configurations are in use the least recently used instance is dropped from the pool.
+
+    Dropped instances are closed with `close`, if given, once idle: callers that `acquire` an instance hold a lease
+    on it until they `release` it, and an evicted instance is closed when its last lease is released. Instances
+    returned by `get` are not leased, so they may be closed as soon as they are evicted.
+    """
+
+    def __init__(self, factory, max_size=8, close=None):
+        """
+        Args:
+            factory (callable): Builds an instance from a configuration dict.
+            max_size (int, optional): Instances kept in the pool. Defaults to 8.
+            close (callable, optional): Releases an evicted instance. It may be a coroutine function when instances
+                are only taken with `aget`/`aacquire`. Defaults to None (evicted instances are left to the garbage
+                collector).
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._close = close
+        self._instances = OrderedDict()
+        self._builds = {}
+        # Leases by id() of the instance, and the evicted instances waiting for their last lease to be released
+        self._leases = {}
+        self._retired = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _cached(self, key, lease=False):
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._instances.move_to_end(key)
+                self._stats["hits"] += 1
+                if lease:
+                    self._leases[id(instance)] = self._leases.get(id(instance), 0) + 1
+            return instance
+
+    def _get(self, config, lease=False):
+        """Return the instance and the evicted instances that are idle, for the caller to close."""
+        key = config_id(config)
+        instance = self._cached(key, lease)
+        if instance is not None:
+            return instance, []
+
+        with self._lock:
+            build_lock = self._builds.setdefault(key, threading.Lock())
+        with build_lock:
+            # Another thread may have finished building it while this one waited
+            instance = self._cached(key, lease)
+            if instance is not None:
+                return instance, []
+            instance = self.factory(copy.deepcopy(config))
+            idle = []
+            with self._lock:
+                self._builds.pop(key, None)
+                self._instances[key] = instance
+                self._stats["misses"] += 1
+                if lease:
+                    self._leases[id(instance)] = self._leases.get(id(instance), 0) + 1
+                while len(self._instances) > self.max_size:
+                    _, evicted = self._instances.popitem(last=False)
+                    self._stats["evictions"] += 1
+                    if self._leases.get(id(evicted)):
+                        self._retired[id(evicted)] = evicted
+                    else:
+                        idle.append(evicted)
+        return instance, idle
+
+    def _release(self, instance):
+        """Drop a lease, returning the instance if it was evicted and this was its last lease."""
+        with self._lock:
+            leases = self._leases.get(id(instance), 0) - 1
+            if leases > 0:
+                self._leases[id(instance)] = leases
+                return None
+            self._leases.pop(id(instance), None)
+            return self._retired.pop(id(instance), None)
+
+    def _close_idle(self, instances):
+        for instance in instances:
+            if self._close is None:
+                continue
+            try:
+                self._close(instance)
+            except Exception as e:
+                logger.error(f"Error closing an evicted instance: {e}")
+
+    async def _aclose_idle(self, instances):
+        for instance in instances:
+            if self._close is None:
+                continue
+            try:
+                result = self._close(instance)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error closing an evicted instance: {e}")
+
+    def get(self, config):
+        """
+        Return the instance for a configuration, building it with `factory` if the pool does not hold one.
+
+        Args:
+            config (dict): Configuration passed to `factory`. It is copied first, as `from_config` fills in defaults.
+
+        Returns:
+            The pooled instance.
+        """
+        instance, idle = self._get(config)
+        self._close_idle(idle)
+        return instance
+
+    async def aget(self, config):
+        """Async `get`: pooled instances are returned directly, new ones are built in a worker thread."""
+        instance = self._cached(config_id(config))
+        if instance is not None:
+            return instance
+        instance, idle = await asyncio.to_thread(self._get, config)
+        await self._aclose_idle(idle)
+        return instance
+
+    def acquire(self, config):
+        """`get` an instance and hold a lease on it, so it isn't closed before `release`."""
+        instance, idle = self._get(config, lease=True)
+        self._close_idle(idle)
+        return instance
+
+    def release(self, instance):
+        """Give back a lease taken with `acquire`, closing the instance if it was evicted in the meantime."""
+        self._close_idle([retired for retired in [self._release(instance)] if retired is not None])
+
+    async def aacquire(self, config):
+        """Async `acquire`."""
+        instance = self._cached(config_id(config), lease=True)
+        if instance is not None:
+            return instance
+        instance, idle = await asyncio.to_thread(self._get, config, True)
+        await self._aclose_idle(idle)
+        return instance
+
+    async def arelease(self, instance):
+        """Async `release`."""
+        await self._aclose_idle([retired for retired in [self._release(instance)] if retired is not None])
+
+    def instances(self):
+        with self._lock:
+            return list(self._instances.values())
+
+    def stats(self):
+        """
+        Pool effectiveness.
+
+        Returns:
+            dict: Number of pooled instances, hits, misses (instances built) and evictions.
+        """
+        with self._lock:
+            return {"size": len(self._instances), **self._stats}
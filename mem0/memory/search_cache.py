@@ -0,0 +1,121 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# Payload fields that scope a memory; every search filters on at least one of them
+SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+
+class SearchCache:
+    """
+    LRU cache of `Memory.search` results with write-aware invalidation.
+
+    Every user_id/agent_id/run_id has a generation that is raised after each write to one of its memories. Cache
+    keys embed the generations of the ids a search filters on, so results computed before a write are never served
+    after it; they simply stop being reachable and age out of the LRU.
+
+    Only the `max_scopes` most recently used generations are kept. Ids without one share a floor generation, which
+    is raised past every generation handed out so far whenever one is evicted, so an evicted id never falls back to
+    a generation its stale results were cached under.
+    """
+
+    def __init__(self, max_entries=1024, ttl=None, max_scopes=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_scopes = max_scopes if max_scopes is not None else 4 * max_entries
+        self._entries = OrderedDict()
+        self._generations = OrderedDict()
+        self._last_generation = 0
+        self._floor = 0
+        # Bumped by `clear`, invalidating every scope at once
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def key(self, query, filters, limit, **options):
+        """
+        Build the cache key of a search.
+
+        The query is compared with its whitespace collapsed; filters and options are compared by value.
+        """
+        with self._lock:
+            generations = tuple(self._generation((name, str(filters[name]))) for name in SCOPE_KEYS if name in filters)
+            epoch = self._epoch
+        return (
+            " ".join(query.split()),
+            json.dumps(filters, sort_keys=True, default=str),
+            limit,
+            tuple(sorted(options.items())),
+            generations,
+            epoch,
+        )
+
+    def _generation(self, generation_key):
+        if generation_key not in self._generations:
+            return self._floor
+        self._generations.move_to_end(generation_key)
+        return self._generations[generation_key]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            value = entry[1]
+        # Callers may modify the results they get back
+        return copy.deepcopy(value)
+
+    def put(self, key, value):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, scopes):
+        """
+        Make cached searches over the given scopes stale.
+
+        Args:
+            scopes (list): Payloads or filters of the memories that were written; their user_id, agent_id and
+                run_id are bumped.
+        """
+        with self._lock:
+            self._last_generation += 1
+            for scope in scopes:
+                for name in SCOPE_KEYS:
+                    if scope.get(name) is not None:
+                        generation_key = (name, str(scope[name]))
+                        self._generations[generation_key] = self._last_generation
+                        self._generations.move_to_end(generation_key)
+            while len(self._generations) > self.max_scopes:
+                self._generations.popitem(last=False)
+                self._floor = self._last_generation
+            self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+            self._stats["invalidations"] += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
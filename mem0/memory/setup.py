@@ -5,10 +5,10 @@ import uuid
 # Set up the directory path
 home_dir = os.path.expanduser("~")
 moremem_dir = os.environ.get("MOREMEM_DIR") or os.path.join(home_dir, ".moremem")
-os.makedirs(moremem_dir, exist_ok=True)
 
 
 def setup_config():
+    os.makedirs(moremem_dir, exist_ok=True)
     config_path = os.path.join(moremem_dir, "config.json")
     if not os.path.exists(config_path):
         user_id = str(uuid.uuid4())
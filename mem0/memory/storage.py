@@ -6,8 +6,12 @@ import threading
 class SQLiteManager:
     def __init__(self, db_path=":memory:"):
         # 默认在内存中创建，程序结束后丢失
-        self.connection = sqlite3.connect(db_path, check_same_thread=False)
-        self._lock = threading.Lock()
+        # Server workers in other processes may write to the same file: wait for their locks rather than fail
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._lock = threading.RLock()
+        if db_path != ":memory:":
+            # Readers no longer block the writer, and vice versa
+            self.connection.execute("PRAGMA journal_mode=WAL")
         self._migrate_history_table()
         self._create_history_table()
 
@@ -92,6 +96,8 @@ class SQLiteManager:
                     )
                 """
                 )
+                # History is always read by memory, and exports read it for a page of memories at a time
+                self.connection.execute("CREATE INDEX IF NOT EXISTS history_memory_id_idx ON history (memory_id)")
 
     def add_history(
         self,
@@ -124,6 +130,41 @@ class SQLiteManager:
                     ),
                 )
 
+    def add_history_many(self, records):
+        """
+        Insert many history rows in one transaction.
+
+        Each record is a dict with the keyword arguments of `add_history`
+        (memory_id, old_memory, new_memory, categories, event and optionally created_at, updated_at, is_deleted).
+        Records may carry the `id` of the row, as imports do; a row with that id is replaced, so importing the same
+        history twice does not duplicate it.
+        """
+        rows = [
+            (
+                record.get("id") or str(uuid.uuid4()),
+                record["memory_id"],
+                record.get("old_memory"),
+                record.get("new_memory"),
+                ",".join(record["categories"]) if record.get("categories") else None,
+                record["event"],
+                record.get("created_at"),
+                record.get("updated_at"),
+                record.get("is_deleted", 0),
+            )
+            for record in records
+        ]
+        if not rows:
+            return
+        with self._lock:
+            with self.connection:
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO history (id, memory_id, old_memory, new_memory, categories, event, created_at, updated_at, is_deleted)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+
     def get_history(self, memory_id):
         with self._lock:
             cursor = self.connection.execute(
@@ -150,8 +191,53 @@ class SQLiteManager:
                 for row in rows
             ]
 
+    def get_history_many(self, memory_ids):
+        """
+        History of several memories with one query.
+
+        Args:
+            memory_ids (list): IDs of the memories.
+
+        Returns:
+            dict: The rows of `get_history`, plus `is_deleted`, by memory ID. Memories without history are left out.
+        """
+        memory_ids = list(memory_ids)
+        if not memory_ids:
+            return {}
+        with self._lock:
+            cursor = self.connection.execute(
+                f"""
+                SELECT id, memory_id, old_memory, new_memory, categories, event, created_at, updated_at, is_deleted
+                FROM history
+                WHERE memory_id IN ({", ".join("?" * len(memory_ids))})
+                ORDER BY updated_at ASC
+            """,
+                memory_ids,
+            )
+            rows = cursor.fetchall()
+        history = {}
+        for row in rows:
+            history.setdefault(row[1], []).append(
+                {
+                    "id": row[0],
+                    "memory_id": row[1],
+                    "old_memory": row[2],
+                    "new_memory": row[3],
+                    "categories": row[4].split(",") if row[4] else [],
+                    "event": row[5],
+                    "created_at": row[6],
+                    "updated_at": row[7],
+                    "is_deleted": row[8],
+                }
+            )
+        return history
+
     def reset(self):
         with self._lock:
             with self.connection:
                 self.connection.execute("DROP TABLE IF EXISTS history")
                 self._create_history_table()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
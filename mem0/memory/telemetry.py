@@ -1,9 +1,13 @@
+import atexit
+import collections
 import logging
 import os
 import platform
+import random
 import sys
-
-from posthog import Posthog
+import threading
+import time
+from datetime import datetime, timezone
 
 import mem0
 from mem0.memory.setup import get_user_id, setup_config
@@ -16,38 +20,127 @@ if isinstance(MEM0_TELEMETRY, str):
 if not isinstance(MEM0_TELEMETRY, bool):
     raise ValueError("MEM0_TELEMETRY must be a boolean value.")
 
+# Share of internal events (fired once per memory written) that are sent
+MEM0_TELEMETRY_SAMPLE_RATE = float(os.environ.get("MEM0_TELEMETRY_SAMPLE_RATE", "0.1"))
+
+# Internal events are named after private methods, e.g. "mem0._create_memory"
+SAMPLED_EVENT_PREFIX = "mem0._"
+
+logger = logging.getLogger(__name__)
+
 logging.getLogger("posthog").setLevel(logging.CRITICAL + 1)
 logging.getLogger("urllib3").setLevel(logging.CRITICAL + 1)
 
 
 class AnonymousTelemetry:
-    def __init__(self, project_api_key, host):
-        self.posthog = Posthog(project_api_key=project_api_key, host=host)
-        # Call setup config to ensure that the user_id is generated
-        setup_config()
-        self.user_id = get_user_id()
-        if not MEM0_TELEMETRY:
-            self.posthog.disabled = True
+    """
+    Anonymous usage events, sent to PostHog from a background thread.
+
+    When disabled, `capture_event` returns immediately and nothing is imported, written or started. When enabled,
+    the user id, host properties and flush thread are set up on the first event; events are appended to a bounded
+    deque (a thread-safe append that never blocks; the oldest event is dropped when it is full) and the daemon
+    thread hands them to PostHog, imported on the first flush, every `flush_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        project_api_key,
+        host,
+        enabled=MEM0_TELEMETRY,
+        max_queue_size=1000,
+        flush_interval=5.0,
+        sample_rate=MEM0_TELEMETRY_SAMPLE_RATE,
+    ):
+        self.project_api_key = project_api_key
+        self.host = host
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self.dropped = 0
+        self.posthog = None
+        self._queue = collections.deque(maxlen=max_queue_size)
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self.user_id = None
+        self.static_properties = None
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            # Call setup config to ensure that the user_id is generated
+            setup_config()
+            self.user_id = get_user_id()
+            self.static_properties = {
+                "client_source": "python",
+                "client_version": mem0.__version__,
+                "python_version": sys.version,
+                "os": sys.platform,
+                "os_version": platform.version(),
+                "os_release": platform.release(),
+                "processor": platform.processor(),
+                "machine": platform.machine(),
+            }
+            atexit.register(self.close)
+            self._thread = threading.Thread(target=self._run, name="mem0-telemetry", daemon=True)
+            self._thread.start()
+
+    def sampled(self, event_name):
+        """Whether an event should be kept: internal events are kept with probability `sample_rate`."""
+        return not event_name.startswith(SAMPLED_EVENT_PREFIX) or random.random() < self.sample_rate
 
     def capture_event(self, event_name, properties=None, user_email=None):
-        if properties is None:
-            properties = {}
-        properties = {
-            "client_source": "python",
-            "client_version": mem0.__version__,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "os_version": platform.version(),
-            "os_release": platform.release(),
-            "processor": platform.processor(),
-            "machine": platform.machine(),
-            **properties,
-        }
+        if not self.enabled or self._closed:
+            return
+        if self._thread is None:
+            self._start()
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
         distinct_id = self.user_id if user_email is None else user_email
-        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
+        self._queue.append((distinct_id, event_name, properties, time.time()))
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug(f"Failed to send telemetry: {e}")
+
+    def flush(self):
+        """Hand every queued event to PostHog, which batches them into as few requests as possible."""
+        with self._flush_lock:
+            if not self._queue:
+                return
+            if self.posthog is None:
+                from posthog import Posthog
+
+                self.posthog = Posthog(project_api_key=self.project_api_key, host=self.host)
+            while self._queue:
+                distinct_id, event_name, properties, timestamp = self._queue.popleft()
+                if event_name.startswith(SAMPLED_EVENT_PREFIX):
+                    properties = {**(properties or {}), "sample_rate": self.sample_rate}
+                self.posthog.capture(
+                    distinct_id=distinct_id,
+                    event=event_name,
+                    properties={**self.static_properties, **(properties or {})},
+                    timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+                )
 
     def close(self):
-        self.posthog.shutdown()
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._wakeup.set()
+            self._thread.join(timeout=self.flush_interval)
+            self.flush()
+        if self.posthog is not None:
+            self.posthog.shutdown()
 
 
 # Initialize AnonymousTelemetry
@@ -57,7 +150,7 @@ telemetry = AnonymousTelemetry(
 )
 
 
-def capture_event(event_name, memory_instance, additional_data=None):
+def memory_event_data(memory_instance, additional_data=None):
     event_data = {
         "collection": memory_instance.collection_name,
         "vector_size": memory_instance.embedding_model.config.embedding_dims,
@@ -72,11 +165,18 @@ def capture_event(event_name, memory_instance, additional_data=None):
     }
     if additional_data:
         event_data.update(additional_data)
+    return event_data
+
 
-    telemetry.capture_event(event_name, event_data)
+def capture_event(event_name, memory_instance, additional_data=None):
+    if not telemetry.enabled or not telemetry.sampled(event_name):
+        return
+    telemetry.capture_event(event_name, memory_event_data(memory_instance, additional_data))
 
 
 def capture_client_event(event_name, instance, additional_data=None):
+    if not telemetry.enabled:
+        return
     event_data = {
         "function": f"{instance.__class__.__module__}.{instance.__class__.__name__}",
     }
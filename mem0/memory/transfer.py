@@ -0,0 +1,154 @@
+"""
+NDJSON format of `Memory.export` and `Memory.import_`.
+
+An export is one JSON document per line. The first line is a header describing the export; every other line is a
+memory: its id, vector store payload, vector and history rows.
+
+    {"type": "header", "format": "mem0", "version": 1, "embedder": {...}, "dims": 1536, "filters": {...}}
+    {"type": "memory", "id": "...", "payload": {"data": "...", ...}, "vector": [...], "history": [...]}
+
+Lines are written and read one page of memories at a time, so exports and imports run in constant memory whatever
+the number of memories.
+"""
+
+import json
+from datetime import datetime, timezone
+
+EXPORT_FORMAT = "mem0"
+EXPORT_VERSION = 1
+
+# Memories read from the vector store, or written to it, per call
+EXPORT_PAGE_SIZE = 500
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def export_header(provider, model, dims, filters):
+    """Header line of an export, naming the embedder that produced its vectors."""
+    return {
+        "type": "header",
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "embedder": {"provider": provider, "model": model},
+        "dims": dims,
+        "filters": filters or {},
+    }
+
+
+def export_record(memory, vector, history):
+    """Line of one memory: its vector store record, vector (None if the store does not return vectors) and history."""
+    return {"type": "memory", "id": str(memory.id), "payload": memory.payload, "vector": vector, "history": history}
+
+
+def dump_line(document):
+    return json.dumps(document, default=str, ensure_ascii=False) + "\n"
+
+
+def parse_line(line, line_number):
+    """Decode one line of an export; blank lines yield None."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        document = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Line {line_number} of the export is not valid JSON: {e}") from e
+    kind = document.get("type") if isinstance(document, dict) else None
+    if kind == "header":
+        if document.get("format") != EXPORT_FORMAT or document.get("version", 0) > EXPORT_VERSION:
+            raise ValueError(
+                f"Unsupported export format {document.get('format')!r} version {document.get('version')!r}"
+            )
+    elif kind != "memory" or not document.get("id") or not isinstance(document.get("payload"), dict):
+        raise ValueError(f"Line {line_number} of the export is not a header or a memory with an id and a payload")
+    return document
+
+
+def iter_batches(lines, batch_size=EXPORT_PAGE_SIZE):
+    """
+    Parse the lines of an export and group its memories into batches.
+
+    Yields:
+        tuple: The header of the export (None if it has none) and at most `batch_size` memory documents.
+    """
+    header, batch = None, []
+    for line_number, line in enumerate(lines, start=1):
+        document = parse_line(line, line_number)
+        if document is None:
+            continue
+        if document["type"] == "header":
+            header = document
+            continue
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield header, batch
+            batch = []
+    if batch:
+        yield header, batch
+
+
+async def aiter_batches(lines, batch_size=EXPORT_PAGE_SIZE):
+    """Async `iter_batches` over an async iterable of lines, or a regular one."""
+    if not hasattr(lines, "__aiter__"):
+        lines = _aiter(lines)
+    header, batch, line_number = None, [], 0
+    async for line in lines:
+        line_number += 1
+        document = parse_line(line, line_number)
+        if document is None:
+            continue
+        if document["type"] == "header":
+            header = document
+            continue
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield header, batch
+            batch = []
+    if batch:
+        yield header, batch
+
+
+async def _aiter(lines):
+    for line in lines:
+        yield line
+
+
+async def aiter_lines(chunks):
+    """Split an async stream of byte chunks, such as an HTTP request body, into lines."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+def same_embedder(header, provider, model):
+    """Whether the header names the given embedder provider and model; vectors of an export without one are unknown."""
+    embedder = (header or {}).get("embedder") or {}
+    return bool(embedder) and embedder.get("provider") == provider and embedder.get("model") == model
+
+
+def vectors_to_reuse(batch, dims, reembed=False):
+    """
+    Exported vectors that can be written as they are: present and of the dimensions the vector store expects.
+
+    Returns:
+        list: The vector of each memory of `batch`, or None where the memory has to be embedded again.
+    """
+    if reembed:
+        return [None] * len(batch)
+    return [
+        document["vector"] if document.get("vector") and (dims is None or len(document["vector"]) == dims) else None
+        for document in batch
+    ]
+
+
+def history_records(batch):
+    """History rows of a batch of memories, keyed like the records of `SQLiteManager.add_history_many`."""
+    return [{**row, "memory_id": document["id"]} for document in batch for row in document.get("history") or []]
@@ -1,5 +1,5 @@
 import re
-from mem0.configs.prompts import FACT_RETRIEVAL_PROMPT, DEFAULT_INCLUDED_INFO, DEFAULT_EXCLUDED_INFO
+from mem0.configs.prompts import FACT_RETRIEVAL_PROMPT, FUSED_MEMORY_PROMPT, DEFAULT_CATEGORIES, DEFAULT_INCLUDED_INFO, DEFAULT_EXCLUDED_INFO
 
 def get_fact_retrieval_messages(message, includes, excludes, custom_prompt=None):
     included_info = includes if includes else (DEFAULT_INCLUDED_INFO if not excludes else "Except for those specifically to be excluded")
@@ -8,6 +8,17 @@ def get_fact_retrieval_messages(message, includes, excludes, custom_prompt=None)
     return (custom_prompt if custom_prompt else FACT_RETRIEVAL_PROMPT).replace("{{INCLUDED_INFO}}", included_info).replace("{{EXCLUDED_INFO}}", excluded_info), f"Input:\n{message}"
 
 
+def get_fused_memory_messages(message, retrieved_old_memory, includes, excludes, custom_categories=None):
+    included_info = includes if includes else (DEFAULT_INCLUDED_INFO if not excludes else "Except for those specifically to be excluded")
+    excluded_info = excludes if excludes else DEFAULT_EXCLUDED_INFO
+    system_prompt = (
+        FUSED_MEMORY_PROMPT.replace("{{INCLUDED_INFO}}", included_info)
+        .replace("{{EXCLUDED_INFO}}", excluded_info)
+        .replace("{{CATEGORIES}}", custom_categories if custom_categories else DEFAULT_CATEGORIES)
+    )
+    return system_prompt, f"Existing memories:\n{retrieved_old_memory}\n\nConversation:\n{message}"
+
+
 def parse_messages(messages):
     response = ""
     for msg in messages:
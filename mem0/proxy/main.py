@@ -2,6 +2,7 @@ import logging
 import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import httpx
@@ -29,6 +30,15 @@ from mem0.memory.telemetry import capture_client_event
 
 logger = logging.getLogger(__name__)
 
+# Background adds to the hosted API, bounded instead of one thread per chat call
+_remote_add_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mem0-proxy-add")
+# Adds waiting for or running on `_remote_add_executor`
+_remote_add_slots = threading.BoundedSemaphore(100)
+
+# Seconds a chat call waits for room in a full add queue before dropping the add. Storing the conversation is
+# best effort, the completion must not hang on it.
+ADD_ENQUEUE_TIMEOUT = 5.0
+
 
 class Mem0:
     def __init__(
@@ -152,18 +162,29 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
+        kwargs = dict(user_id=user_id, agent_id=agent_id, run_id=run_id, metadata=metadata, filters=filters)
+        if isinstance(self.mem0_client, Memory):
+            # Durable, bounded and ordered per user, unlike a thread per chat call
+            try:
+                self.mem0_client.add(messages=messages, mode="deferred", enqueue_timeout=ADD_ENQUEUE_TIMEOUT, **kwargs)
+            except TimeoutError as e:
+                logger.warning(f"Dropped the add of this conversation: {e}")
+            return
+
+        if not _remote_add_slots.acquire(timeout=ADD_ENQUEUE_TIMEOUT):
+            logger.warning("Dropped the add of this conversation: too many adds are waiting for the Mem0 API")
+            return
+
         def add_task():
             logger.debug("Adding to memory asynchronously")
-            self.mem0_client.add(
-                messages=messages,
-                user_id=user_id,
-                agent_id=agent_id,
-                run_id=run_id,
-                metadata=metadata,
-                filters=filters,
-            )
-
-        threading.Thread(target=add_task, daemon=True).start()
+            try:
+                self.mem0_client.add(messages=messages, **kwargs)
+            except Exception as e:
+                logger.error(f"Error adding to memory: {e}")
+            finally:
+                _remote_add_slots.release()
+
+        _remote_add_executor.submit(add_task)
 
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
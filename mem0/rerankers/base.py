@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+
+
+class RerankerBase(ABC):
+    """Initialized a base reranker class
+
+    :param config: Reranker configuration option class, defaults to None
+    :type config: Optional[BaseRerankerConfig], optional
+    """
+
+    # Rerankers that score with the documents' embeddings set this, so callers pass the stored vectors along
+    uses_document_embeddings = False
+
+    def __init__(self, config: Optional[BaseRerankerConfig] = None):
+        if config is None:
+            self.config = BaseRerankerConfig()
+        else:
+            self.config = config
+
+    @abstractmethod
+    def score(
+        self,
+        query: str,
+        documents: List[str],
+        query_embedding: Optional[list] = None,
+        document_embeddings: Optional[List[list]] = None,
+    ) -> List[float]:
+        """
+        Score every document against the query once.
+
+        Args:
+            query (str): The query.
+            documents (List[str]): The candidate documents.
+            query_embedding (list, optional): Embedding of the query, if already available.
+            document_embeddings (List[list], optional): Embeddings of the documents, if already available; None
+                for a document whose embedding is not.
+
+        Returns:
+            List[float]: One relevance score per document, higher is more relevant.
+        """
+        pass
+
+    def rerank(self, query: str, documents: List[str], top_n: Optional[int] = None, **kwargs) -> List[Tuple[int, float]]:
+        """
+        Order documents by relevance to the query.
+
+        Returns:
+            List[Tuple[int, float]]: (document index, score) pairs, most relevant first, truncated to `top_n`.
+                Documents with equal scores keep their original order.
+        """
+        if not documents:
+            return []
+        scores = self.score(query, documents, **kwargs)
+        ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+        return ranked[:top_n] if top_n is not None else ranked
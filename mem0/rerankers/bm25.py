@@ -0,0 +1,35 @@
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import MicroTokenizer
+except ImportError:
+    raise ImportError("MicroTokenizer is not installed. Please install it using pip install MicroTokenizer")
+
+try:
+    from rank_bm25 import BM25Okapi
+except ImportError:
+    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.rerankers.base import RerankerBase
+
+
+class BM25Reranker(RerankerBase):
+    """Lexical reranker scoring documents with BM25 over MicroTokenizer tokens (multilingual)."""
+
+    def __init__(self, config: Optional[BaseRerankerConfig] = None):
+        super().__init__(config)
+        # Graph entities and memories recur across searches, so their tokens are cached
+        self._tokenize = lru_cache(maxsize=self.config.tokenizer_cache_size)(self._cut)
+
+    @staticmethod
+    def _cut(text: str) -> tuple:
+        return tuple(token for token in MicroTokenizer.cut(text.replace("_", " ")) if token.strip())
+
+    def score(self, query, documents, query_embedding=None, document_embeddings=None) -> List[float]:
+        tokenized_documents = [list(self._tokenize(document)) for document in documents]
+        if not any(tokenized_documents):
+            return [0.0] * len(documents)
+        bm25 = BM25Okapi(tokenized_documents)
+        return [float(score) for score in bm25.get_scores(list(self._tokenize(query)))]
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class RerankerConfig(BaseModel):
+    provider: str = Field(
+        description="Provider of the reranker (e.g., 'bm25', 'embedding', 'cross_encoder')",
+        default="bm25",
+    )
+    config: Optional[dict] = Field(description="Configuration for the specific reranker", default={})
+    top_n: int = Field(description="Number of graph relations kept after reranking", default=5)
+    rerank_memories: bool = Field(
+        description="Also rerank the memories returned by the vector store search", default=False
+    )
+
+    @field_validator("config")
+    def validate_config(cls, v, values):
+        provider = values.data.get("provider")
+        if provider in ["bm25", "embedding", "cross_encoder"]:
+            return v
+        else:
+            raise ValueError(f"Unsupported reranker provider: {provider}")
@@ -0,0 +1,35 @@
+import threading
+from typing import List, Optional
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.rerankers.base import RerankerBase
+
+
+class CrossEncoderReranker(RerankerBase):
+    """Reranker scoring (query, document) pairs with a local sentence-transformers cross-encoder."""
+
+    def __init__(self, config: Optional[BaseRerankerConfig] = None):
+        super().__init__(config)
+
+        self.config.model = self.config.model or "cross-encoder/ms-marco-MiniLM-L-6-v2"
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        # Loaded on first use so that configuring the reranker does not load the model up front
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import CrossEncoder
+                    except ImportError:
+                        raise ImportError(
+                            "sentence_transformers is not installed. Please install it using pip install sentence-transformers"
+                        )
+                    self._model = CrossEncoder(self.config.model, device=self.config.device, **self.config.model_kwargs)
+        return self._model
+
+    def score(self, query, documents, query_embedding=None, document_embeddings=None) -> List[float]:
+        scores = self.model.predict([(query, document) for document in documents], batch_size=self.config.batch_size)
+        return [float(score) for score in scores]
@@ -0,0 +1,39 @@
+import math
+from typing import List, Optional
+
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.rerankers.base import RerankerBase
+
+
+def cosine_similarity(a, b) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class EmbeddingReranker(RerankerBase):
+    """
+    Reranker scoring documents by cosine similarity of embeddings.
+
+    Embeddings passed by the caller, such as the vectors stored with the memories, are used as is; missing ones are
+    computed with the memory's embedder (in a single batch for the documents).
+    """
+
+    uses_document_embeddings = True
+
+    def __init__(self, config: Optional[BaseRerankerConfig] = None, embedding_model=None):
+        super().__init__(config)
+        if embedding_model is None:
+            raise ValueError("The embedding reranker requires an embedding model.")
+        self.embedding_model = embedding_model
+
+    def score(self, query, documents, query_embedding=None, document_embeddings=None) -> List[float]:
+        if query_embedding is None:
+            query_embedding = self.embedding_model.embed(query, "search")
+        document_embeddings = list(document_embeddings or [None] * len(documents))
+        missing = [idx for idx, embedding in enumerate(document_embeddings) if embedding is None]
+        if missing:
+            embeddings = self.embedding_model.embed_batch([documents[idx] for idx in missing], "search")
+            for idx, embedding in zip(missing, embeddings):
+                document_embeddings[idx] = embedding
+        return [cosine_similarity(query_embedding, embedding) for embedding in document_embeddings]
@@ -2,6 +2,7 @@ import importlib
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.configs.rerankers.base import BaseRerankerConfig
 
 
 def load_class(class_type):
@@ -54,12 +55,21 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, cache_config=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if isinstance(cache_config, dict):
+                from mem0.embeddings.configs import EmbeddingCacheConfig
+
+                cache_config = EmbeddingCacheConfig(**cache_config)
+            if cache_config and cache_config.enabled:
+                from mem0.embeddings.cache import CachedEmbedding, EmbeddingCache
+
+                embedder = CachedEmbedding(embedder, provider_name, EmbeddingCache.from_config(cache_config))
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -77,15 +87,42 @@ class VectorStoreFactory:
         "opensearch": "mem0.vector_stores.opensearch.OpenSearchDB",
         "supabase": "mem0.vector_stores.supabase.Supabase",
         "weaviate": "mem0.vector_stores.weaviate.Weaviate",
+        "local": "mem0.vector_stores.local.LocalVectorStore",
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, tenancy=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
+            if tenancy is not None and tenancy.strategy == "sharded":
+                from mem0.vector_stores.sharded import ShardedVectorStore
+
+                return ShardedVectorStore(provider_name, config, tenancy)
             if not isinstance(config, dict):
                 config = config.model_dump()
+            if tenancy is not None and tenancy.strategy == "partition":
+                config["tenant_key"] = tenancy.tenant_key
             vector_store_instance = load_class(class_type)
             return vector_store_instance(**config)
         else:
             raise ValueError(f"Unsupported VectorStore provider: {provider_name}")
+
+
+class RerankerFactory:
+    provider_to_class = {
+        "bm25": "mem0.rerankers.bm25.BM25Reranker",
+        "embedding": "mem0.rerankers.embedding.EmbeddingReranker",
+        "cross_encoder": "mem0.rerankers.cross_encoder.CrossEncoderReranker",
+    }
+
+    @classmethod
+    def create(cls, provider_name, config, embedding_model=None):
+        class_type = cls.provider_to_class.get(provider_name)
+        if class_type:
+            reranker_instance = load_class(class_type)
+            base_config = BaseRerankerConfig(**(config or {}))
+            if provider_name == "embedding":
+                return reranker_instance(base_config, embedding_model=embedding_model)
+            return reranker_instance(base_config)
+        else:
+            raise ValueError(f"Unsupported Reranker provider: {provider_name}")
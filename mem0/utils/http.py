@@ -0,0 +1,209 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
+import time
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean the request was not (or may safely be re-) processed
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_clients = {}
+_async_clients = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _retry_delay(attempt, response, backoff_factor, max_backoff):
+    """Full-jitter exponential backoff, honouring a numeric Retry-After header when the server sends one."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), max_backoff)
+        except ValueError:
+            pass
+    return random.uniform(0, min(max_backoff, backoff_factor * 2**attempt))
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Transport that retries requests answered with 429 or 5xx.
+
+    Connection failures are already retried by the wrapped `httpx.HTTPTransport`.
+    """
+
+    def __init__(self, transport, max_retries=3, backoff_factor=0.5, max_backoff=30.0):
+        self.transport = transport
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    def handle_request(self, request):
+        for attempt in range(self.max_retries + 1):
+            response = self.transport.handle_request(request)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            delay = _retry_delay(attempt, response, self.backoff_factor, self.max_backoff)
+            logger.warning(f"{request.method} {request.url} returned {response.status_code}, retrying in {delay:.2f}s")
+            response.close()
+            time.sleep(delay)
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `RetryTransport`."""
+
+    def __init__(self, transport, max_retries=3, backoff_factor=0.5, max_backoff=30.0):
+        self.transport = transport
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    async def handle_async_request(self, request):
+        for attempt in range(self.max_retries + 1):
+            response = await self.transport.handle_async_request(request)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            delay = _retry_delay(attempt, response, self.backoff_factor, self.max_backoff)
+            logger.warning(f"{request.method} {request.url} returned {response.status_code}, retrying in {delay:.2f}s")
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _proxy_mounts(proxies, transport_class=httpx.HTTPTransport, **transport_kwargs):
+    """
+    httpx mounts routing requests through `http_client_proxies`: a proxy URL for every request, or a dict of URL
+    patterns ("http://", "https://", "all://"...) to proxy URLs.
+    """
+    if isinstance(proxies, (str, httpx.URL, httpx.Proxy)):
+        proxies = {"all://": proxies}
+    return {pattern: transport_class(proxy=proxy, **transport_kwargs) for pattern, proxy in proxies.items()}
+
+
+class LoopLocal:
+    """
+    One object per running event loop, built by `factory` on first use in that loop.
+
+    For clients whose connections are bound to the loop that opened them, such as `AsyncOpenAI`: reusing one in
+    another loop, e.g. a second `asyncio.run`, fails with "Event loop is closed".
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self._instances = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            instance = self._instances.get(loop)
+        if instance is None:
+            instance = self.factory()
+            with self._lock:
+                instance = self._instances.setdefault(loop, instance)
+        return instance
+
+
+def _client_settings(config, retry):
+    # HTTP/2 needs the optional `h2` package
+    http2 = bool(config.http2) and importlib.util.find_spec("h2") is not None
+    return (
+        config.http_timeout,
+        config.http_connect_timeout,
+        config.http_max_connections,
+        config.http_max_keepalive_connections,
+        http2,
+        config.http_max_retries if retry else 0,
+    )
+
+
+def _client_kwargs(settings):
+    timeout, connect_timeout, max_connections, max_keepalive_connections, http2, retries = settings
+    return {
+        "timeout": httpx.Timeout(timeout, connect=connect_timeout),
+        "limits": httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+        "http2": http2,
+        "retries": retries,
+    }
+
+
+def get_http_client(config, retry=True) -> httpx.Client:
+    """
+    Return the process-wide pooled `httpx.Client` for the HTTP settings of an embedder or LLM config.
+
+    Providers with the same settings share one client, so keep-alive connections (and the DNS and TLS
+    handshakes behind them) are reused across instances and threads.
+
+    Args:
+        config (BaseEmbedderConfig | BaseLlmConfig): Config holding the `http_*` settings.
+        retry (bool, optional): Retry 429/5xx responses with jittered backoff. Disable for SDK clients that
+            already retry on their own. Defaults to True.
+
+    Returns:
+        httpx.Client: The shared client.
+    """
+    settings = _client_settings(config, retry)
+    with _lock:
+        client = _clients.get(settings)
+        if client is None or client.is_closed:
+            kwargs = _client_kwargs(settings)
+            transport = httpx.HTTPTransport(http2=kwargs["http2"], limits=kwargs["limits"], retries=kwargs["retries"])
+            if retry:
+                transport = RetryTransport(transport, max_retries=config.http_max_retries)
+            client = httpx.Client(transport=transport, timeout=kwargs["timeout"])
+            _clients[settings] = client
+        return client
+
+
+def get_async_http_client(config, retry=True) -> httpx.AsyncClient:
+    """
+    Async counterpart of `get_http_client`.
+
+    An `httpx.AsyncClient` cannot be shared between event loops, so one client is kept per running loop. The async
+    path has no prebuilt `http_client`, so the client routes requests through `http_client_proxies` itself.
+    """
+    proxies = getattr(config, "http_client_proxies", None)
+    # Dicts aren't hashable; their repr tells proxy settings apart well enough to key the pool
+    settings = (*_client_settings(config, retry), repr(proxies) if proxies else None)
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(settings)
+        if client is None or client.is_closed:
+            kwargs = _client_kwargs(settings[:-1])
+            transport_kwargs = {"http2": kwargs["http2"], "limits": kwargs["limits"], "retries": kwargs["retries"]}
+            transport = httpx.AsyncHTTPTransport(**transport_kwargs)
+            mounts = _proxy_mounts(proxies, httpx.AsyncHTTPTransport, **transport_kwargs) if proxies else {}
+            if retry:
+                transport = AsyncRetryTransport(transport, max_retries=config.http_max_retries)
+                mounts = {
+                    pattern: AsyncRetryTransport(mount, max_retries=config.http_max_retries)
+                    for pattern, mount in mounts.items()
+                }
+            client = httpx.AsyncClient(transport=transport, mounts=mounts, timeout=kwargs["timeout"])
+            clients[settings] = client
+        return client
+
+
+def openai_client_kwargs(config, asynchronous=False):
+    """
+    Keyword arguments that make an OpenAI-compatible SDK client use the shared connection pool.
+
+    The SDK already retries 429/5xx with jittered backoff, so the pooled client is created without
+    `RetryTransport` and the SDK is given the configured retry budget instead. A client built from
+    `http_client_proxies` takes precedence over the shared one; async clients are pooled per proxy setting.
+    """
+    if asynchronous:
+        http_client = get_async_http_client(config, retry=False)
+    else:
+        http_client = getattr(config, "http_client", None) or get_http_client(config, retry=False)
+    return {"http_client": http_client, "max_retries": config.http_max_retries}
@@ -0,0 +1,53 @@
+import argparse
+import json
+import logging
+
+from mem0.configs.base import MemoryConfig
+from mem0.utils.factory import VectorStoreFactory
+
+logger = logging.getLogger(__name__)
+
+
+def create_payload_indexes(config=None, fields=None):
+    """
+    Build the payload indexes of an existing vector store collection.
+
+    Collections are indexed when they are created; this brings collections created by earlier versions up to
+    date. Index creation is idempotent, so running it twice is harmless.
+
+    Args:
+        config (MemoryConfig | dict, optional): Memory configuration naming the vector store. Defaults to the
+            default configuration.
+        fields (list, optional): Payload fields to index. Defaults to user_id, agent_id, run_id and the vector
+            store's `indexed_fields`.
+
+    Returns:
+        list: The fields that were indexed.
+    """
+    if not isinstance(config, MemoryConfig):
+        config = MemoryConfig(**(config or {}))
+    vector_store = VectorStoreFactory.create(
+        config.vector_store.provider, config.vector_store.config, config.vector_store.tenancy
+    )
+    fields = vector_store.payload_index_fields(fields)
+    logger.info(f"Indexing payload fields {fields} of {type(vector_store).__name__}")
+    vector_store.create_payload_indexes(fields)
+    return fields
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create payload indexes on an existing mem0 vector store collection.")
+    parser.add_argument("--config", help="Path to a JSON Memory configuration. Defaults to the default configuration.")
+    parser.add_argument("--fields", nargs="+", help="Payload fields to index instead of the configured ones.")
+    args = parser.parse_args(argv)
+
+    config = None
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    fields = create_payload_indexes(config, args.fields)
+    print(f"Indexed payload fields: {', '.join(fields)}")
+
+
+if __name__ == "__main__":
+    main()
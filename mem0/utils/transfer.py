@@ -0,0 +1,54 @@
+import argparse
+import contextlib
+import json
+import sys
+
+from mem0.memory.main import Memory
+
+
+def _open(path, mode):
+    """The file at `path`, or stdin/stdout for "-", which are left open."""
+    if path == "-":
+        return contextlib.nullcontext(sys.stdout if "w" in mode else sys.stdin)
+    return open(path, mode, encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export mem0 memories, vectors and history to NDJSON, or import such an export."
+    )
+    parser.add_argument("--config", help="Path to a JSON Memory configuration. Defaults to the default configuration.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Write memories to an NDJSON file.")
+    export_parser.add_argument("output", nargs="?", default="-", help="File to write. Defaults to stdout.")
+    for field in ("user_id", "agent_id", "run_id"):
+        export_parser.add_argument(f"--{field.replace('_', '-')}", dest=field, help=f"Only export this {field}.")
+
+    import_parser = commands.add_parser("import", help="Read memories from an NDJSON export.")
+    import_parser.add_argument("input", nargs="?", default="-", help="File to read. Defaults to stdin.")
+    import_parser.add_argument("--batch-size", type=int, default=500, help="Memories written per vector store call.")
+    import_parser.add_argument(
+        "--reembed", action="store_true", help="Embed every memory again instead of reusing the exported vectors."
+    )
+    args = parser.parse_args(argv)
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    memory = Memory.from_config(config)
+
+    if args.command == "export":
+        filters = {field: getattr(args, field) for field in ("user_id", "agent_id", "run_id") if getattr(args, field)}
+        with _open(args.output, "w") as stream:
+            result = memory.export(filters=filters, stream=stream)
+        print(f"Exported {result['memories']} memories", file=sys.stderr)
+    else:
+        with _open(args.input, "r") as stream:
+            result = memory.import_(stream, batch_size=args.batch_size, reembed=args.reembed)
+        print(f"Imported {result['imported']} memories, {result['reembedded']} embedded again", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
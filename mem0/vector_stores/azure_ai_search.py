@@ -337,6 +337,26 @@ class AzureAISearch(VectorStoreBase):
             )
         return results
 
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        List one page of vectors with the service's own `skip`; the cursor is the number of vectors skipped.
+
+        Returns:
+            tuple: The vectors of the page and the cursor of the next one, None after the last page.
+        """
+        offset = int(cursor) if cursor else 0
+        search_results = self.search_client.search(
+            search_text="*",
+            filter=self._build_filter_expression(filters) if filters else None,
+            top=limit + 1,
+            skip=offset,
+        )
+        page = [
+            OutputData(id=result["id"], score=result["@search.score"], payload=json.loads(result["payload"]))
+            for result in search_results
+        ]
+        return page[:limit], str(offset + limit) if len(page) > limit else None
+
     def __del__(self):
         """Close the search client when the object is deleted."""
         self.search_client.close()
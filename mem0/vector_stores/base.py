@@ -1,7 +1,24 @@
+import asyncio
+import concurrent.futures
 from abc import ABC, abstractmethod
 
+# Payload fields every Memory call filters on; stores index them along with their configured `indexed_fields`
+IDENTITY_FIELDS = ("user_id", "agent_id", "run_id")
+
 
 class VectorStoreBase(ABC):
+    # Stores with a full-text index set this and implement `keyword_search`
+    supports_keyword_search = False
+    # Whether that keyword search finds terms inside runs of CJK characters; stores that index such a run as one
+    # token clear it, and hybrid search then uses the local index unless told to use the native one
+    keyword_search_segments_cjk = True
+    # Stores whose `list_page` cursor still points at the next unread record after the records already listed are
+    # deleted (keyset, scroll or snapshot cursors) set this; offset cursors would skip records
+    stable_list_cursor = False
+    # Whether a higher `search` score is a closer match; stores that return distances clear it. `keyword_search`
+    # scores are relevance ranks, always higher for better matches
+    higher_score_is_better = True
+
     @abstractmethod
     def create_col(self, name, vector_size, distance):
         """Create a new collection."""
@@ -51,3 +68,189 @@ class VectorStoreBase(ABC):
     def list(self, filters=None, limit=None):
         """List all memories."""
         pass
+
+    def search_batch(self, queries, limit=5, filters=None):
+        """
+        Search for the neighbours of several query vectors at once.
+
+        Stores with a multi-query API override this to answer every query in a single request;
+        the default runs the individual searches concurrently.
+
+        Returns:
+            list: One list of search results per query, in the same order as `queries`.
+        """
+        if len(queries) <= 1:
+            return [self.search(query=query, limit=limit, filters=filters) for query in queries]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(queries), 8)) as executor:
+            return list(executor.map(lambda query: self.search(query=query, limit=limit, filters=filters), queries))
+
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        List one page of memories, resuming after `cursor`.
+
+        Stores with a native cursor (scroll offsets, keyset pagination, search_after) override this; the
+        default pages by offset over `list`, which re-reads the earlier pages on every call and is only
+        consistent if `list` returns the records in a stable order.
+
+        Args:
+            filters (dict, optional): Filters to apply. Defaults to None.
+            limit (int, optional): Page size. Defaults to 100.
+            cursor (str, optional): Opaque cursor returned with the previous page. Defaults to None (first page).
+
+        Returns:
+            tuple: The memories of the page and the cursor of the next page, None after the last page.
+        """
+        offset = int(cursor) if cursor else 0
+        memories = self.list(filters=filters, limit=offset + limit + 1)[0]
+        next_cursor = str(offset + limit) if len(memories) > offset + limit else None
+        return memories[offset : offset + limit], next_cursor
+
+    def keyword_search(self, query, limit=5, filters=None):
+        """
+        Search the `data` of the memories for the terms of a text query, best match first.
+
+        Used by hybrid search; stores without a full-text index leave this unimplemented and Memory
+        keeps a local keyword index instead.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support keyword search")
+
+    # Bulk variants used to apply a whole batch of memory actions at once. Stores with a native
+    # bulk API override these; the defaults fall back to the single-point methods.
+
+    def insert_many(self, vectors, payloads=None, ids=None):
+        """Insert many vectors into a collection in one call."""
+        return self.insert(vectors=vectors, payloads=payloads, ids=ids)
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """Update many vectors and their payloads; `vectors` and `payloads` are aligned with `vector_ids`."""
+        for idx, vector_id in enumerate(vector_ids):
+            self.update(
+                vector_id=vector_id,
+                vector=vectors[idx] if vectors else None,
+                payload=payloads[idx] if payloads else None,
+            )
+
+    def delete_many(self, vector_ids):
+        """Delete many vectors by ID."""
+        for vector_id in vector_ids:
+            self.delete(vector_id=vector_id)
+
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose payload matches `filters`.
+
+        Stores that can delete by query do it in one server-side call; the default collects the
+        matching ids page by page and removes them with `delete_many`.
+        """
+        vector_ids = []
+        cursor = None
+        while True:
+            page, cursor = self.list_page(filters=filters, limit=1000, cursor=cursor)
+            vector_ids.extend(record.id for record in page)
+            if cursor is None:
+                break
+        if vector_ids:
+            self.delete_many(vector_ids)
+
+    def get_vectors(self, vector_ids):
+        """
+        Retrieve the stored vectors of several records, for exports that carry embeddings along with payloads and
+        rerankers that score with them.
+
+        Stores that can return vectors override this; the default returns none, and importers and rerankers
+        embed the records from their `data` instead.
+
+        Args:
+            vector_ids (list): IDs of the records.
+
+        Returns:
+            dict: Vector (a list of floats) by ID, for the IDs that were found.
+        """
+        return {}
+
+    def payload_index_fields(self, fields=None):
+        """
+        Payload fields to index: `fields` if given, else the identity fields, the configured `indexed_fields` and the
+        tenant key of partitioned stores.
+        """
+        if fields is None:
+            fields = [*IDENTITY_FIELDS, *(getattr(self, "indexed_fields", None) or [])]
+            if getattr(self, "tenant_key", None):
+                fields.append(self.tenant_key)
+        return list(dict.fromkeys(fields))
+
+    def create_payload_indexes(self, fields=None):
+        """
+        Index payload fields so that filtered searches, listings and deletes don't scan the whole collection.
+
+        Stores build these indexes when they create a collection; calling this again is safe and is how
+        collections created before the indexes existed are migrated. Stores whose filter fields are always
+        indexed keep this no-op default.
+
+        Args:
+            fields (list, optional): Payload fields to index. Defaults to `payload_index_fields()`.
+        """
+
+    def close(self):
+        """Release the connections and files held by the store; it can't be used afterwards. The default holds none."""
+
+    # Async variants. Stores with a native async client override these; the defaults
+    # offload the sync implementation to a worker thread so the event loop is never blocked.
+
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Asynchronously insert vectors into a collection."""
+        return await asyncio.to_thread(self.insert, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def asearch(self, query, limit=5, filters=None):
+        """Asynchronously search for similar vectors."""
+        return await asyncio.to_thread(self.search, query=query, limit=limit, filters=filters)
+
+    async def asearch_batch(self, queries, limit=5, filters=None):
+        """Asynchronously search for the neighbours of several query vectors at once."""
+        return await asyncio.to_thread(self.search_batch, queries=queries, limit=limit, filters=filters)
+
+    async def alist_page(self, filters=None, limit=100, cursor=None):
+        """Asynchronously list one page of memories, resuming after `cursor`."""
+        return await asyncio.to_thread(self.list_page, filters=filters, limit=limit, cursor=cursor)
+
+    async def akeyword_search(self, query, limit=5, filters=None):
+        """Asynchronously search the memories for the terms of a text query."""
+        return await asyncio.to_thread(self.keyword_search, query=query, limit=limit, filters=filters)
+
+    async def ainsert_many(self, vectors, payloads=None, ids=None):
+        """Asynchronously insert many vectors into a collection in one call."""
+        return await asyncio.to_thread(self.insert_many, vectors=vectors, payloads=payloads, ids=ids)
+
+    async def aupdate_many(self, vector_ids, vectors=None, payloads=None):
+        """Asynchronously update many vectors and their payloads."""
+        return await asyncio.to_thread(self.update_many, vector_ids=vector_ids, vectors=vectors, payloads=payloads)
+
+    async def adelete_many(self, vector_ids):
+        """Asynchronously delete many vectors by ID."""
+        return await asyncio.to_thread(self.delete_many, vector_ids=vector_ids)
+
+    async def adelete_by_filter(self, filters):
+        """Asynchronously delete every vector whose payload matches `filters`."""
+        return await asyncio.to_thread(self.delete_by_filter, filters=filters)
+
+    async def aget_vectors(self, vector_ids):
+        """Asynchronously retrieve the stored vectors of several records."""
+        return await asyncio.to_thread(self.get_vectors, vector_ids=vector_ids)
+
+    async def adelete(self, vector_id):
+        """Asynchronously delete a vector by ID."""
+        return await asyncio.to_thread(self.delete, vector_id=vector_id)
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Asynchronously update a vector and its payload."""
+        return await asyncio.to_thread(self.update, vector_id=vector_id, vector=vector, payload=payload)
+
+    async def aget(self, vector_id):
+        """Asynchronously retrieve a vector by ID."""
+        return await asyncio.to_thread(self.get, vector_id=vector_id)
+
+    async def alist(self, filters=None, limit=None):
+        """Asynchronously list all memories."""
+        if limit is None:
+            return await asyncio.to_thread(self.list, filters=filters)
+        return await asyncio.to_thread(self.list, filters=filters, limit=limit)
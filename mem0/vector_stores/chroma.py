@@ -21,6 +21,8 @@ class OutputData(BaseModel):
 
 
 class ChromaDB(VectorStoreBase):
+    higher_score_is_better = False
+
     def __init__(
         self,
         collection_name: str,
@@ -143,6 +145,27 @@ class ChromaDB(VectorStoreBase):
         final_results = self._parse_output(results)
         return final_results
 
+    def search_batch(self, queries: List[list], limit: int = 5, filters: Optional[Dict] = None) -> List[List[OutputData]]:
+        """
+        Search for the neighbours of several query vectors in a single query call.
+
+        Args:
+            queries (List[list]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: One list of search results per query.
+        """
+        if not queries:
+            return []
+        results = self.collection.query(query_embeddings=queries, where=filters, n_results=limit)
+        keys = ["ids", "distances", "metadatas"]
+        per_query = []
+        for i in range(len(queries)):
+            per_query.append(self._parse_output({key: [(results.get(key) or [[]] * len(queries))[i]] for key in keys}))
+        return per_query
+
     def delete(self, vector_id: str):
         """
         Delete a vector by ID.
@@ -168,6 +191,31 @@ class ChromaDB(VectorStoreBase):
         """
         self.collection.update(ids=vector_id, embeddings=vector, metadatas=payload)
 
+    def update_many(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[List[float]]] = None,
+        payloads: Optional[List[Dict]] = None,
+    ):
+        """
+        Update many vectors and their payloads in one call.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (Optional[List[List[float]]], optional): Updated vectors, aligned with `vector_ids`. Defaults to None.
+            payloads (Optional[List[Dict]], optional): Updated payloads, aligned with `vector_ids`. Defaults to None.
+        """
+        self.collection.update(ids=list(vector_ids), embeddings=vectors, metadatas=payloads)
+
+    def delete_many(self, vector_ids: List[str]):
+        """
+        Delete many vectors by ID.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        self.collection.delete(ids=list(vector_ids))
+
     def get(self, vector_id: str) -> OutputData:
         """
         Retrieve a vector by ID.
@@ -218,3 +266,14 @@ class ChromaDB(VectorStoreBase):
         """
         results = self.collection.get(where=filters, limit=limit)
         return [self._parse_output(results)]
+
+    def list_page(self, filters: Optional[Dict] = None, limit: int = 100, cursor: Optional[str] = None) -> tuple:
+        """
+        List one page of vectors in insertion order, using Chroma's own offset; the cursor is that offset.
+
+        Returns:
+            tuple: The vectors of the page and the cursor of the next one, None after the last page.
+        """
+        offset = int(cursor) if cursor else 0
+        page = self._parse_output(self.collection.get(where=filters, limit=limit + 1, offset=offset))
+        return page[:limit], str(offset + limit) if len(page) > limit else None
@@ -1,7 +1,36 @@
-from typing import Dict, Optional, List
+import hashlib
+import json
+import re
+from typing import Dict, List, Literal, Optional
+from urllib.parse import urlsplit, urlunsplit
 
 from pydantic import BaseModel, Field, model_validator
 
+# Settings left out of `VectorStoreConfig.identity`: credentials, which may be rotated
+_SECRET_FIELD_RE = re.compile(r"key|token|password|secret|credential", re.IGNORECASE)
+
+
+def _without_credentials(value):
+    """`value` with the user and password of a URL or connection string removed."""
+    if isinstance(value, str) and "://" in value and "@" in value:
+        parts = urlsplit(value)
+        return urlunsplit(parts._replace(netloc=parts.netloc.rsplit("@", 1)[1]))
+    return value
+
+
+class TenancyConfig(BaseModel):
+    strategy: Literal["shared", "partition", "sharded"] = Field(
+        description=(
+            "How tenants are laid out: 'shared' keeps everyone in one collection and filters, 'partition' lets the "
+            "store partition the collection by tenant (Qdrant, Milvus), 'sharded' spreads tenants over several "
+            "collections with consistent hashing"
+        ),
+        default="shared",
+    )
+    tenant_key: str = Field(description="Payload field that identifies the tenant", default="user_id")
+    shards: int = Field(description="Number of collections tenants are spread over when sharded", default=16, ge=1)
+    virtual_nodes: int = Field(description="Points per collection on the consistent-hash ring", default=64, ge=1)
+
 
 class VectorStoreConfig(BaseModel):
     provider: str = Field(
@@ -11,6 +40,9 @@ class VectorStoreConfig(BaseModel):
     config: Optional[Dict] = Field(description="Configuration for the specific vector store", default=None)
     custom_prompt: Optional[str] = Field(description="Custom prompt for vector store", default=None)
     custom_categories: Optional[List[Dict[str, str]]] = Field(description="Custom prompt for vector store", default=None)
+    tenancy: TenancyConfig = Field(
+        description="How memories of different tenants are split across the vector store", default_factory=TenancyConfig
+    )
 
     _provider_configs: Dict[str, str] = {
         "qdrant": "QdrantConfig",
@@ -24,6 +56,7 @@ class VectorStoreConfig(BaseModel):
         "opensearch": "OpenSearchConfig",
         "supabase": "SupabaseConfig",
         "weaviate": "WeaviateConfig",
+        "local": "LocalVectorStoreConfig",
     }
 
     @model_validator(mode="after")
@@ -40,6 +73,9 @@ class VectorStoreConfig(BaseModel):
         )
         config_class = getattr(module, self._provider_configs[provider])
 
+        if self.tenancy.strategy == "partition" and "tenant_key" not in config_class.model_fields:
+            raise ValueError(f"Vector store provider {provider} does not support partition tenancy")
+
         if config is None:
             config = {}
 
@@ -54,3 +90,19 @@ class VectorStoreConfig(BaseModel):
 
         self.config = config_class(**config)
         return self
+
+    def identity(self) -> str:
+        """
+        Stable id of the collection this configuration points at, e.g. to key local state kept beside it.
+
+        Derived from the provider and the plain settings (location, collection name...). Credentials are left
+        out, so rotating a key keeps the id and no secret is hashed into it.
+        """
+        config = self.config.model_dump() if isinstance(self.config, BaseModel) else dict(self.config or {})
+        settings = {
+            key: _without_credentials(value)
+            for key, value in config.items()
+            if isinstance(value, (str, int, float, bool)) and not _SECRET_FIELD_RE.search(key)
+        }
+        document = json.dumps({"provider": self.provider, **settings}, sort_keys=True, default=str)
+        return hashlib.md5(document.encode()).hexdigest()
@@ -1,5 +1,7 @@
+import base64
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from elasticsearch import Elasticsearch
@@ -22,6 +24,11 @@ class OutputData(BaseModel):
 
 
 class ElasticsearchDB(VectorStoreBase):
+    supports_keyword_search = True
+    stable_list_cursor = True
+    # How long an abandoned `list_page` cursor stays valid
+    PIT_KEEP_ALIVE = "5m"
+
     def __init__(self, **kwargs):
         config = ElasticsearchConfig(**kwargs)
 
@@ -147,10 +154,35 @@ class ElasticsearchDB(VectorStoreBase):
 
         return results
 
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
+        """Full-text search of the memory text with a `match` query, ranked by BM25."""
+        search_query = {"size": limit, "query": {"bool": {"must": [{"match": {"metadata.data": query}}]}}}
+        if filters:
+            search_query["query"]["bool"]["filter"] = [
+                {"term": {f"metadata.{key}": value}} for key, value in filters.items()
+            ]
+
+        response = self.client.search(index=self.collection_name, body=search_query)
+
+        results = []
+        for hit in response["hits"]["hits"]:
+            results.append(
+                OutputData(id=hit["_id"], score=hit["_score"], payload=hit.get("_source", {}).get("metadata", {}))
+            )
+
+        return results
+
     def delete(self, vector_id: str) -> None:
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
 
+    def delete_by_filter(self, filters: Dict) -> None:
+        """Delete every document whose metadata matches the filters with a single `delete_by_query`."""
+        filter_conditions = [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]
+        self.client.delete_by_query(
+            index=self.collection_name, body={"query": {"bool": {"filter": filter_conditions}}}, refresh=True
+        )
+
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload."""
         doc = {}
@@ -161,6 +193,29 @@ class ElasticsearchDB(VectorStoreBase):
 
         self.client.update(index=self.collection_name, id=vector_id, body={"doc": doc})
 
+    def update_many(
+        self,
+        vector_ids: List[str],
+        vectors: Optional[List[List[float]]] = None,
+        payloads: Optional[List[Dict]] = None,
+    ) -> None:
+        """Update many vectors and their payloads with a single bulk request."""
+        actions = []
+        for i, vector_id in enumerate(vector_ids):
+            doc = {}
+            if vectors and vectors[i] is not None:
+                doc["vector"] = vectors[i]
+            if payloads and payloads[i] is not None:
+                doc["metadata"] = payloads[i]
+            actions.append({"_op_type": "update", "_index": self.collection_name, "_id": vector_id, "doc": doc})
+
+        bulk(self.client, actions)
+
+    def delete_many(self, vector_ids: List[str]) -> None:
+        """Delete many vectors by ID with a single bulk request."""
+        actions = [{"_op_type": "delete", "_index": self.collection_name, "_id": vector_id} for vector_id in vector_ids]
+        bulk(self.client, actions)
+
     def get(self, vector_id: str) -> Optional[OutputData]:
         """Retrieve a vector by ID."""
         try:
@@ -218,3 +273,45 @@ class ElasticsearchDB(VectorStoreBase):
             )
 
         return [results]
+
+    def list_page(
+        self, filters: Optional[Dict] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[OutputData], Optional[str]]:
+        """
+        List one page of memories with `search_after` over a point in time.
+
+        The point in time keeps the listing consistent while it is paged through; it is closed after the last
+        page and otherwise expires after `keep_alive` without use.
+        """
+        if cursor:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        else:
+            pit = self.client.open_point_in_time(index=self.collection_name, keep_alive=self.PIT_KEEP_ALIVE)
+            state = {"pit": pit["id"], "after": None}
+
+        query: Dict[str, Any] = {
+            "size": limit + 1,
+            "query": {"match_all": {}},
+            "pit": {"id": state["pit"], "keep_alive": self.PIT_KEEP_ALIVE},
+            "sort": [{"_shard_doc": "asc"}],
+        }
+        if filters:
+            query["query"] = {
+                "bool": {"must": [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]}
+            }
+        if state["after"]:
+            query["search_after"] = state["after"]
+
+        response = self.client.search(body=query)
+        hits = response["hits"]["hits"]
+        results = [
+            OutputData(id=hit["_id"], score=1.0, payload=hit.get("_source", {}).get("metadata", {}))
+            for hit in hits[:limit]
+        ]
+
+        pit_id = response.get("pit_id", state["pit"])
+        if len(hits) <= limit:
+            self.client.close_point_in_time(body={"id": pit_id})
+            return results, None
+        next_state = {"pit": pit_id, "after": hits[limit - 1]["sort"]}
+        return results, base64.urlsafe_b64encode(json.dumps(next_state).encode()).decode()
@@ -0,0 +1,532 @@
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from typing import Dict, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+PAYLOADS_FILE = "payloads.db"
+VECTORS_FILE = "vectors.bin"
+# Per-row scale factors of int8 vectors
+SCALES_FILE = "scales.bin"
+
+
+class OutputData(BaseModel):
+    id: Optional[str]
+    score: Optional[float]
+    payload: Optional[Dict]
+
+
+def _encode_value(value):
+    # Filter values are compared by their JSON encoding, so 1, "1" and True stay distinct
+    return json.dumps(value, sort_keys=True)
+
+
+class LocalVectorStore(VectorStoreBase):
+    """
+    In-process vector store: vectors in a memory-mapped NumPy matrix, payloads in SQLite.
+
+    Every vector occupies one row (slot) of the matrix; slots of deleted vectors are reused. Filters on indexed
+    fields are answered from an inverted index of `(field, value) -> slot`, other fields from the JSON payloads.
+    Search scores all candidate rows with one matrix product and picks the top k with `argpartition`, so results
+    are exact, with no approximate index to build or tune.
+    """
+
+    stable_list_cursor = True
+
+    def __init__(
+        self,
+        collection_name,
+        embedding_model_dims,
+        path,
+        dtype="float32",
+        distance="cosine",
+        indexed_fields=None,
+        initial_capacity=1024,
+    ):
+        """
+        Initialize the local vector store.
+
+        Args:
+            collection_name (str): Name of the collection; its files live in `path/collection_name`.
+            embedding_model_dims (int): Dimensions of the embedding model.
+            path (str): Directory holding the collections.
+            dtype (str, optional): Storage type of the vectors: float32, float16 or int8. Defaults to "float32".
+            distance (str, optional): Similarity used to rank results: cosine or dot. Defaults to "cosine".
+            indexed_fields (list, optional): Metadata fields indexed in addition to user_id, agent_id and run_id.
+                Defaults to None.
+            initial_capacity (int, optional): Rows allocated before the vector file grows. Defaults to 1024.
+        """
+        self.embedding_model_dims = embedding_model_dims
+        self.path = path
+        self.dtype = dtype
+        self.distance = distance
+        self.indexed_fields = indexed_fields or []
+        self.initial_capacity = initial_capacity
+        self.connection = None
+        self._lock = threading.RLock()
+        self.create_col(collection_name, embedding_model_dims, distance)
+
+    def create_col(self, name, vector_size, distance):
+        """Open the collection `name`, creating its files if needed."""
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+            self.collection_name = name
+            self.directory = os.path.join(self.path, name)
+            os.makedirs(self.directory, exist_ok=True)
+            self.connection = sqlite3.connect(
+                os.path.join(self.directory, PAYLOADS_FILE), check_same_thread=False, isolation_level=None
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS records (
+                    slot INTEGER PRIMARY KEY,
+                    id TEXT UNIQUE NOT NULL,
+                    payload TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS postings (
+                    field TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    slot INTEGER NOT NULL,
+                    PRIMARY KEY (field, value, slot)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS postings_slot ON postings (slot);
+                """
+            )
+            meta = dict(self.connection.execute("SELECT key, value FROM meta").fetchall())
+            if meta:
+                if int(meta["dims"]) != vector_size or meta["dtype"] != self.dtype or meta["distance"] != distance:
+                    raise ValueError(
+                        f"Collection {name} stores {meta['dims']}-dimensional {meta['dtype']} vectors ranked by "
+                        f"{meta['distance']}, not {vector_size}-dimensional {self.dtype} vectors ranked by {distance}"
+                    )
+                self._capacity = int(meta["capacity"])
+                self._index_fields = json.loads(meta.get("indexed_fields", "[]"))
+            else:
+                self._capacity = self.initial_capacity
+                self._index_fields = []
+                self._set_meta(dims=vector_size, dtype=self.dtype, distance=distance, capacity=self._capacity)
+            self.embedding_model_dims = vector_size
+            self.distance = distance
+            self._open_files()
+            self._load_slots()
+        self.create_payload_indexes()
+
+    def _set_meta(self, **values):
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value) if isinstance(value, list) else str(value)) for key, value in values.items()],
+        )
+
+    def _open_files(self):
+        """Map the vector (and scale) files, sized to the current capacity."""
+        files = [(VECTORS_FILE, np.dtype(self.dtype), (self._capacity, self.embedding_model_dims))]
+        if self.dtype == "int8":
+            files.append((SCALES_FILE, np.dtype(np.float32), (self._capacity,)))
+        maps = []
+        for file_name, dtype, shape in files:
+            file_path = os.path.join(self.directory, file_name)
+            size = int(np.prod(shape)) * dtype.itemsize
+            # Growing the file keeps the rows already written; the new tail reads as zeros
+            with open(file_path, "ab") as f:
+                if f.tell() < size:
+                    f.truncate(size)
+            maps.append(np.memmap(file_path, dtype=dtype, mode="r+", shape=shape))
+        self._vectors = maps[0]
+        self._scales = maps[1] if len(maps) > 1 else None
+
+    def _load_slots(self):
+        """Rebuild the in-memory slot bookkeeping from the payload database."""
+        slots = np.fromiter((row[0] for row in self.connection.execute("SELECT slot FROM records")), dtype=np.int64)
+        self._size = int(slots.max()) + 1 if len(slots) else 0
+        self._alive = np.zeros(self._capacity, dtype=bool)
+        self._alive[slots] = True
+        self._free = np.flatnonzero(~self._alive[: self._size]).tolist()
+
+    def _reserve(self, rows):
+        if rows <= self._capacity:
+            return
+        self._vectors.flush()
+        self._capacity = max(rows, self._capacity * 2)
+        self._open_files()
+        self._alive = np.concatenate([self._alive, np.zeros(self._capacity - len(self._alive), dtype=bool)])
+        self._set_meta(capacity=self._capacity)
+
+    def _allocate(self):
+        if self._free:
+            return self._free.pop()
+        slot = self._size
+        self._size += 1
+        self._reserve(self._size)
+        return slot
+
+    def _normalize(self, vectors):
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(-1, self.embedding_model_dims)
+        if self.distance == "cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1, norms)
+        return matrix
+
+    def _encode(self, vectors):
+        """Convert vectors to stored rows (and int8 scales)."""
+        matrix = self._normalize(vectors)
+        if self.dtype == "int8":
+            scales = np.abs(matrix).max(axis=1) / 127
+            scales[scales == 0] = 1
+            return np.round(matrix / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+        return matrix.astype(self.dtype), None
+
+    def _rows(self, index):
+        """Stored rows as float32, ready to be multiplied with queries."""
+        rows = self._vectors[index]
+        if self.dtype == "int8":
+            return rows.astype(np.float32) * self._scales[index][:, None]
+        return rows
+
+    def _write(self, slots, rows, scales):
+        index = np.asarray(slots, dtype=np.int64)
+        self._vectors[index] = rows
+        if scales is not None:
+            self._scales[index] = scales
+            self._scales.flush()
+        self._vectors.flush()
+        self._alive[index] = True
+
+    def _transaction(self, operation, *args):
+        """Run `operation` in one SQLite transaction, restoring the slot bookkeeping if it fails."""
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation(*args)
+                self.connection.execute("COMMIT")
+                return result
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                self._load_slots()
+                raise
+
+    def _index(self, slot, payload):
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO postings (field, value, slot) VALUES (?, ?, ?)",
+            [
+                (field, _encode_value(payload[field]), slot)
+                for field in self._index_fields
+                if payload.get(field) is not None
+            ],
+        )
+
+    def _filter_sql(self, filters):
+        """SQL selecting the slots whose payload matches every filter, intersecting one lookup per field."""
+        queries, params = [], []
+        for key, value in filters.items():
+            if key in self._index_fields:
+                queries.append("SELECT slot FROM postings WHERE field = ? AND value = ?")
+                params.extend([key, _encode_value(value)])
+            else:
+                queries.append("SELECT slot FROM records WHERE json_extract(payload, ?) = json_extract(?, '$')")
+                params.extend([f'$."{key}"', _encode_value(value)])
+        return " INTERSECT ".join(queries), params
+
+    def _candidates(self, filters):
+        sql, params = self._filter_sql(filters)
+        return np.fromiter((row[0] for row in self.connection.execute(sql, params)), dtype=np.int64)
+
+    def _records(self, slots):
+        slots = [int(slot) for slot in slots]
+        rows = self.connection.execute(
+            f"SELECT slot, id, payload FROM records WHERE slot IN ({', '.join('?' * len(slots))})", slots
+        ).fetchall()
+        return {slot: (vector_id, json.loads(payload)) for slot, vector_id, payload in rows}
+
+    def insert(self, vectors, payloads=None, ids=None):
+        """
+        Insert vectors into the collection; ids that already exist are overwritten.
+
+        Args:
+            vectors (list): Vectors to insert.
+            payloads (list, optional): Payloads aligned with `vectors`. Defaults to None.
+            ids (list, optional): Ids aligned with `vectors`. Defaults to new UUIDs.
+        """
+        if not len(vectors):
+            return
+        payloads = payloads or [{} for _ in vectors]
+        ids = ids or [str(uuid.uuid4()) for _ in vectors]
+        rows, scales = self._encode(vectors)
+        self._transaction(self._insert, rows, scales, payloads, ids)
+
+    def _insert(self, rows, scales, payloads, ids):
+        slots = []
+        for vector_id, payload in zip(ids, payloads):
+            row = self.connection.execute("SELECT slot FROM records WHERE id = ?", (str(vector_id),)).fetchone()
+            if row is not None:
+                slot = row[0]
+                self.connection.execute("DELETE FROM postings WHERE slot = ?", (slot,))
+                self.connection.execute(
+                    "UPDATE records SET payload = ? WHERE slot = ?", (json.dumps(payload, default=str), slot)
+                )
+            else:
+                slot = self._allocate()
+                self.connection.execute(
+                    "INSERT INTO records (slot, id, payload) VALUES (?, ?, ?)",
+                    (slot, str(vector_id), json.dumps(payload, default=str)),
+                )
+            self._index(slot, payload)
+            slots.append(slot)
+        self._write(slots, rows, scales)
+
+    def search(self, query, limit=5, filters=None):
+        """
+        Search for the vectors most similar to a query vector.
+
+        Args:
+            query (list): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (dict, optional): Payload values the results must match. Defaults to None.
+
+        Returns:
+            list: OutputData hits, most similar first.
+        """
+        return self.search_batch([query], limit=limit, filters=filters)[0]
+
+    def search_batch(self, queries, limit=5, filters=None):
+        """
+        Search for the neighbours of several query vectors with a single matrix product.
+
+        Returns:
+            list: One list of OutputData hits per query.
+        """
+        if not queries:
+            return []
+        queries = self._normalize(queries)
+        with self._lock:
+            if filters:
+                slots = self._candidates(filters)
+                scores = queries @ self._rows(slots).T
+            else:
+                # Score every row through a view of the file and mask out free slots
+                slots = np.arange(self._size)
+                alive = self._alive[: self._size]
+                scores = (queries @ self._rows(slice(0, self._size)).T)[:, alive]
+                slots = slots[alive]
+            k = min(limit, len(slots))
+            if k <= 0:
+                return [[] for _ in queries]
+            tops = []
+            for row in scores:
+                top = np.argpartition(-row, k - 1)[:k] if k < len(row) else np.arange(len(row))
+                tops.append(top[np.argsort(-row[top], kind="stable")])
+            records = self._records({int(slots[i]) for top in tops for i in top})
+        return [
+            [
+                OutputData(id=records[slots[i]][0], score=float(row[i]), payload=records[slots[i]][1])
+                for i in top
+                if slots[i] in records
+            ]
+            for row, top in zip(scores, tops)
+        ]
+
+    def delete(self, vector_id):
+        """Delete a vector by ID."""
+        self.delete_many([vector_id])
+
+    def delete_many(self, vector_ids):
+        """Delete many vectors by ID in one transaction."""
+        vector_ids = [str(vector_id) for vector_id in vector_ids]
+        if not vector_ids:
+            return
+
+        def delete():
+            rows = self.connection.execute(
+                f"SELECT slot FROM records WHERE id IN ({', '.join('?' * len(vector_ids))})", vector_ids
+            ).fetchall()
+            self._delete_slots([row[0] for row in rows])
+
+        self._transaction(delete)
+
+    def delete_by_filter(self, filters):
+        """Delete every vector whose payload matches `filters`, with one statement per table."""
+        self._transaction(lambda: self._delete_slots(self._candidates(filters).tolist()))
+
+    def _delete_slots(self, slots):
+        if not slots:
+            return
+        slot_list = ", ".join(str(int(slot)) for slot in slots)
+        self.connection.execute(f"DELETE FROM postings WHERE slot IN ({slot_list})")
+        self.connection.execute(f"DELETE FROM records WHERE slot IN ({slot_list})")
+        self._alive[np.asarray(slots, dtype=np.int64)] = False
+        self._free.extend(int(slot) for slot in slots)
+
+    def update(self, vector_id, vector=None, payload=None):
+        """
+        Update a vector and/or its payload.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (list, optional): New vector. Defaults to None.
+            payload (dict, optional): New payload, replacing the old one. Defaults to None.
+        """
+        self.update_many([vector_id], [vector], [payload])
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """Update many vectors and their payloads in one transaction."""
+        vectors = vectors or [None] * len(vector_ids)
+        payloads = payloads or [None] * len(vector_ids)
+        self._transaction(self._update_many, vector_ids, vectors, payloads)
+
+    def _update_many(self, vector_ids, vectors, payloads):
+        for vector_id, vector, payload in zip(vector_ids, vectors, payloads):
+            row = self.connection.execute("SELECT slot FROM records WHERE id = ?", (str(vector_id),)).fetchone()
+            if row is None:
+                logger.warning(f"Vector {vector_id} not found in {self.collection_name}, skipping update")
+                continue
+            slot = row[0]
+            if payload is not None:
+                self.connection.execute("DELETE FROM postings WHERE slot = ?", (slot,))
+                self.connection.execute(
+                    "UPDATE records SET payload = ? WHERE slot = ?", (json.dumps(payload, default=str), slot)
+                )
+                self._index(slot, payload)
+            if vector is not None:
+                self._write([slot], *self._encode([vector]))
+
+    def get(self, vector_id):
+        """
+        Retrieve a vector's payload by ID.
+
+        Returns:
+            OutputData: The record, or None if there is no vector with this ID.
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT id, payload FROM records WHERE id = ?", (str(vector_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return OutputData(id=row[0], score=None, payload=json.loads(row[1]))
+
+    def get_vectors(self, vector_ids):
+        """
+        Read the stored vectors of several records from the vector file.
+
+        Vectors come back as stored: normalized for cosine distance, and dequantized from int8.
+        """
+        vector_ids = [str(vector_id) for vector_id in vector_ids]
+        if not vector_ids:
+            return {}
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT id, slot FROM records WHERE id IN ({', '.join('?' * len(vector_ids))})", vector_ids
+            ).fetchall()
+            if not rows:
+                return {}
+            vectors = np.asarray(self._rows(np.asarray([slot for _, slot in rows], dtype=np.int64)), dtype=np.float32)
+        return {vector_id: vector.tolist() for (vector_id, _), vector in zip(rows, vectors)}
+
+    def list_cols(self):
+        """List the collections stored under `path`."""
+        return sorted(
+            name for name in os.listdir(self.path) if os.path.exists(os.path.join(self.path, name, PAYLOADS_FILE))
+        )
+
+    def delete_col(self):
+        """Delete the collection and its files."""
+        with self._lock:
+            self.connection.close()
+            self.connection = None
+            self._vectors = self._scales = None
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def col_info(self):
+        """Get information about the collection."""
+        with self._lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        return {
+            "name": self.collection_name,
+            "count": count,
+            "dims": self.embedding_model_dims,
+            "dtype": self.dtype,
+            "distance": self.distance,
+            "capacity": self._capacity,
+            "indexed_fields": list(self._index_fields),
+        }
+
+    def list(self, filters=None, limit=100):
+        """
+        List vectors, oldest slot first.
+
+        Returns:
+            list: A one-element list holding the OutputData records.
+        """
+        return [self.list_page(filters=filters, limit=limit)[0]]
+
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        Return one page of records in slot order and the cursor of the next page.
+
+        The cursor is the last slot returned; vectors inserted into freed slots before it are not revisited.
+        """
+        conditions, params = ["slot > ?"], [int(cursor) if cursor else -1]
+        if filters:
+            sql, filter_params = self._filter_sql(filters)
+            conditions.append(f"slot IN ({sql})")
+            params.extend(filter_params)
+        query = f"SELECT slot, id, payload FROM records WHERE {' AND '.join(conditions)} ORDER BY slot"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit + 1)
+        with self._lock:
+            rows = self.connection.execute(query, params).fetchall()
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = str(rows[-1][0])
+        page = [OutputData(id=vector_id, score=None, payload=json.loads(payload)) for _, vector_id, payload in rows]
+        return page, next_cursor
+
+    def create_payload_indexes(self, fields=None):
+        """
+        Add fields to the inverted index and index the payloads already stored.
+
+        Args:
+            fields (list, optional): Payload fields to index. Defaults to `payload_index_fields()`.
+        """
+        with self._lock:
+            new_fields = [field for field in self.payload_index_fields(fields) if field not in self._index_fields]
+            if not new_fields:
+                return
+
+            index_fields = [*self._index_fields, *new_fields]
+
+            def backfill():
+                for slot, payload in self.connection.execute("SELECT slot, payload FROM records").fetchall():
+                    payload = json.loads(payload)
+                    self.connection.executemany(
+                        "INSERT OR IGNORE INTO postings (field, value, slot) VALUES (?, ?, ?)",
+                        [
+                            (field, _encode_value(payload[field]), slot)
+                            for field in new_fields
+                            if payload.get(field) is not None
+                        ],
+                    )
+                self._set_meta(indexed_fields=index_fields)
+
+            self._transaction(backfill)
+            self._index_fields = index_fields
+
+    def close(self):
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -1,4 +1,6 @@
+import json
 import logging
+import re
 from typing import Dict, Optional
 
 from pydantic import BaseModel
@@ -23,6 +25,8 @@ class OutputData(BaseModel):
 
 
 class MilvusDB(VectorStoreBase):
+    stable_list_cursor = True
+
     def __init__(
         self,
         url: str,
@@ -30,6 +34,8 @@ class MilvusDB(VectorStoreBase):
         collection_name: str,
         embedding_model_dims: int,
         metric_type: MetricType,
+        indexed_fields: list = None,
+        tenant_key: str = None,
     ) -> None:
         """Initialize the MilvusDB database.
 
@@ -39,10 +45,17 @@ class MilvusDB(VectorStoreBase):
             collection_name (str): Name of the collection (defaults to mem0).
             embedding_model_dims (int): Dimensions of the embedding model (defaults to 1536).
             metric_type (MetricType): Metric type for similarity search (defaults to L2).
+            indexed_fields (list, optional): Metadata fields indexed in addition to user_id, agent_id and run_id.
+            tenant_key (str, optional): Metadata field copied into a partition key field, so searches filtered on it
+                only scan that tenant's partition.
         """
         self.collection_name = collection_name
+        self.indexed_fields = indexed_fields or []
+        self.tenant_key = tenant_key
         self.embedding_model_dims = embedding_model_dims
         self.metric_type = metric_type
+        # IP and COSINE are similarities, the other metrics distances
+        self.higher_score_is_better = metric_type in (MetricType.IP, MetricType.COSINE)
         self.client = MilvusClient(uri=url, token=token)
         self.create_col(
             collection_name=self.collection_name,
@@ -72,14 +85,45 @@ class MilvusDB(VectorStoreBase):
                 FieldSchema(name="vectors", dtype=DataType.FLOAT_VECTOR, dim=vector_size),
                 FieldSchema(name="metadata", dtype=DataType.JSON),
             ]
+            if self.tenant_key:
+                fields.append(
+                    FieldSchema(name=self.tenant_key, dtype=DataType.VARCHAR, max_length=512, is_partition_key=True)
+                )
 
             schema = CollectionSchema(fields, enable_dynamic_field=True)
 
             index = self.client.prepare_index_params(
                 field_name="vectors", metric_type=metric_type, index_type="AUTOINDEX", index_name="vector_index"
             )
+            self._add_payload_indexes(index, self.payload_index_fields())
             self.client.create_collection(collection_name=collection_name, schema=schema, index_params=index)
 
+    @staticmethod
+    def _add_payload_indexes(index_params, fields, existing=()):
+        """Add an INVERTED index on the `metadata["field"]` JSON path of every field not indexed yet."""
+        for field in fields:
+            index_name = f"metadata_{re.sub(r'[^0-9A-Za-z_]', '_', field)}_index"
+            if index_name not in existing:
+                index_params.add_index(
+                    field_name="metadata",
+                    index_type="INVERTED",
+                    index_name=index_name,
+                    params={"json_path": f'metadata["{field}"]', "json_cast_type": "varchar"},
+                )
+
+    def create_payload_indexes(self, fields=None):
+        """
+        Index the JSON paths of metadata filter fields, so filter expressions don't scan every entity.
+
+        Args:
+            fields (list, optional): Metadata fields to index. Defaults to `payload_index_fields()`.
+        """
+        index_params = self.client.prepare_index_params()
+        existing = set(self.client.list_indexes(collection_name=self.collection_name))
+        self._add_payload_indexes(index_params, self.payload_index_fields(fields), existing)
+        if index_params:
+            self.client.create_index(collection_name=self.collection_name, index_params=index_params)
+
     def insert(self, ids, vectors, payloads, **kwargs: Optional[dict[str, any]]):
         """Insert vectors into a collection.
 
@@ -88,9 +132,14 @@ class MilvusDB(VectorStoreBase):
             payloads (List[Dict], optional): List of payloads corresponding to vectors.
             ids (List[str], optional): List of IDs corresponding to vectors.
         """
-        for idx, embedding, metadata in zip(ids, vectors, payloads):
-            data = {"id": idx, "vectors": embedding, "metadata": metadata}
-            self.client.insert(collection_name=self.collection_name, data=data, **kwargs)
+        data = [self._entity(idx, embedding, metadata) for idx, embedding, metadata in zip(ids, vectors, payloads)]
+        self.client.insert(collection_name=self.collection_name, data=data, **kwargs)
+
+    def _entity(self, vector_id, vector, payload):
+        entity = {"id": vector_id, "vectors": vector, "metadata": payload}
+        if self.tenant_key:
+            entity[self.tenant_key] = str((payload or {}).get(self.tenant_key) or "")
+        return entity
 
     def _create_filter(self, filters: dict):
         """Prepare filters for efficient query.
@@ -103,7 +152,10 @@ class MilvusDB(VectorStoreBase):
         """
         operands = []
         for key, value in filters.items():
-            if isinstance(value, str):
+            if key == self.tenant_key:
+                # Filtering on the partition key field lets Milvus skip the other tenants' partitions
+                operands.append(f'({key} == "{value}")')
+            elif isinstance(value, str):
                 operands.append(f'(metadata["{key}"] == "{value}")')
             else:
                 operands.append(f'(metadata["{key}"] == {value})')
@@ -157,6 +209,30 @@ class MilvusDB(VectorStoreBase):
         result = self._parse_output(data=hits[0])
         return result
 
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for the neighbours of several query vectors in a single multi-vector search request.
+
+        Args:
+            queries (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=queries,
+            limit=limit,
+            filter=query_filter,
+            output_fields=["*"],
+        )
+        return [self._parse_output(data=hit) for hit in hits]
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -166,6 +242,15 @@ class MilvusDB(VectorStoreBase):
         """
         self.client.delete(collection_name=self.collection_name, ids=vector_id)
 
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose metadata matches the filters, with a single delete expression.
+
+        Args:
+            filters (Dict): Filters the vectors to delete must match.
+        """
+        self.client.delete(collection_name=self.collection_name, filter=self._create_filter(filters))
+
     def update(self, vector_id=None, vector=None, payload=None):
         """
         Update a vector and its payload.
@@ -175,8 +260,31 @@ class MilvusDB(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        schema = {"id": vector_id, "vectors": vector, "metadata": payload}
-        self.client.upsert(collection_name=self.collection_name, data=schema)
+        self.client.upsert(collection_name=self.collection_name, data=self._entity(vector_id, vector, payload))
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """
+        Update many vectors and their payloads with a single upsert.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors, aligned with `vector_ids`.
+            payloads (List[Dict], optional): Updated payloads, aligned with `vector_ids`.
+        """
+        data = [
+            self._entity(vector_id, vectors[idx] if vectors else None, payloads[idx] if payloads else None)
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        self.client.upsert(collection_name=self.collection_name, data=data)
+
+    def delete_many(self, vector_ids):
+        """
+        Delete many vectors by ID.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        self.client.delete(collection_name=self.collection_name, ids=list(vector_ids))
 
     def get(self, vector_id):
         """
@@ -236,3 +344,32 @@ class MilvusDB(VectorStoreBase):
             obj = OutputData(id=data.get("id"), score=None, payload=data.get("metadata"))
             memories.append(obj)
         return [memories]
+
+    def list_page(self, filters: dict = None, limit: int = 100, cursor: str = None) -> tuple:
+        """
+        List one page of vectors in primary key order, resuming after the id in `cursor` (keyset pagination).
+
+        Queries with a limit return entities sorted by primary key, so each page asks for the ids after the last one
+        of the previous page. Unlike an offset this does not re-read the earlier pages, and stays below Milvus' cap
+        of 16384 on offset + limit however deep the listing goes.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Page size. Defaults to 100.
+            cursor (str, optional): Cursor of the page to fetch. Defaults to None (first page).
+
+        Returns:
+            tuple: The vectors of the page and the cursor of the next one, None after the last page.
+        """
+        conditions = [self._create_filter(filters)] if filters else []
+        if cursor:
+            # A JSON string is a valid Milvus string literal, with its quotes escaped
+            conditions.append(f"(id > {json.dumps(cursor)})")
+        result = self.client.query(
+            collection_name=self.collection_name,
+            filter=" and ".join(conditions),
+            limit=limit + 1,
+            output_fields=["id", "metadata"],
+        )
+        page = [OutputData(id=data.get("id"), score=None, payload=data.get("metadata")) for data in result[:limit]]
+        return page, page[-1].id if len(result) > limit else None
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from opensearchpy import OpenSearch
@@ -22,6 +22,11 @@ class OutputData(BaseModel):
 
 
 class OpenSearchDB(VectorStoreBase):
+    supports_keyword_search = True
+    stable_list_cursor = True
+    # How long an abandoned `list_page` scroll stays open
+    SCROLL_KEEP_ALIVE = "5m"
+
     def __init__(self, **kwargs):
         config = OpenSearchConfig(**kwargs)
 
@@ -137,10 +142,32 @@ class OpenSearchDB(VectorStoreBase):
         ]
         return results
 
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[OutputData]:
+        """Full-text search of the memory text with a `match` query, ranked by BM25."""
+        search_query = {"size": limit, "query": {"bool": {"must": [{"match": {"metadata.data": query}}]}}}
+        if filters:
+            search_query["query"]["bool"]["filter"] = [
+                {"term": {f"metadata.{key}": value}} for key, value in filters.items()
+            ]
+
+        response = self.client.search(index=self.collection_name, body=search_query)
+
+        return [
+            OutputData(id=hit["_id"], score=hit["_score"], payload=hit["_source"].get("metadata", {}))
+            for hit in response["hits"]["hits"]
+        ]
+
     def delete(self, vector_id: str) -> None:
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
 
+    def delete_by_filter(self, filters: Dict) -> None:
+        """Delete every document whose metadata matches the filters with a single `delete_by_query`."""
+        filter_conditions = [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]
+        self.client.delete_by_query(
+            index=self.collection_name, body={"query": {"bool": {"filter": filter_conditions}}}, refresh=True
+        )
+
     def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
         """Update a vector and its payload."""
         doc = {}
@@ -191,3 +218,30 @@ class OpenSearchDB(VectorStoreBase):
                 for hit in response["hits"]["hits"]
             ]
         ]
+
+    def list_page(
+        self, filters: Optional[Dict] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[OutputData], Optional[str]]:
+        """
+        List one page of memories with a scroll; the cursor is the scroll id.
+
+        A scroll reads a snapshot of the index taken with the first page, so the listing is consistent while it is
+        paged through. It is cleared after the last page and otherwise expires after `SCROLL_KEEP_ALIVE` without use.
+        """
+        if cursor:
+            response = self.client.scroll(scroll_id=cursor, scroll=self.SCROLL_KEEP_ALIVE)
+        else:
+            query: Dict[str, Any] = {"size": limit, "query": {"match_all": {}}, "sort": ["_doc"]}
+            if filters:
+                query["query"] = {
+                    "bool": {"must": [{"term": {f"metadata.{key}": value}} for key, value in filters.items()]}
+                }
+            response = self.client.search(index=self.collection_name, body=query, scroll=self.SCROLL_KEEP_ALIVE)
+        hits = response["hits"]["hits"]
+        page = [OutputData(id=hit["_id"], score=1.0, payload=hit["_source"].get("metadata", {})) for hit in hits]
+        scroll_id = response.get("_scroll_id")
+        if len(hits) < limit:
+            if scroll_id:
+                self.client.clear_scroll(scroll_id=scroll_id)
+            return page, None
+        return page, scroll_id
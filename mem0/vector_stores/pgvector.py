@@ -1,11 +1,19 @@
+import hashlib
 import json
 import logging
+import re
+import threading
+import uuid
+from contextlib import contextmanager
 from typing import List, Optional
 
 from pydantic import BaseModel
 
 try:
     import psycopg2
+    import psycopg2.extensions
+    import psycopg2.extras
+    import psycopg2.pool
     from psycopg2.extras import execute_values
 except ImportError:
     raise ImportError("The 'psycopg2' library is required. Please install it using 'pip install psycopg2'.")
@@ -14,6 +22,14 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# Matches the expression of the GIN index created with the table, so keyword searches can use it
+TSVECTOR_EXPRESSION = "to_tsvector('simple'::regconfig, payload->>'data')"
+
+
+def _sql_literal(value):
+    """Quote a payload key for use in a statement, e.g. `payload->>'user_id'`."""
+    return "'" + value.replace("'", "''") + "'"
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -21,7 +37,21 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
+class _PooledConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements have already been prepared on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
 class PGVector(VectorStoreBase):
+    supports_keyword_search = True
+    # to_tsvector('simple', ...) keeps a run of Chinese characters as one token
+    keyword_search_segments_cjk = False
+    stable_list_cursor = True
+    higher_score_is_better = False
+
     def __init__(
         self,
         dbname,
@@ -33,6 +63,11 @@ class PGVector(VectorStoreBase):
         port,
         diskann,
         hnsw,
+        minconn=1,
+        maxconn=10,
+        prepared_statements=True,
+        list_batch_size=1000,
+        indexed_fields=None,
     ):
         """
         Initialize the PGVector database.
@@ -47,18 +82,75 @@ class PGVector(VectorStoreBase):
             port (int, optional): Database port
             diskann (bool, optional): Use DiskANN for faster search
             hnsw (bool, optional): Use HNSW for faster search
+            minconn (int, optional): Minimum number of pooled connections. Defaults to 1.
+            maxconn (int, optional): Maximum number of pooled connections. Defaults to 10.
+            prepared_statements (bool, optional): Prepare search statements per connection. Defaults to True.
+            list_batch_size (int, optional): Rows fetched per round-trip when listing. Defaults to 1000.
+            indexed_fields (list, optional): Payload fields indexed in addition to user_id, agent_id and run_id.
+                Defaults to None.
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
-
-        self.conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
-        self.cur = self.conn.cursor()
+        self.prepared_statements = prepared_statements
+        self.list_batch_size = list_batch_size
+        self.indexed_fields = indexed_fields or []
+
+        # Every operation checks out its own connection, so concurrent Memory calls no longer share
+        # a cursor. ThreadedConnectionPool raises once maxconn connections are in use, so callers
+        # beyond that wait on the semaphore instead.
+        self.pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn,
+            maxconn,
+            dbname=dbname,
+            user=user,
+            password=password,
+            host=host,
+            port=port,
+            connection_factory=_PooledConnection,
+        )
+        self._slots = threading.BoundedSemaphore(maxconn)
 
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col(embedding_model_dims)
 
+    @contextmanager
+    def _cursor(self, name=None):
+        """
+        Check a connection out of the pool for the duration of one operation.
+
+        The transaction is committed when the block succeeds and rolled back otherwise.
+
+        Args:
+            name (str, optional): Open a server-side cursor with this name instead of a client-side one.
+        """
+        with self._slots:
+            conn = self.pool.getconn()
+            try:
+                with conn.cursor(name=name) as cur:
+                    yield cur
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                self.pool.putconn(conn, close=bool(conn.closed))
+
+    @staticmethod
+    def _filter_clause(filters, conditions=()):
+        filter_conditions = list(conditions)
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
     def create_col(self, embedding_model_dims):
         """
         Create a new collection (table in PostgreSQL).
@@ -67,42 +159,78 @@ class PGVector(VectorStoreBase):
         Args:
             embedding_model_dims (int): Dimension of the embedding vector.
         """
-        self.cur.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.collection_name} (
-                id UUID PRIMARY KEY,
-                vector vector({embedding_model_dims}),
-                payload JSONB
-            );
-        """
-        )
+        with self._cursor() as cur:
+            cur.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.collection_name} (
+                    id UUID PRIMARY KEY,
+                    vector vector({embedding_model_dims}),
+                    payload JSONB
+                );
+            """
+            )
 
-        if self.use_diskann and embedding_model_dims < 2000:
-            # Check if vectorscale extension is installed
-            self.cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
-            if self.cur.fetchone():
-                # Create DiskANN index if extension is installed for faster search
-                self.cur.execute(
+            if self.use_diskann and embedding_model_dims < 2000:
+                # Check if vectorscale extension is installed
+                cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
+                if cur.fetchone():
+                    # Create DiskANN index if extension is installed for faster search
+                    cur.execute(
+                        f"""
+                        CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
+                        ON {self.collection_name}
+                        USING diskann (vector);
+                    """
+                    )
+            elif self.use_hnsw:
+                cur.execute(
                     f"""
-                    CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
+                    CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
                     ON {self.collection_name}
-                    USING diskann (vector);
+                    USING hnsw (vector vector_cosine_ops)
                 """
                 )
-        elif self.use_hnsw:
-            self.cur.execute(
+
+            # Full-text index behind keyword_search
+            cur.execute(
                 f"""
-                CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_data_tsv_idx
                 ON {self.collection_name}
-                USING hnsw (vector vector_cosine_ops)
+                USING gin ({TSVECTOR_EXPRESSION})
             """
             )
+        self.create_payload_indexes()
+
+    def create_payload_indexes(self, fields=None):
+        """
+        Create an expression index per filter field and a GIN index over the payload.
 
-        self.conn.commit()
+        The expression indexes match the `payload->>'field' = value` conditions of search and list; the GIN index
+        serves the containment (`@>`) query of `delete_by_filter`.
+
+        Args:
+            fields (list, optional): Payload fields to index. Defaults to `payload_index_fields()`.
+        """
+        with self._cursor() as cur:
+            for field in self.payload_index_fields(fields):
+                suffix = re.sub(r"\W", "_", field)
+                cur.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.collection_name}_payload_{suffix}_idx
+                    ON {self.collection_name} ((payload->>{_sql_literal(field)}))
+                """
+                )
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_payload_gin_idx
+                ON {self.collection_name}
+                USING gin (payload jsonb_path_ops)
+            """
+            )
 
     def insert(self, vectors, payloads=None, ids=None):
         """
-        Insert vectors into a collection.
+        Insert vectors into a collection; ids that already exist are overwritten.
 
         Args:
             vectors (List[List[float]]): List of vectors to insert.
@@ -113,12 +241,15 @@ class PGVector(VectorStoreBase):
         json_payloads = [json.dumps(payload) for payload in payloads]
 
         data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
-        execute_values(
-            self.cur,
-            f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s",
-            data,
-        )
-        self.conn.commit()
+        with self._cursor() as cur:
+            execute_values(
+                cur,
+                f"""
+                INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s
+                ON CONFLICT (id) DO UPDATE SET vector = EXCLUDED.vector, payload = EXCLUDED.payload
+            """,
+                data,
+            )
 
     def search(self, query, limit=5, filters=None):
         """
@@ -132,30 +263,127 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
+        with self._cursor() as cur:
+            if self.prepared_statements:
+                self._execute_prepared_search(cur, query, limit, filters)
+            else:
+                filter_clause, filter_params = self._filter_clause(filters)
+                cur.execute(
+                    f"""
+                    SELECT id, vector <=> %s::vector AS distance, payload
+                    FROM {self.collection_name}
+                    {filter_clause}
+                    ORDER BY distance
+                    LIMIT %s
+                """,
+                    (query, *filter_params, limit),
+                )
+            results = cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+    def keyword_search(self, query, limit=5, filters=None):
+        """
+        Full-text search of the memory text, ranked with `ts_rank_cd`.
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        Any of the query terms may match. The 'simple' text search configuration is used so that no
+        language-specific stemming is applied.
 
-        self.cur.execute(
-            f"""
-            SELECT id, vector <=> %s::vector AS distance, payload
-            FROM {self.collection_name}
-            {filter_clause}
-            ORDER BY distance
-            LIMIT %s
-        """,
-            (query, *filter_params, limit),
-        )
+        Args:
+            query (str): Text query.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
 
-        results = self.cur.fetchall()
+        Returns:
+            list: Search results, best match first.
+        """
+        filter_clause, filter_params = self._filter_clause(filters, [f"{TSVECTOR_EXPRESSION} @@ terms"])
+        with self._cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT id, ts_rank_cd({TSVECTOR_EXPRESSION}, terms) AS rank, payload
+                FROM {self.collection_name},
+                    to_tsquery('simple', replace(plainto_tsquery('simple', %s)::text, ' & ', ' | ')) AS terms
+                {filter_clause}
+                ORDER BY rank DESC
+                LIMIT %s
+            """,
+                (query, *filter_params, limit),
+            )
+            results = cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
+    def _execute_prepared_search(self, cur, query, limit, filters):
+        """
+        Run a search through a statement prepared once per connection and set of filter keys.
+
+        Filter keys are written into the statement as literals and only their values are bound, so even a generic
+        plan compares `payload->>'user_id'` etc. and can use the expression indexes of `create_payload_indexes`.
+        """
+        keys = sorted(filters or {})
+        filter_params = [str(filters[key]) for key in keys]
+        name = "mem0_search"
+        if keys:
+            name += "_" + hashlib.md5(json.dumps(keys).encode()).hexdigest()[:16]
+
+        conn = cur.connection
+        if name not in conn.prepared:
+            conditions = " AND ".join(f"payload->>{_sql_literal(key)} = ${i + 2}" for i, key in enumerate(keys))
+            filter_clause = f"WHERE {conditions}" if conditions else ""
+            cur.execute(
+                f"""
+                PREPARE {name} (vector{", text" * len(keys)}, integer) AS
+                SELECT id, vector <=> $1 AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT ${len(keys) + 2}
+            """
+            )
+            conn.prepared.add(name)
+
+        placeholders = ", ".join(["%s::vector"] + ["%s"] * (len(filter_params) + 1))
+        cur.execute(f"EXECUTE {name} ({placeholders})", (query, *filter_params, limit))
+
+    def search_batch(self, queries, limit=5, filters=None):
+        """
+        Search for the neighbours of several query vectors in one round-trip using a LATERAL join.
+
+        Args:
+            queries (List[List[float]]): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+
+        filter_clause, filter_params = self._filter_clause(filters)
+
+        with self._cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT q.ord, t.id, t.distance, t.payload
+                FROM unnest(%s::text[]) WITH ORDINALITY AS q(vec, ord)
+                CROSS JOIN LATERAL (
+                    SELECT id, vector <=> q.vec::vector AS distance, payload
+                    FROM {self.collection_name}
+                    {filter_clause}
+                    ORDER BY distance
+                    LIMIT %s
+                ) t
+                ORDER BY q.ord, t.distance
+            """,
+                ([json.dumps(list(query)) for query in queries], *filter_params, limit),
+            )
+            rows = cur.fetchall()
+
+        results = [[] for _ in queries]
+        for ord_, id_, distance, payload in rows:
+            results[ord_ - 1].append(OutputData(id=str(id_), score=float(distance), payload=payload))
+        return results
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
@@ -163,8 +391,21 @@ class PGVector(VectorStoreBase):
         Args:
             vector_id (str): ID of the vector to delete.
         """
-        self.cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
-        self.conn.commit()
+        with self._cursor() as cur:
+            cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+
+    def delete_by_filter(self, filters):
+        """
+        Delete every vector whose payload contains the filters, in a single statement.
+
+        Args:
+            filters (Dict): Filters the vectors to delete must match.
+        """
+        with self._cursor() as cur:
+            cur.execute(
+                f"DELETE FROM {self.collection_name} WHERE payload @> %s::jsonb",
+                (json.dumps(filters),),
+            )
 
     def update(self, vector_id, vector=None, payload=None):
         """
@@ -175,17 +416,64 @@ class PGVector(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        if vector:
-            self.cur.execute(
-                f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
-                (vector, vector_id),
+        with self._cursor() as cur:
+            if vector:
+                cur.execute(
+                    f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
+                    (vector, vector_id),
+                )
+            if payload:
+                cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
+                    (psycopg2.extras.Json(payload), vector_id),
+                )
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        """
+        Update many vectors and their payloads with a single UPDATE ... FROM (VALUES ...) statement.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to update.
+            vectors (List[List[float]], optional): Updated vectors, aligned with `vector_ids`.
+            payloads (List[Dict], optional): Updated payloads, aligned with `vector_ids`.
+        """
+        if not vector_ids:
+            return
+        data = [
+            (
+                vector_id,
+                json.dumps(list(vectors[idx])) if vectors and vectors[idx] else None,
+                json.dumps(payloads[idx]) if payloads and payloads[idx] else None,
+            )
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        with self._cursor() as cur:
+            execute_values(
+                cur,
+                f"""
+                UPDATE {self.collection_name} AS t
+                SET vector = COALESCE(v.vector::vector, t.vector),
+                    payload = COALESCE(v.payload::jsonb, t.payload)
+                FROM (VALUES %s) AS v (id, vector, payload)
+                WHERE t.id = v.id::uuid
+            """,
+                data,
             )
-        if payload:
-            self.cur.execute(
-                f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
-                (psycopg2.extras.Json(payload), vector_id),
+
+    def delete_many(self, vector_ids):
+        """
+        Delete many vectors by ID.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        if not vector_ids:
+            return
+        with self._cursor() as cur:
+            cur.execute(
+                f"DELETE FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
             )
-        self.conn.commit()
 
     def get(self, vector_id) -> OutputData:
         """
@@ -197,14 +485,36 @@ class PGVector(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        self.cur.execute(
-            f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
-            (vector_id,),
-        )
-        result = self.cur.fetchone()
+        with self._cursor() as cur:
+            cur.execute(
+                f"SELECT id, payload FROM {self.collection_name} WHERE id = %s",
+                (vector_id,),
+            )
+            result = cur.fetchone()
         if not result:
             return None
-        return OutputData(id=str(result[0]), score=None, payload=result[2])
+        return OutputData(id=str(result[0]), score=None, payload=result[1])
+
+    def get_vectors(self, vector_ids) -> dict:
+        """
+        Retrieve the vectors of several rows with one query.
+
+        Args:
+            vector_ids (list): IDs of the rows.
+
+        Returns:
+            dict: Vector by ID, for the rows that were found.
+        """
+        if not vector_ids:
+            return {}
+        with self._cursor() as cur:
+            # The text form of a pgvector value, "[1,2,3]", is a JSON array
+            cur.execute(
+                f"SELECT id, vector::text FROM {self.collection_name} WHERE id = ANY(%s::uuid[])",
+                ([str(vector_id) for vector_id in vector_ids],),
+            )
+            rows = cur.fetchall()
+        return {str(row[0]): json.loads(row[1]) for row in rows}
 
     def list_cols(self) -> List[str]:
         """
@@ -213,13 +523,14 @@ class PGVector(VectorStoreBase):
         Returns:
             List[str]: List of collection names.
         """
-        self.cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
-        return [row[0] for row in self.cur.fetchall()]
+        with self._cursor() as cur:
+            cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
+            return [row[0] for row in cur.fetchall()]
 
     def delete_col(self):
         """Delete a collection."""
-        self.cur.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
-        self.conn.commit()
+        with self._cursor() as cur:
+            cur.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
 
     def col_info(self):
         """
@@ -228,24 +539,28 @@ class PGVector(VectorStoreBase):
         Returns:
             Dict[str, Any]: Collection information.
         """
-        self.cur.execute(
-            f"""
-            SELECT 
-                table_name, 
-                (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
-                (SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))) as total_size
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' AND table_name = %s
-        """,
-            (self.collection_name,),
-        )
-        result = self.cur.fetchone()
+        with self._cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    table_name,
+                    (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
+                    (SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))) as total_size
+                FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_name = %s
+            """,
+                (self.collection_name,),
+            )
+            result = cur.fetchone()
         return {"name": result[0], "count": result[1], "size": result[2]}
 
     def list(self, filters=None, limit=100):
         """
         List all vectors in a collection.
 
+        Rows are streamed through a server-side cursor in batches of `list_batch_size`, so large
+        listings do not have to be materialised by the driver in one go.
+
         Args:
             filters (Dict, optional): Filters to apply to the list.
             limit (int, optional): Number of vectors to return. Defaults to 100.
@@ -253,33 +568,58 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        filter_clause, filter_params = self._filter_clause(filters)
 
         query = f"""
-            SELECT id, vector, payload
+            SELECT id, payload
             FROM {self.collection_name}
             {filter_clause}
             LIMIT %s
         """
 
-        self.cur.execute(query, (*filter_params, limit))
+        with self._cursor(name=f"mem0_list_{uuid.uuid4().hex}") as cur:
+            cur.itersize = self.list_batch_size
+            cur.execute(query, (*filter_params, limit))
+            results = [OutputData(id=str(r[0]), score=None, payload=r[1]) for r in cur]
+        return [results]
+
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        List one page of vectors, ordered by id and resuming after the id in `cursor` (keyset pagination).
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list.
+            limit (int, optional): Page size. Defaults to 100.
+            cursor (str, optional): Cursor of the page to fetch. Defaults to None (first page).
+
+        Returns:
+            tuple: The vectors of the page and the cursor of the next one, None after the last page.
+        """
+        filter_clause, filter_params = self._filter_clause(filters, ["id > %s::uuid"] if cursor else [])
+
+        with self._cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT id, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY id
+                LIMIT %s
+            """,
+                (*([cursor] if cursor else []), *filter_params, limit + 1),
+            )
+            results = cur.fetchall()
+
+        page = [OutputData(id=str(r[0]), score=None, payload=r[1]) for r in results[:limit]]
+        return page, page[-1].id if len(results) > limit else None
 
-        results = self.cur.fetchall()
-        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
+    def close(self):
+        """Close the pooled database connections."""
+        if hasattr(self, "pool") and not self.pool.closed:
+            self.pool.closeall()
 
     def __del__(self):
         """
-        Close the database connection when the object is deleted.
+        Close the pooled database connections when the object is deleted.
         """
-        if hasattr(self, "cur"):
-            self.cur.close()
-        if hasattr(self, "conn"):
-            self.conn.close()
+        self.close()
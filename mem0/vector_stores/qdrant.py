@@ -1,15 +1,22 @@
+import json
 import logging
 import os
 import shutil
 
 from qdrant_client import QdrantClient
+from qdrant_client.local.qdrant_local import QdrantLocal
 from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
+    KeywordIndexParams,
+    KeywordIndexType,
     MatchValue,
+    PayloadSchemaType,
     PointIdsList,
     PointStruct,
+    QueryRequest,
     Range,
     VectorParams,
 )
@@ -20,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 
 class Qdrant(VectorStoreBase):
+    stable_list_cursor = True
+
     def __init__(
         self,
         collection_name: str,
@@ -31,6 +40,8 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        indexed_fields: list = None,
+        tenant_key: str = None,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +56,13 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            indexed_fields (list, optional): Metadata fields indexed in addition to user_id, agent_id and run_id.
+                Defaults to None.
+            tenant_key (str, optional): Payload field indexed as the tenant id, so Qdrant co-locates and searches
+                each tenant's points separately. Defaults to None.
         """
+        self.indexed_fields = indexed_fields or []
+        self.tenant_key = tenant_key
         if client:
             self.client = client
         else:
@@ -65,6 +82,8 @@ class Qdrant(VectorStoreBase):
 
             self.client = QdrantClient(**params)
 
+        # Payload indexes have no effect in local mode
+        self.is_local = isinstance(getattr(self.client, "_client", None), QdrantLocal)
         self.collection_name = collection_name
         self.create_col(embedding_model_dims, on_disk)
 
@@ -88,6 +107,31 @@ class Qdrant(VectorStoreBase):
             collection_name=self.collection_name,
             vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
         )
+        if not self.is_local:
+            # A new collection has no payload indexes yet
+            self._create_payload_indexes(self.payload_index_fields())
+
+    def create_payload_indexes(self, fields=None):
+        """
+        Create keyword payload indexes, so filters on these fields don't scan every point.
+
+        Args:
+            fields (list, optional): Payload fields to index. Defaults to `payload_index_fields()`.
+        """
+        if self.is_local:
+            return
+        existing = self.col_info().payload_schema or {}
+        self._create_payload_indexes([field for field in self.payload_index_fields(fields) if field not in existing])
+
+    def _create_payload_indexes(self, fields):
+        for field in fields:
+            if field == self.tenant_key:
+                field_schema = KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=True)
+            else:
+                field_schema = PayloadSchemaType.KEYWORD
+            self.client.create_payload_index(
+                collection_name=self.collection_name, field_name=field, field_schema=field_schema
+            )
 
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
         """
@@ -148,6 +192,29 @@ class Qdrant(VectorStoreBase):
         )
         return hits.points
 
+    def search_batch(self, queries: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for the neighbours of several query vectors in a single request.
+
+        Args:
+            queries (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(query=query, filter=query_filter, limit=limit, with_payload=True) for query in queries
+            ],
+        )
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -162,6 +229,18 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    def delete_by_filter(self, filters: dict):
+        """
+        Delete every point whose payload matches the filters, with a single filter-selector request.
+
+        Args:
+            filters (dict): Filters the points to delete must match.
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(filter=self._create_filter(filters)),
+        )
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
@@ -174,6 +253,39 @@ class Qdrant(VectorStoreBase):
         point = PointStruct(id=vector_id, vector=vector, payload=payload)
         self.client.upsert(collection_name=self.collection_name, points=[point])
 
+    def update_many(self, vector_ids: list, vectors: list = None, payloads: list = None):
+        """
+        Update many vectors and their payloads with a single upsert.
+
+        Args:
+            vector_ids (list): IDs of the vectors to update.
+            vectors (list, optional): Updated vectors, aligned with `vector_ids`. Defaults to None.
+            payloads (list, optional): Updated payloads, aligned with `vector_ids`. Defaults to None.
+        """
+        points = [
+            PointStruct(
+                id=vector_id,
+                vector=vectors[idx] if vectors else None,
+                payload=payloads[idx] if payloads else None,
+            )
+            for idx, vector_id in enumerate(vector_ids)
+        ]
+        self.client.upsert(collection_name=self.collection_name, points=points)
+
+    def delete_many(self, vector_ids: list):
+        """
+        Delete many vectors by ID.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(
+                points=list(vector_ids),
+            ),
+        )
+
     def get(self, vector_id: int) -> dict:
         """
         Retrieve a vector by ID.
@@ -187,6 +299,23 @@ class Qdrant(VectorStoreBase):
         result = self.client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
         return result[0] if result else None
 
+    def get_vectors(self, vector_ids: list) -> dict:
+        """
+        Retrieve the vectors of several points in one request.
+
+        Args:
+            vector_ids (list): IDs of the points.
+
+        Returns:
+            dict: Vector by point ID (as a string), for the points that were found.
+        """
+        if not vector_ids:
+            return {}
+        points = self.client.retrieve(
+            collection_name=self.collection_name, ids=list(vector_ids), with_payload=False, with_vectors=True
+        )
+        return {str(point.id): list(point.vector) for point in points if point.vector is not None}
+
     def list_cols(self) -> list:
         """
         List all collections.
@@ -229,3 +358,31 @@ class Qdrant(VectorStoreBase):
             with_vectors=False,
         )
         return result
+
+    def list_page(self, filters: dict = None, limit: int = 100, cursor: str = None) -> tuple:
+        """
+        List one page of vectors with a scroll, resuming from the offset returned with the previous page.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Page size. Defaults to 100.
+            cursor (str, optional): Cursor of the page to fetch. Defaults to None (first page).
+
+        Returns:
+            tuple: The points of the page and the cursor of the next one, None after the last page.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        points, next_offset = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            offset=json.loads(cursor) if cursor else None,
+            with_payload=True,
+            with_vectors=False,
+        )
+        # Point ids are either UUID strings or integers; JSON keeps the two apart
+        return points, json.dumps(next_offset) if next_offset is not None else None
+
+    def close(self):
+        """Close the client, which releases the folder lock of a local Qdrant."""
+        self.client.close()
@@ -45,11 +45,14 @@ class MemoryResult:
 
 
 class RedisDB(VectorStoreBase):
+    higher_score_is_better = False
+
     def __init__(
         self,
         redis_url: str,
         collection_name: str,
         embedding_model_dims: int,
+        indexed_fields: list = None,
     ):
         """
         Initialize the Redis vector store.
@@ -58,7 +61,11 @@ class RedisDB(VectorStoreBase):
             redis_url (str): Redis URL.
             collection_name (str): Collection name.
             embedding_model_dims (int): Embedding model dimensions.
+            indexed_fields (list, optional): Metadata fields stored as TAG fields, so they can be filtered on like
+                user_id, agent_id and run_id.
         """
+        reserved = excluded_keys | {field["name"] for field in DEFAULT_FIELDS}
+        self.indexed_fields = [field for field in indexed_fields or [] if field not in reserved]
         index_schema = {
             "name": collection_name,
             "prefix": f"mem0:{collection_name}",
@@ -66,6 +73,7 @@ class RedisDB(VectorStoreBase):
 
         fields = DEFAULT_FIELDS.copy()
         fields[-1]["attrs"]["dims"] = embedding_model_dims
+        fields[-1:-1] = [{"name": field, "type": "tag"} for field in self.indexed_fields]
 
         self.schema = {"index": index_schema, "fields": fields}
 
@@ -94,6 +102,7 @@ class RedisDB(VectorStoreBase):
             for field in ["agent_id", "run_id", "user_id"]:
                 if field in payload:
                     entry[field] = payload[field]
+            entry.update(self._tag_fields(payload))
 
             # Add metadata excluding specific keys
             entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
@@ -145,6 +154,17 @@ class RedisDB(VectorStoreBase):
         self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
 
     def update(self, vector_id=None, vector=None, payload=None):
+        self.update_many([vector_id], [vector], [payload])
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        data = [self._update_entry(vector_id, vectors[idx], payloads[idx]) for idx, vector_id in enumerate(vector_ids)]
+        keys = [f"{self.schema['index']['prefix']}:{vector_id}" for vector_id in vector_ids]
+        self.index.load(data=data, keys=keys, id_field="memory_id")
+
+    def delete_many(self, vector_ids):
+        self.index.drop_keys([f"{self.schema['index']['prefix']}:{vector_id}" for vector_id in vector_ids])
+
+    def _update_entry(self, vector_id, vector, payload):
         data = {
             "memory_id": vector_id,
             "hash": payload["hash"],
@@ -157,9 +177,14 @@ class RedisDB(VectorStoreBase):
         for field in ["agent_id", "run_id", "user_id"]:
             if field in payload:
                 data[field] = payload[field]
+        data.update(self._tag_fields(payload))
 
         data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+        return data
+
+    def _tag_fields(self, payload):
+        # Indexed metadata fields are copied out of the metadata JSON into their own TAG fields
+        return {field: str(payload[field]) for field in self.indexed_fields if payload.get(field) is not None}
 
     def get(self, vector_id):
         result = self.index.fetch(vector_id)
@@ -197,40 +222,51 @@ class RedisDB(VectorStoreBase):
         """
         List all recent created memories from the vector store.
         """
-        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
-        filter = reduce(lambda x, y: x & y, conditions)
-        query = Query(str(filter)).sort_by("created_at", asc=False)
+        query = self._list_query(filters)
         if limit is not None:
-            query = Query(str(filter)).sort_by("created_at", asc=False).paging(0, limit)
+            query = query.paging(0, limit)
 
         results = self.index.search(query)
-        return [
-            [
-                MemoryResult(
-                    id=result["memory_id"],
-                    payload={
-                        "hash": result["hash"],
-                        "data": result["memory"],
-                        "created_at": datetime.fromtimestamp(
-                            int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                        ).isoformat(timespec="microseconds"),
-                        **(
-                            {
-                                "updated_at": datetime.fromtimestamp(
-                                    int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                                ).isoformat(timespec="microseconds")
-                            }
-                            if result.__dict__.get("updated_at")
-                            else {}
-                        ),
-                        **{
-                            field: result[field]
-                            for field in ["agent_id", "run_id", "user_id"]
-                            if field in result.__dict__
-                        },
-                        **{k: v for k, v in json.loads(result["metadata"]).items()},
-                    },
-                )
-                for result in results.docs
-            ]
-        ]
+        return [[self._listed_memory(result) for result in results.docs]]
+
+    def list_page(self, filters: dict = None, limit: int = 100, cursor: str = None) -> tuple:
+        """
+        List one page of memories, most recent first, with RediSearch's own paging; the cursor is the offset.
+
+        Returns:
+            tuple: The memories of the page and the cursor of the next one, None after the last page.
+        """
+        offset = int(cursor) if cursor else 0
+        results = self.index.search(self._list_query(filters).paging(offset, limit + 1))
+        page = [self._listed_memory(result) for result in results.docs]
+        return page[:limit], str(offset + limit) if len(page) > limit else None
+
+    @staticmethod
+    def _list_query(filters):
+        conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
+        filter = reduce(lambda x, y: x & y, conditions)
+        return Query(str(filter)).sort_by("created_at", asc=False)
+
+    @staticmethod
+    def _listed_memory(result):
+        return MemoryResult(
+            id=result["memory_id"],
+            payload={
+                "hash": result["hash"],
+                "data": result["memory"],
+                "created_at": datetime.fromtimestamp(
+                    int(result["created_at"]), tz=pytz.timezone("US/Pacific")
+                ).isoformat(timespec="microseconds"),
+                **(
+                    {
+                        "updated_at": datetime.fromtimestamp(
+                            int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
+                        ).isoformat(timespec="microseconds")
+                    }
+                    if result.__dict__.get("updated_at")
+                    else {}
+                ),
+                **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result.__dict__},
+                **{k: v for k, v in json.loads(result["metadata"]).items()},
+            },
+        )
@@ -0,0 +1,299 @@
+import bisect
+import hashlib
+import itertools
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """
+    Map keys to nodes so that adding or removing a node only moves the keys of its neighbours on the ring.
+
+    Each node is placed at `virtual_nodes` points, which evens out how many keys land on every node.
+    """
+
+    def __init__(self, nodes, virtual_nodes=64):
+        self._ring = sorted((_hash(f"{node}#{i}"), node) for node in nodes for i in range(virtual_nodes))
+        self._points = [point for point, _ in self._ring]
+
+    def node(self, key):
+        index = bisect.bisect(self._points, _hash(str(key))) % len(self._points)
+        return self._ring[index][1]
+
+
+class ShardedVectorStore(VectorStoreBase):
+    """
+    Vector store that spreads tenants over several collections of one provider.
+
+    Every tenant (the value of `tenant_key` in the payload, usually user_id) is routed to one collection with
+    consistent hashing, so its searches, listings and deletes only touch that collection. Calls that don't name a
+    tenant fan out to every collection, and id-only calls look the id up in each collection unless it was seen
+    recently. Collections are opened on first use.
+
+    Changing the number of shards moves some tenants to another collection; their existing memories are not
+    migrated.
+    """
+
+    # Ids whose collection is remembered, so get/update/delete by id don't have to probe every collection
+    LOCATION_CACHE_SIZE = 100_000
+
+    def __init__(self, provider, config, tenancy):
+        from mem0.utils.factory import VectorStoreFactory, load_class
+
+        self.provider = provider
+        self.config = config
+        self.tenant_key = tenancy.tenant_key
+        self.collection_name = config.collection_name
+        self.shard_names = [f"{self.collection_name}_{shard}" for shard in range(tenancy.shards)]
+        self.ring = ConsistentHashRing(self.shard_names, tenancy.virtual_nodes)
+        store_class = load_class(VectorStoreFactory.provider_to_class[provider])
+        self.supports_keyword_search = store_class.supports_keyword_search
+        self.keyword_search_segments_cjk = store_class.keyword_search_segments_cjk
+        self.stable_list_cursor = store_class.stable_list_cursor
+        self._shards = {}
+        self._locations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create_col(self, name, vector_size, distance):
+        self._shard(name)
+
+    def _shard(self, name):
+        from mem0.utils.factory import VectorStoreFactory
+
+        with self._lock:
+            store = self._shards.get(name)
+            if store is None:
+                update = {"collection_name": name}
+                # Stores that accept a client (e.g. local Qdrant, which locks its folder) share the first one
+                if "client" in type(self.config).model_fields and self.config.client is None and self._shards:
+                    update["client"] = next(iter(self._shards.values())).client
+                store = VectorStoreFactory.create(self.provider, self.config.model_copy(update=update))
+                self._shards[name] = store
+            return store
+
+    def _all_shards(self):
+        return [self._shard(name) for name in self.shard_names]
+
+    def _route(self, payload):
+        return self.ring.node("" if payload.get(self.tenant_key) is None else payload[self.tenant_key])
+
+    def _targets(self, filters):
+        """`(name, store)` of the collections that can hold matches of `filters`: the tenant's own, or all of them."""
+        if filters and filters.get(self.tenant_key) is not None:
+            names = [self._route(filters)]
+        else:
+            names = self.shard_names
+        return [(name, self._shard(name)) for name in names]
+
+    def _remember(self, name, vector_ids):
+        with self._lock:
+            for vector_id in vector_ids:
+                self._locations[str(vector_id)] = name
+                self._locations.move_to_end(str(vector_id))
+            while len(self._locations) > self.LOCATION_CACHE_SIZE:
+                self._locations.popitem(last=False)
+
+    def _locate(self, vector_id):
+        """Return `(store, record)` of the collection holding the id, or `(None, None)`."""
+        with self._lock:
+            name = self._locations.get(str(vector_id))
+        names = [name] if name else []
+        for candidate in itertools.chain(names, (other for other in self.shard_names if other not in names)):
+            store = self._shard(candidate)
+            try:
+                record = store.get(vector_id=vector_id)
+            except Exception as e:
+                logger.debug(f"Vector {vector_id} not found in {candidate}: {e}")
+                record = None
+            if record:
+                self._remember(candidate, [vector_id])
+                return store, record
+        return None, None
+
+    def _group_existing(self, vector_ids):
+        groups = {}
+        for idx, vector_id in enumerate(vector_ids):
+            store, _ = self._locate(vector_id)
+            if store is not None:
+                groups.setdefault(id(store), (store, []))[1].append(idx)
+        return groups.values()
+
+    def _insert(self, method, vectors, payloads, ids):
+        """Write new vectors to the collections their tenants are routed to."""
+        payloads = payloads or [{} for _ in vectors]
+        groups = {}
+        for idx, payload in enumerate(payloads):
+            groups.setdefault(self._route(payload or {}), []).append(idx)
+        for name, positions in groups.items():
+            group_ids = [ids[i] for i in positions]
+            getattr(self._shard(name), method)(
+                vectors=[vectors[i] for i in positions], payloads=[payloads[i] for i in positions], ids=group_ids
+            )
+            self._remember(name, group_ids)
+
+    def insert(self, vectors, payloads=None, ids=None):
+        self._insert("insert", vectors, payloads, ids)
+
+    def insert_many(self, vectors, payloads=None, ids=None):
+        self._insert("insert_many", vectors, payloads, ids)
+
+    @property
+    def higher_score_is_better(self):
+        # Milvus sets it per metric, so ask a collection rather than the class
+        return self._shard(self.shard_names[0]).higher_score_is_better
+
+    @staticmethod
+    def _merge(result_lists, limit, higher_score_is_better=True):
+        """
+        Best `limit` hits of several collections. Every collection uses the same provider and metric, so their
+        scores are comparable; hits without a score come last.
+        """
+        sign = -1 if higher_score_is_better else 1
+        merged = sorted(
+            (hit for hits in result_lists for hit in hits),
+            key=lambda hit: (hit.score is None, 0 if hit.score is None else sign * hit.score),
+        )
+        return merged[:limit]
+
+    def search(self, query, limit=5, filters=None):
+        results = []
+        for name, store in self._targets(filters):
+            hits = store.search(query=query, limit=limit, filters=filters)
+            self._remember(name, [hit.id for hit in hits])
+            results.append(hits)
+        return self._merge(results, limit, self.higher_score_is_better)
+
+    def search_batch(self, queries, limit=5, filters=None):
+        if not queries:
+            return []
+        per_store = []
+        for name, store in self._targets(filters):
+            batches = store.search_batch(queries, limit=limit, filters=filters)
+            for hits in batches:
+                self._remember(name, [hit.id for hit in hits])
+            per_store.append(batches)
+        higher_score_is_better = self.higher_score_is_better
+        return [
+            self._merge([batches[i] for batches in per_store], limit, higher_score_is_better)
+            for i in range(len(queries))
+        ]
+
+    def keyword_search(self, query, limit=5, filters=None):
+        results = [store.keyword_search(query, limit=limit, filters=filters) for _, store in self._targets(filters)]
+        return self._merge(results, limit)
+
+    def get(self, vector_id):
+        return self._locate(vector_id)[1]
+
+    def get_vectors(self, vector_ids):
+        """Ask the collections in turn for the vectors not found so far, starting with the cached locations."""
+        missing = [str(vector_id) for vector_id in vector_ids]
+        with self._lock:
+            known = [self._locations[vector_id] for vector_id in missing if vector_id in self._locations]
+        vectors = {}
+        for name in dict.fromkeys([*known, *self.shard_names]):
+            if not missing:
+                break
+            found = self._shard(name).get_vectors(missing)
+            vectors.update(found)
+            self._remember(name, list(found))
+            missing = [vector_id for vector_id in missing if vector_id not in vectors]
+        return vectors
+
+    def update(self, vector_id, vector=None, payload=None):
+        store, _ = self._locate(vector_id)
+        if store is None:
+            raise ValueError(f"Vector {vector_id} not found in any shard of {self.collection_name}")
+        store.update(vector_id=vector_id, vector=vector, payload=payload)
+
+    def update_many(self, vector_ids, vectors=None, payloads=None):
+        for store, positions in self._group_existing(vector_ids):
+            store.update_many(
+                [vector_ids[i] for i in positions],
+                vectors=[vectors[i] for i in positions] if vectors else None,
+                payloads=[payloads[i] for i in positions] if payloads else None,
+            )
+
+    def delete(self, vector_id):
+        store, _ = self._locate(vector_id)
+        if store is not None:
+            store.delete(vector_id=vector_id)
+            with self._lock:
+                self._locations.pop(str(vector_id), None)
+
+    def delete_many(self, vector_ids):
+        vector_ids = list(vector_ids)
+        for store, positions in self._group_existing(vector_ids):
+            store.delete_many([vector_ids[i] for i in positions])
+        with self._lock:
+            for vector_id in vector_ids:
+                self._locations.pop(str(vector_id), None)
+
+    def delete_by_filter(self, filters):
+        for _, store in self._targets(filters):
+            store.delete_by_filter(filters)
+
+    def list(self, filters=None, limit=None):
+        records = []
+        # Without a limit every store applies its own default
+        options = {"limit": limit} if limit is not None else {}
+        for _, store in self._targets(filters):
+            records.extend(store.list(filters=filters, **options)[0])
+            if limit is not None and len(records) >= limit:
+                break
+        return [records[:limit] if limit is not None else records]
+
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        Page through the collections that can hold matches one after the other.
+
+        The cursor records the collection being read and that collection's own cursor.
+        """
+        stores = [store for _, store in self._targets(filters)]
+        state = json.loads(cursor) if cursor else {"shard": 0, "cursor": None}
+        index, inner = state["shard"], state["cursor"]
+        while index < len(stores):
+            page, inner = stores[index].list_page(filters=filters, limit=limit, cursor=inner)
+            if inner is None:
+                index += 1
+            if page or index >= len(stores):
+                next_cursor = json.dumps({"shard": index, "cursor": inner}) if index < len(stores) else None
+                return page, next_cursor
+        return [], None
+
+    def list_cols(self):
+        return self._shard(self.shard_names[0]).list_cols()
+
+    def close(self):
+        with self._lock:
+            stores = list(self._shards.values())
+            self._shards.clear()
+        for store in stores:
+            store.close()
+
+    def delete_col(self):
+        for store in self._all_shards():
+            store.delete_col()
+        with self._lock:
+            self._shards.clear()
+            self._locations.clear()
+
+    def col_info(self):
+        return {name: self._shard(name).col_info() for name in self.shard_names}
+
+    def create_payload_indexes(self, fields=None):
+        for store in self._all_shards():
+            store.create_payload_indexes(fields)
+
+    def payload_index_fields(self, fields=None):
+        return self._shard(self.shard_names[0]).payload_index_fields(fields)
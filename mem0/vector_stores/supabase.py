@@ -22,6 +22,8 @@ class OutputData(BaseModel):
 
 
 class Supabase(VectorStoreBase):
+    higher_score_is_better = False
+
     def __init__(
         self,
         connection_string: str,
@@ -287,6 +287,22 @@ class Weaviate(VectorStoreBase):
         """
         List all vectors in a collection.
         """
+        return [self._fetch_objects(filters, limit)]
+
+    def list_page(self, filters=None, limit=100, cursor=None):
+        """
+        List one page of vectors, using Weaviate's own offset; the cursor is that offset.
+
+        Weaviate's `after` cursor cannot be combined with filters, which every Memory listing has.
+
+        Returns:
+            tuple: The vectors of the page and the cursor of the next one, None after the last page.
+        """
+        offset = int(cursor) if cursor else 0
+        page = self._fetch_objects(filters, limit + 1, offset)
+        return page[:limit], str(offset + limit) if len(page) > limit else None
+
+    def _fetch_objects(self, filters, limit, offset=None):
         collection = self.client.collections.get(self.collection_name)
         filter_conditions = []
         if filters:
@@ -296,6 +312,7 @@ class Weaviate(VectorStoreBase):
         combined_filter = Filter.all_of(filter_conditions) if filter_conditions else None
         response = collection.query.fetch_objects(
             limit=limit,
+            offset=offset,
             filters=combined_filter,
             return_properties=["hash", "created_at", "updated_at", "user_id", "agent_id", "run_id", "data", "category"],
         )
@@ -304,4 +321,4 @@ class Weaviate(VectorStoreBase):
             payload = obj.properties.copy()
             payload["id"] = str(obj.uuid).split("'")[0]
             results.append(OutputData(id=str(obj.uuid).split("'")[0], score=1.0, payload=payload))
-        return [results]
+        return results
@@ -1,10 +1,19 @@
+import asyncio
+import json
 import os
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, RedirectResponse, FileResponse
+import re
+import tempfile
+import time
+from collections import defaultdict
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from typing import Optional, List, Any, Dict
-from mem0 import Memory
+from mem0 import AsyncMemory
+from mem0.memory.pool import MemoryPool, config_id
+from mem0.memory.setup import moremem_dir
+from mem0.memory.transfer import NDJSON_MEDIA_TYPE, aiter_lines
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -54,8 +63,20 @@ DEFAULT_CONFIG = {
         }
     },
 }
-# 初始化Memory实例
-MEMORY_INSTANCE = Memory.from_config(DEFAULT_CONFIG)
+# 用 MEM0_SERVER_CONFIG 指定的 JSON 文件替换默认配置
+if os.getenv("MEM0_SERVER_CONFIG"):
+    with open(os.getenv("MEM0_SERVER_CONFIG")) as config_file:
+        DEFAULT_CONFIG = json.load(config_file)
+
+# Memory instances, one per configuration in use; built on first request so that forked workers never share clients.
+# Evicted instances are closed once the requests using them are done
+POOL = MemoryPool(AsyncMemory.from_config, max_size=int(os.getenv("MEM0_POOL_SIZE", "8")), close=AsyncMemory.close)
+
+# Most operations accepted by one batch request
+MAX_BATCH_SIZE = int(os.getenv("MEM0_MAX_BATCH_SIZE", "100"))
+
+# Configurations set through /api/configure are stored here, so every worker process serves the same one
+STATE_DIR = os.getenv("MEM0_SERVER_STATE_DIR") or os.path.join(moremem_dir, "server")
 
 app = FastAPI(
     title="测试页面",
@@ -64,6 +85,173 @@ app = FastAPI(
 )
 
 
+def _write_atomically(path, content):
+    # Configurations hold API keys and passwords: only the server's user may read them
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as tmp:
+        os.chmod(tmp.name, 0o600)
+        tmp.write(content)
+    os.replace(tmp.name, path)
+
+
+class ConfigStore:
+    """
+    Configurations shared by the worker processes through STATE_DIR.
+
+    Each configuration is saved as `configs/<id>.json` and the active one is named in `active`; workers re-read
+    `active` only when its modification time changes.
+    """
+
+    def __init__(self, state_dir, default_config):
+        self.state_dir = state_dir
+        self.default_config = default_config
+        self._configs = {}
+        self._active_stamp = None
+        self._active_id = None
+
+    # Ids are produced by `config_id`; anything else, e.g. a path from the X-Mem0-Config header, names no config
+    ID_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+    def _config_path(self, cid):
+        return os.path.join(self.state_dir, "configs", f"{cid}.json")
+
+    def save(self, config):
+        cid = config_id(config)
+        _write_atomically(self._config_path(cid), json.dumps(config))
+        self._configs[cid] = config
+        return cid
+
+    def activate(self, cid):
+        _write_atomically(os.path.join(self.state_dir, "active"), cid)
+
+    def load(self, cid):
+        if not self.ID_PATTERN.fullmatch(cid or ""):
+            return None
+        if cid not in self._configs:
+            try:
+                with open(self._config_path(cid)) as config_file:
+                    self._configs[cid] = json.load(config_file)
+            except (FileNotFoundError, ValueError):
+                return None
+        return self._configs[cid]
+
+    def active(self):
+        path = os.path.join(self.state_dir, "active")
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return self.default_config
+        if stamp != self._active_stamp:
+            with open(path) as active_file:
+                self._active_id = active_file.read().strip()
+            self._active_stamp = stamp
+        return self.load(self._active_id) or self.default_config
+
+
+CONFIGS = ConfigStore(STATE_DIR, DEFAULT_CONFIG)
+
+
+class Metrics:
+    """Request counts and latencies of this worker process, rendered in the Prometheus text format."""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = defaultdict(int)
+        self.latency = defaultdict(lambda: [0] * len(self.BUCKETS))
+        self.latency_sum = defaultdict(float)
+        self.latency_count = defaultdict(int)
+
+    def observe(self, method, route, status, seconds):
+        self.requests[(method, route, status)] += 1
+        buckets = self.latency[(method, route)]
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+        self.latency_sum[(method, route)] += seconds
+        self.latency_count[(method, route)] += 1
+
+    def render(self, pool):
+        pid = os.getpid()
+        lines = [
+            "# HELP mem0_http_requests_total HTTP requests handled by this worker.",
+            "# TYPE mem0_http_requests_total counter",
+        ]
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = f'worker="{pid}",method="{method}",route="{route}",status="{status}"'
+            lines.append(f"mem0_http_requests_total{{{labels}}} {count}")
+        lines += [
+            "# HELP mem0_http_request_duration_seconds Time spent handling HTTP requests.",
+            "# TYPE mem0_http_request_duration_seconds histogram",
+        ]
+        for (method, route), buckets in sorted(self.latency.items()):
+            labels = f'worker="{pid}",method="{method}",route="{route}"'
+            for bound, count in zip(self.BUCKETS, buckets):
+                lines.append(f'mem0_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            count = self.latency_count[(method, route)]
+            lines.append(f'mem0_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"mem0_http_request_duration_seconds_sum{{{labels}}} {self.latency_sum[(method, route)]}")
+            lines.append(f"mem0_http_request_duration_seconds_count{{{labels}}} {count}")
+
+        pool_stats = pool.stats()
+        search_cache = defaultdict(int)
+        for memory in pool.instances():
+            for key, value in (memory.search_cache_stats() or {}).items():
+                if key in ("hits", "misses", "evictions"):
+                    search_cache[key] += value
+        for name, kind, value, description in (
+            ("mem0_memory_pool_instances", "gauge", pool_stats["size"], "Memory instances held by the pool."),
+            ("mem0_memory_pool_hits_total", "counter", pool_stats["hits"], "Requests served by a pooled instance."),
+            ("mem0_memory_pool_misses_total", "counter", pool_stats["misses"], "Memory instances built."),
+            ("mem0_memory_pool_evictions_total", "counter", pool_stats["evictions"], "Instances evicted by LRU."),
+            ("mem0_search_cache_hits_total", "counter", search_cache["hits"], "Searches served from cache."),
+            ("mem0_search_cache_misses_total", "counter", search_cache["misses"], "Searches run against the store."),
+            ("mem0_process_start_time_seconds", "gauge", self.started, "Start time of this worker process."),
+        ):
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}", f'{name}{{worker="{pid}"}} {value}']
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        METRICS.observe(
+            request.method, route.path if route else "unmatched", status, time.perf_counter() - started
+        )
+
+
+async def get_memory(
+    x_mem0_config: Optional[str] = Header(None, description="Config id to use instead of the active configuration."),
+):
+    """The pooled Memory of the requested configuration, or of the active one, leased until the response is sent."""
+    if x_mem0_config:
+        config = CONFIGS.load(x_mem0_config)
+        if config is None:
+            raise HTTPException(status_code=404, detail=f"Unknown configuration {x_mem0_config}")
+    else:
+        config = CONFIGS.active()
+    try:
+        memory = await POOL.aacquire(config)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    try:
+        yield memory
+    finally:
+        await POOL.arelease(memory)
+
+
 class Message(BaseModel):
     role: str = Field(..., description="Role of the message (user or assistant).")
     content: str = Field(..., description="Message content.")
@@ -75,6 +263,7 @@ class MemoryCreate(BaseModel):
     agent_id: Optional[str] = None
     run_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    infer: Optional[bool] = Field(None, description="Extract facts with the LLM (default) or store messages as is.")
 
 
 class SearchRequest(BaseModel):
@@ -83,13 +272,25 @@ class SearchRequest(BaseModel):
     run_id: Optional[str] = None
     agent_id: Optional[str] = None
     filters: Optional[Dict] = None
+    limit: Optional[int] = None
+
+
+class MemoryBatchCreate(BaseModel):
+    memories: List[MemoryCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class SearchBatchRequest(BaseModel):
+    searches: List[SearchRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class MemoryBatchDelete(BaseModel):
+    memory_ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
 
 
 @app.post("/api/configure", summary="Configure Mem0")
-def set_config(config: Dict[str, Any]):
-    """Set memory configuration."""
-    global MEMORY_INSTANCE
-    
+async def set_config(config: Dict[str, Any]):
+    """Set memory configuration for every worker, reusing the pooled Memory if this config was seen before."""
+
     # 定义一个深度合并字典的函数
     def deep_merge(default_dict: Dict[str, Any], user_dict: Dict[str, Any]) -> Dict[str, Any]:
         """递归合并两个字典，用户字典中的值优先，缺失值用默认字典填充"""
@@ -106,16 +307,29 @@ def set_config(config: Dict[str, Any]):
     # 合并用户配置和默认数据库配置
     merged_config = deep_merge(DEFAULT_CONFIG, config)
     # 传递环境变量
-    merged_config["vector_store"]["config"]["host"] = QDRANT_HOST
-    merged_config["vector_store"]["config"]["port"] = int(QDRANT_PORT)
+    if merged_config["vector_store"].get("provider", "qdrant") == "qdrant":
+        merged_config["vector_store"]["config"]["host"] = QDRANT_HOST
+        merged_config["vector_store"]["config"]["port"] = int(QDRANT_PORT)
     # merged_config["graph_store"]["config"]["url"] = f"neo4j://{NEO4J_HOST}:{NEO4J_PORT}"
-    
-    MEMORY_INSTANCE = Memory.from_config(merged_config)
-    return {"message": "Configuration set successfully"}
+
+    try:
+        # Built (or found in the pool) before it is activated, so an invalid config never becomes the active one
+        await POOL.aget(merged_config)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cid = CONFIGS.save(merged_config)
+    CONFIGS.activate(cid)
+    return {"message": "Configuration set successfully", "config_id": cid}
+
+
+@app.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def metrics():
+    """Request, pool and search cache metrics of the worker that serves the scrape."""
+    return PlainTextResponse(METRICS.render(POOL), media_type="text/plain; version=0.0.4")
 
 
 @app.post("/api/memories", summary="Create memories")
-def add_memory(memory_create: MemoryCreate):
+async def add_memory(memory_create: MemoryCreate, memory: AsyncMemory = Depends(get_memory)):
     """Store new memories."""
     if not any([memory_create.user_id, memory_create.agent_id, memory_create.run_id]):
         raise HTTPException(
@@ -124,97 +338,199 @@ def add_memory(memory_create: MemoryCreate):
 
     params = {k: v for k, v in memory_create.model_dump().items() if v is not None and k != "messages"}
     try:
-        response = MEMORY_INSTANCE.add(messages=[m.model_dump() for m in memory_create.messages], **params)
+        response = await memory.add(messages=[m.model_dump() for m in memory_create.messages], **params)
         return JSONResponse(content=response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/memories/batch", summary="Create memories in bulk")
+async def add_memories_batch(batch: MemoryBatchCreate, memory: AsyncMemory = Depends(get_memory)):
+    """
+    Store several conversations in one request.
+
+    Conversations of different users, agents or runs are added concurrently; those sharing the same ids are added
+    one after another in request order, so each is reconciled against the memories of the ones before it.
+    """
+    for item in batch.memories:
+        if not any([item.user_id, item.agent_id, item.run_id]):
+            raise HTTPException(
+                status_code=400, detail="At least one identifier (user_id, agent_id, run_id) is required."
+            )
+
+    scopes = defaultdict(list)
+    for index, item in enumerate(batch.memories):
+        scopes[(item.user_id, item.agent_id, item.run_id)].append(index)
+    results = [None] * len(batch.memories)
+
+    async def add_in_order(indexes):
+        for index in indexes:
+            item = batch.memories[index]
+            params = {k: v for k, v in item.model_dump().items() if v is not None and k != "messages"}
+            try:
+                results[index] = await memory.add(messages=[m.model_dump() for m in item.messages], **params)
+            except Exception as e:
+                results[index] = {"error": str(e)}
+
+    await asyncio.gather(*(add_in_order(indexes) for indexes in scopes.values()))
+    return JSONResponse(content={"results": results})
+
+
+@app.delete("/api/memories/batch", summary="Delete memories in bulk")
+async def delete_memories_batch(batch: MemoryBatchDelete = Body(...), memory: AsyncMemory = Depends(get_memory)):
+    """Delete several memories by ID with one vector store call."""
+    try:
+        return await memory.delete_many(batch.memory_ids)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/memories", summary="Get memories")
-def get_all_memories(
+async def get_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
+    page_size: Optional[int] = Query(None, ge=1, le=1000, description="Return one page of this many memories."),
+    cursor: Optional[str] = Query(None, description="`next_cursor` returned with the previous page."),
+    memory: AsyncMemory = Depends(get_memory),
 ):
-    """Retrieve stored memories."""
+    """Retrieve stored memories, optionally one page at a time."""
     if not any([user_id, run_id, agent_id]):
         raise HTTPException(status_code=400, detail="At least one identifier is required.")
     try:
-        params = {k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None}
-        return MEMORY_INSTANCE.get_all(**params)
+        params = {
+            k: v
+            for k, v in {
+                "user_id": user_id,
+                "run_id": run_id,
+                "agent_id": agent_id,
+                "page_size": page_size,
+                "cursor": cursor,
+            }.items()
+            if v is not None
+        }
+        return await memory.get_all(**params)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/memories/{memory_id}", summary="Get a memory")
-def get_memory(memory_id: str):
+async def get_memory_by_id(memory_id: str, memory: AsyncMemory = Depends(get_memory)):
     """Retrieve a specific memory by ID."""
     try:
-        return MEMORY_INSTANCE.get(memory_id)
+        return await memory.get(memory_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/search", summary="Search memories")
-def search_memories(search_req: SearchRequest):
+async def search_memories(search_req: SearchRequest, memory: AsyncMemory = Depends(get_memory)):
     """Search for memories based on a query."""
     try:
         params = {k: v for k, v in search_req.model_dump().items() if v is not None and k != "query"}
-        return MEMORY_INSTANCE.search(query=search_req.query, **params)
+        return await memory.search(query=search_req.query, **params)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/search/batch", summary="Search memories in bulk")
+async def search_memories_batch(batch: SearchBatchRequest, memory: AsyncMemory = Depends(get_memory)):
+    """Run several searches concurrently, embedding all their queries in one request to the embedder."""
+    searches = [{k: v for k, v in search.model_dump().items() if v is not None} for search in batch.searches]
+    try:
+        return {"results": await memory.search_many(searches)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.put("/api/memories/{memory_id}", summary="Update a memory")
-def update_memory(memory_id: str, updated_memory: Dict[str, Any]):
+async def update_memory(memory_id: str, updated_memory: Dict[str, Any], memory: AsyncMemory = Depends(get_memory)):
     """Update an existing memory."""
     try:
-        return MEMORY_INSTANCE.update(memory_id=memory_id, data=updated_memory)
+        return await memory.update(memory_id=memory_id, data=updated_memory)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/memories/{memory_id}/history", summary="Get memory history")
-def memory_history(memory_id: str):
+async def memory_history(memory_id: str, memory: AsyncMemory = Depends(get_memory)):
     """Retrieve memory history."""
     try:
-        return MEMORY_INSTANCE.history(memory_id=memory_id)
+        return await memory.history(memory_id=memory_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/memories/{memory_id}", summary="Delete a memory")
-def delete_memory(memory_id: str):
+async def delete_memory(memory_id: str, memory: AsyncMemory = Depends(get_memory)):
     """Delete a specific memory by ID."""
     try:
-        MEMORY_INSTANCE.delete(memory_id=memory_id)
+        await memory.delete(memory_id=memory_id)
         return {"message": "Memory deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/memories", summary="Delete all memories")
-def delete_all_memories(
+async def delete_all_memories(
     user_id: Optional[str] = None,
     run_id: Optional[str] = None,
     agent_id: Optional[str] = None,
+    memory: AsyncMemory = Depends(get_memory),
 ):
     """Delete all memories for a given identifier."""
     if not any([user_id, run_id, agent_id]):
         raise HTTPException(status_code=400, detail="At least one identifier is required.")
     try:
         params = {k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None}
-        MEMORY_INSTANCE.delete_all(**params)
+        await memory.delete_all(**params)
         return {"message": "All relevant memories deleted"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/export", summary="Export memories")
+async def export_memories(
+    user_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    export_all: bool = Query(
+        False, alias="all", description="Export every memory of the configuration, without an identifier."
+    ),
+    memory: AsyncMemory = Depends(get_memory),
+):
+    """
+    Stream memories with their vectors and history as NDJSON, one memory per line.
+
+    Exporting every memory of the configuration has to be asked for with `all=true`.
+    """
+    filters = {k: v for k, v in {"user_id": user_id, "run_id": run_id, "agent_id": agent_id}.items() if v is not None}
+    if not filters and not export_all:
+        raise HTTPException(status_code=400, detail="At least one identifier, or all=true, is required.")
+    lines = await memory.export(filters=filters)
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
+
+
+@app.post("/api/import", summary="Import memories")
+async def import_memories(
+    request: Request,
+    reembed: bool = Query(False, description="Embed every memory again instead of reusing exported vectors."),
+    memory: AsyncMemory = Depends(get_memory),
+):
+    """Import an NDJSON export from the request body, read and written one batch at a time."""
+    try:
+        return await memory.import_(aiter_lines(request.stream()), reembed=reembed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/reset", summary="Reset all memories")
-def reset_memory():
+async def reset_memory(memory: AsyncMemory = Depends(get_memory)):
     """Completely reset stored memories."""
     try:
-        MEMORY_INSTANCE.reset()
+        await memory.reset()
         return {"message": "All memories reset"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,43 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.main import Memory
+
+
+def make_memory(memory_class, store=None, embedder=None, **config):
+    """
+    Build a `Memory` or `AsyncMemory` whose embedder and LLM are mocks, with its history in memory.
+
+    The vector store is mocked too (`store`, a plain Mock by default) unless `config` sets a vector_store, which is
+    then created for real.
+    """
+    config = {"history_db_path": ":memory:", **config}
+    with patch("mem0.memory.main.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.main.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.main.LlmFactory") as mock_llm:
+        mock_embedder.create.return_value = embedder or Mock()
+        mock_vector_store.create.return_value = store or Mock()
+        mock_llm.create.return_value = Mock()
+        if "vector_store" in config:
+            from mem0.utils.factory import VectorStoreFactory
+
+            mock_vector_store.create.side_effect = VectorStoreFactory.create
+        return memory_class(MemoryConfig(**config))
+
+
+def hit(memory_id, data, user_id="alice"):
+    """A vector store search result."""
+    return Mock(id=memory_id, score=0.9, payload={"data": data, "user_id": user_id})
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry():
+    with patch("mem0.memory.main.capture_event"):
+        yield
+
+
+@pytest.fixture
+def memory():
+    return make_memory(Memory)
@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.cache import CachedEmbedding, EmbeddingCache
+from mem0.embeddings.configs import EmbeddingCacheConfig
+from mem0.utils.factory import EmbedderFactory
+
+
+class CountingEmbedding(EmbeddingBase):
+    def __init__(self, config=None):
+        super().__init__(config or BaseEmbedderConfig(model="test-model", embedding_dims=2))
+        self.calls = []
+
+    def embed(self, text, memory_action=None):
+        self.calls.append([text])
+        return [float(len(text)), 1.0]
+
+    def embed_batch(self, texts, memory_action=None):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.fixture
+def cached():
+    return CachedEmbedding(CountingEmbedding(), "openai", EmbeddingCache(max_size=2))
+
+
+def test_repeated_text_is_served_from_cache(cached):
+    assert cached.embed("hello") == [5.0, 1.0]
+    assert cached.embed("  hello ") == [5.0, 1.0]
+
+    assert cached.embedder.calls == [["hello"]]
+    assert cached.cache_stats()["hits"] == 1
+    assert cached.cache_stats()["misses"] == 1
+
+
+def test_batch_only_embeds_misses(cached):
+    cached.embed("a")
+    result = cached.embed_batch(["a", "bb", "ccc", "bb"])
+
+    assert result == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+    assert cached.embedder.calls == [["a"], ["bb", "ccc"]]
+
+
+def test_async_batch(cached):
+    result = asyncio.run(cached.aembed_batch(["x", "yy"]))
+    assert result == [[1.0, 1.0], [2.0, 1.0]]
+    assert asyncio.run(cached.aembed("x")) == [1.0, 1.0]
+    assert cached.cache_stats()["hits"] == 1
+
+
+def test_lru_eviction(cached):
+    cached.embed_batch(["a", "bb", "ccc"])
+    assert cached.cache_stats()["size"] == 2
+
+    cached.embed("a")
+    assert cached.embedder.calls[-1] == ["a"]
+
+
+def test_ttl_expiry():
+    cached = CachedEmbedding(CountingEmbedding(), "openai", EmbeddingCache(ttl=10))
+    with patch("mem0.embeddings.cache.time.time", return_value=100.0):
+        cached.embed("hello")
+    with patch("mem0.embeddings.cache.time.time", return_value=105.0):
+        cached.embed("hello")
+    with patch("mem0.embeddings.cache.time.time", return_value=111.0):
+        cached.embed("hello")
+
+    assert len(cached.embedder.calls) == 2
+
+
+def test_key_includes_model_and_dims():
+    cache = EmbeddingCache()
+    small = CachedEmbedding(CountingEmbedding(BaseEmbedderConfig(model="m", embedding_dims=2)), "openai", cache)
+    large = CachedEmbedding(CountingEmbedding(BaseEmbedderConfig(model="m", embedding_dims=4)), "openai", cache)
+
+    small.embed("hello")
+    large.embed("hello")
+
+    assert len(large.embedder.calls) == 1
+
+
+def test_persistent_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    CachedEmbedding(CountingEmbedding(), "openai", EmbeddingCache(path=path)).embed("hello")
+
+    restarted = CachedEmbedding(CountingEmbedding(), "openai", EmbeddingCache(path=path))
+    assert restarted.embed("hello") == [5.0, 1.0]
+    assert restarted.embedder.calls == []
+
+
+def test_factory_wraps_when_enabled(tmp_path):
+    with patch("mem0.utils.factory.load_class", return_value=Mock(return_value=CountingEmbedding())):
+        plain = EmbedderFactory.create("openai", {})
+        wrapped = EmbedderFactory.create("openai", {}, EmbeddingCacheConfig(enabled=True))
+        persistent = EmbedderFactory.create(
+            "openai", {}, {"enabled": True, "persistent": True, "path": str(tmp_path / "c.db")}
+        )
+
+    assert isinstance(plain, CountingEmbedding)
+    assert isinstance(wrapped, CachedEmbedding)
+    assert wrapped.config.model == "test-model"
+    assert persistent.cache.path == str(tmp_path / "c.db")
@@ -39,3 +39,24 @@ def test_ensure_model_exists(mock_ollama_client):
     embedder._ensure_model_exists()
 
     mock_ollama_client.pull.assert_called_once_with("nomic-embed-text")
+
+
+def test_embed_batch(mock_ollama_client):
+    embedder = OllamaEmbedding(BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512))
+    mock_ollama_client.embed.return_value = {"embeddings": [[0.1, 0.2], [0.3, 0.4]]}
+
+    embeddings = embedder.embed_batch(["first", "second"])
+
+    mock_ollama_client.embed.assert_called_once_with(model="nomic-embed-text", input=["first", "second"])
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_model_is_checked_on_first_request_only(mock_ollama_client):
+    embedder = OllamaEmbedding(BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512))
+    mock_ollama_client.list.assert_not_called()
+
+    mock_ollama_client.embeddings.return_value = {"embedding": [0.1]}
+    embedder.embed("first")
+    embedder.embed("second")
+
+    mock_ollama_client.list.assert_called_once()
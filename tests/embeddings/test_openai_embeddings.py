@@ -82,3 +82,31 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions = 1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_embed_batch_respects_batch_size(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+    embedder.batch_size = 2
+    mock_openai_client.embeddings.create.side_effect = lambda input, **kwargs: Mock(
+        data=[Mock(embedding=[float(len(text))]) for text in input]
+    )
+
+    result = embedder.embed_batch(["a", "bb", "ccc"])
+
+    assert mock_openai_client.embeddings.create.call_count == 2
+    assert result == [[1.0], [2.0], [3.0]]
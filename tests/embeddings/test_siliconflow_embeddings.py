@@ -5,22 +5,21 @@ from mem0.configs.embeddings.base import BaseEmbedderConfig
 
 
 @pytest.fixture
-def mock_requests():
-    with patch("mem0.embeddings.siliconflow.requests") as mock_req:
-        yield mock_req
+def mock_client():
+    with patch("mem0.embeddings.siliconflow.get_http_client") as mock_get_client:
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        yield mock_client
 
 
-def test_embed_default_model(mock_requests):
+def test_embed_default_model(mock_client):
     config = BaseEmbedderConfig()
     embedder = SiliconFlowEmbedding(config)
-    mock_response = Mock()
-    mock_response.data = [Mock(embedding=[0.1, 0.2, 0.3])]
-    mock_requests.request.return_value = mock_response
+    mock_client.post.return_value.json.return_value = {"data": [{"index": 0, "embedding": [0.1, 0.2, 0.3]}]}
 
     result = embedder.embed("Hello world")
 
-    mock_requests.request.assert_called_once_with(
-        "POST",
+    mock_client.post.assert_called_once_with(
         embedder.base_url,
         json={
             "model": "BAAI/bge-m3",
@@ -35,17 +34,14 @@ def test_embed_default_model(mock_requests):
     assert result == [0.1, 0.2, 0.3]
 
 
-def test_embed_custom_model(mock_requests):
+def test_embed_custom_model(mock_client):
     config = BaseEmbedderConfig(model="custom-model", embedding_dims=1024)
     embedder = SiliconFlowEmbedding(config)
-    mock_response = Mock()
-    mock_response.data = [Mock(embedding=[0.4, 0.5, 0.6])]
-    mock_requests.request.return_value = mock_response
+    mock_client.post.return_value.json.return_value = {"data": [{"index": 0, "embedding": [0.4, 0.5, 0.6]}]}
 
     result = embedder.embed("Test embedding")
 
-    mock_requests.request.assert_called_once_with(
-        "POST",
+    mock_client.post.assert_called_once_with(
         embedder.base_url,
         json={
             "model": "custom-model",
@@ -60,17 +56,14 @@ def test_embed_custom_model(mock_requests):
     assert result == [0.4, 0.5, 0.6]
 
 
-def test_embed_removes_newlines(mock_requests):
+def test_embed_removes_newlines(mock_client):
     config = BaseEmbedderConfig()
     embedder = SiliconFlowEmbedding(config)
-    mock_response = Mock()
-    mock_response.data = [Mock(embedding=[0.7, 0.8, 0.9])]
-    mock_requests.request.return_value = mock_response
+    mock_client.post.return_value.json.return_value = {"data": [{"index": 0, "embedding": [0.7, 0.8, 0.9]}]}
 
     result = embedder.embed("Hello\nworld")
 
-    mock_requests.request.assert_called_once_with(
-        "POST",
+    mock_client.post.assert_called_once_with(
         embedder.base_url,
         json={
             "model": "BAAI/bge-m3",
@@ -85,17 +78,14 @@ def test_embed_removes_newlines(mock_requests):
     assert result == [0.7, 0.8, 0.9]
 
 
-def test_embed_without_api_key_env_var(mock_requests):
+def test_embed_without_api_key_env_var(mock_client):
     config = BaseEmbedderConfig(api_key="test_key")
     embedder = SiliconFlowEmbedding(config)
-    mock_response = Mock()
-    mock_response.data = [Mock(embedding=[1.0, 1.1, 1.2])]
-    mock_requests.request.return_value = mock_response
+    mock_client.post.return_value.json.return_value = {"data": [{"index": 0, "embedding": [1.0, 1.1, 1.2]}]}
 
     result = embedder.embed("Testing API key")
 
-    mock_requests.request.assert_called_once_with(
-        "POST",
+    mock_client.post.assert_called_once_with(
         embedder.base_url,
         json={
             "model": "BAAI/bge-m3",
@@ -110,19 +100,16 @@ def test_embed_without_api_key_env_var(mock_requests):
     assert result == [1.0, 1.1, 1.2]
 
 
-def test_embed_uses_environment_api_key_and_base_url(mock_requests, monkeypatch):
+def test_embed_uses_environment_api_key_and_base_url(mock_client, monkeypatch):
     monkeypatch.setenv("SILICONFLOW_API_KEY", "env_key")
     monkeypatch.setenv("SILICONFLOW_API_BASE", "http://test.api.base")
     config = BaseEmbedderConfig()
     embedder = SiliconFlowEmbedding(config)
-    mock_response = Mock()
-    mock_response.data = [Mock(embedding=[1.3, 1.4, 1.5])]
-    mock_requests.request.return_value = mock_response
+    mock_client.post.return_value.json.return_value = {"data": [{"index": 0, "embedding": [1.3, 1.4, 1.5]}]}
 
     result = embedder.embed("Environment config test")
 
-    mock_requests.request.assert_called_once_with(
-        "POST",
+    mock_client.post.assert_called_once_with(
         "http://test.api.base",
         json={
             "model": "BAAI/bge-m3",
@@ -134,4 +121,34 @@ def test_embed_uses_environment_api_key_and_base_url(mock_requests, monkeypatch)
             "Content-Type": "application/json"
         }
     )
-    assert result == [1.3, 1.4, 1.5]
\ No newline at end of file
+    assert result == [1.3, 1.4, 1.5]
+
+def test_embed_batch_single_request(mock_client):
+    embedder = SiliconFlowEmbedding(BaseEmbedderConfig(api_key="test_key"))
+    mock_client.post.return_value.json.return_value = {
+        "data": [{"index": 1, "embedding": [0.3, 0.4]}, {"index": 0, "embedding": [0.1, 0.2]}]
+    }
+
+    result = embedder.embed_batch(["Hello\nworld", "Second"])
+
+    mock_client.post.assert_called_once_with(
+        embedder.base_url,
+        json={
+            "model": "BAAI/bge-m3",
+            "input": ["Hello world", "Second"],
+            "encoding_format": "float"
+        },
+        headers={
+            "Authorization": "Bearer test_key",
+            "Content-Type": "application/json"
+        }
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_embed_raises_on_http_error(mock_client):
+    embedder = SiliconFlowEmbedding(BaseEmbedderConfig(api_key="test_key"))
+    mock_client.post.return_value.raise_for_status.side_effect = RuntimeError("503 Service Unavailable")
+
+    with pytest.raises(RuntimeError):
+        embedder.embed("Hello")
@@ -0,0 +1,122 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.configs.rerankers.base import BaseRerankerConfig
+from mem0.memory.main import Memory
+from mem0.rerankers.bm25 import BM25Reranker
+from mem0.rerankers.cross_encoder import CrossEncoderReranker
+from mem0.rerankers.embedding import EmbeddingReranker
+from mem0.utils.factory import RerankerFactory
+
+
+def test_bm25_scores_each_document_once_and_caches_tokens():
+    reranker = BM25Reranker()
+    documents = ["alice likes green_tea", "bob lives_in paris", "alice works_at acme"]
+
+    with patch("mem0.rerankers.bm25.MicroTokenizer.cut", side_effect=lambda text: text.split()) as cut:
+        ranked = reranker.rerank("where does bob live", documents, top_n=2)
+        reranker.rerank("where does bob live", documents, top_n=2)
+
+    assert ranked[0][0] == 1
+    assert len(ranked) == 2
+    assert cut.call_count == len(documents) + 1
+
+
+def test_bm25_handles_documents_without_tokens():
+    assert BM25Reranker().score("query", ["", " "]) == [0.0, 0.0]
+
+
+def test_embedding_reranker_uses_given_embeddings():
+    embedder = Mock()
+    reranker = EmbeddingReranker(embedding_model=embedder)
+
+    ranked = reranker.rerank(
+        "q", ["a", "b"], query_embedding=[1.0, 0.0], document_embeddings=[[0.0, 1.0], [1.0, 0.0]]
+    )
+
+    assert [idx for idx, _ in ranked] == [1, 0]
+    embedder.embed.assert_not_called()
+    embedder.embed_batch.assert_not_called()
+
+
+def test_embedding_reranker_embeds_missing_documents_in_one_batch():
+    embedder = Mock()
+    embedder.embed_batch.return_value = [[0.0, 1.0], [1.0, 0.0]]
+    reranker = EmbeddingReranker(embedding_model=embedder)
+
+    ranked = reranker.rerank("q", ["a", "b"], top_n=1, query_embedding=[1.0, 0.0])
+
+    assert ranked == [(1, 1.0)]
+    embedder.embed_batch.assert_called_once_with(["a", "b"], "search")
+
+
+def test_embedding_reranker_embeds_only_documents_without_an_embedding():
+    embedder = Mock()
+    embedder.embed_batch.return_value = [[1.0, 0.0]]
+    reranker = EmbeddingReranker(embedding_model=embedder)
+
+    ranked = reranker.rerank("q", ["a", "b"], query_embedding=[1.0, 0.0], document_embeddings=[[0.0, 1.0], None])
+
+    assert [idx for idx, _ in ranked] == [1, 0]
+    embedder.embed_batch.assert_called_once_with(["b"], "search")
+
+
+def test_cross_encoder_loads_model_lazily():
+    reranker = CrossEncoderReranker(BaseRerankerConfig(model="my-cross-encoder"))
+    model = Mock()
+    model.predict.return_value = [0.1, 0.9]
+
+    with patch.dict("sys.modules", {"sentence_transformers": Mock(CrossEncoder=Mock(return_value=model))}):
+        ranked = reranker.rerank("q", ["a", "b"])
+
+    assert ranked == [(1, 0.9), (0, 0.1)]
+    model.predict.assert_called_once_with([("q", "a"), ("q", "b")], batch_size=32)
+
+
+def test_factory_rejects_unknown_provider():
+    with pytest.raises(ValueError, match="Unsupported Reranker provider"):
+        RerankerFactory.create("unknown", {})
+
+
+def test_memory_search_reranks_vector_hits():
+    with patch("mem0.memory.main.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.main.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.main.LlmFactory"), patch("mem0.memory.main.capture_event"):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        memory = Memory(MemoryConfig(version="v1.1", history_db_path=":memory:"))
+
+    hits = [Mock(id="m1", score=0.9, payload={"data": "a"}), Mock(id="m2", score=0.8, payload={"data": "b"})]
+    memory.vector_store.search.return_value = hits
+    memory.embedding_model.embed.return_value = [1.0, 0.0]
+    memory._reranker = Mock(uses_document_embeddings=False)
+    memory._reranker.rerank.return_value = [(1, 2.0), (0, 1.0)]
+
+    results = memory._search_vector_store("q", {"user_id": "alice"}, limit=2, rerank=True)
+
+    memory._reranker.rerank.assert_called_once_with("q", ["a", "b"], query_embedding=[1.0, 0.0])
+    assert [r["id"] for r in results] == ["m2", "m1"]
+    assert [r["rerank_score"] for r in results] == [2.0, 1.0]
+
+
+def test_memory_search_passes_stored_vectors_to_the_embedding_reranker():
+    with patch("mem0.memory.main.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.main.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.main.LlmFactory"), patch("mem0.memory.main.capture_event"):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        memory = Memory(MemoryConfig(version="v1.1", history_db_path=":memory:"))
+
+    hits = [Mock(id="m1", score=0.9, payload={"data": "a"}), Mock(id="m2", score=0.8, payload={"data": "b"})]
+    memory.vector_store.search.return_value = hits
+    memory.vector_store.get_vectors.return_value = {"m1": [0.0, 1.0], "m2": [1.0, 0.0]}
+    memory.embedding_model.embed.return_value = [1.0, 0.0]
+    memory._reranker = EmbeddingReranker(embedding_model=memory.embedding_model)
+
+    results = memory._search_vector_store("q", {"user_id": "alice"}, limit=2, rerank=True)
+
+    memory.vector_store.get_vectors.assert_called_once_with(["m1", "m2"])
+    memory.embedding_model.embed_batch.assert_not_called()
+    assert [r["id"] for r in results] == ["m2", "m1"]
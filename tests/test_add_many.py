@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def memory(memory):
+    reconciled = []
+    lock = threading.Lock()
+
+    def extract_facts(messages, prompt=None, includes=None, excludes=None):
+        # Later conversations finish extraction first to exercise per-user ordering
+        text = messages[0]["content"]
+        time.sleep(0.05 if text.endswith("0") else 0)
+        return [text]
+
+    def reconcile_facts(facts, metadata, filters, custom_categories=None):
+        if facts == ["boom"]:
+            raise RuntimeError("LLM unavailable")
+        with lock:
+            reconciled.append((filters["user_id"], facts[0]))
+        return [{"id": facts[0], "memory": facts[0], "event": "ADD"}]
+
+    memory._extract_facts = extract_facts
+    memory._reconcile_facts = reconcile_facts
+    memory.reconciled = reconciled
+    return memory
+
+
+def conversation(user_id, text, **extra):
+    return {"messages": [{"role": "user", "content": text}], "user_id": user_id, **extra}
+
+
+def test_add_many_keeps_per_user_order(memory):
+    conversations = [conversation("alice", "a0"), conversation("bob", "b0"), conversation("alice", "a1")]
+
+    entries = list(memory.add_many(conversations, concurrency=3))
+
+    assert sorted(entry["id"] for entry in entries) == [0, 1, 2]
+    assert all(entry["error"] is None for entry in entries)
+    assert entries[-1]["progress"] == {"completed": 3, "failed": 0, "skipped": 0, "total": 3}
+    alice = [fact for user, fact in memory.reconciled if user == "alice"]
+    assert alice == ["a0", "a1"]
+    assert {entry["id"]: entry["result"]["results"][0]["memory"] for entry in entries}[2] == "a1"
+
+
+def test_add_many_reports_errors_without_stopping(memory):
+    conversations = [conversation("alice", "boom"), {"messages": "no identifier"}, conversation("alice", "a1")]
+
+    entries = {entry["id"]: entry for entry in memory.add_many(conversations, concurrency=2)}
+
+    assert "LLM unavailable" in entries[0]["error"]
+    assert "user_id, agent_id or run_id" in entries[1]["error"]
+    assert entries[2]["result"]["results"][0]["memory"] == "a1"
+
+
+def test_add_many_resumes_from_checkpoint(memory, tmp_path):
+    checkpoint = str(tmp_path / "backfill.ckpt")
+    conversations = [
+        conversation("alice", "a0", id="c0"),
+        conversation("alice", "boom", id="c1"),
+        conversation("bob", "b0", id="c2"),
+    ]
+
+    list(memory.add_many(conversations, checkpoint_path=checkpoint))
+    memory.reconciled.clear()
+    entries = {entry["id"]: entry for entry in memory.add_many(conversations, checkpoint_path=checkpoint)}
+
+    assert entries["c0"]["skipped"] and entries["c2"]["skipped"]
+    assert entries["c1"]["error"]
+    assert memory.reconciled == []
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.llms.base import LLMBase
+from mem0.memory.main import AsyncMemory, Memory
+from mem0.vector_stores.base import VectorStoreBase
+from tests.conftest import hit, make_memory
+
+
+@pytest.fixture
+def async_memory():
+    with patch("mem0.memory.main.EmbedderFactory") as mock_embedder, patch(
+        "mem0.memory.main.VectorStoreFactory"
+    ) as mock_vector_store, patch("mem0.memory.main.LlmFactory") as mock_llm, patch(
+        "mem0.memory.main.capture_event"
+    ):
+        mock_embedder.create.return_value = Mock()
+        mock_vector_store.create.return_value = Mock()
+        mock_llm.create.return_value = Mock()
+
+        memory = AsyncMemory(MemoryConfig(version="v1.1", history_db_path=":memory:"))
+        yield memory
+
+
+def test_add_runs_extraction_search_and_write(async_memory):
+    async_memory.llm.agenerate_response = AsyncMock(
+        side_effect=[
+            json.dumps({"facts": ["Likes tea", "Lives in Paris"]}),
+            json.dumps({"memory": [{"id": "0", "text": "Likes tea", "event": "ADD"}]}),
+            json.dumps({"memory": [{"text": "Likes tea", "categories": ["food"]}]}),
+        ]
+    )
+    async_memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+    async_memory.vector_store.asearch_batch = AsyncMock(return_value=[[], []])
+    async_memory.vector_store.ainsert_many = AsyncMock()
+
+    result = asyncio.run(async_memory.add("I like tea and live in Paris", user_id="alice"))
+
+    assert [m["memory"] for m in result["results"]] == ["Likes tea"]
+    assert result["results"][0]["categories"] == ["food"]
+    async_memory.embedding_model.aembed_batch.assert_awaited_once_with(["Likes tea", "Lives in Paris"], "add")
+    async_memory.vector_store.asearch_batch.assert_awaited_once_with(
+        queries=[[0.1, 0.2], [0.3, 0.4]], limit=5, filters={"user_id": "alice"}
+    )
+    async_memory.vector_store.ainsert_many.assert_awaited_once()
+    payload = async_memory.vector_store.ainsert_many.await_args.kwargs["payloads"][0]
+    assert payload["user_id"] == "alice"
+    assert payload["data"] == "Likes tea"
+
+
+def test_add_sends_the_same_prompts_and_writes_as_memory():
+    responses = [
+        json.dumps({"facts": ["Likes green tea"]}),
+        json.dumps({"memory": [{"id": "0", "text": "Likes green tea", "event": "UPDATE", "old_memory": "Likes tea"}]}),
+    ]
+    sync_memory = make_memory(Memory, version="v1.1")
+    sync_memory.llm.generate_response = Mock(side_effect=responses)
+    sync_memory.embedding_model.embed_batch = Mock(return_value=[[0.1, 0.2]])
+    sync_memory.vector_store.search_batch = Mock(return_value=[[hit("m1", "Likes tea")]])
+    async_memory = make_memory(AsyncMemory, version="v1.1")
+    async_memory.llm.agenerate_response = AsyncMock(side_effect=responses)
+    async_memory.embedding_model.aembed_batch = AsyncMock(return_value=[[0.1, 0.2]])
+    async_memory.vector_store.asearch_batch = AsyncMock(return_value=[[hit("m1", "Likes tea")]])
+    async_memory.vector_store.aupdate_many = AsyncMock()
+
+    sync_result = sync_memory.add("I now prefer green tea", user_id="alice")
+    async_result = asyncio.run(async_memory.add("I now prefer green tea", user_id="alice"))
+
+    assert async_result == sync_result
+    assert async_memory.llm.agenerate_response.await_args_list == sync_memory.llm.generate_response.call_args_list
+    update = async_memory.vector_store.aupdate_many.await_args.kwargs
+    assert update["vector_ids"] == sync_memory.vector_store.update_many.call_args.kwargs["vector_ids"] == ["m1"]
+
+
+def test_add_requires_identifier(async_memory):
+    with pytest.raises(ValueError, match="One of the filters"):
+        asyncio.run(async_memory.add("hello"))
+
+
+def test_add_leaves_the_callers_arguments_untouched(async_memory):
+    async_memory._add_to_vector_store = AsyncMock(return_value=[])
+    async_memory._add_to_graph = AsyncMock(return_value=[])
+    metadata, filters, includes = {"source": "chat"}, {"topic": "food"}, {"vector": "food"}
+
+    asyncio.run(async_memory.add("I like tea", user_id="alice", metadata=metadata, filters=filters, includes=includes))
+
+    assert (metadata, filters, includes) == ({"source": "chat"}, {"topic": "food"}, {"vector": "food"})
+    args = async_memory._add_to_vector_store.await_args.args
+    assert args[1] == {"source": "chat", "user_id": "alice"} and args[2] == {"topic": "food", "user_id": "alice"}
+
+
+def test_search(async_memory):
+    async_memory.embedding_model.aembed = AsyncMock(return_value=[0.1, 0.2])
+    async_memory.vector_store.asearch = AsyncMock(
+        return_value=[Mock(id="1", payload={"data": "Memory 1", "user_id": "alice"}, score=0.9)]
+    )
+
+    result = asyncio.run(async_memory.search("query", user_id="alice", limit=3))
+
+    assert result["results"][0]["memory"] == "Memory 1"
+    assert result["results"][0]["score"] == 0.9
+    async_memory.vector_store.asearch.assert_awaited_once_with(query=[0.1, 0.2], limit=3, filters={"user_id": "alice"})
+
+
+def test_delete_all_and_history(async_memory):
+    memories = [Mock(id="1", payload={"data": "a"}), Mock(id="2", payload={"data": "b"})]
+    async_memory.vector_store.alist_page = AsyncMock(side_effect=[(memories[:1], "next"), (memories[1:], None)])
+    async_memory.vector_store.adelete_by_filter = AsyncMock()
+
+    asyncio.run(async_memory.delete_all(user_id="alice"))
+
+    async_memory.vector_store.adelete_by_filter.assert_awaited_once_with({"user_id": "alice"})
+    history = asyncio.run(async_memory.history("2"))
+    assert history[0]["event"] == "DELETE" and history[0]["old_memory"] == "b"
+
+
+def test_base_classes_fall_back_to_threads():
+    class Embedder(EmbeddingBase):
+        def embed(self, text, memory_action=None):
+            return [len(text)]
+
+    class Llm(LLMBase):
+        def generate_response(self, messages, **kwargs):
+            return messages[0]["content"]
+
+    class Store(VectorStoreBase):
+        create_col = insert = delete = update = get = list_cols = delete_col = col_info = list = Mock()
+        search = Mock(return_value=["hit"])
+
+    assert asyncio.run(Embedder().aembed("abc")) == [3]
+    assert asyncio.run(Embedder().aembed_batch(["a", "abc"])) == [[1], [3]]
+    assert asyncio.run(Llm().agenerate_response([{"role": "user", "content": "hi"}])) == "hi"
+    assert asyncio.run(Store().asearch(query=[0.1], limit=1)) == ["hit"]
+    assert asyncio.run(Store().asearch_batch(queries=[[0.1], [0.2]], limit=1)) == [["hit"], ["hit"]]
@@ -0,0 +1,97 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from mem0.client_simplified.main import MemoryClient
+from mem0.memory.main import AsyncMemory, Memory
+from tests.conftest import hit, make_memory
+
+SEARCHES = [
+    {"query": "tea", "user_id": "alice"},
+    {"query": "tea", "user_id": "bob", "limit": 3},
+    {"query": "pets"},
+]
+
+
+def test_search_many_embeds_queries_once_and_reports_errors_per_item():
+    memory = make_memory(Memory)
+    memory.embedding_model.embed_batch.return_value = [[1.0, 0.0], [0.0, 1.0]]
+    memory.vector_store.search.side_effect = lambda query, limit, filters: [
+        hit(f"{filters['user_id']}-1", f"{filters['user_id']} likes tea", filters["user_id"])
+    ]
+
+    results = memory.search_many(SEARCHES)
+
+    memory.embedding_model.embed_batch.assert_called_once_with(["tea", "pets"], "search")
+    memory.embedding_model.embed.assert_not_called()
+    assert [result["results"][0]["id"] for result in results[:2]] == ["alice-1", "bob-1"]
+    assert memory.vector_store.search.call_args_list[1].kwargs == {
+        "query": [1.0, 0.0],
+        "limit": 3,
+        "filters": {"user_id": "bob"},
+    }
+    assert "user_id, agent_id or run_id is required" in results[2]["error"]
+
+
+def test_async_search_many_embeds_queries_once():
+    memory = make_memory(AsyncMemory)
+    memory.embedding_model.aembed_batch = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+    memory.embedding_model.aembed = AsyncMock()
+    memory.vector_store.asearch = AsyncMock(
+        side_effect=lambda query, limit, filters: [hit("m1", "likes tea", filters["user_id"])]
+    )
+
+    results = asyncio.run(memory.search_many(SEARCHES))
+
+    memory.embedding_model.aembed_batch.assert_awaited_once_with(["tea", "pets"], "search")
+    memory.embedding_model.aembed.assert_not_called()
+    assert [len(result["results"]) for result in results[:2]] == [1, 1]
+    assert "error" in results[2]
+
+
+@pytest.mark.parametrize("memory_class", [Memory, AsyncMemory])
+def test_delete_many_deletes_found_memories_in_one_call(memory_class):
+    memory = make_memory(memory_class)
+    records = {"a": hit("a", "likes tea", "alice"), "c": hit("c", "has a dog", "alice")}
+    if memory_class is Memory:
+        memory.vector_store.get.side_effect = lambda vector_id: records.get(vector_id)
+        result = memory.delete_many(["a", "b", "c", "a"])
+        delete_many = memory.vector_store.delete_many
+    else:
+        memory.vector_store.aget = AsyncMock(side_effect=lambda vector_id: records.get(vector_id))
+        memory.vector_store.adelete_many = AsyncMock()
+        result = asyncio.run(memory.delete_many(["a", "b", "c", "a"]))
+        delete_many = memory.vector_store.adelete_many
+
+    assert result == {"deleted": ["a", "c"], "not_found": ["b"]}
+    delete_many.assert_called_once_with(vector_ids=["a", "c"])
+    history = memory.db.get_history("a")
+    assert [(row["old_memory"], row["event"]) for row in history] == [("likes tea", "DELETE")]
+
+
+def test_simplified_client_batch_methods():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"results": []})
+
+    client = MemoryClient(host="http://memory.invalid/api")
+    client.client = httpx.Client(base_url=client.host, transport=httpx.MockTransport(handler))
+
+    client.batch_add([{"messages": "I like tea", "user_id": "alice", "metadata": None}])
+    client.batch_search([{"query": "tea", "user_id": "alice"}])
+    client.batch_delete(["a", "b"])
+
+    assert [(request.method, request.url.path) for request in requests] == [
+        ("POST", "/api/memories/batch"),
+        ("POST", "/api/search/batch"),
+        ("DELETE", "/api/memories/batch"),
+    ]
+    assert json.loads(requests[0].content) == {
+        "memories": [{"messages": [{"role": "user", "content": "I like tea"}], "user_id": "alice"}]
+    }
+    assert json.loads(requests[2].content) == {"memory_ids": ["a", "b"]}
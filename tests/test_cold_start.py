@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.main import Memory
+
+
+def imported_modules(code, moremem_dir):
+    script = f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    env = {**os.environ, "MOREMEM_DIR": str(moremem_dir), "MEM0_TELEMETRY": "true"}
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_importing_mem0_loads_no_clients_and_writes_nothing(tmp_path):
+    moremem_dir = tmp_path / "moremem"
+
+    modules = imported_modules("import mem0", moremem_dir)
+    assert "mem0.memory.main" not in modules
+    assert "httpx" not in modules
+
+    modules = imported_modules("from mem0 import Memory", moremem_dir)
+    assert not {"posthog", "qdrant_client", "openai", "httpx"} & modules
+    assert not moremem_dir.exists()
+
+
+def test_llm_is_created_on_first_use():
+    with patch("mem0.memory.main.EmbedderFactory"), patch("mem0.memory.main.VectorStoreFactory"), patch(
+        "mem0.memory.main.LlmFactory"
+    ) as mock_llm, patch("mem0.memory.main.capture_event"):
+        mock_llm.create.return_value = Mock()
+        memory = Memory(MemoryConfig(history_db_path=":memory:"))
+        mock_llm.create.assert_not_called()
+
+        assert memory.llm is mock_llm.create.return_value
+        assert memory.llm is mock_llm.create.return_value
+        mock_llm.create.assert_called_once_with("openai", memory.config.llm.config)
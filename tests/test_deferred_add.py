@@ -0,0 +1,181 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.memory.ingest import AddJobQueue, DeferredAddWorker
+from mem0.memory.main import Memory
+from tests.conftest import make_memory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = make_memory(Memory, deferred_add={"path": str(tmp_path / "queue.db"), "concurrency": 3})
+
+    applied = []
+    lock = threading.Lock()
+
+    def add_to_vector_store(params):
+        text = params["messages"][0]["content"]
+        # Earlier conversations are slower, so ordering only holds if the queue enforces it
+        time.sleep(0.05 if text.endswith("0") else 0)
+        if text == "boom":
+            raise RuntimeError("LLM unavailable")
+        with lock:
+            applied.append((params["filters"]["user_id"], text))
+        return [{"id": text, "memory": text, "event": "ADD"}]
+
+    memory._add_to_vector_store_from_params = add_to_vector_store
+    memory.applied = applied
+    yield memory
+    if memory._deferred_adds is not None:
+        memory._deferred_adds.close()
+
+
+def test_deferred_add_returns_job_and_keeps_per_user_order(memory):
+    jobs = [
+        memory.add("a0", user_id="alice", mode="deferred"),
+        memory.add("b0", user_id="bob", mode="deferred"),
+        memory.add("a1", user_id="alice", mode="deferred"),
+    ]
+
+    assert all(job["status"] == "queued" for job in jobs)
+    finished = [memory.wait_for_add_job(job["job_id"], timeout=5) for job in jobs]
+
+    assert [job["status"] for job in finished] == ["done", "done", "done"]
+    assert finished[2]["result"]["results"][0]["memory"] == "a1"
+    assert [text for user, text in memory.applied if user == "alice"] == ["a0", "a1"]
+    stats = memory.deferred_add_stats()
+    assert stats["done"] == 3 and stats["queued"] == 0 and stats["concurrency"] == 3
+
+
+def test_deferred_add_records_failures(memory):
+    job = memory.add("boom", user_id="alice", mode="deferred")
+
+    finished = memory.wait_for_add_job(job["job_id"], timeout=5)
+
+    assert finished["status"] == "failed"
+    assert "LLM unavailable" in finished["error"]
+    assert memory.get_add_job(job["job_id"])["status"] == "failed"
+
+
+def test_deferred_add_validates_before_enqueueing(memory):
+    with pytest.raises(ValueError, match="user_id, agent_id or run_id"):
+        memory.add("hello", mode="deferred")
+    with pytest.raises(ValueError, match="Unsupported add mode"):
+        memory.add("hello", user_id="alice", mode="later")
+
+
+def test_deferred_add_describes_images_in_the_worker(memory):
+    memory.config.llm.config["enable_vision"] = True
+    threads = []
+
+    def parse_vision_messages(messages, *args):
+        threads.append(threading.current_thread())
+        return messages
+
+    with patch("mem0.memory.main.parse_vision_messages", side_effect=parse_vision_messages):
+        job = memory.add("a0", user_id="alice", mode="deferred")
+        assert threads == []
+        finished = memory.wait_for_add_job(job["job_id"], timeout=5)
+
+    assert finished["status"] == "done"
+    assert len(threads) == 1 and threads[0] is not threading.current_thread()
+    assert memory.get_add_job(job["job_id"]) is not None
+
+
+def test_queue_hands_out_one_job_per_user_in_order(tmp_path):
+    queue = AddJobQueue(str(tmp_path / "queue.db"), owner="config-a")
+    other = AddJobQueue(str(tmp_path / "queue.db"), owner="config-b")
+    first = queue.enqueue("alice", [{"role": "user", "content": "a0"}], {"user_id": "alice"})
+    queue.enqueue("alice", [{"role": "user", "content": "a1"}], {"user_id": "alice"})
+    bob = queue.enqueue("bob", "b0", {"user_id": "bob"})
+
+    assert [job[0] for job in queue.claim(10)] == [first, bob]
+    assert queue.claim(10) == []
+    assert other.claim(10) == []
+
+    queue.finish(first, result={"results": []})
+    assert [job[1] for job in queue.claim(10)] == [[{"role": "user", "content": "a1"}]]
+
+
+def test_interrupted_jobs_resume_once_their_lease_expires(tmp_path):
+    path = str(tmp_path / "queue.db")
+    queue = AddJobQueue(path, owner="config", lease_timeout=0.1)
+    job_id = queue.enqueue("alice", "a0", {"user_id": "alice"})
+    queue.claim(1)
+    queue.close()
+    time.sleep(0.15)
+
+    run_job = Mock(return_value={"results": []})
+    worker = DeferredAddWorker(AddJobQueue(path, owner="config"), run_job, poll_interval=0.05)
+    try:
+        assert worker.wait(job_id, timeout=5)["status"] == "done"
+        run_job.assert_called_once_with("a0", {"user_id": "alice"})
+    finally:
+        worker.close()
+
+
+def test_full_queue_pushes_back_on_producers(tmp_path):
+    release = threading.Event()
+    worker = DeferredAddWorker(
+        AddJobQueue(str(tmp_path / "queue.db"), owner="config"),
+        lambda messages, kwargs: release.wait(),
+        concurrency=1,
+        max_pending=1,
+        poll_interval=0.05,
+    )
+    try:
+        worker.submit("alice", "a0", {})
+        while worker.stats()["running"] == 0:
+            time.sleep(0.01)
+        worker.submit("alice", "a1", {})
+
+        with pytest.raises(TimeoutError, match="queue is full"):
+            worker.submit("alice", "a2", {}, timeout=0.1)
+        assert worker.stats()["throttled"] == 1
+    finally:
+        release.set()
+        worker.close()
+
+
+def test_jobs_of_a_live_worker_are_not_requeued_by_another_process(tmp_path):
+    path = str(tmp_path / "queue.db")
+    release = threading.Event()
+    worker = DeferredAddWorker(
+        AddJobQueue(path, owner="config", lease_timeout=0.3),
+        lambda messages, kwargs: release.wait(),
+        poll_interval=0.02,
+    )
+    other = AddJobQueue(path, owner="config", lease_timeout=0.3)
+    try:
+        job_id = worker.submit("alice", "a0", {})
+        while worker.stats()["running"] == 0:
+            time.sleep(0.01)
+        # Outlive the first lease: the heartbeat has to keep the job reserved
+        time.sleep(0.6)
+
+        assert other.requeue_expired() == 0
+        assert other.claim(10) == []
+        release.set()
+        assert worker.wait(job_id, timeout=5)["status"] == "done"
+    finally:
+        release.set()
+        worker.close()
+        other.close()
+
+
+def test_deferred_queue_is_keyed_on_the_store_not_the_credentials(tmp_path):
+    def owner(api_key):
+        memory = make_memory(
+            Memory,
+            llm={"provider": "openai", "config": {"api_key": api_key}},
+            deferred_add={"path": str(tmp_path / "queue.db")},
+        )
+        try:
+            return memory.deferred_adds.queue.owner
+        finally:
+            memory.close()
+
+    assert owner("sk-first") == owner("sk-second")
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+from mem0.memory.main import AsyncMemory, Memory
+from tests.conftest import make_memory
+
+FUSED_RESPONSE = json.dumps(
+    {
+        "facts": ["Likes green tea", "Lives in Paris"],
+        "memory": [
+            {"id": "0", "text": "Likes green tea", "event": "UPDATE", "old_memory": "Likes tea"},
+            {"text": "Lives in Paris", "event": "ADD", "categories": ["travel"]},
+        ],
+    }
+)
+
+
+def existing_memory():
+    return Mock(id="mem-a", score=0.1, payload={"data": "Likes tea", "user_id": "alice"})
+
+
+def test_fused_add_makes_a_single_llm_call():
+    memory = make_memory(Memory, add_pipeline="fused")
+    memory.embedding_model.embed.return_value = [0.5, 0.5]
+    memory.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.1, 0.2] for _ in texts]
+    memory.vector_store.search.return_value = [existing_memory()]
+    memory.llm.generate_response.return_value = FUSED_RESPONSE
+
+    result = memory.add("I now prefer green tea, and I moved to Paris", user_id="alice")
+
+    memory.llm.generate_response.assert_called_once()
+    system_prompt = memory.llm.generate_response.call_args.kwargs["messages"][0]["content"]
+    assert "personal_details" in system_prompt
+    user_prompt = memory.llm.generate_response.call_args.kwargs["messages"][1]["content"]
+    assert "'id': '0', 'text': 'Likes tea'" in user_prompt
+    memory.embedding_model.embed.assert_called_once_with("user: I now prefer green tea, and I moved to Paris\n", "search")
+    memory.vector_store.search.assert_called_once_with(query=[0.5, 0.5], limit=10, filters={"user_id": "alice"})
+    memory.vector_store.search_batch.assert_not_called()
+    assert [(r["event"], r["memory"]) for r in result["results"]] == [
+        ("UPDATE", "Likes green tea"),
+        ("ADD", "Lives in Paris"),
+    ]
+    assert memory.vector_store.update_many.call_args.kwargs["vector_ids"] == ["mem-a"]
+    assert memory.vector_store.insert_many.call_args.kwargs["payloads"][0]["categories"] == ["travel"]
+
+
+def test_fused_add_survives_invalid_llm_output():
+    memory = make_memory(Memory, add_pipeline="fused")
+    memory.embedding_model.embed.return_value = [0.5, 0.5]
+    memory.vector_store.search.return_value = []
+    memory.llm.generate_response.return_value = "not json"
+
+    assert memory.add("hello", user_id="alice")["results"] == []
+    memory.vector_store.insert_many.assert_not_called()
+
+
+def test_custom_fact_prompt_falls_back_to_multi_call():
+    memory = make_memory(Memory, add_pipeline="fused")
+    memory._extract_facts = Mock(return_value=[])
+    memory._reconcile_facts = Mock(return_value=[])
+
+    memory.add("hello", user_id="alice", prompt="Only extract food preferences")
+
+    memory._extract_facts.assert_called_once()
+    memory.llm.generate_response.assert_not_called()
+
+
+def test_add_many_skips_separate_extraction_stage():
+    memory = make_memory(Memory, add_pipeline="fused")
+    memory._extract_facts = Mock()
+    memory._add_fused = Mock(return_value=[{"id": "m1", "memory": "Likes tea", "event": "ADD"}])
+
+    entries = list(memory.add_many([{"messages": "I like tea", "user_id": "alice"}]))
+
+    memory._extract_facts.assert_not_called()
+    assert entries[0]["result"]["results"][0]["memory"] == "Likes tea"
+
+
+def test_async_fused_add_makes_a_single_llm_call():
+    memory = make_memory(AsyncMemory, add_pipeline="fused")
+    memory.embedding_model.aembed = AsyncMock(return_value=[0.5, 0.5])
+    memory.embedding_model.aembed_batch = AsyncMock(side_effect=lambda texts, action: [[0.1, 0.2] for _ in texts])
+    memory.vector_store.asearch = AsyncMock(return_value=[existing_memory()])
+    memory.vector_store.aupdate_many = AsyncMock()
+    memory.vector_store.ainsert_many = AsyncMock()
+    memory.llm.agenerate_response = AsyncMock(return_value=FUSED_RESPONSE)
+
+    result = asyncio.run(memory.add("I now prefer green tea, and I moved to Paris", user_id="alice"))
+
+    memory.llm.agenerate_response.assert_awaited_once()
+    assert [r["event"] for r in result["results"]] == ["UPDATE", "ADD"]
@@ -0,0 +1,197 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.base import MemoryConfig
+from mem0.memory.graph_memory import MemoryGraph
+
+
+def make_graph(similarity_search="auto"):
+    config = MemoryConfig(
+        graph_store={
+            "config": {
+                "url": "bolt://localhost:7687",
+                "username": "neo4j",
+                "password": "password",
+                "similarity_search": similarity_search,
+            }
+        }
+    )
+    with patch("mem0.memory.graph_memory.Neo4jGraph"), patch(
+        "mem0.memory.graph_memory.EmbedderFactory"
+    ), patch("mem0.memory.graph_memory.LlmFactory"):
+        graph = MemoryGraph(config)
+    graph.graph = Mock()
+    graph.embedding_model = Mock()
+    return graph
+
+
+def test_local_similarity_scores_candidates_once():
+    graph = make_graph("local")
+    graph.graph.query.return_value = [
+        {"id": "n1", "embedding": [1.0, 0.0]},
+        {"id": "n2", "embedding": [0.6, 0.8]},
+        {"id": "n3", "embedding": [0.0, 1.0]},
+    ]
+
+    matches = graph._find_similar_nodes([[1.0, 0.0], [0.0, 1.0]], "alice", threshold=0.5)
+
+    assert graph.graph.query.call_count == 1
+    assert matches == [[("n1", 1.0), ("n2", 0.6)], [("n3", 1.0), ("n2", 0.8)]]
+
+
+def test_auto_falls_back_to_local_when_index_cannot_be_created():
+    graph = make_graph("auto")
+    graph.graph.query.side_effect = [Exception("vector indexes not supported"), []]
+
+    assert graph._find_similar_nodes([[1.0, 0.0]], "alice", threshold=0.9) == [[]]
+    assert graph.similarity_search == "local"
+
+
+def test_vector_index_is_created_once_and_queried_for_all_embeddings():
+    graph = make_graph("vector_index")
+    graph.graph.query.side_effect = [
+        [],
+        [],
+        [
+            {"idx": 0, "returned": 2, "lowest": 0.3, "matches": [{"id": "n1", "similarity": 0.91}]},
+            {"idx": 1, "returned": 2, "lowest": 0.91, "matches": [{"id": "n2", "similarity": 0.95}]},
+        ],
+        [],
+    ]
+
+    matches = graph._find_similar_nodes([[1.0, 0.0], [0.0, 1.0]], "alice", threshold=0.9, limit=1)
+    graph._find_similar_nodes([[1.0, 0.0]], "alice", threshold=0.9)
+
+    assert "CREATE VECTOR INDEX memory_entity_embedding" in graph.graph.query.call_args_list[0].args[0]
+    assert "`vector.dimensions`: 2" in graph.graph.query.call_args_list[0].args[0]
+    queries = [call.args[0] for call in graph.graph.query.call_args_list]
+    assert sum("CREATE VECTOR INDEX" in q for q in queries) == 1
+    assert graph.graph.query.call_args_list[2].kwargs["params"]["embeddings"] == [[1.0, 0.0], [0.0, 1.0]]
+    assert matches == [[("n1", 0.91)], [("n2", 0.95)]]
+
+
+def test_vector_index_oversamples_when_other_users_fill_the_candidates():
+    graph = make_graph("vector_index")
+    graph.vector_index_candidates = 2
+    graph._vector_index_ready = True
+    # Bob's nodes are the two nearest neighbours, so Alice's match only shows up with more candidates
+    nodes = [("bob-1", "bob", 0.99), ("bob-2", "bob", 0.97), ("alice-1", "alice", 0.95), ("alice-2", "alice", 0.2)]
+
+    def query(cypher, params):
+        hits = nodes[: params["candidates"]]
+        return [
+            {
+                "idx": idx,
+                "returned": len(hits),
+                "lowest": min(similarity for _, _, similarity in hits),
+                "matches": [
+                    {"id": node, "similarity": similarity}
+                    for node, user, similarity in hits
+                    if user == params["user_id"] and similarity >= params["threshold"]
+                ],
+            }
+            for idx in range(len(params["embeddings"]))
+        ]
+
+    graph.graph.query.side_effect = query
+
+    assert graph._find_similar_nodes([[1.0, 0.0]], "alice", threshold=0.9) == [[("alice-1", 0.95)]]
+    assert [call.kwargs["params"]["candidates"] for call in graph.graph.query.call_args_list] == [2, 4]
+
+
+def test_vector_index_falls_back_to_local_scoring_past_the_candidate_cap():
+    graph = make_graph("vector_index")
+    graph.vector_index_candidates = 2
+    graph.MAX_VECTOR_INDEX_CANDIDATES = 2
+    graph._vector_index_ready = True
+    graph.graph.query.side_effect = [
+        [{"idx": 0, "returned": 2, "lowest": 0.97, "matches": []}],
+        [{"id": "alice-1", "embedding": [1.0, 0.0]}],
+    ]
+
+    assert graph._find_similar_nodes([[1.0, 0.0]], "alice", threshold=0.9) == [[("alice-1", 1.0)]]
+    assert graph.graph.query.call_args_list[1].kwargs["params"] == {"user_id": "alice"}
+
+
+def test_vector_index_mode_raises_when_index_cannot_be_created():
+    graph = make_graph("vector_index")
+    graph.graph.query.side_effect = Exception("vector indexes not supported")
+
+    with pytest.raises(Exception, match="not supported"):
+        graph._find_similar_nodes([[1.0, 0.0]], "alice", threshold=0.9)
+
+
+def test_search_graph_db_fetches_relations_in_one_query():
+    graph = make_graph("local")
+    graph.embedding_model.embed_batch.return_value = [[1.0, 0.0], [0.0, 1.0]]
+    relation = {
+        "source": "alice",
+        "source_id": "n1",
+        "relatationship": "likes",
+        "relation_id": "r1",
+        "destination": "tea",
+        "destination_id": "n3",
+    }
+    graph.graph.query.side_effect = [
+        [{"id": "n1", "embedding": [1.0, 0.0]}, {"id": "n3", "embedding": [0.0, 1.0]}],
+        [{"idx": 0, **relation, "similarity": 1.0}, {"idx": 1, **relation, "similarity": 1.0}],
+    ]
+
+    results = graph._search_graph_db(["alice", "tea"], {"user_id": "alice"})
+
+    assert graph.graph.query.call_count == 2
+    rows = graph.graph.query.call_args.kwargs["params"]["rows"]
+    assert rows == [{"idx": 0, "id": "n1", "similarity": 1.0}, {"idx": 1, "id": "n3", "similarity": 1.0}]
+    assert results == [{**relation, "similarity": 1.0}, {**relation, "similarity": 1.0}]
+
+
+def test_add_triples_resolves_entities_once_and_groups_writes():
+    graph = make_graph("local")
+    graph.embedding_model.embed_batch.return_value = [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]]
+    graph.graph.query.side_effect = [
+        # existing node embeddings: only "alice" is already in the graph
+        [{"id": "n-alice", "embedding": [1.0, 0.0]}],
+        [
+            {"idx": 0, "source": "alice", "relationship": "likes", "target": "tea"},
+            {"idx": 2, "source": "alice", "relationship": "likes", "target": "coffee"},
+        ],
+        [{"idx": 1, "source": "tea", "relationship": "grown_in", "target": "coffee"}],
+    ]
+    triples = [
+        {"source": "alice", "relationship": "likes", "destination": "tea"},
+        {"source": "tea", "relationship": "grown_in", "destination": "coffee"},
+        {"source": "alice", "relationship": "likes", "destination": "coffee"},
+    ]
+
+    results = graph._add_triples(triples, "alice", {"alice": "person", "tea": "drink", "coffee": "drink"})
+
+    graph.embedding_model.embed_batch.assert_called_once_with(["alice", "tea", "coffee"])
+    assert graph.graph.query.call_count == 3
+    likes_call = graph.graph.query.call_args_list[1]
+    assert "UNWIND $rows" in likes_call.args[0] and "MERGE (destination:drink" in likes_call.args[0]
+    assert [row["source_id"] for row in likes_call.kwargs["params"]["rows"]] == ["n-alice", "n-alice"]
+    assert "MERGE (n:drink" in graph.graph.query.call_args_list[2].args[0]
+    assert [len(r) for r in results] == [1, 1, 1]
+    assert results[1][0]["relationship"] == "grown_in"
+
+
+def test_delete_relations_groups_by_relationship_type():
+    graph = make_graph("local")
+    graph.graph.query.side_effect = [
+        [{"idx": 0, "source": "alice", "target": "tea", "relationship": "likes"}],
+        [],
+    ]
+    to_be_deleted = [
+        {"source": "alice", "relationship": "likes", "destination": "tea"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        {"source": "bob", "relationship": "likes", "destination": "tea"},
+    ]
+
+    results = graph._delete_relations(to_be_deleted, "alice")
+
+    assert graph.graph.query.call_count == 2
+    first_query = graph.graph.query.call_args_list[0]
+    assert "-[r:likes]->" in first_query.args[0]
+    assert [row["idx"] for row in first_query.kwargs["params"]["rows"]] == [0, 2]
+    assert results == [[{"source": "alice", "target": "tea", "relationship": "likes"}], [], []]
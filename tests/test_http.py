@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.embeddings.openai import OpenAIEmbedding
+from mem0.utils.http import (
+    AsyncRetryTransport,
+    RetryTransport,
+    get_async_http_client,
+    get_http_client,
+    openai_client_kwargs,
+)
+
+
+def flaky_handler(statuses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1], headers={"Retry-After": "0"})
+
+    return handler, calls
+
+
+def test_retry_transport_retries_429_and_5xx_then_succeeds():
+    handler, calls = flaky_handler([429, 503, 200])
+    client = httpx.Client(transport=RetryTransport(httpx.MockTransport(handler), max_retries=3))
+
+    response = client.post("https://api.example.com/v1/embeddings", json={"input": "hi"})
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert calls[-1].content == b'{"input":"hi"}'
+
+
+def test_retry_transport_gives_up_after_max_retries():
+    handler, calls = flaky_handler([500])
+    client = httpx.Client(transport=RetryTransport(httpx.MockTransport(handler), max_retries=2))
+
+    assert client.get("https://api.example.com").status_code == 500
+    assert len(calls) == 3
+
+
+def test_retry_transport_does_not_retry_client_errors():
+    handler, calls = flaky_handler([400, 200])
+    client = httpx.Client(transport=RetryTransport(httpx.MockTransport(handler)))
+
+    assert client.get("https://api.example.com").status_code == 400
+    assert len(calls) == 1
+
+
+def test_retry_delay_uses_jitter_without_retry_after():
+    handler_calls = []
+
+    def handler(request):
+        handler_calls.append(request)
+        return httpx.Response(503 if len(handler_calls) == 1 else 200)
+
+    client = httpx.Client(transport=RetryTransport(httpx.MockTransport(handler), backoff_factor=0.5))
+    with patch("mem0.utils.http.time.sleep") as sleep, patch("mem0.utils.http.random.uniform", return_value=0.3) as uniform:
+        client.get("https://api.example.com")
+
+    uniform.assert_called_once_with(0, 0.5)
+    sleep.assert_called_once_with(0.3)
+
+
+def test_async_retry_transport():
+    handler, calls = flaky_handler([502, 200])
+
+    async def run():
+        async with httpx.AsyncClient(transport=AsyncRetryTransport(httpx.MockTransport(handler))) as client:
+            return await client.get("https://api.example.com")
+
+    assert asyncio.run(run()).status_code == 200
+    assert len(calls) == 2
+
+
+def test_clients_are_shared_per_settings():
+    embedder_config = BaseEmbedderConfig(http_max_connections=7)
+    llm_config = BaseLlmConfig(http_max_connections=7)
+
+    client = get_http_client(embedder_config)
+
+    assert get_http_client(llm_config) is client
+    assert get_http_client(BaseEmbedderConfig(http_max_connections=8)) is not client
+    assert get_http_client(embedder_config, retry=False) is not client
+    assert client.timeout.connect == embedder_config.http_connect_timeout
+
+
+def test_async_clients_are_kept_per_event_loop():
+    config = BaseEmbedderConfig()
+
+    async def get_twice():
+        return get_async_http_client(config), get_async_http_client(config)
+
+    first, again = asyncio.run(get_twice())
+    second, _ = asyncio.run(get_twice())
+
+    assert first is again
+    assert first is not second
+
+
+def test_openai_client_kwargs_prefers_proxy_client():
+    config = BaseLlmConfig(http_max_retries=5)
+    config.http_client = httpx.Client()
+
+    kwargs = openai_client_kwargs(config)
+
+    assert kwargs == {"http_client": config.http_client, "max_retries": 5}
+
+
+def test_openai_async_clients_follow_the_running_loop():
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="sk-test"))
+
+    async def clients():
+        return embedder.async_client, embedder.async_client
+
+    first, again = asyncio.run(clients())
+    second, _ = asyncio.run(clients())
+
+    assert first is again
+    assert first is not second
+
+
+def test_async_clients_route_through_the_configured_proxies():
+    config = BaseLlmConfig()
+    config.http_client_proxies = {"https://": "http://proxy.local:3128"}
+
+    async def clients():
+        return get_async_http_client(config), get_async_http_client(BaseLlmConfig())
+
+    proxied, direct = asyncio.run(clients())
+
+    assert proxied is not direct
+    assert [pattern.pattern for pattern in proxied._mounts] == ["https://"]
@@ -0,0 +1,147 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mem0.memory.lexical import LexicalIndex, reciprocal_rank_fusion, tokenize
+from mem0.memory.main import AsyncMemory, Memory
+from mem0.vector_stores.pgvector import PGVector
+from tests.conftest import hit, make_memory
+
+
+def make_hybrid_memory(memory_class, tmp_path, store=None, **hybrid_search):
+    store = store or Mock(supports_keyword_search=False, list_page=Mock(return_value=([], None)))
+    hybrid_search = {"enabled": True, "path": str(tmp_path / "lexical.db"), **hybrid_search}
+    return make_memory(memory_class, store=store, hybrid_search=hybrid_search)
+
+
+def test_tokenize_splits_cjk_runs_into_bigrams():
+    assert tokenize("我喜欢乌龙茶 and Green-Tea") == ["我喜", "喜欢", "欢乌", "乌龙", "龙茶", "and", "green", "tea"]
+    assert tokenize("乌龙茶", unigrams=True)[-3:] == ["乌", "龙", "茶"]
+
+
+def test_lexical_index_matches_terms_within_filters(tmp_path):
+    index = LexicalIndex(str(tmp_path / "lexical.db"), "mem0")
+    index.upsert(
+        ["a", "b", "c"],
+        [
+            {"data": "我最喜欢喝乌龙茶", "user_id": "alice"},
+            {"data": "Drinks coffee every morning", "user_id": "alice"},
+            {"data": "也喜欢乌龙茶", "user_id": "bob"},
+        ],
+    )
+
+    assert [h.id for h in index.search("乌龙", filters={"user_id": "alice"})] == ["a"]
+    assert {h.id for h in index.search("茶")} == {"a", "c"}
+
+    index.upsert(["a"], [{"data": "Switched to coffee", "user_id": "alice"}])
+    index.delete(["b"])
+    assert index.search("乌龙", filters={"user_id": "alice"}) == []
+    assert [h.id for h in index.search("coffee")] == ["a"]
+
+
+def test_new_index_is_filled_from_the_vector_store_and_can_be_rebuilt(tmp_path):
+    pages = {
+        None: ([hit("a", "Takes the K2 bus")], "next"),
+        "next": ([hit("b", "Rides a bike to work", user_id="bob")], None),
+    }
+    store = Mock(supports_keyword_search=False)
+    store.list_page.side_effect = lambda filters, limit, cursor: pages[cursor]
+    memory = make_hybrid_memory(Memory, tmp_path, store=store)
+
+    assert {h.id for h in memory.lexical_index.search("bus bike")} == {"a", "b"}
+    assert store.list_page.call_count == 2
+
+    # A restart finds the index filled and does not read the store again
+    reopened = LexicalIndex(memory.lexical_index.path, "mem0", memory.config.vector_store.identity())
+    assert not reopened.is_empty()
+
+    pages[None] = ([hit("c", "Walks the dog")], None)
+    assert memory.rebuild_lexical_index() == {"indexed": 1}
+    assert [h.id for h in memory.lexical_index.search("bus dog")] == ["c"]
+
+
+def test_index_tables_are_scoped_by_vector_store(tmp_path):
+    path = str(tmp_path / "lexical.db")
+    first = LexicalIndex(path, "mem0", "9e107d9d372bb6826bd81d3542a419d6")
+    second = LexicalIndex(path, "mem0", "e4d909c290d0fb1ca068ffaddf22cbd0")
+    first.upsert(["a"], [{"data": "Takes the K2 bus"}])
+
+    assert [h.id for h in first.search("bus")] == ["a"]
+    assert second.is_empty()
+
+
+def test_reciprocal_rank_fusion_is_weighted():
+    assert [i for i, _ in reciprocal_rank_fusion([["a", "b"], ["b", "c"]])] == ["b", "a", "c"]
+    fused = reciprocal_rank_fusion([["a", "b"], ["c"]], weights=[1.0, 3.0], k=1)
+    assert fused[0] == ("c", 1.5)
+
+
+def test_hybrid_search_fuses_keyword_hits_from_local_index(tmp_path):
+    memory = make_hybrid_memory(Memory, tmp_path)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+
+    memory._create_memory("Favourite tea is 大红袍", {}, [], {"user_id": "alice"})
+    memory_id = memory.vector_store.insert.call_args.kwargs["ids"][0]
+    memory.vector_store.search.return_value = [hit("other", "Likes hiking"), hit(memory_id, "Favourite tea is 大红袍")]
+
+    results = memory.search("大红袍", user_id="alice", limit=2)["results"]
+
+    memory.vector_store.search.assert_called_once_with(query=[0.1, 0.2], limit=4, filters={"user_id": "alice"})
+    assert [r["id"] for r in results] == [memory_id, "other"]
+    assert results[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+
+    memory.vector_store.get.return_value = hit(memory_id, "Favourite tea is 大红袍")
+    memory._delete_memory(memory_id)
+    assert memory.lexical_index.search("大红袍") == []
+
+
+def test_hybrid_search_prefers_native_keyword_search(tmp_path):
+    memory = make_hybrid_memory(Memory, tmp_path, enabled=False)
+    memory.vector_store.supports_keyword_search = True
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    memory.vector_store.search.return_value = [hit("v1", "Likes hiking")]
+    memory.vector_store.keyword_search.return_value = [hit("k1", "Takes the K2 bus")]
+
+    results = memory.search("K2", user_id="alice", hybrid=True, limit=5)["results"]
+
+    assert memory.lexical_index is None
+    memory.vector_store.keyword_search.assert_called_once_with(query="K2", limit=10, filters={"user_id": "alice"})
+    assert {r["id"] for r in results} == {"v1", "k1"}
+
+
+def test_auto_mode_keeps_cjk_terms_searchable_on_pgvector(tmp_path):
+    store = Mock(
+        supports_keyword_search=PGVector.supports_keyword_search,
+        keyword_search_segments_cjk=PGVector.keyword_search_segments_cjk,
+        list_page=Mock(return_value=([hit("a", "最喜欢喝乌龙茶"), hit("b", "Drinks coffee")], None)),
+    )
+    memory = make_hybrid_memory(Memory, tmp_path, store=store)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    store.search.return_value = []
+
+    results = memory.search("乌龙", user_id="alice", limit=2)["results"]
+
+    store.keyword_search.assert_not_called()
+    assert [r["id"] for r in results] == ["a"]
+    assert make_hybrid_memory(Memory, tmp_path, store=store, lexical_index="native").lexical_index is None
+
+
+def test_hybrid_search_without_index_or_native_support_raises(tmp_path):
+    memory = make_hybrid_memory(Memory, tmp_path, enabled=False)
+
+    with pytest.raises(ValueError, match="hybrid_search.enabled"):
+        memory.search("K2", user_id="alice", hybrid=True)
+
+
+def test_async_hybrid_search(tmp_path):
+    memory = make_hybrid_memory(AsyncMemory, tmp_path, lexical_index="local", lexical_weight=2.0)
+    memory.embedding_model.aembed = AsyncMock(return_value=[0.1, 0.2])
+    memory.vector_store.asearch = AsyncMock(return_value=[hit("v1", "Likes hiking")])
+    memory.vector_store.ainsert = AsyncMock()
+    memory.db = Mock()
+
+    asyncio.run(memory._create_memory("Takes the K2 bus", {}, [], {"user_id": "alice"}))
+    results = asyncio.run(memory.search("k2 bus", user_id="alice"))["results"]
+
+    assert [r["memory"] for r in results] == ["Takes the K2 bus", "Likes hiking"]
@@ -206,14 +206,19 @@ def test_delete(memory_instance):
 def test_delete_all(memory_instance, version, enable_graph):
     memory_instance.config.version = version
     memory_instance.enable_graph = enable_graph
-    mock_memories = [Mock(id="1"), Mock(id="2")]
-    memory_instance.vector_store.list = Mock(return_value=(mock_memories, None))
+    mock_memories = [Mock(id="1", payload={"data": "a"}), Mock(id="2", payload={"data": "b"})]
+    memory_instance.vector_store.list_page = Mock(return_value=(mock_memories, None))
+    memory_instance.vector_store.delete_by_filter = Mock()
+    memory_instance.db = Mock()
     memory_instance._delete_memory = Mock()
     memory_instance.graph.delete_all = Mock()
 
     result = memory_instance.delete_all(user_id="test_user")
 
-    assert memory_instance._delete_memory.call_count == 2
+    memory_instance._delete_memory.assert_not_called()
+    memory_instance.vector_store.delete_by_filter.assert_called_once_with({"user_id": "test_user"})
+    records = memory_instance.db.add_history_many.call_args.args[0]
+    assert [(r["memory_id"], r["old_memory"], r["event"]) for r in records] == [("1", "a", "DELETE"), ("2", "b", "DELETE")]
 
     if enable_graph:
         memory_instance.graph.delete_all.assert_called_once_with({"user_id": "test_user"})
@@ -223,6 +228,34 @@ def test_delete_all(memory_instance, version, enable_graph):
     assert result["message"] == "Memories deleted successfully!"
 
 
+def test_delete_all_snapshots_every_page_then_deletes_by_filter(memory_instance):
+    memory_instance.enable_graph = False
+    pages = {
+        None: ([Mock(id="0", payload={"data": "m0", "user_id": "alice"})], "next"),
+        "next": ([Mock(id="1", payload={"data": "m1", "user_id": "alice", "agent_id": "bot"})], None),
+    }
+    calls = Mock()
+    memory_instance.vector_store.list_page = Mock(side_effect=lambda filters, limit, cursor: pages[cursor])
+    memory_instance.vector_store.delete_by_filter = calls.delete_by_filter
+    memory_instance.db = Mock(add_history_many=calls.add_history_many)
+
+    memory_instance.delete_all(user_id="alice")
+
+    assert [call[0] for call in calls.mock_calls] == ["delete_by_filter", "add_history_many"]
+    calls.delete_by_filter.assert_called_once_with({"user_id": "alice"})
+    assert [record["memory_id"] for record in calls.add_history_many.call_args.args[0]] == ["0", "1"]
+
+
+def test_delete_all_writes_no_history_when_the_delete_fails(memory_instance):
+    memory_instance.vector_store.list_page = Mock(return_value=([Mock(id="0", payload={"data": "m0"})], None))
+    memory_instance.vector_store.delete_by_filter = Mock(side_effect=RuntimeError("store unavailable"))
+    memory_instance.db = Mock()
+
+    with pytest.raises(RuntimeError, match="store unavailable"):
+        memory_instance.delete_all(user_id="alice")
+    memory_instance.db.add_history_many.assert_not_called()
+
+
 def test_reset(memory_instance):
     memory_instance.vector_store.delete_col = Mock()
     # persisting vector store to make sure previous collection is deleted
@@ -235,7 +268,9 @@ def test_reset(memory_instance):
         initial_vector_store.delete_col.assert_called_once()
         memory_instance.db.reset.assert_called_once()
         mock_create.assert_called_once_with(
-            memory_instance.config.vector_store.provider, memory_instance.config.vector_store.config
+            memory_instance.config.vector_store.provider,
+            memory_instance.config.vector_store.config,
+            memory_instance.config.vector_store.tenancy,
         )
 
 
@@ -359,6 +394,24 @@ def test_create_categories(memory_instance):
     
     memory_instance.llm.generate_response.assert_called_once()
 
+
+def test_create_categories_survives_invalid_responses(memory_instance):
+    memory_instance.llm.generate_response = Mock(return_value="not json")
+
+    assert memory_instance._create_categories("not json", None) == {"memory": []}
+    result = memory_instance._create_categories(json.dumps({"memory": [{"text": "Memory 1", "event": "ADD"}]}), None)
+    assert result == {"memory": [{"text": "Memory 1", "event": "ADD"}]}
+
+
+def test_add_without_inference_keeps_messages_as_memories(memory_instance):
+    memory_instance._add_to_vector_store = Mock(return_value=[])
+    memory_instance._add_to_graph = Mock(return_value=[])
+
+    memory_instance.add("I like tea", user_id="alice", infer=False)
+
+    assert memory_instance._add_to_vector_store.call_args.args[3] is False
+
+
 def test_create_memory(memory_instance):
     test_data = "Test memory"
     test_embeddings = {"Test memory": [0.1, 0.2, 0.3]}
@@ -470,3 +523,49 @@ def test_add_with_vision_enabled(memory_instance):
         memory_instance.add(messages, user_id="test_user")
         
         mock_parse.assert_called_once_with(messages, memory_instance.llm, True)
+
+
+def test_list_page_falls_back_to_offsets():
+    from mem0.vector_stores.base import VectorStoreBase
+
+    class Store(VectorStoreBase):
+        create_col = insert = search = delete = update = get = list_cols = delete_col = col_info = None
+
+        def list(self, filters=None, limit=None):
+            return [list(range(5))[:limit]]
+
+    store = Store()
+    assert store.list_page(limit=2) == ([0, 1], "2")
+    assert store.list_page(limit=2, cursor="2") == ([2, 3], "4")
+    assert store.list_page(limit=2, cursor="4") == ([4], None)
+
+    store.list = lambda filters=None, limit=None: [[Mock(id=str(i)) for i in range(3)][:limit]]
+    store.delete_many = Mock()
+    store.delete_by_filter({"user_id": "alice"})
+    store.delete_many.assert_called_once_with(["0", "1", "2"])
+
+
+def test_get_all_returns_one_page_with_cursor(memory_instance):
+    memory_instance.enable_graph = False
+    memory = Mock(id="1", payload={"data": "Memory 1", "user_id": "alice"})
+    memory_instance.vector_store.list_page = Mock(return_value=([memory], "next"))
+
+    result = memory_instance.get_all(user_id="alice", page_size=1)
+
+    memory_instance.vector_store.list_page.assert_called_once_with(filters={"user_id": "alice"}, limit=1, cursor=None)
+    assert result["next_cursor"] == "next"
+    assert result["results"][0]["memory"] == "Memory 1"
+
+
+def test_iter_all_follows_cursors_lazily(memory_instance):
+    pages = {
+        None: ([Mock(id="1", payload={"data": "a"}), Mock(id="2", payload={"data": "b"})], "c1"),
+        "c1": ([Mock(id="3", payload={"data": "c"})], None),
+    }
+    memory_instance.vector_store.list_page = Mock(side_effect=lambda filters, limit, cursor: pages[cursor])
+
+    memories = memory_instance.iter_all(user_id="alice", page_size=2)
+    assert next(memories)["id"] == "1"
+    assert memory_instance.vector_store.list_page.call_count == 1
+    assert [m["memory"] for m in memories] == ["b", "c"]
+    assert memory_instance.vector_store.list_page.call_count == 2
@@ -0,0 +1,71 @@
+from mem0.memory.actions import MemoryActionBatch
+from mem0.memory.storage import SQLiteManager
+
+ACTIONS = [
+    {"id": "0", "text": "Likes green tea", "event": "UPDATE", "old_memory": "Likes tea"},
+    {"id": "1", "text": "Lives in Paris", "event": "DELETE"},
+    {"id": "2", "text": "Works at ACME", "event": "ADD", "categories": ["work"]},
+    {"id": "9", "text": "Hallucinated", "event": "DELETE"},
+    {"id": "3", "text": "", "event": "ADD"},
+]
+MAPPING = {"0": "mem-a", "1": "mem-b"}
+EXISTING = {
+    "mem-a": {"data": "Likes tea", "user_id": "alice", "created_at": "2024-01-01T00:00:00"},
+    "mem-b": {"data": "Lives in Paris", "user_id": "alice"},
+}
+
+
+def test_batch_groups_actions_and_skips_invalid_entries():
+    batch = MemoryActionBatch.from_actions(ACTIONS, MAPPING, EXISTING, {"user_id": "alice"})
+
+    assert batch.ids("UPDATE") == ["mem-a"]
+    assert batch.ids("DELETE") == ["mem-b"]
+    assert len(batch.ids("ADD")) == 1
+    update_payload = batch.payloads("UPDATE")[0]
+    assert update_payload["created_at"] == "2024-01-01T00:00:00"
+    assert update_payload["user_id"] == "alice"
+    assert batch.payloads("ADD")[0]["categories"] == ["work"]
+    assert batch.texts_to_embed({"Works at ACME": [0.1]}) == {"add": [], "update": ["Likes green tea"]}
+
+
+def test_apply_memory_actions_uses_one_bulk_call_per_event(memory):
+    batch = MemoryActionBatch.from_actions(ACTIONS, MAPPING, EXISTING, {"user_id": "alice"})
+    memory.embedding_model.embed_batch.return_value = [[0.2]]
+
+    results = memory._apply_memory_actions(batch, {"Works at ACME": [0.1]})
+
+    memory.embedding_model.embed_batch.assert_called_once_with(["Likes green tea"], "update")
+    memory.vector_store.insert_many.assert_called_once()
+    memory.vector_store.update_many.assert_called_once_with(
+        vector_ids=["mem-a"], vectors=[[0.2]], payloads=batch.payloads("UPDATE")
+    )
+    memory.vector_store.delete_many.assert_called_once_with(vector_ids=["mem-b"])
+    assert [r["event"] for r in results] == ["UPDATE", "DELETE", "ADD"]
+    assert results[0]["previous_memory"] == "Likes tea"
+    assert memory.db.get_history("mem-a")[0]["old_memory"] == "Likes tea"
+    assert memory.db.get_history("mem-b")[0]["event"] == "DELETE"
+
+
+def test_failed_group_is_not_reported(memory):
+    batch = MemoryActionBatch.from_actions(ACTIONS, MAPPING, EXISTING)
+    memory.embedding_model.embed_batch.return_value = [[0.2]]
+    memory.vector_store.delete_many.side_effect = RuntimeError("boom")
+
+    results = memory._apply_memory_actions(batch, {"Works at ACME": [0.1]})
+
+    assert [r["event"] for r in results] == ["UPDATE", "ADD"]
+    assert memory.db.get_history("mem-b") == []
+
+
+def test_add_history_many():
+    db = SQLiteManager(":memory:")
+    db.add_history_many(
+        [
+            {"memory_id": "m1", "new_memory": "a", "categories": ["x", "y"], "event": "ADD"},
+            {"memory_id": "m1", "old_memory": "a", "event": "DELETE", "is_deleted": 1},
+        ]
+    )
+
+    history = db.get_history("m1")
+    assert [h["event"] for h in history] == ["ADD", "DELETE"]
+    assert history[0]["categories"] == ["x", "y"]
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from mem0.memory.pool import MemoryPool, config_id
+
+
+def test_config_id_ignores_key_order():
+    assert config_id({"a": 1, "b": {"c": 2, "d": 3}}) == config_id({"b": {"d": 3, "c": 2}, "a": 1})
+    assert config_id({"a": 1}) != config_id({"a": 2})
+
+
+def test_instances_are_reused_and_least_recently_used_evicted():
+    factory = Mock(side_effect=lambda config: object())
+    pool = MemoryPool(factory, max_size=2)
+
+    first = pool.get({"llm": "a"})
+    second = pool.get({"llm": "b"})
+    assert pool.get({"llm": "a"}) is first
+    third = pool.get({"llm": "c"})
+
+    assert factory.call_count == 3
+    assert pool.instances() == [first, third]
+    assert second not in pool.instances()
+    assert pool.stats() == {"size": 2, "hits": 1, "misses": 3, "evictions": 1}
+
+
+def test_factory_gets_a_copy_of_the_config():
+    config = {"vector_store": {"config": {}}}
+    pool = MemoryPool(lambda config: config["vector_store"]["config"].setdefault("path", "/tmp/x"))
+
+    pool.get(config)
+
+    assert config == {"vector_store": {"config": {}}}
+    assert pool.get(config) == "/tmp/x"
+
+
+def test_concurrent_requests_share_one_build():
+    def slow_factory(config):
+        time.sleep(0.05)
+        return object()
+
+    factory = Mock(side_effect=slow_factory)
+    pool = MemoryPool(factory)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.get({"llm": "a"}))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.call_count == 1
+    assert len({id(result) for result in results}) == 1
+
+
+def test_aget_builds_in_a_thread_and_returns_pooled_instances():
+    pool = MemoryPool(lambda config: threading.current_thread())
+
+    async def run():
+        built = await pool.aget({"llm": "a"})
+        return built, await pool.aget({"llm": "a"})
+
+    built, again = asyncio.run(run())
+    assert built is not threading.main_thread()
+    assert again is built
+
+
+def test_evicted_instances_are_closed_once_their_leases_are_released():
+    close = Mock()
+    pool = MemoryPool(lambda config: Mock(name=config["llm"]), max_size=1, close=close)
+
+    idle = pool.get({"llm": "a"})
+    leased = pool.acquire({"llm": "b"})
+    close.assert_called_once_with(idle)
+
+    pool.get({"llm": "c"})
+    assert close.call_count == 1
+    pool.release(leased)
+    close.assert_called_with(leased)
+    assert close.call_count == 2
+
+
+def test_async_leases_await_a_coroutine_close():
+    closed = []
+
+    async def close(instance):
+        closed.append(instance)
+
+    pool = MemoryPool(lambda config: object(), max_size=1, close=close)
+
+    async def run():
+        first = await pool.aacquire({"llm": "a"})
+        await pool.aget({"llm": "b"})
+        assert closed == []
+        await pool.arelease(first)
+        return first
+
+    assert closed == [asyncio.run(run())]
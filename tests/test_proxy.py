@@ -1,10 +1,11 @@
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
 from mem0 import Memory, MemoryClient
 from mem0.configs.prompts import MEMORY_ANSWER_PROMPT
-from mem0.proxy.main import Chat, Completions, Mem0
+from mem0.proxy.main import ADD_ENQUEUE_TIMEOUT, Chat, Completions, Mem0
 
 
 @pytest.fixture
@@ -98,4 +99,26 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
 
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
-    assert call_args["messages"][0]["content"] == "You are a helpful assistant."
\ No newline at end of file
+    assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+def test_add_is_dropped_when_the_deferred_queue_stays_full(mock_litellm):
+    memory = Mock(spec=Memory)
+    memory.add.side_effect = TimeoutError("Deferred add queue is full (1000 pending jobs)")
+    completions = Completions(memory)
+
+    completions._async_add_to_memory([{"role": "user", "content": "hi"}], "alice", None, None, None, None)
+
+    assert memory.add.call_args.kwargs["mode"] == "deferred"
+    assert memory.add.call_args.kwargs["enqueue_timeout"] == ADD_ENQUEUE_TIMEOUT
+
+
+def test_remote_add_is_dropped_when_too_many_are_waiting(mock_memory_client):
+    completions = Completions(mock_memory_client)
+
+    with patch("mem0.proxy.main._remote_add_slots", threading.BoundedSemaphore(1)) as slots, patch(
+        "mem0.proxy.main.ADD_ENQUEUE_TIMEOUT", 0.01
+    ):
+        slots.acquire()
+        completions._async_add_to_memory([{"role": "user", "content": "hi"}], "alice", None, None, None, None)
+
+    mock_memory_client.add.assert_not_called()
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+from mem0.memory.main import AsyncMemory, Memory
+from mem0.memory.search_cache import SearchCache
+from tests.conftest import hit, make_memory
+
+
+def make_cached_memory(memory_class, **search_cache):
+    return make_memory(memory_class, search_cache={"enabled": True, **search_cache})
+
+
+def test_cache_is_lru_and_counts_hits():
+    cache = SearchCache(max_entries=2)
+    keys = [cache.key(f"query {i}", {"user_id": "alice"}, 10) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, [i])
+    cache.get(keys[1])
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == [2]
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "invalidations": 0,
+        "hit_rate": 2 / 3,
+        "size": 2,
+        "max_entries": 2,
+    }
+
+
+def test_writes_only_invalidate_their_scope():
+    cache = SearchCache()
+    alice = cache.key("tea", {"user_id": "alice"}, 10)
+    bob = cache.key("tea", {"user_id": "bob", "agent_id": "helper"}, 10)
+
+    cache.invalidate([{"data": "Likes coffee", "user_id": "alice"}])
+
+    assert cache.key("  tea ", {"user_id": "alice"}, 10) != alice
+    assert cache.key("tea", {"agent_id": "helper", "user_id": "bob"}, 10) == bob
+
+
+def test_scope_generations_are_bounded_and_evicted_scopes_stay_invalidated():
+    cache = SearchCache(max_scopes=2)
+    stale = cache.key("tea", {"user_id": "alice"}, 10)
+    cache.put(stale, ["Likes tea"])
+    cache.invalidate([{"user_id": "alice"}])
+
+    for user in ("bob", "carol", "dave"):
+        cache.invalidate([{"user_id": user}])
+
+    assert len(cache._generations) == 2
+    assert cache.get(cache.key("tea", {"user_id": "alice"}, 10)) is None
+    # The ids still tracked keep their cached searches
+    dave = cache.key("tea", {"user_id": "dave"}, 10)
+    cache.invalidate([{"user_id": "erin"}])
+    assert cache.key("tea", {"user_id": "dave"}, 10) == dave
+
+
+def test_repeated_search_skips_embedding_and_vector_store():
+    memory = make_cached_memory(Memory)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    memory.vector_store.search.return_value = [hit("m1", "Likes tea")]
+
+    first = memory.search("what do I drink?", user_id="alice")
+    first["results"][0]["memory"] = "changed by the caller"
+    second = memory.search("what do  I drink?", user_id="alice")
+
+    assert memory.embedding_model.embed.call_count == 1
+    assert memory.vector_store.search.call_count == 1
+    assert second["results"][0]["memory"] == "Likes tea"
+    assert memory.search_cache_stats()["hits"] == 1
+
+
+def test_writes_invalidate_cached_searches():
+    memory = make_cached_memory(Memory)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    memory.vector_store.search.return_value = [hit("m1", "Likes tea")]
+    memory.vector_store.get.return_value = hit("m1", "Likes tea")
+
+    memory.search("drinks", user_id="alice")
+    memory._create_memory("Likes coffee", {}, [], {"user_id": "bob"})
+    memory.search("drinks", user_id="alice")
+    assert memory.vector_store.search.call_count == 1
+
+    for write in (
+        lambda: memory._create_memory("Likes coffee", {}, [], {"user_id": "alice"}),
+        lambda: memory._update_memory("m1", "Likes green tea", {}),
+        lambda: memory._delete_memory("m1"),
+        lambda: memory.delete_all(user_id="alice"),
+    ):
+        memory.vector_store.list_page.return_value = ([], None)
+        calls = memory.vector_store.search.call_count
+        write()
+        memory.search("drinks", user_id="alice")
+        assert memory.vector_store.search.call_count == calls + 1
+
+    with patch("mem0.memory.main.VectorStoreFactory") as mock_vector_store:
+        mock_vector_store.create.return_value = memory.vector_store
+        memory.reset()
+    memory.search("drinks", user_id="alice")
+    assert memory.vector_store.search.call_count == 6
+
+
+def test_delete_all_invalidates_every_scope_of_the_deleted_memories():
+    memory = make_cached_memory(Memory)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    memory.vector_store.search.return_value = [hit("m1", "alice likes tea")]
+    memory.vector_store.list_page.return_value = (
+        [Mock(id="m1", payload={"data": "alice likes tea", "user_id": "alice", "agent_id": "bot"})],
+        None,
+    )
+
+    memory.search("tea", agent_id="bot")
+    memory.delete_all(user_id="alice")
+    memory.vector_store.search.return_value = []
+
+    assert memory.search("tea", agent_id="bot")["results"] == []
+
+
+def test_memory_actions_invalidate_after_write():
+    memory = make_cached_memory(Memory)
+    memory.embedding_model.embed.return_value = [0.1, 0.2]
+    memory.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.1, 0.2] for _ in texts]
+    memory.vector_store.search.return_value = [hit("m1", "Likes tea")]
+    memory.vector_store.search_batch.return_value = [[hit("m1", "Likes tea")]]
+    memory.search("drinks", user_id="alice")
+
+    memory.llm.generate_response.side_effect = [
+        json.dumps({"facts": ["Dislikes tea now"]}),
+        json.dumps({"memory": [{"id": "0", "text": "Likes tea", "event": "DELETE"}]}),
+    ]
+    memory.add("I don't like tea anymore", user_id="alice")
+    memory.search("drinks", user_id="alice")
+
+    memory.vector_store.delete_many.assert_called_once_with(vector_ids=["m1"])
+    assert memory.vector_store.search.call_count == 2
+
+
+def test_async_search_uses_cache():
+    memory = make_cached_memory(AsyncMemory, max_entries=8)
+    memory.embedding_model.aembed = AsyncMock(return_value=[0.1, 0.2])
+    memory.vector_store.asearch = AsyncMock(return_value=[hit("m1", "Likes tea")])
+
+    async def run():
+        await memory.search("drinks", user_id="alice")
+        return await memory.search("drinks", user_id="alice")
+
+    assert asyncio.run(run())["results"][0]["memory"] == "Likes tea"
+    memory.vector_store.asearch.assert_awaited_once()
@@ -0,0 +1,35 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from server import main as server
+
+
+@pytest.fixture
+def configs(tmp_path):
+    store = server.ConfigStore(str(tmp_path / "state"), {"version": "v1.1"})
+    with patch.object(server, "CONFIGS", store):
+        yield store
+
+
+def test_config_header_must_be_a_config_id(configs, tmp_path):
+    # A readable JSON file outside the configs directory
+    (tmp_path / "outside.json").write_text(json.dumps({"version": "v1.1"}))
+    (tmp_path / "state" / "configs" / "folder.json").mkdir(parents=True)
+
+    with patch.object(server.POOL, "aacquire", AsyncMock()) as acquire:
+        client = TestClient(server.app)
+        for header in ["../../outside", "folder"]:
+            response = client.get("/api/memories", params={"user_id": "alice"}, headers={"X-Mem0-Config": header})
+            assert response.status_code == 404
+        acquire.assert_not_called()
+    assert configs.load("../../outside") is None
+
+
+def test_saved_configs_load_by_id(configs):
+    cid = configs.save({"version": "v1.1", "llm": {"provider": "openai"}})
+    configs._configs.clear()
+
+    assert configs.load(cid) == {"version": "v1.1", "llm": {"provider": "openai"}}
@@ -32,3 +32,56 @@ def test_telemetry_disabled():
 
 def test_telemetry_default_enabled():
     assert use_telemetry() is True
+
+
+def make_telemetry(**kwargs):
+    from mem0.memory.telemetry import AnonymousTelemetry
+
+    return AnonymousTelemetry(project_api_key="key", host="https://posthog.invalid", **kwargs)
+
+
+def test_disabled_telemetry_starts_nothing():
+    with patch("posthog.Posthog") as posthog_class:
+        telemetry = make_telemetry(enabled=False)
+        telemetry.capture_event("mem0.add", {"version": "v1.1"})
+
+    assert telemetry._thread is None
+    assert telemetry.user_id is None
+    assert len(telemetry._queue) == 0
+    posthog_class.assert_not_called()
+
+
+def test_events_are_flushed_in_the_background_with_static_properties():
+    with patch("posthog.Posthog") as posthog_class:
+        telemetry = make_telemetry(enabled=True, flush_interval=60)
+        telemetry.capture_event("mem0.add", {"version": "v1.1"})
+        telemetry.capture_event("client.search", {}, user_email="a@example.com")
+        posthog_class.return_value.capture.assert_not_called()
+
+        telemetry.close()
+
+    calls = posthog_class.return_value.capture.call_args_list
+    assert [call.kwargs["event"] for call in calls] == ["mem0.add", "client.search"]
+    assert calls[0].kwargs["properties"]["version"] == "v1.1"
+    assert calls[0].kwargs["properties"]["client_source"] == "python"
+    assert calls[1].kwargs["distinct_id"] == "a@example.com"
+    posthog_class.return_value.shutdown.assert_called_once()
+
+
+def test_full_queue_drops_oldest_events():
+    with patch("posthog.Posthog"):
+        telemetry = make_telemetry(enabled=True, max_queue_size=2, flush_interval=60)
+        for i in range(5):
+            telemetry.capture_event(f"event.{i}")
+
+        assert [event[1] for event in telemetry._queue] == ["event.3", "event.4"]
+        assert telemetry.dropped == 3
+        telemetry.close()
+
+
+def test_internal_events_are_sampled():
+    with patch("posthog.Posthog"):
+        telemetry = make_telemetry(enabled=True, sample_rate=0.0, flush_interval=60)
+        assert telemetry.sampled("mem0.add")
+        assert not telemetry.sampled("mem0._create_memory")
+        telemetry.close()
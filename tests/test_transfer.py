@@ -0,0 +1,119 @@
+import asyncio
+import io
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mem0.memory.main import AsyncMemory, Memory
+from mem0.memory.transfer import aiter_lines
+from tests.conftest import make_memory
+
+
+def make_local_memory(memory_class, path, dims=4, model="text-embedding-3-small"):
+    return make_memory(
+        memory_class,
+        embedder=Mock(config=Mock(model=model)),
+        vector_store={"provider": "local", "config": {"path": str(path / "store"), "embedding_model_dims": dims}},
+        history_db_path=str(path / "history.db"),
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    memory = make_local_memory(Memory, tmp_path / "source")
+    memory.vector_store.insert(
+        vectors=[[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]],
+        payloads=[
+            {"data": "Likes tea", "user_id": "alice", "hash": "h1"},
+            {"data": "Has a dog", "user_id": "alice", "category": "pets"},
+            {"data": "Likes coffee", "user_id": "bob"},
+        ],
+        ids=["a", "b", "c"],
+    )
+    memory.db.add_history("a", None, "Likes coffee", ["food"], "ADD", "2026-01-01", "2026-01-01")
+    memory.db.add_history("a", "Likes coffee", "Likes tea", ["food"], "UPDATE", "2026-01-01", "2026-02-01")
+    return memory
+
+
+def export_text(memory, **kwargs):
+    stream = io.StringIO()
+    result = memory.export(stream=stream, **kwargs)
+    return result, stream.getvalue()
+
+
+def test_export_writes_a_header_then_one_line_per_memory(source):
+    result, text = export_text(source, filters={"user_id": "alice"}, page_size=1)
+
+    header, *records = [json.loads(line) for line in text.splitlines()]
+    assert result == {"memories": 2}
+    assert (header["type"], header["dims"], header["filters"]) == ("header", 4, {"user_id": "alice"})
+    assert [record["id"] for record in records] == ["a", "b"]
+    assert records[0]["vector"] == [1.0, 0.0, 0.0, 0.0]
+    assert records[1]["payload"] == {"data": "Has a dog", "user_id": "alice", "category": "pets"}
+    assert [row["event"] for row in records[0]["history"]] == ["ADD", "UPDATE"]
+    assert records[1]["history"] == []
+    # Without a stream the lines are returned lazily
+    assert [json.loads(line)["id"] for line in list(source.export(filters={"user_id": "bob"}))[1:]] == ["c"]
+
+
+def test_import_restores_memories_vectors_and_history_without_embedding(source, tmp_path):
+    _, text = export_text(source)
+    target = make_local_memory(Memory, tmp_path / "target")
+
+    assert target.import_(io.StringIO(text), batch_size=2) == {"imported": 3, "reembedded": 0}
+    # Importing again overwrites instead of duplicating
+    target.import_(io.StringIO(text))
+
+    target.embedding_model.embed_batch.assert_not_called()
+    assert target.vector_store.col_info()["count"] == 3
+    assert target.get("b")["metadata"] == {"category": "pets"}
+    assert target.vector_store.get_vectors(["c"]) == {"c": [0.0, 0.0, 1.0, 0.0]}
+    assert target.history("a") == source.history("a")
+
+
+def test_import_embeds_memories_whose_vectors_do_not_fit(source, tmp_path):
+    _, text = export_text(source)
+    target = make_local_memory(Memory, tmp_path / "target", dims=3)
+    target.embedding_model.embed_batch.side_effect = lambda texts, action: [[1.0, 0.0, 0.0] for _ in texts]
+
+    assert target.import_(text.splitlines()) == {"imported": 3, "reembedded": 3}
+    target.embedding_model.embed_batch.assert_called_once_with(["Likes tea", "Has a dog", "Likes coffee"], "add")
+
+
+def test_import_embeds_memories_exported_with_another_embedder(source, tmp_path):
+    _, text = export_text(source)
+    target = make_local_memory(Memory, tmp_path / "target", model="text-embedding-3-large")
+    target.embedding_model.embed_batch.side_effect = lambda texts, action: [[0.5, 0.5, 0.5, 0.5] for _ in texts]
+
+    assert json.loads(text.splitlines()[0])["embedder"] ["model"] == "text-embedding-3-small"
+    assert target.import_(text.splitlines()) == {"imported": 3, "reembedded": 3}
+    assert target.vector_store.get_vectors(["a"]) == {"a": [0.5, 0.5, 0.5, 0.5]}
+    # Without a header the embedder of the vectors is unknown
+    assert target.import_(text.splitlines()[1:]) == {"imported": 3, "reembedded": 3}
+
+
+def test_import_rejects_lines_that_are_not_memories(tmp_path):
+    target = make_local_memory(Memory, tmp_path / "target")
+
+    with pytest.raises(ValueError, match="Line 2"):
+        target.import_(['{"type": "header", "format": "mem0", "version": 1}', '{"id": "a"}'])
+
+
+def test_async_export_and_import_of_a_chunked_stream(source, tmp_path):
+    target = make_local_memory(AsyncMemory, tmp_path / "target")
+    target.embedding_model.aembed_batch = AsyncMock()
+
+    async def chunks(text, size=7):
+        for start in range(0, len(text), size):
+            yield text[start : start + size].encode()
+
+    async def run():
+        exporter = make_local_memory(AsyncMemory, tmp_path / "source")
+        lines = await exporter.export(filters={"user_id": "alice"})
+        text = "".join([line async for line in lines])
+        return await target.import_(aiter_lines(chunks(text)))
+
+    assert asyncio.run(run()) == {"imported": 2, "reembedded": 0}
+    target.embedding_model.aembed_batch.assert_not_called()
+    assert [row["event"] for row in target.db.get_history("a")] == ["ADD", "UPDATE"]
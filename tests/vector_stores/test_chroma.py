@@ -99,3 +99,15 @@ def test_list_vectors(chromadb_instance):
     assert len(results[0]) == 2
     assert results[0][0].id == "id1"
     assert results[0][1].id == "id2"
+
+
+def test_list_page_uses_chroma_offsets(chromadb_instance):
+    chromadb_instance.collection.get.return_value = {
+        "ids": ["id3", "id4", "id5"],
+        "metadatas": [{"user_id": "alice"}] * 3,
+    }
+
+    page, cursor = chromadb_instance.list_page(filters={"user_id": "alice"}, limit=2, cursor="2")
+
+    chromadb_instance.collection.get.assert_called_once_with(where={"user_id": "alice"}, limit=3, offset=2)
+    assert ([record.id for record in page], cursor) == (["id3", "id4"], "4")
@@ -220,6 +220,29 @@ class TestElasticsearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_keyword_search(self):
+        self.client_mock.search.return_value = {
+            "hits": {"hits": [{"_id": "id1", "_score": 3.2, "_source": {"metadata": {"data": "喜欢乌龙茶"}}}]}
+        }
+
+        results = self.es_db.keyword_search(query="乌龙茶", limit=4, filters={"user_id": "alice"})
+
+        body = self.client_mock.search.call_args[1]["body"]
+        self.assertEqual(body["size"], 4)
+        self.assertEqual(body["query"]["bool"]["must"], [{"match": {"metadata.data": "乌龙茶"}}])
+        self.assertEqual(body["query"]["bool"]["filter"], [{"term": {"metadata.user_id": "alice"}}])
+        self.assertEqual(results[0].id, "id1")
+        self.assertEqual(results[0].score, 3.2)
+
+    def test_delete_by_filter(self):
+        self.es_db.delete_by_filter({"user_id": "alice"})
+
+        self.client_mock.delete_by_query.assert_called_once_with(
+            index="test_collection",
+            body={"query": {"bool": {"filter": [{"term": {"metadata.user_id": "alice"}}]}}},
+            refresh=True,
+        )
+
     def test_get(self):
         # Mock get response with correct structure
         mock_response = {
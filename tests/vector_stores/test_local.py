@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from mem0.utils.factory import VectorStoreFactory
+from mem0.vector_stores.configs import VectorStoreConfig
+from mem0.vector_stores.local import LocalVectorStore
+
+
+def make_store(path, **kwargs):
+    return LocalVectorStore(collection_name="memories", embedding_model_dims=4, path=str(path), **kwargs)
+
+
+def seed(store):
+    store.insert(
+        vectors=[[1, 0, 0, 0], [0, 1, 0, 0], [0.9, 0.1, 0, 0], [0, 0, 1, 0]],
+        payloads=[
+            {"data": "a", "user_id": "alice", "topic": "tea"},
+            {"data": "b", "user_id": "alice", "topic": "code"},
+            {"data": "c", "user_id": "bob", "topic": "tea"},
+            {"data": "d", "user_id": "bob", "topic": "code", "pinned": True},
+        ],
+        ids=["a", "b", "c", "d"],
+    )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+def test_search_ranks_by_cosine_similarity(tmp_path, dtype):
+    store = make_store(tmp_path, dtype=dtype)
+    seed(store)
+
+    hits = store.search(query=[1, 0, 0, 0], limit=2)
+    assert [hit.id for hit in hits] == ["a", "c"]
+    assert hits[0].score == pytest.approx(1.0, abs=1e-2)
+
+    hits = store.search(query=[1, 0, 0, 0], limit=5, filters={"user_id": "bob"})
+    assert [hit.id for hit in hits] == ["c", "d"]
+    assert hits[0].payload == {"data": "c", "user_id": "bob", "topic": "tea"}
+
+
+def test_filters_on_indexed_and_unindexed_fields(tmp_path):
+    store = make_store(tmp_path)
+    seed(store)
+
+    assert [hit.id for hit in store.search([1, 0, 0, 0], filters={"user_id": "bob", "topic": "tea"})] == ["c"]
+    assert [record.id for record in store.list(filters={"pinned": True})[0]] == ["d"]
+    assert store.list(filters={"pinned": "true"})[0] == []
+
+
+def test_search_batch_matches_single_searches(tmp_path):
+    store = make_store(tmp_path)
+    seed(store)
+    queries = [[1, 0, 0, 0], [0, 0, 1, 0]]
+
+    batch = store.search_batch(queries, limit=2, filters={"user_id": "bob"})
+
+    assert [[hit.id for hit in hits] for hits in batch] == [
+        [hit.id for hit in store.search(query, limit=2, filters={"user_id": "bob"})] for query in queries
+    ]
+
+
+def test_update_delete_and_slot_reuse(tmp_path):
+    store = make_store(tmp_path)
+    seed(store)
+
+    store.update("b", vector=[0, 0, 0, 1], payload={"data": "b2", "user_id": "carol"})
+    assert store.get("b").payload == {"data": "b2", "user_id": "carol"}
+    assert [hit.id for hit in store.search([0, 0, 0, 1], limit=1)] == ["b"]
+    assert store.list(filters={"user_id": "alice"})[0][0].id == "a"
+
+    store.delete("a")
+    store.delete_by_filter({"user_id": "bob"})
+    assert store.get("a") is None
+    assert [record.id for record in store.list()[0]] == ["b"]
+
+    store.insert(vectors=[[1, 1, 0, 0]], payloads=[{"data": "e"}], ids=["e"])
+    assert store.col_info()["count"] == 2
+    assert store._size == 4
+
+
+def test_vectors_and_payloads_persist_and_grow(tmp_path):
+    store = make_store(tmp_path, initial_capacity=2)
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 4)).tolist()
+    payloads = [{"data": str(i), "user_id": "alice"} for i in range(50)]
+    store.insert(vectors=vectors, payloads=payloads, ids=[str(i) for i in range(50)])
+    store.close()
+
+    reopened = make_store(tmp_path, initial_capacity=2)
+    assert reopened.col_info()["capacity"] >= 50
+    assert [hit.id for hit in reopened.search(vectors[17], limit=1)] == ["17"]
+    assert reopened.list_cols() == ["memories"]
+
+    with pytest.raises(ValueError):
+        LocalVectorStore(collection_name="memories", embedding_model_dims=8, path=str(tmp_path))
+
+
+def test_list_page_and_payload_index_backfill(tmp_path):
+    store = make_store(tmp_path)
+    seed(store)
+
+    page, cursor = store.list_page(limit=3)
+    rest, end = store.list_page(limit=3, cursor=cursor)
+    assert [record.id for record in page + rest] == ["a", "b", "c", "d"]
+    assert end is None
+
+    store.create_payload_indexes(["topic"])
+    assert "topic" in store.col_info()["indexed_fields"]
+    assert [record.id for record in store.list(filters={"topic": "tea"})[0]] == ["a", "c"]
+
+
+def test_factory_builds_local_store(tmp_path):
+    config = VectorStoreConfig(provider="local", config={"path": str(tmp_path), "embedding_model_dims": 4})
+    store = VectorStoreFactory.create(config.provider, config.config)
+
+    assert isinstance(store, LocalVectorStore)
+    store.delete_col()
+    assert store.list_cols() == []
@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.configs.vector_stores.milvus import MetricType
+from mem0.vector_stores.milvus import MilvusDB
+
+
+@pytest.fixture
+def milvus():
+    with patch("mem0.vector_stores.milvus.MilvusClient") as mock_client:
+        mock_client.return_value = MagicMock()
+        mock_client.return_value.has_collection.return_value = True
+        yield MilvusDB(
+            url="http://localhost:19530",
+            token=None,
+            collection_name="mem0",
+            embedding_model_dims=4,
+            metric_type=MetricType.COSINE,
+        )
+
+
+def test_list_page_resumes_after_the_last_primary_key(milvus):
+    milvus.client.query.return_value = [{"id": f"id{i}", "metadata": {"user_id": "alice"}} for i in range(3)]
+
+    page, cursor = milvus.list_page(filters={"user_id": "alice"}, limit=2)
+    assert ([record.id for record in page], cursor) == (["id0", "id1"], "id1")
+    assert milvus.client.query.call_args.kwargs["filter"] == '(metadata["user_id"] == "alice")'
+    assert milvus.client.query.call_args.kwargs["limit"] == 3
+
+    milvus.client.query.return_value = [{"id": "id2", "metadata": {"user_id": "alice"}}]
+    page, cursor = milvus.list_page(filters={"user_id": "alice"}, limit=2, cursor=cursor)
+    assert ([record.id for record in page], cursor) == (["id2"], None)
+    assert milvus.client.query.call_args.kwargs["filter"] == '(metadata["user_id"] == "alice") and (id > "id1")'
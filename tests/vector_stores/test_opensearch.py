@@ -141,6 +141,22 @@ class TestOpenSearchDB(unittest.TestCase):
         self.assertEqual(results[0].score, 0.8)
         self.assertEqual(results[0].payload, {"key1": "value1"})
 
+    def test_list_page_scrolls_until_a_short_page(self):
+        hit = lambda i: {"_id": f"id{i}", "_source": {"metadata": {"user_id": "alice"}}}  # noqa: E731
+        self.client_mock.search.return_value = {"_scroll_id": "s1", "hits": {"hits": [hit(0), hit(1)]}}
+        self.client_mock.scroll = MagicMock(return_value={"_scroll_id": "s2", "hits": {"hits": [hit(2)]}})
+        self.client_mock.clear_scroll = MagicMock()
+
+        page, cursor = self.os_db.list_page(filters={"user_id": "alice"}, limit=2)
+        self.assertEqual(([r.id for r in page], cursor), (["id0", "id1"], "s1"))
+        body = self.client_mock.search.call_args.kwargs["body"]
+        self.assertEqual(body["query"]["bool"]["must"], [{"term": {"metadata.user_id": "alice"}}])
+
+        page, cursor = self.os_db.list_page(filters={"user_id": "alice"}, limit=2, cursor=cursor)
+        self.assertEqual(([r.id for r in page], cursor), (["id2"], None))
+        self.client_mock.scroll.assert_called_once_with(scroll_id="s1", scroll=OpenSearchDB.SCROLL_KEEP_ALIVE)
+        self.client_mock.clear_scroll.assert_called_once_with(scroll_id="s2")
+
     def test_delete(self):
         self.os_db.delete(vector_id="id1")
         self.client_mock.delete.assert_called_once_with(index="test_collection", id="id1")
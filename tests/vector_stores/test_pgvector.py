@@ -0,0 +1,195 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.vector_stores.pgvector import PGVector
+
+
+def make_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.prepared = set()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.connection = conn
+    cursor.fetchall.return_value = []
+    return conn
+
+
+@pytest.fixture
+def pool():
+    with patch("mem0.vector_stores.pgvector.psycopg2.pool.ThreadedConnectionPool") as pool_class:
+        pool = pool_class.return_value
+        pool.closed = False
+        connections = [make_connection() for _ in range(2)]
+        free = list(connections)
+        lock = threading.Lock()
+
+        def getconn():
+            with lock:
+                return free.pop()
+
+        def putconn(conn, close=False):
+            with lock:
+                free.append(conn)
+
+        pool.getconn.side_effect = getconn
+        pool.putconn.side_effect = putconn
+        pool.connections = connections
+        yield pool
+
+
+def make_store(**kwargs):
+    return PGVector(
+        dbname="db",
+        collection_name="memories",
+        embedding_model_dims=3,
+        user="u",
+        password="p",
+        host="localhost",
+        port=5432,
+        diskann=False,
+        hnsw=False,
+        **kwargs,
+    )
+
+
+def cursor_of(conn):
+    return conn.cursor.return_value.__enter__.return_value
+
+
+def test_each_operation_checks_out_and_returns_a_connection(pool):
+    store = make_store()
+    pool.getconn.reset_mock()
+    pool.putconn.reset_mock()
+
+    store.delete("id-1")
+
+    assert pool.getconn.call_count == 1
+    conn = pool.putconn.call_args.args[0]
+    conn.commit.assert_called()
+
+
+def test_failed_operation_rolls_back(pool):
+    store = make_store()
+    for conn in pool.connections:
+        cursor_of(conn).execute.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        store.delete("id-1")
+
+    assert any(conn.rollback.called for conn in pool.connections)
+    assert pool.getconn.call_count == pool.putconn.call_count
+
+
+def test_search_prepares_statement_once_per_connection(pool):
+    store = make_store(maxconn=1)
+    for conn in pool.connections:
+        cursor_of(conn).fetchall.return_value = [("a1b2", 0.25, {"data": "tea"})]
+
+    store.search([0.1, 0.2, 0.3], limit=2, filters={"user_id": "alice"})
+    results = store.search([0.1, 0.2, 0.3], limit=2, filters={"user_id": "bob"})
+    store.search([0.1, 0.2, 0.3], limit=2, filters={"agent_id": "bot"})
+
+    calls = [call.args for conn in pool.connections for call in cursor_of(conn).execute.call_args_list]
+    prepares = [args[0] for args in calls if "PREPARE mem0_search_" in args[0]]
+    executes = [args for args in calls if args[0].startswith("EXECUTE mem0_search_")]
+    # Keys are literals, so a generic plan can still use the payload->>'user_id' expression index
+    assert len(prepares) == 2
+    assert "payload->>'user_id' = $2" in prepares[0] and "LIMIT $3" in prepares[0]
+    assert "payload->>'agent_id' = $2" in prepares[1]
+    assert [args[1][1:] for args in executes] == [("alice", 2), ("bob", 2), ("bot", 2)]
+    assert executes[0][0].split()[1] == executes[1][0].split()[1] != executes[2][0].split()[1]
+    assert results[0].id == "a1b2" and results[0].score == 0.25
+
+
+def test_keyword_search_matches_any_term_with_filters(pool):
+    store = make_store()
+    for conn in pool.connections:
+        cursor_of(conn).fetchall.return_value = [("a1b2", 0.5, {"data": "green tea"})]
+
+    results = store.keyword_search("green tea", limit=3, filters={"user_id": "alice"})
+
+    conn = pool.putconn.call_args.args[0]
+    sql, params = cursor_of(conn).execute.call_args.args
+    assert "' & ', ' | '" in sql and "@@ terms AND payload->>%s = %s" in sql
+    assert params == ("green tea", "user_id", "alice", 3)
+    assert results[0].id == "a1b2" and results[0].score == 0.5
+
+
+def test_list_page_uses_keyset_pagination(pool):
+    store = make_store()
+    for conn in pool.connections:
+        cursor_of(conn).fetchall.return_value = [("id-1", {"data": "tea"}), ("id-2", {"data": "coffee"})]
+
+    page, cursor = store.list_page(filters={"user_id": "alice"}, limit=1, cursor="id-0")
+
+    conn = pool.putconn.call_args.args[0]
+    sql, params = cursor_of(conn).execute.call_args.args
+    assert "WHERE id > %s::uuid AND payload->>%s = %s" in sql and "ORDER BY id" in sql
+    assert params == ("id-0", "user_id", "alice", 2)
+    assert [r.id for r in page] == ["id-1"] and cursor == "id-1"
+
+
+def test_delete_by_filter_is_one_statement(pool):
+    store = make_store()
+
+    store.delete_by_filter({"user_id": "alice", "agent_id": "helper"})
+
+    conn = pool.putconn.call_args.args[0]
+    sql, params = cursor_of(conn).execute.call_args.args
+    assert sql == "DELETE FROM memories WHERE payload @> %s::jsonb"
+    assert params == ('{"user_id": "alice", "agent_id": "helper"}',)
+
+
+def test_new_collection_indexes_filter_fields(pool):
+    make_store(indexed_fields=["category", "user_id"])
+
+    statements = [
+        " ".join(call.args[0].split())
+        for conn in pool.connections
+        for call in cursor_of(conn).execute.call_args_list
+    ]
+    for field in ["user_id", "agent_id", "run_id", "category"]:
+        assert (
+            f"CREATE INDEX IF NOT EXISTS memories_payload_{field}_idx ON memories ((payload->>'{field}'))" in statements
+        )
+    assert "CREATE INDEX IF NOT EXISTS memories_payload_gin_idx ON memories USING gin (payload jsonb_path_ops)" in statements
+
+
+def test_list_streams_through_server_side_cursor(pool):
+    store = make_store(list_batch_size=50)
+    for conn in pool.connections:
+        cursor_of(conn).__iter__.return_value = iter([("a1b2", {"data": "tea"})])
+
+    results = store.list(filters={"user_id": "alice"}, limit=10)
+
+    conn = pool.putconn.call_args.args[0]
+    assert conn.cursor.call_args.kwargs["name"].startswith("mem0_list_")
+    assert cursor_of(conn).itersize == 50
+    assert [r.payload for r in results[0]] == [{"data": "tea"}]
+
+
+def test_callers_beyond_maxconn_wait_for_a_free_connection(pool):
+    store = make_store(maxconn=2)
+    active = []
+    peak = []
+
+    def slow_execute(*args, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        time.sleep(0.02)
+        active.pop()
+
+    for conn in pool.connections:
+        cursor_of(conn).execute.side_effect = slow_execute
+
+    threads = [threading.Thread(target=store.delete, args=(f"id-{i}",)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) <= 2
+    assert pool.getconn.call_count == pool.putconn.call_count
@@ -7,6 +7,7 @@ from qdrant_client.models import (
     PointStruct,
     VectorParams,
     PointIdsList,
+    PayloadSchemaType,
 )
 from mem0.vector_stores.qdrant import Qdrant
 
@@ -33,6 +34,19 @@ class TestQdrant(unittest.TestCase):
             collection_name="test_collection", vectors_config=expected_config
         )
 
+    def test_create_payload_indexes_skips_indexed_fields(self):
+        self.qdrant.indexed_fields = ["category"]
+        self.client_mock.create_payload_index.reset_mock()
+        self.client_mock.get_collection.return_value = MagicMock(payload_schema={"user_id": MagicMock()})
+
+        self.qdrant.create_payload_indexes()
+
+        indexed = [call.kwargs["field_name"] for call in self.client_mock.create_payload_index.call_args_list]
+        self.assertEqual(indexed, ["agent_id", "run_id", "category"])
+        self.assertEqual(
+            self.client_mock.create_payload_index.call_args.kwargs["field_schema"], PayloadSchemaType.KEYWORD
+        )
+
     def test_insert(self):
         vectors = [[0.1, 0.2], [0.3, 0.4]]
         payloads = [{"key": "value1"}, {"key": "value2"}]
@@ -67,6 +81,19 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(results[0].payload, {"key": "value"})
         self.assertEqual(results[0].score, 0.95)
 
+    def test_search_batch(self):
+        queries = [[0.1, 0.2], [0.3, 0.4]]
+        first, second = MagicMock(id="1", payload={"key": "a"}), MagicMock(id="2", payload={"key": "b"})
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=[first]), MagicMock(points=[second])]
+
+        results = self.qdrant.search_batch(queries=queries, limit=1)
+
+        self.client_mock.query_batch_points.assert_called_once()
+        requests = self.client_mock.query_batch_points.call_args[1]["requests"]
+        self.assertEqual([request.query for request in requests], queries)
+        self.assertEqual(results, [[first], [second]])
+        self.assertEqual(self.qdrant.search_batch(queries=[]), [])
+
     def test_delete(self):
         vector_id = str(uuid.uuid4())
         self.qdrant.delete(vector_id=vector_id)
@@ -76,6 +103,24 @@ class TestQdrant(unittest.TestCase):
             points_selector=PointIdsList(points=[vector_id]),
         )
 
+    def test_delete_many(self):
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.qdrant.delete_many(vector_ids=ids)
+
+        self.client_mock.delete.assert_called_once_with(
+            collection_name="test_collection",
+            points_selector=PointIdsList(points=ids),
+        )
+
+    def test_update_many(self):
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.qdrant.update_many(vector_ids=ids, vectors=[[0.1], [0.2]], payloads=[{"k": 1}, {"k": 2}])
+
+        self.client_mock.upsert.assert_called_once()
+        points = self.client_mock.upsert.call_args[1]["points"]
+        self.assertEqual([point.id for point in points], ids)
+        self.assertEqual(points[1].payload, {"k": 2})
+
     def test_update(self):
         vector_id = str(uuid.uuid4())
         updated_vector = [0.2, 0.3]
@@ -101,6 +146,26 @@ class TestQdrant(unittest.TestCase):
         self.assertEqual(result["id"], vector_id)
         self.assertEqual(result["payload"], {"key": "value"})
 
+    def test_list_page_resumes_from_scroll_offset(self):
+        point = MagicMock(id="id-1", payload={"data": "tea"})
+        next_id = str(uuid.uuid4())
+        self.client_mock.scroll.return_value = ([point], next_id)
+
+        points, cursor = self.qdrant.list_page(limit=1)
+        self.assertEqual(points, [point])
+        self.client_mock.scroll.return_value = ([point], None)
+        _, last_cursor = self.qdrant.list_page(limit=1, cursor=cursor)
+
+        self.assertEqual(self.client_mock.scroll.call_args.kwargs["offset"], next_id)
+        self.assertIsNone(last_cursor)
+
+    def test_delete_by_filter_uses_filter_selector(self):
+        self.qdrant.delete_by_filter({"user_id": "alice"})
+
+        selector = self.client_mock.delete.call_args.kwargs["points_selector"]
+        self.assertEqual(selector.filter.must[0].key, "user_id")
+        self.assertEqual(selector.filter.must[0].match.value, "alice")
+
     def test_list_cols(self):
         self.client_mock.get_collections.return_value = MagicMock(collections=[{"name": "test_collection"}])
         result = self.qdrant.list_cols()
@@ -0,0 +1,127 @@
+import json
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from mem0.configs.vector_stores.qdrant import QdrantConfig
+from mem0.utils.factory import VectorStoreFactory
+from mem0.vector_stores.configs import TenancyConfig, VectorStoreConfig
+from mem0.vector_stores.sharded import ConsistentHashRing, ShardedVectorStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    config = QdrantConfig(collection_name="memories", embedding_model_dims=2, path=str(tmp_path), on_disk=True)
+    return VectorStoreFactory.create("qdrant", config, TenancyConfig(strategy="sharded", shards=4))
+
+
+def add(store, memory_id, user_id, vector):
+    store.insert(vectors=[vector], payloads=[{"data": memory_id, "user_id": user_id}], ids=[memory_id])
+
+
+def test_ring_is_balanced_and_stable():
+    nodes = [f"memories_{shard}" for shard in range(4)]
+    ring = ConsistentHashRing(nodes)
+    counts = Counter(ring.node(f"user-{i}") for i in range(4000))
+    assert set(counts) == set(nodes)
+    assert min(counts.values()) > 500
+
+    # Adding a collection only moves tenants onto the new one
+    grown = ConsistentHashRing([*nodes, "memories_4"])
+    moved = [i for i in range(4000) if grown.node(f"user-{i}") != ring.node(f"user-{i}")]
+    assert all(grown.node(f"user-{i}") == "memories_4" for i in moved)
+
+
+def test_tenant_calls_touch_only_their_collection(store):
+    ids = {"alice": "00000000-0000-0000-0000-000000000001", "bob": "00000000-0000-0000-0000-000000000002"}
+    add(store, ids["alice"], "alice", [1.0, 0.0])
+    add(store, ids["bob"], "bob", [0.9, 0.1])
+
+    hits = store.search(query=[1.0, 0.0], limit=5, filters={"user_id": "alice"})
+    assert [hit.id for hit in hits] == [ids["alice"]]
+    assert store._route({"user_id": "alice"}) in store._shards
+
+    # Fan-out when no tenant is named
+    assert {hit.id for hit in store.search(query=[1.0, 0.0], limit=5)} == set(ids.values())
+
+    store._locations.clear()
+    assert store.get(ids["bob"]).payload["user_id"] == "bob"
+
+    store.delete_by_filter({"user_id": "alice"})
+    assert store.list(filters={"user_id": "alice"})[0] == []
+    assert [record.id for record in store.list()[0]] == [ids["bob"]]
+
+
+def test_fan_out_search_keeps_the_best_scores_of_every_collection(store):
+    users = ["alice"] + [f"user-{i}" for i in range(20)]
+    bob = next(user for user in users if store._route({"user_id": user}) != store._route({"user_id": "alice"}))
+    add(store, "00000000-0000-0000-0000-000000000001", "alice", [1.0, 0.0])
+    add(store, "00000000-0000-0000-0000-000000000002", "alice", [1.0, 0.05])
+    add(store, "00000000-0000-0000-0000-000000000003", bob, [0.0, 1.0])
+
+    hits = store.search(query=[1.0, 0.0], limit=2)
+    assert [hit.payload["user_id"] for hit in hits] == ["alice", "alice"]
+    assert hits[0].score >= hits[1].score
+
+
+def test_merge_follows_the_score_direction_of_the_provider():
+    class Hit:
+        def __init__(self, id, score):
+            self.id, self.score = id, score
+
+    near, middle, far = Hit("near", 0.1), Hit("middle", 0.2), Hit("far", 0.9)
+    # Distances: lower is better
+    assert ShardedVectorStore._merge([[near, far], [middle]], 2, higher_score_is_better=False) == [near, middle]
+    assert ShardedVectorStore._merge([[far, middle], [near, Hit("none", None)]], 4)[:3] == [far, middle, near]
+
+
+def test_list_page_walks_every_collection(store):
+    memory_ids = [f"00000000-0000-0000-0000-0000000000{i:02d}" for i in range(12)]
+    for i, memory_id in enumerate(memory_ids):
+        add(store, memory_id, f"user-{i}", [1.0, float(i)])
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = store.list_page(limit=5, cursor=cursor)
+        seen.extend(record.id for record in page)
+        if cursor is None:
+            break
+        assert json.loads(cursor)["shard"] < 4
+    assert sorted(seen) == memory_ids
+
+
+def test_get_vectors_collects_vectors_from_every_collection(store):
+    memory_ids = [f"00000000-0000-0000-0000-0000000000{i:02d}" for i in range(6)]
+    for i, memory_id in enumerate(memory_ids):
+        add(store, memory_id, f"user-{i}", [0.0, 1.0] if i % 2 else [1.0, 0.0])
+    store._locations.clear()
+
+    vectors = store.get_vectors([*memory_ids, "00000000-0000-0000-0000-000000000099"])
+
+    assert sorted(vectors) == memory_ids
+    assert vectors[memory_ids[1]] == pytest.approx([0.0, 1.0])
+
+
+def test_local_qdrant_shards_share_one_client(store):
+    first, second = store._shard("memories_0"), store._shard("memories_1")
+    assert first.client is second.client
+
+
+def test_partition_strategy_needs_a_partitioning_store():
+    with pytest.raises(ValueError, match="does not support partition tenancy"):
+        VectorStoreConfig(
+            provider="redis", config={"redis_url": "redis://localhost"}, tenancy={"strategy": "partition"}
+        )
+
+
+def test_partition_strategy_passes_tenant_key_to_store(tmp_path):
+    config = QdrantConfig(collection_name="memories", embedding_model_dims=2, path=str(tmp_path), on_disk=True)
+    with patch("mem0.vector_stores.qdrant.Qdrant.__init__", return_value=None) as init:
+        VectorStoreFactory.create("qdrant", config, TenancyConfig(strategy="partition"))
+    assert init.call_args.kwargs["tenant_key"] == "user_id"
+
+
+def test_sharded_store_is_a_vector_store(store):
+    assert isinstance(store, ShardedVectorStore)
+    assert store.supports_keyword_search is False